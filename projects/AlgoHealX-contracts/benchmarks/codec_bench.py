@@ -0,0 +1,79 @@
+"""
+AlgoHealX ARC-4 Codec Benchmark
+Compares algosdk's generic ABI encoding with the generated per-method codec
+"""
+
+import argparse
+import time
+
+from algosdk import account
+from algosdk.abi import Method
+
+from smart_contracts.artifacts.algo_healx import drug_batch_contract_codec as codec
+
+
+def generic_encode(method, values):
+    """What the generic path does per call: ABI type objects encode each argument"""
+    return [method.get_selector()] + [
+        arg.type.encode(value) for arg, value in zip(method.args, values)
+    ]
+
+
+def generic_decode(methods_by_selector, app_args):
+    method = methods_by_selector[app_args[0]]
+    return tuple(arg.type.decode(encoded) for arg, encoded in zip(method.args, app_args[1:]))
+
+
+def timed(label, fn, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - started
+    return label, elapsed / iterations * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    holder = account.generate_account()[1]
+    cases = {
+        "transfer(address,string)void": (holder, "Warehouse 7, Hyderabad"),
+        "register(string,string,string,string,string,uint64)void": (
+            "BATCH-000001",
+            "Paracetamol 500mg",
+            "Acme Pharma",
+            "2025-01-01",
+            "2027-01-01",
+            10_000,
+        ),
+        "approve(uint64)void": (87,),
+    }
+    methods = {sig: Method.from_signature(sig) for sig in cases}
+    by_selector = {m.get_selector(): m for m in methods.values()}
+
+    print(f"{'method':<16} {'path':<18} {'ns/call':>10} {'speedup':>8}")
+    for sig, values in cases.items():
+        method = methods[sig]
+        encode = codec.ENCODERS[sig]
+        _, decode = codec.DECODERS_BY_SELECTOR[method.get_selector()]
+        app_args = encode(*values)
+        assert app_args == generic_encode(method, values)
+        assert list(decode(app_args)) == list(generic_decode(by_selector, app_args))
+
+        for kind, generic, specialised in (
+            ("encode", lambda: generic_encode(method, values), lambda: encode(*values)),
+            ("decode", lambda: generic_decode(by_selector, app_args), lambda: decode(app_args)),
+        ):
+            _, generic_ns = timed("generic", generic, args.iterations)
+            _, specialised_ns = timed("generated", specialised, args.iterations)
+            print(f"{method.name:<16} {kind + ' generic':<18} {generic_ns:>10.0f}")
+            print(
+                f"{method.name:<16} {kind + ' generated':<18} {specialised_ns:>10.0f} "
+                f"{generic_ns / specialised_ns:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+AlgoHealX Client Handle Memory Benchmark
+Compares the memory held by DrugBatchHandles with DrugBatchContractClients for the same apps
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from algokit_utils import AlgorandClient
+
+from smart_contracts.algo_healx.handles import ClientContext
+from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+    DrugBatchContractClient,
+)
+
+_SENDER = "A" * 58
+
+
+def measure(label, build, count):
+    """Builds `count` objects; reports the memory they hold, and what is left once dropped"""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    objects = [build(app_id) for app_id in range(1, count + 1)]
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    del objects
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    print(
+        f"{label:<26} {held / 2**20:>9.1f} MiB {held / count:>8.0f} B "
+        f"{elapsed / count * 1e6:>8.1f} µs {retained / 2**20:>11.1f} MiB"
+    )
+    return held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Clients are built offline; nothing is sent
+    algorand = AlgorandClient.default_localnet()
+    # Parse the app spec before measuring, both kinds share it
+    DrugBatchContractClient(algorand=algorand, app_id=1, default_sender=_SENDER)
+
+    tracemalloc.start()
+    print(f"{'':<26} {'held':>13} {'per app':>10} {'build':>11} {'after del':>15}")
+    context = ClientContext(algorand, default_sender=_SENDER)
+    handles = measure("DrugBatchHandle", context.handle, args.count)
+    clients = measure(
+        "DrugBatchContractClient",
+        lambda app_id: DrugBatchContractClient(
+            algorand=algorand, app_id=app_id, default_sender=_SENDER
+        ),
+        args.count,
+    )
+    print(f"Handles hold {clients / handles:.0f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+AlgoHealX Block Scanner Benchmark
+Scans synthetic blocks with an increasing number of worker processes
+"""
+
+import argparse
+import functools
+import os
+import random
+import time
+
+import msgpack
+from algosdk import encoding
+
+from smart_contracts.algo_healx.scanner import BlockScanner
+from smart_contracts.artifacts.algo_healx import drug_batch_contract_codec as codec
+
+
+# Same addresses in every worker process
+_ADDRESSES = [random.Random(i).randbytes(32) for i in range(32)]
+
+
+class SyntheticBlocks:
+    """
+    Deterministic msgpack blocks: `txns` payments and unrelated app calls per block,
+    with a DrugBatchContract transfer in `hit_rate` of the blocks. A pool of
+    `distinct` blocks is reused, so that generating them does not dominate the scan.
+    """
+
+    def __init__(self, app_id, txns, hit_rate, distinct=1_000):
+        self.app_id = app_id
+        self.txns = txns
+        self.hit_rate = hit_rate
+        self.distinct = distinct
+
+    def raw_block(self, round_):
+        return self._block(round_ % self.distinct)
+
+    @functools.lru_cache(maxsize=None)
+    def _block(self, seed):
+        rng = random.Random(seed)
+        txns = []
+        for _ in range(self.txns):
+            sender = rng.choice(_ADDRESSES)
+            if rng.random() < 0.5:
+                txn = {"type": "pay", "snd": sender, "rcv": rng.choice(_ADDRESSES), "amt": 1_000}
+            else:
+                txn = {"type": "appl", "snd": sender, "apid": 1_000, "apaa": [rng.randbytes(4)]}
+            txns.append({"txn": txn, "hgi": True})
+        if rng.random() < self.hit_rate:
+            holder = encoding.encode_address(rng.choice(_ADDRESSES))
+            txns.append(
+                {
+                    "txn": {
+                        "type": "appl",
+                        "snd": rng.choice(_ADDRESSES),
+                        "apid": self.app_id,
+                        "apaa": codec.encode_transfer(holder, "Warehouse 7, Hyderabad"),
+                    },
+                    "hgi": True,
+                }
+            )
+        return msgpack.packb({"block": {"rnd": seed, "txns": txns}}, use_bin_type=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20_000)
+    parser.add_argument("--txns", type=int, default=50, help="unrelated transactions per block")
+    parser.add_argument("--hit-rate", type=float, default=0.05)
+    parser.add_argument("--chunk-rounds", type=int, default=500)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1})
+    )
+    args = parser.parse_args()
+
+    source = SyntheticBlocks(app_id=4242, txns=args.txns, hit_rate=args.hit_rate)
+    print(f"{'workers':>7} {'calls':>7} {'rounds/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        scanner = BlockScanner(
+            source, app_ids=[4242], workers=workers, chunk_rounds=args.chunk_rounds
+        )
+        started = time.perf_counter()
+        calls = sum(1 for _ in scanner.scan(1, args.rounds))
+        rate = args.rounds / (time.perf_counter() - started)
+        baseline = baseline or rate
+        print(f"{workers:>7} {calls:>7} {rate:>10.0f} {rate / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
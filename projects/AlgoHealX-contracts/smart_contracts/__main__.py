@@ -1,6 +1,7 @@
 import dataclasses
 import importlib
 import logging
+import os
 import subprocess
 import sys
 from collections.abc import Callable
@@ -10,6 +11,10 @@ from shutil import rmtree
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+from smart_contracts._helpers.arc4_codec import write_codec
+from smart_contracts._helpers.async_client import write_async_client
+from smart_contracts._helpers.program_stats import check_against_baseline, measure
+
 # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
 # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
@@ -108,6 +113,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "--no-output-arc32",
             "--output-arc56",
             "--output-source-map",
+            "--output-bytecode",
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -152,6 +158,19 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+            if deployment_extension == "py":
+                codec_path = write_codec(output_dir / file_name)
+                logger.info(f"Generated ARC-4 codec {codec_path}")
+                async_client_path = write_async_client(output_dir / file_name)
+                logger.info(f"Generated asyncio client {async_client_path}")
+            # Fail the build if program size or method cost regressed against the
+            # baseline committed next to the contract.
+            check_against_baseline(
+                measure(output_dir, output_dir / file_name),
+                contract_path.parent / "program_baseline.json",
+                threshold=float(os.environ.get("PROGRAM_REGRESSION_THRESHOLD", "0.05")),
+                update=os.environ.get("UPDATE_PROGRAM_BASELINE") == "1",
+            )
     if client_file:
         return output_dir / client_file
     return output_dir
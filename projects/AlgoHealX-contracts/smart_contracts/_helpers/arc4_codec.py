@@ -0,0 +1,317 @@
+import json
+import keyword
+import re
+from pathlib import Path
+
+from algosdk.abi import Method
+from algosdk.encoding import checksum
+
+# Generates a module of ARC-4 app-arg encoders and decoders specialised to each
+# method of an ARC-56 app spec, plus a decoder for each of its ARC-28 events.
+# Every argument is packed directly with a precompiled struct (or a cached,
+# checksum-verified address decode) instead of going through algosdk's generic
+# ABI type objects.
+
+_HEADER = '''# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts/_helpers/arc4_codec.py.
+# DO NOT MODIFY IT BY HAND.
+import functools
+import struct
+import typing
+
+from algosdk.encoding import decode_address as _checked_decode_address
+from algosdk.encoding import encode_address as _checked_encode_address
+
+_UINT8 = struct.Struct(">B")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_address(address: str) -> bytes:
+    return _checked_decode_address(address)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_address(public_key: bytes) -> str:
+    return _checked_encode_address(public_key)
+
+
+def _prefixed(value: bytes) -> bytes:
+    return _UINT16.pack(len(value)) + value
+
+
+def _unprefixed(encoded: bytes) -> bytes:
+    (length,) = _UINT16.unpack_from(encoded)
+    if len(encoded) != length + 2:
+        raise ValueError(f"Expected {length} bytes after the length prefix, got {len(encoded) - 2}")
+    return encoded[2:]
+
+
+def _dynamic(log: bytes, head: int) -> bytes:
+    # Offsets in an event's head are relative to the tuple, after the 4-byte selector
+    start = 4 + _UINT16.unpack_from(log, head)[0]
+    (length,) = _UINT16.unpack_from(log, start)
+    return log[start + 2 : start + 2 + length]
+
+
+def _pack_uint_array(values: list[int], code: str) -> bytes:
+    return _UINT16.pack(len(values)) + struct.pack(f">{len(values)}{code}", *values)
+
+
+def _pack_string_array(values: list[str]) -> bytes:
+    tails = [_prefixed(value.encode()) for value in values]
+    heads = []
+    offset = 2 * len(tails)
+    for tail in tails:
+        heads.append(_UINT16.pack(offset))
+        offset += len(tail)
+    return _UINT16.pack(len(tails)) + b"".join(heads) + b"".join(tails)
+
+
+def _string_array(encoded: bytes) -> list[str]:
+    (length,) = _UINT16.unpack_from(encoded)
+    values = []
+    for i in range(length):
+        start = 2 + _UINT16.unpack_from(encoded, 2 + 2 * i)[0]
+        (size,) = _UINT16.unpack_from(encoded, start)
+        values.append(encoded[start + 2 : start + 2 + size].decode())
+    return values
+
+
+def _uint_array(encoded: bytes, code: str, size: int) -> list[int]:
+    (length,) = _UINT16.unpack_from(encoded)
+    if len(encoded) != 2 + length * size:
+        raise ValueError(f"Expected {length} {size}-byte elements after the length prefix")
+    return list(struct.unpack_from(f">{length}{code}", encoded, 2))
+
+
+def _unreturned(log: bytes) -> bytes:
+    if not log.startswith(RETURN_PREFIX):
+        raise ValueError("Log is not an ARC-4 return value")
+    return log[4:]
+'''
+
+_UINT_STRUCTS = {8: "_UINT8", 16: "_UINT16", 32: "_UINT32", 64: "_UINT64"}
+_UINT_CODES = {8: "B", 16: "H", 32: "I", 64: "Q"}
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _identifier(name: str) -> str:
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def _python_type(arc4_type: str, encoding: bool) -> str:
+    if arc4_type in ("address", "string"):
+        return "str"
+    if arc4_type == "byte[]":
+        return "bytes | str" if encoding else "bytes"
+    if arc4_type == "bool":
+        return "bool"
+    if arc4_type.endswith("[]"):
+        return f"list[{_python_type(arc4_type[:-2], encoding)}]"
+    return "int"
+
+
+def _encode_expression(arc4_type: str, value: str) -> str:
+    if arc4_type == "address":
+        return f"_decode_address({value})"
+    if arc4_type == "string":
+        return f"_prefixed({value}.encode())"
+    if arc4_type == "byte[]":
+        return f"_prefixed({value}.encode() if isinstance({value}, str) else {value})"
+    if arc4_type == "bool":
+        return f'(b"\\x80" if {value} else b"\\x00")'
+    if arc4_type == "byte":
+        return f"_UINT8.pack({value})"
+    if arc4_type == "string[]":
+        return f"_pack_string_array({value})"
+    if (match := re.fullmatch(r"uint(\d+)\[\]", arc4_type)) and int(match.group(1)) in _UINT_CODES:
+        return f"_pack_uint_array({value}, {_UINT_CODES[int(match.group(1))]!r})"
+    if match := re.fullmatch(r"uint(\d+)", arc4_type):
+        bits = int(match.group(1))
+        if bits in _UINT_STRUCTS:
+            return f"{_UINT_STRUCTS[bits]}.pack({value})"
+        return f'{value}.to_bytes({bits // 8}, "big")'
+    raise Exception(f"Unsupported ARC-4 type for codec generation: {arc4_type}")
+
+
+def _decode_expression(arc4_type: str, encoded: str) -> str:
+    if arc4_type == "address":
+        return f"_encode_address({encoded})"
+    if arc4_type == "string":
+        return f"_unprefixed({encoded}).decode()"
+    if arc4_type == "byte[]":
+        return f"_unprefixed({encoded})"
+    if arc4_type == "bool":
+        return f"({encoded}[0] & 0x80 != 0)"
+    if arc4_type == "byte":
+        return f"{encoded}[0]"
+    if arc4_type == "string[]":
+        return f"_string_array({encoded})"
+    if match := re.fullmatch(r"uint(\d+)", arc4_type):
+        bits = int(match.group(1))
+        if bits in _UINT_STRUCTS:
+            return f"{_UINT_STRUCTS[bits]}.unpack({encoded})[0]"
+        return f'int.from_bytes({encoded}, "big")'
+    if (match := re.fullmatch(r"uint(\d+)\[\]", arc4_type)) and int(match.group(1)) in _UINT_CODES:
+        bits = int(match.group(1))
+        return f"_uint_array({encoded}, {_UINT_CODES[bits]!r}, {bits // 8})"
+    raise Exception(f"Unsupported ARC-4 type for codec generation: {arc4_type}")
+
+
+_STATIC_SIZES = {"address": 32, "byte": 1}
+
+
+def _event_field_expression(arc4_type: str, offset: int) -> tuple[str, int]:
+    """Decode expression for a tuple field at `offset` in the log, and its head size."""
+    if arc4_type in ("string", "byte[]"):
+        decoded = f"_dynamic(log, {offset})"
+        return (f"{decoded}.decode()" if arc4_type == "string" else decoded), 2
+    if arc4_type == "address":
+        return f"_encode_address(log[{offset}:{offset + 32}])", 32
+    if arc4_type == "byte":
+        return f"log[{offset}]", 1
+    if match := re.fullmatch(r"uint(\d+)", arc4_type):
+        bits = int(match.group(1))
+        if bits in _UINT_STRUCTS:
+            return f"{_UINT_STRUCTS[bits]}.unpack_from(log, {offset})[0]", bits // 8
+        end = offset + bits // 8
+        return f'int.from_bytes(log[{offset}:{end}], "big")', bits // 8
+    raise Exception(f"Unsupported ARC-28 event field type for codec generation: {arc4_type}")
+
+
+def _render_event(event: dict) -> tuple[str, str, str]:
+    args = event["args"]
+    signature = f"{event['name']}({','.join(arg['type'] for arg in args)})"
+    selector = checksum(signature.encode())[:4]
+    function_name = f"{_snake_case(event['name'])}_event"
+    class_name = f"{event['name']}Event"
+    selector_name = f"{function_name.upper()}_SELECTOR"
+
+    fields = []
+    offset = 4
+    for arg in args:
+        expression, size = _event_field_expression(arg["type"], offset)
+        fields.append(f"        {expression},")
+        offset += size
+    lines = [
+        f"class {class_name}(typing.NamedTuple):",
+        f'    """{signature} ARC-28 event"""',
+        "",
+        *(
+            f"    {_identifier(arg['name'])}: {_python_type(arg['type'], encoding=False)}"
+            for arg in args
+        ),
+        "",
+        "",
+        f"{selector_name} = bytes.fromhex({selector.hex()!r})",
+        "",
+        "",
+        f"def decode_{function_name}(log: bytes) -> {class_name}:",
+        f'    """Fields of a {event["name"]} event, from its log"""',
+        f"    return {class_name}(",
+        *fields,
+        "    )",
+    ]
+    return signature, function_name, "\n".join(lines)
+
+
+def _render_method(method: dict, function_name: str) -> tuple[str, str]:
+    args = method["args"]
+    if len(args) > 15:
+        raise Exception(f"{method['name']} has more than 15 arguments, which needs tuple packing")
+
+    signature = (
+        f"{method['name']}({','.join(arg['type'] for arg in args)}){method['returns']['type']}"
+    )
+    selector = Method.from_signature(signature).get_selector()
+    selector_name = f"{function_name.upper()}_SELECTOR"
+    names = [_identifier(arg["name"]) for arg in args]
+
+    params = ", ".join(
+        f"{name}: {_python_type(arg['type'], encoding=True)}" for name, arg in zip(names, args)
+    )
+    encoded = [f"        {_encode_expression(arg['type'], name)}," for name, arg in zip(names, args)]
+    decoded = [
+        f"        {_decode_expression(arg['type'], f'app_args[{i}]')},"
+        for i, arg in enumerate(args, start=1)
+    ]
+    decoded_type = ", ".join(_python_type(arg["type"], encoding=False) for arg in args) or "()"
+    lines = [
+        f"{selector_name} = bytes.fromhex({selector.hex()!r})",
+        "",
+        "",
+        f"def encode_{function_name}({params}) -> list[bytes]:",
+        f'    """App args for {signature}"""',
+        "    return [",
+        f"        {selector_name},",
+        *encoded,
+        "    ]",
+        "",
+        "",
+        f"def decode_{function_name}(app_args: list[bytes]) -> tuple[{decoded_type}]:",
+        f'    """Arguments of a {signature} call, from its app args"""',
+        "    return (",
+        *decoded,
+        "    )",
+    ]
+    returns = method["returns"]["type"]
+    if returns != "void":
+        lines += [
+            "",
+            "",
+            f"def decode_{function_name}_return(log: bytes) -> {_python_type(returns, encoding=False)}:",
+            f'    """Return value of {signature}, from the last log of the call"""',
+            f"    return {_decode_expression(returns, '_unreturned(log)')}",
+        ]
+    return signature, "\n".join(lines)
+
+
+def generate_codec(app_spec_path: Path) -> str:
+    """Renders the codec module source for an ARC-56 app spec."""
+    spec = json.loads(app_spec_path.read_text())
+    seen: dict[str, int] = {}
+    sections = [_HEADER]
+    registry = []
+    for method in spec["methods"]:
+        function_name = method["name"]
+        seen[function_name] = seen.get(function_name, 0) + 1
+        if seen[function_name] > 1:
+            function_name = f"{function_name}_{seen[function_name]}"
+        signature, source = _render_method(method, function_name)
+        sections.append(source)
+        registry.append((signature, function_name))
+
+    events = []
+    for event in spec.get("events", []):
+        signature, function_name, source = _render_event(event)
+        sections.append(source)
+        events.append((signature, function_name))
+
+    encoders = "".join(f"    {sig!r}: encode_{name},\n" for sig, name in registry)
+    decoders = "".join(
+        f"    {name.upper()}_SELECTOR: ({sig!r}, decode_{name}),\n" for sig, name in registry
+    )
+    sections.append(f"ENCODERS = {{\n{encoders}}}")
+    sections.append(f"DECODERS_BY_SELECTOR = {{\n{decoders}}}")
+    event_decoders = "".join(
+        f"    {name.upper()}_SELECTOR: ({sig!r}, decode_{name}),\n" for sig, name in events
+    )
+    sections.append(f"EVENTS_BY_SELECTOR = {{\n{event_decoders}}}")
+    return "\n\n\n".join(sections) + "\n"
+
+
+def write_codec(app_spec_path: Path) -> Path:
+    """Writes `<contract>_codec.py` next to the app spec and returns its path."""
+    name = json.loads(app_spec_path.read_text())["name"]
+    codec_path = app_spec_path.parent / f"{_snake_case(name)}_codec.py"
+    codec_path.write_text(generate_codec(app_spec_path))
+    return codec_path
@@ -0,0 +1,416 @@
+import asyncio
+import base64
+import dataclasses
+import time
+import typing
+from collections.abc import Callable, Sequence
+from urllib.parse import quote
+
+import httpx
+from algosdk import encoding, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.constants import algod_auth_header
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client import models
+from algosdk.v2client.algod import AlgodClient
+
+# Runtime for the asyncio clients generated by smart_contracts/_helpers/async_client.py:
+# a pooled algod transport and a transaction group composer that awaits instead of
+# blocking on HTTP.
+
+DEFAULT_CONCURRENCY = 64
+DEFAULT_VALIDITY_WINDOW = 1000
+# Suggested params only change between rounds, so concurrent calls share them
+_PARAMS_TTL_SECONDS = 1.0
+_MAX_SIMULATE_OPCODE_BUDGET = 20_000 * 16
+
+T = typing.TypeVar("T")
+ReturnDecoder = Callable[[bytes], object]
+
+# ------------------------------- Transport ------------------------------- #
+
+
+class AsyncAlgod:
+    """
+    The algod endpoints the generated asyncio clients use, over one pooled HTTP client.
+
+    At most `concurrency` requests are in flight; further requests wait for a pooled
+    connection instead of opening more. Transactions waiting for confirmation share a
+    single `wait-for-block-after` long poll per round, so any number of concurrent
+    sends hold at most one extra connection between blocks.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        token: str = "",
+        *,
+        headers: dict[str, str] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float = 30.0,
+    ):
+        self.concurrency = concurrency
+        self._http = httpx.AsyncClient(
+            base_url=f"{address.rstrip('/')}/v2",
+            headers={algod_auth_header: token, **(headers or {})},
+            limits=httpx.Limits(
+                max_connections=concurrency, max_keepalive_connections=concurrency
+            ),
+            # Requests queue for a connection for as long as it takes
+            timeout=httpx.Timeout(timeout, pool=None),
+        )
+        self._params: tuple[float, transaction.SuggestedParams] | None = None
+        self._round_waits: dict[int, asyncio.Task[dict]] = {}
+
+    @classmethod
+    def from_algod(cls, algod: AlgodClient, **kwargs: typing.Any) -> "AsyncAlgod":
+        """An async transport to the same node as a synchronous algod client."""
+        return cls(algod.algod_address, algod.algod_token, headers=algod.headers, **kwargs)
+
+    async def __aenter__(self) -> "AsyncAlgod":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | None = None,
+        content_type: str | None = None,
+        timeout: typing.Any = httpx.USE_CLIENT_DEFAULT,
+    ) -> dict:
+        response = await self._http.request(
+            method,
+            path,
+            content=content,
+            headers={"Content-Type": content_type} if content_type else None,
+            timeout=timeout,
+        )
+        if response.is_error:
+            try:
+                message = response.json()["message"]
+            except (ValueError, KeyError):
+                message = response.text
+            raise AlgodHTTPError(message, response.status_code)
+        return response.json()  # type: ignore[no-any-return]
+
+    async def status(self) -> dict:
+        return await self._request("GET", "/status")
+
+    async def status_after_block(self, round_: int) -> dict:
+        """Node status once a block after `round_` exists, shared by every waiter."""
+        task = self._round_waits.get(round_)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request(
+                    "GET", f"/status/wait-for-block-after/{round_}", timeout=httpx.Timeout(None)
+                )
+            )
+            self._round_waits[round_] = task
+            task.add_done_callback(lambda _: self._round_waits.pop(round_, None))
+        # A cancelled waiter must not cancel the poll the others are waiting on
+        return await asyncio.shield(task)
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        now = time.monotonic()
+        if self._params is None or now - self._params[0] > _PARAMS_TTL_SECONDS:
+            response = await self._request("GET", "/transactions/params")
+            params = transaction.SuggestedParams(
+                fee=response["min-fee"],
+                first=response["last-round"],
+                last=response["last-round"] + DEFAULT_VALIDITY_WINDOW,
+                gh=response["genesis-hash"],
+                gen=response["genesis-id"],
+                flat_fee=True,
+                consensus_version=response["consensus-version"],
+                min_fee=response["min-fee"],
+            )
+            self._params = (now, params)
+        return self._params[1]
+
+    async def application_info(self, app_id: int) -> dict:
+        return await self._request("GET", f"/applications/{app_id}")
+
+    async def application_box(self, app_id: int, name: bytes) -> bytes | None:
+        """The value of one of an app's boxes, or None if it does not exist."""
+        encoded = quote(f"b64:{base64.b64encode(name).decode()}", safe="")
+        try:
+            response = await self._request("GET", f"/applications/{app_id}/box?name={encoded}")
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return base64.b64decode(response["value"])
+
+    async def raw_block(self, round_: int) -> bytes:
+        """The msgpack-encoded `block_info` response for a round."""
+        response = await self._http.get(f"/blocks/{round_}", params={"format": "msgpack"})
+        if response.is_error:
+            raise AlgodHTTPError(response.text, response.status_code)
+        return response.content
+
+    async def pending_transaction_info(self, tx_id: str) -> dict:
+        return await self._request("GET", f"/transactions/pending/{tx_id}")
+
+    async def send_raw_transactions(
+        self, signed: Sequence[transaction.GenericSignedTransaction]
+    ) -> str:
+        """Submits a signed group; returns the ID of its first transaction."""
+        content = b"".join(
+            base64.b64decode(encoding.msgpack_encode(stxn)) for stxn in signed
+        )
+        response = await self._request(
+            "POST", "/transactions", content=content, content_type="application/x-binary"
+        )
+        return response["txId"]  # type: ignore[no-any-return]
+
+    async def simulate(self, request: models.SimulateRequest) -> dict:
+        content = base64.b64decode(encoding.msgpack_encode(request))
+        return await self._request(
+            "POST", "/transactions/simulate", content=content, content_type="application/msgpack"
+        )
+
+    async def wait_for_confirmation(self, tx_id: str, from_round: int, max_rounds: int = 5) -> dict:
+        """The pending transaction info once `tx_id` is confirmed, within `max_rounds` of `from_round`."""
+        round_ = from_round
+        while True:
+            info = await self.pending_transaction_info(tx_id)
+            if info.get("pool-error"):
+                raise Exception(f"Transaction {tx_id} was rejected: {info['pool-error']}")
+            if info.get("confirmed-round"):
+                return info
+            if round_ >= from_round + max_rounds:
+                raise Exception(f"Transaction {tx_id} was not confirmed within {max_rounds} rounds")
+            round_ = (await self.status_after_block(round_))["last-round"]
+
+
+# ------------------------------- Composer ------------------------------- #
+
+
+@dataclasses.dataclass
+class CallParams:
+    """Transaction fields of one app call, like algokit's `CommonAppCallParams`; fees in microAlgo."""
+
+    sender: str | None = None
+    signer: TransactionSigner | None = None
+    note: bytes | None = None
+    lease: bytes | None = None
+    rekey_to: str | None = None
+    static_fee: int | None = None
+    extra_fee: int | None = None
+    validity_window: int | None = None
+    account_references: list[str] | None = None
+    app_references: list[int] | None = None
+    asset_references: list[int] | None = None
+    box_references: list[tuple[int, bytes]] | None = None
+
+
+@dataclasses.dataclass
+class SendParams:
+    max_rounds_to_wait: int = 5
+
+
+@dataclasses.dataclass(frozen=True)
+class SendResult(typing.Generic[T]):
+    """A confirmed group: each transaction's ID, confirmation and decoded ABI return."""
+
+    tx_ids: list[str]
+    confirmations: list[dict]
+    # None for transactions that are not method calls, or return void
+    returns: list[object]
+    confirmed_round: int
+    # The return value of the last transaction in the group
+    abi_return: T
+
+    @property
+    def tx_id(self) -> str:
+        return self.tx_ids[-1]
+
+
+@dataclasses.dataclass(frozen=True)
+class SimulateResult(typing.Generic[T]):
+    """A simulated group: each transaction's result and decoded ABI return."""
+
+    tx_ids: list[str]
+    txn_results: list[dict]
+    returns: list[object]
+    last_round: int
+    abi_return: T
+    response: dict
+
+
+class _Entry(typing.NamedTuple):
+    build: Callable[[transaction.SuggestedParams], transaction.Transaction]
+    signer: TransactionSigner | None
+    decode_return: ReturnDecoder | None
+
+
+class AsyncComposer:
+    """
+    An atomic transaction group, sent or simulated without blocking the event loop.
+
+    Transactions are built when the group is sent, from suggested params shared by
+    every composer on the same `AsyncAlgod`, and signed with each signer once.
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgod,
+        *,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+    ):
+        self.algod = algod
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        self._entries: list[_Entry] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add_transaction(
+        self, txn: transaction.Transaction, signer: TransactionSigner | None = None
+    ) -> "AsyncComposer":
+        self._entries.append(_Entry(lambda _: txn, signer or self.default_signer, None))
+        return self
+
+    def add_app_call(
+        self,
+        app_id: int,
+        app_args: list[bytes],
+        params: CallParams | None = None,
+        *,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+        decode_return: ReturnDecoder | None = None,
+    ) -> "AsyncComposer":
+        """Adds an app call; `decode_return` decodes the ARC-4 return value from its last log."""
+        params = params or CallParams()
+        sender = params.sender or self.default_sender
+        if not sender:
+            raise Exception(f"No sender provided and no default sender present for call to app {app_id}")
+        signer = params.signer or (
+            self.default_signer if sender == self.default_sender else None
+        )
+
+        def build(suggested: transaction.SuggestedParams) -> transaction.Transaction:
+            suggested = transaction.SuggestedParams(**vars(suggested))
+            if params.static_fee is not None:
+                suggested.fee = params.static_fee
+            elif params.extra_fee:
+                suggested.fee = suggested.min_fee + params.extra_fee
+            if params.validity_window is not None:
+                suggested.last = suggested.first + params.validity_window
+            return transaction.ApplicationCallTxn(
+                sender,
+                suggested,
+                app_id,
+                on_complete,
+                app_args=app_args,
+                accounts=params.account_references,
+                foreign_apps=params.app_references,
+                foreign_assets=params.asset_references,
+                boxes=params.box_references,
+                note=params.note,
+                lease=params.lease,
+                rekey_to=params.rekey_to,
+            )
+
+        self._entries.append(_Entry(build, signer, decode_return))
+        return self
+
+    async def build(self) -> list[transaction.Transaction]:
+        """The group's transactions, with a group ID if there is more than one."""
+        if not self._entries:
+            raise Exception("Cannot send an empty transaction group")
+        suggested = await self.algod.suggested_params()
+        txns = [entry.build(suggested) for entry in self._entries]
+        return transaction.assign_group_id(txns) if len(txns) > 1 else txns
+
+    def _sign(self, txns: list[transaction.Transaction]) -> list[transaction.GenericSignedTransaction]:
+        by_signer: dict[int, tuple[TransactionSigner, list[int]]] = {}
+        for i, entry in enumerate(self._entries):
+            if entry.signer is None:
+                raise Exception(f"No signer for transaction {i} sent by {txns[i].sender}")
+            by_signer.setdefault(id(entry.signer), (entry.signer, []))[1].append(i)
+        signed: list[transaction.GenericSignedTransaction] = [None] * len(txns)  # type: ignore[list-item]
+        for signer, indexes in by_signer.values():
+            for i, stxn in zip(indexes, signer.sign_transactions(txns, indexes)):
+                signed[i] = stxn
+        return signed
+
+    def _returns(self, results: list[dict]) -> list[object]:
+        returns: list[object] = []
+        for entry, result in zip(self._entries, results):
+            logs = result.get("logs") or []
+            if entry.decode_return is None or not logs:
+                returns.append(None)
+            else:
+                returns.append(entry.decode_return(base64.b64decode(logs[-1])))
+        return returns
+
+    async def send(self, send_params: SendParams | None = None) -> SendResult[typing.Any]:
+        send_params = send_params or SendParams()
+        txns = await self.build()
+        await self.algod.send_raw_transactions(self._sign(txns))
+        tx_ids = [txn.get_txid() for txn in txns]
+        # A group is confirmed in one round, so waiting on its last transaction is enough
+        last = await self.algod.wait_for_confirmation(
+            tx_ids[-1], txns[-1].first_valid_round, send_params.max_rounds_to_wait
+        )
+        others = await asyncio.gather(
+            *(self.algod.pending_transaction_info(tx_id) for tx_id in tx_ids[:-1])
+        )
+        confirmations = [*others, last]
+        returns = self._returns(confirmations)
+        return SendResult(
+            tx_ids=tx_ids,
+            confirmations=confirmations,
+            returns=returns,
+            confirmed_round=confirmations[-1]["confirmed-round"],
+            abi_return=returns[-1],
+        )
+
+    async def simulate(
+        self,
+        *,
+        skip_signatures: bool = True,
+        allow_unnamed_resources: bool = True,
+        extra_opcode_budget: int = _MAX_SIMULATE_OPCODE_BUDGET,
+    ) -> SimulateResult[typing.Any]:
+        """Simulates the group, unsigned by default, and raises if it would fail."""
+        txns = await self.build()
+        signed: list[transaction.GenericSignedTransaction] = (
+            [transaction.SignedTransaction(txn, None) for txn in txns]  # type: ignore[arg-type]
+            if skip_signatures
+            else self._sign(txns)
+        )
+        response = await self.algod.simulate(
+            models.SimulateRequest(
+                txn_groups=[models.SimulateRequestTransactionGroup(txns=signed)],
+                allow_empty_signatures=skip_signatures,
+                allow_unnamed_resources=allow_unnamed_resources,
+                allow_more_logs=True,
+                extra_opcode_budget=extra_opcode_budget,
+            )
+        )
+        group = response["txn-groups"][0]
+        if group.get("failure-message"):
+            raise Exception(
+                f"Simulating transaction {group.get('failed-at')} failed: {group['failure-message']}"
+            )
+        txn_results = [result["txn-result"] for result in group["txn-results"]]
+        returns = self._returns(txn_results)
+        return SimulateResult(
+            tx_ids=[txn.get_txid() for txn in txns],
+            txn_results=txn_results,
+            returns=returns,
+            last_round=response["last-round"],
+            abi_return=returns[-1],
+            response=response,
+        )
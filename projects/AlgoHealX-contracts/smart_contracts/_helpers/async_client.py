@@ -0,0 +1,288 @@
+import json
+from pathlib import Path
+
+from smart_contracts._helpers.arc4_codec import _identifier, _python_type, _snake_case
+
+# Generates an asyncio client for an ARC-56 app spec, next to the typed client
+# algokit generates. It mirrors that client's `send`, `create_transaction`,
+# `state.global_state` and `new_group()` surface with awaitable methods, encodes
+# arguments with the generated ARC-4 codec and runs on the pooled transport in
+# smart_contracts/_helpers/async_algod.py.
+
+_HEADER = '''# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts/_helpers/async_client.py.
+# DO NOT MODIFY IT BY HAND.
+from __future__ import annotations
+
+import base64
+import dataclasses
+import typing
+
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.encoding import encode_address
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers.async_algod import (
+    AsyncAlgod,
+    AsyncComposer,
+    CallParams,
+    SendParams,
+    SendResult,
+    SimulateResult,
+)
+
+from . import {codec_module} as _codec
+
+if typing.TYPE_CHECKING:
+    from .{client_module} import (
+{type_imports}
+    )
+
+
+def _args(args: typing.Any) -> tuple:
+    """Positional values of an args tuple or one of the typed client's `<Method>Args`"""
+    if dataclasses.is_dataclass(args):
+        return tuple(getattr(args, field.name) for field in dataclasses.fields(args))
+    return tuple(args)
+
+
+_VALUE_DECODERS = {{
+    "AVMUint64": lambda value: value.get("uint", 0),
+    "AVMBytes": lambda value: base64.b64decode(value.get("bytes", "")),
+    "AVMString": lambda value: base64.b64decode(value.get("bytes", "")).decode("utf-8", errors="replace"),
+    "address": lambda value: encode_address(base64.b64decode(value.get("bytes", ""))),
+}}'''
+
+_STATE_TYPES = {"AVMUint64": "int", "AVMBytes": "bytes", "AVMString": "str", "address": "str"}
+
+
+def _pascal_case(name: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in name.split("_"))
+
+
+def _signature(method: dict) -> str:
+    args = ",".join(arg["type"] for arg in method["args"])
+    return f"{method['name']}({args}){method['returns']['type']}"
+
+
+def _method_names(spec: dict) -> list[tuple[dict, str]]:
+    """Each method with its codec function name, numbered like the codec's on overloads."""
+    seen: dict[str, int] = {}
+    names = []
+    for method in spec["methods"]:
+        name = method["name"]
+        seen[name] = seen.get(name, 0) + 1
+        names.append((method, name if seen[name] == 1 else f"{name}_{seen[name]}"))
+    return names
+
+
+def _callable(method: dict) -> bool:
+    return "NoOp" in method["actions"]["call"]
+
+
+def _render_composer(class_name: str, methods: list[tuple[dict, str]]) -> str:
+    lines = [
+        f"class {class_name}Composer:",
+        f'    """A group of {class_name.removeprefix("Async")} calls and other transactions, sent or simulated together"""',
+        "",
+        f"    def __init__(self, client: \"{class_name}Client\"):",
+        "        self.client = client",
+        "        self.composer = AsyncComposer(",
+        "            client.algod,",
+        "            default_sender=client.default_sender,",
+        "            default_signer=client.default_signer,",
+        "        )",
+    ]
+    for method, name in methods:
+        args = method["args"]
+        returns = method["returns"]["type"]
+        arg_types = ", ".join(_python_type(arg["type"], encoding=True) for arg in args)
+        encoded = f"_codec.encode_{name}(*_args(args))" if args else f"_codec.encode_{name}()"
+        decoder = f"_codec.decode_{name}_return" if returns != "void" else "None"
+        lines += [
+            "",
+            f"    def {_identifier(name)}(",
+            "        self,",
+            f"        args: tuple[{arg_types}] | \"{_pascal_case(name)}Args\"," if args else None,
+            "        params: CallParams | None = None,",
+            f"    ) -> \"{class_name}Composer\":",
+            f'        """Adds a {_signature(method)} call"""',
+            "        self.composer.add_app_call(",
+            f"            self.client.app_id, {encoded}, params, decode_return={decoder}",
+            "        )",
+            "        return self",
+        ]
+    lines += [
+        "",
+        "    def add_transaction(",
+        "        self, txn: transaction.Transaction, signer: TransactionSigner | None = None",
+        f"    ) -> \"{class_name}Composer\":",
+        "        self.composer.add_transaction(txn, signer)",
+        "        return self",
+        "",
+        "    async def build(self) -> list[transaction.Transaction]:",
+        "        return await self.composer.build()",
+        "",
+        "    async def send(self, send_params: SendParams | None = None) -> SendResult[typing.Any]:",
+        "        return await self.composer.send(send_params)",
+        "",
+        "    async def simulate(self, **options: typing.Any) -> SimulateResult[typing.Any]:",
+        "        return await self.composer.simulate(**options)",
+    ]
+    return "\n".join(line for line in lines if line is not None)
+
+
+def _render_accessor(class_name: str, kind: str, methods: list[tuple[dict, str]]) -> str:
+    """The `send` or `create_transaction` accessor, one awaitable method per ABI method."""
+    accessor = "Send" if kind == "send" else "CreateTransactionParams"
+    lines = [
+        f"class {class_name}{accessor}:",
+        f"    def __init__(self, client: \"{class_name}Client\"):",
+        "        self.client = client",
+    ]
+    for method, name in methods:
+        args = method["args"]
+        returns = method["returns"]["type"]
+        readonly = bool(method.get("readonly"))
+        arg_types = ", ".join(_python_type(arg["type"], encoding=True) for arg in args)
+        return_type = "None" if returns == "void" else _python_type(returns, encoding=False)
+        if kind == "send":
+            result_type = f"SimulateResult[{return_type}]" if readonly else f"SendResult[{return_type}]"
+            tail = ["        send_params: SendParams | None = None,"]
+            call = (
+                "return await composer.simulate()" if readonly else "return await composer.send(send_params)"
+            )
+        else:
+            result_type = "transaction.Transaction"
+            tail = []
+            call = "return (await composer.build())[0]"
+        lines += [
+            "",
+            f"    async def {_identifier(name)}(",
+            "        self,",
+            f"        args: tuple[{arg_types}] | \"{_pascal_case(name)}Args\"," if args else None,
+            "        params: CallParams | None = None,",
+            *tail,
+            f"    ) -> {result_type}:",
+            f"        composer = self.client.new_group().{_identifier(name)}({'args, ' if args else ''}params)",
+            f"        {call}",
+        ]
+    return "\n".join(line for line in lines if line is not None)
+
+
+def _render_state(class_name: str, keys: dict) -> str:
+    schema = "".join(
+        f"    {info['key']!r}: ({name!r}, _VALUE_DECODERS[{info['valueType']!r}]),\n"
+        for name, info in keys.items()
+    )
+    lines = [
+        f"_GLOBAL_STATE = {{\n{schema}}}",
+        "",
+        "",
+        "class _GlobalState:",
+        f"    def __init__(self, client: \"{class_name}Client\"):",
+        "        self.client = client",
+        "",
+        '    async def get_all(self) -> "GlobalStateValue":',
+        '        """Get all current keyed values from global_state state"""',
+        "        info = await self.client.algod.application_info(self.client.app_id)",
+        "        state = {}",
+        '        for entry in info["params"].get("global-state", []):',
+        '            key = _GLOBAL_STATE.get(entry["key"])',
+        "            if key is not None:",
+        "                name, decode = key",
+        '                state[name] = decode(entry["value"])',
+        '        return typing.cast("GlobalStateValue", state)',
+    ]
+    for name, info in keys.items():
+        value_type = _STATE_TYPES.get(info["valueType"], "typing.Any")
+        lines += [
+            "",
+            f"    async def {_identifier(name)}(self) -> {value_type} | None:",
+            f'        """Get the current value of the {name} key in global_state state"""',
+            f"        return (await self.get_all()).get({name!r})",
+        ]
+    lines += [
+        "",
+        "",
+        f"class {class_name}State:",
+        f"    def __init__(self, client: \"{class_name}Client\"):",
+        "        self.global_state = _GlobalState(client)",
+    ]
+    return "\n".join(lines)
+
+
+def _render_client(class_name: str, has_state: bool) -> str:
+    lines = [
+        f"class {class_name}Client:",
+        '    """',
+        f"    asyncio client for a {class_name.removeprefix('Async')} app, over an `AsyncAlgod` shared by every client",
+        "    of a service:",
+        "",
+        "        async with AsyncAlgod.from_algod(algorand.client.algod, concurrency=64) as algod:",
+        f"            client = {class_name}Client(algod, app_id, default_sender=sender, default_signer=signer)",
+        "            await client.send.<method>(args=(...))",
+        '    """',
+        "",
+        "    def __init__(",
+        "        self,",
+        "        algod: AsyncAlgod,",
+        "        app_id: int,",
+        "        *,",
+        "        default_sender: str | None = None,",
+        "        default_signer: TransactionSigner | None = None,",
+        "    ):",
+        "        self.algod = algod",
+        "        self.app_id = app_id",
+        "        self.default_sender = default_sender",
+        "        self.default_signer = default_signer",
+        f"        self.send = {class_name}Send(self)",
+        f"        self.create_transaction = {class_name}CreateTransactionParams(self)",
+        f"        self.state = {class_name}State(self)" if has_state else None,
+        "",
+        "    @property",
+        "    def app_address(self) -> str:",
+        "        return get_application_address(self.app_id)",
+        "",
+        f"    def new_group(self) -> {class_name}Composer:",
+        f"        return {class_name}Composer(self)",
+    ]
+    return "\n".join(line for line in lines if line is not None)
+
+
+def generate_async_client(app_spec_path: Path) -> str:
+    """Renders the asyncio client module source for an ARC-56 app spec."""
+    spec = json.loads(app_spec_path.read_text())
+    class_name = f"Async{spec['name']}"
+    module = _snake_case(spec["name"])
+    methods = [(method, name) for method, name in _method_names(spec) if _callable(method)]
+    keys = spec.get("state", {}).get("keys", {}).get("global", {})
+
+    type_imports = [f"{_pascal_case(name)}Args" for method, name in methods if method["args"]]
+    if keys:
+        type_imports.append("GlobalStateValue")
+    sections = [
+        _HEADER.format(
+            codec_module=f"{module}_codec",
+            client_module=f"{module}_client",
+            type_imports="".join(f"        {name},\n" for name in type_imports).rstrip("\n"),
+        ),
+        _render_composer(class_name, methods),
+        _render_accessor(class_name, "send", methods),
+        _render_accessor(class_name, "create_transaction", methods),
+    ]
+    if keys:
+        sections.append(_render_state(class_name, keys))
+    sections.append(_render_client(class_name, bool(keys)))
+    return "\n\n\n".join(sections) + "\n"
+
+
+def write_async_client(app_spec_path: Path) -> Path:
+    """Writes `<contract>_async_client.py` next to the app spec and returns its path."""
+    name = json.loads(app_spec_path.read_text())["name"]
+    client_path = app_spec_path.parent / f"{_snake_case(name)}_async_client.py"
+    client_path.write_text(generate_async_client(app_spec_path))
+    return client_path
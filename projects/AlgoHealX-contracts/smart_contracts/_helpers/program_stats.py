@@ -0,0 +1,174 @@
+import json
+import logging
+import math
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Opcodes that cost more than 1; every other opcode costs 1
+OPCODE_COSTS = {
+    "sha256": 35,
+    "sha512_256": 45,
+    "keccak256": 130,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+}
+PAGE_SIZE = 2048
+_TERMINAL_OPS = {"return", "err", "retsub"}
+_BRANCH_OPS = {"bz", "bnz"}
+_MULTI_BRANCH_OPS = {"match", "switch"}
+_SIZE_METRICS = ("approval_bytes", "clear_bytes")
+
+# ----------------------------- Static Analysis ----------------------------- #
+
+
+class _ControlFlow:
+    """Opcodes and branch targets of a compiled program, from its `.puya.map`."""
+
+    def __init__(self, map_path: Path):
+        events = json.loads(map_path.read_text())["pc_events"]
+        self.ops = {
+            int(pc): event["op"].split("//")[0].split()
+            for pc, event in events.items()
+            if "op" in event
+        }
+        self.labels = {event["block"]: int(pc) for pc, event in events.items() if "block" in event}
+        pcs = sorted(self.ops)
+        self._next = dict(zip(pcs, pcs[1:]))
+
+    def successors(self, pc: int, stop_at_dispatch: bool = False) -> list[int]:
+        name, *args = self.ops[pc]
+        following = [self._next[pc]] if pc in self._next else []
+        if name in _TERMINAL_OPS:
+            return []
+        if name == "b":
+            return [self.labels[args[0]]]
+        if name in _BRANCH_OPS:
+            return [self.labels[args[0]], *following]
+        if name in _MULTI_BRANCH_OPS:
+            if stop_at_dispatch:
+                return following
+            return [self.labels[label] for label in args] + following
+        return following
+
+    def longest_path(self, start: int, stop_at_dispatch: bool = False) -> int:
+        """
+        Opcode cost of the most expensive path from `start` to a return. Loop
+        back-edges are ignored, so loops count as a single iteration.
+        """
+        costs: dict[int, int] = {}
+        on_path: set[int] = set()
+        stack = [(start, False)]
+        while stack:
+            pc, expanded = stack.pop()
+            if pc in costs or (pc in on_path and not expanded):
+                continue
+            name, *args = self.ops[pc]
+            callee = [self.labels[args[0]]] if name == "callsub" else []
+            successors = self.successors(pc, stop_at_dispatch)
+            if not expanded:
+                on_path.add(pc)
+                stack.append((pc, True))
+                stack.extend(
+                    (dependency, False)
+                    for dependency in callee + successors
+                    if dependency not in costs and dependency not in on_path
+                )
+                continue
+            on_path.discard(pc)
+            costs[pc] = (
+                OPCODE_COSTS.get(name, 1)
+                + sum(costs.get(dependency, 0) for dependency in callee)
+                + max((costs.get(successor, 0) for successor in successors), default=0)
+            )
+        return costs[start]
+
+
+def measure(output_dir: Path, app_spec_path: Path) -> dict:
+    """Program sizes, extra pages and static cost of the router and every method."""
+    spec = json.loads(app_spec_path.read_text())
+    name = spec["name"]
+
+    stats: dict = {}
+    for program in ("approval", "clear"):
+        bytecode = output_dir / f"{name}.{program}.bin"
+        stats[f"{program}_bytes"] = bytecode.stat().st_size if bytecode.exists() else None
+    if None in (stats["approval_bytes"], stats["clear_bytes"]):
+        stats["extra_pages"] = None
+    else:
+        total = stats["approval_bytes"] + stats["clear_bytes"]
+        stats["extra_pages"] = max(0, math.ceil(total / PAGE_SIZE) - 1)
+
+    flow = _ControlFlow(output_dir / f"{name}.approval.puya.map")
+    entry = min(flow.ops)
+    stats["router_cost"] = flow.longest_path(entry, stop_at_dispatch=True)
+    methods = {}
+    for method in spec["methods"]:
+        arg_types = ",".join(arg["type"] for arg in method["args"])
+        signature = f"{method['name']}({arg_types}){method['returns']['type']}"
+        # Methods with an inlined body are routed to a `main_<name>_route@N` block
+        block: str | None = method["name"]
+        if block not in flow.labels:
+            route = f"main_{method['name']}_route@"
+            block = next((label for label in flow.labels if label.startswith(route)), None)
+        if block is None:
+            logger.warning(f"No routing block found for {signature}, skipping its cost")
+            continue
+        methods[signature] = flow.longest_path(flow.labels[block])
+    stats["method_costs"] = methods
+    return stats
+
+
+# ------------------------------ Baseline Gate ------------------------------ #
+
+
+def _diff_rows(baseline: dict, current: dict) -> list[tuple[str, int | None, int | None]]:
+    rows = [
+        (metric, baseline.get(metric), current.get(metric))
+        for metric in (*_SIZE_METRICS, "extra_pages", "router_cost")
+    ]
+    before = baseline.get("method_costs", {})
+    after = current.get("method_costs", {})
+    rows += [(method, before.get(method), after.get(method)) for method in sorted(before | after)]
+    return rows
+
+
+def check_against_baseline(
+    stats: dict, baseline_path: Path, threshold: float, update: bool = False
+) -> None:
+    """
+    Prints a delta table against the baseline and raises if a size or cost grew by
+    more than `threshold` (a fraction) or the program needs more extra pages.
+    Writes the baseline instead if it does not exist yet or `update` is set.
+    """
+    if update or not baseline_path.exists():
+        baseline_path.write_text(json.dumps(stats, indent=2, sort_keys=True) + "\n")
+        logger.info(f"Recorded program baseline in {baseline_path}")
+        return
+
+    baseline = json.loads(baseline_path.read_text())
+    regressions = []
+    print(f"{'metric':<60} {'baseline':>10} {'current':>10} {'delta':>8}")
+    for metric, before, after in _diff_rows(baseline, stats):
+        if before is None or after is None:
+            before_text = "-" if before is None else before
+            after_text = "-" if after is None else after
+            print(f"{metric:<60} {before_text:>10} {after_text:>10}")
+            continue
+        change = (after - before) / before if before else float(after > 0)
+        print(f"{metric:<60} {before:>10} {after:>10} {change:>+8.1%}")
+        limit = 0 if metric == "extra_pages" else threshold
+        if change > limit:
+            regressions.append(f"{metric}: {before} -> {after}")
+
+    if regressions:
+        raise Exception(
+            f"Program regressed by more than {threshold:.0%} against {baseline_path}:\n"
+            + "\n".join(regressions)
+            + "\nSet UPDATE_PROGRAM_BASELINE=1 to accept the new numbers."
+        )
@@ -0,0 +1,596 @@
+import argparse
+import base64
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import typing
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+import algokit_utils
+import msgpack
+from algosdk.encoding import encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.algo_healx.scanner import (
+    APPROVAL_PROGRAM_PATH,
+    AlgodBlocks,
+    app_calls,
+    approval_hash,
+    state_delta,
+)
+from smart_contracts.algo_healx.state_reader import BatchStateReader
+
+if typing.TYPE_CHECKING:
+    import psycopg
+
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        GlobalStateValue,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Anti-entropy between `public.medicines` in Supabase and DrugBatchContract state.
+#
+# Both sides hash every batch to a 64-bit leaf, the first 8 bytes of
+# md5("<batch_id>:<status>"), and group leaves into buckets by the first
+# BUCKET_DEPTH hex digits of md5(batch_id). A bucket's digest is its row count
+# and the XOR of its leaves, so digests of any hex prefix are XORs of the digests
+# below it. Reconciling compares prefixes one hex digit at a time, Merkle-style,
+# and only descends into those that differ: a check of millions of batches reads
+# one digest per bucket from each side plus the rows of the few buckets that
+# diverged. Supabase keeps the hashes in generated columns (migration
+# 20251201090000); the chain side is a local SQLite mirror kept current from
+# blocks, with bucket digests updated as statuses change.
+
+DEFAULT_INDEX_PATH = Path(os.environ.get("CHAIN_STATUS_INDEX_PATH", ".algokit/chain_status.sqlite"))
+BUCKET_DEPTH = 4
+DEFAULT_BATCH_SIZE = 1_000
+_WATCHED_KEYS = (b"batch_id", b"reg_status", b"is_authentic")
+_UPDATE_APPLICATION = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS apps (
+    app_id INTEGER PRIMARY KEY,
+    batch_id TEXT,
+    reg_status TEXT NOT NULL,
+    is_authentic INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    bucket TEXT,
+    leaf INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS apps_batch_id ON apps (batch_id);
+CREATE INDEX IF NOT EXISTS apps_bucket ON apps (bucket);
+CREATE TABLE IF NOT EXISTS buckets (
+    bucket TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    digest INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def supabase_status(reg_status: str, is_authentic: int) -> str:
+    """
+    The `medicines.status` a batch's chain state corresponds to.
+
+    Supabase records the regulator's decision, which `status` on chain loses once a
+    batch is transferred or delivered, so it is compared with `reg_status` instead;
+    a batch marked counterfeit is `counterfeit` whatever its later status.
+    """
+    return reg_status if is_authentic else "counterfeit"
+
+
+def bucket_of(batch_id: str) -> str:
+    return hashlib.md5(batch_id.encode()).hexdigest()[:BUCKET_DEPTH]
+
+
+def leaf_hash(batch_id: str, status: str) -> int:
+    """The signed 64-bit leaf Postgres computes for `medicines.sync_leaf`."""
+    digest = hashlib.md5(f"{batch_id}:{status}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def _text(value: bytes | int | None) -> str:
+    return value.decode("utf-8", errors="replace") if isinstance(value, bytes) else ""
+
+
+def _batched(items: Sequence, size: int) -> Iterator[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+Digests = dict[str, tuple[int, int]]
+
+
+def rollup(buckets: Digests, depth: int, prefixes: Iterable[str] = ("",)) -> Digests:
+    """(count, digest) of each `depth`-digit prefix of the buckets under `prefixes`."""
+    parents = set(prefixes)
+    result: Digests = {}
+    for bucket, (count, digest) in buckets.items():
+        if bucket[: depth - 1] not in parents:
+            continue
+        total, combined = result.get(bucket[:depth], (0, 0))
+        result[bucket[:depth]] = (total + count, combined ^ digest)
+    return result
+
+
+# --------------------------- Chain Status Index --------------------------- #
+
+
+class ChainStatusIndex:
+    """
+    Local mirror of the status every DrugBatchContract batch has on chain, in the
+    shape Supabase stores it, with per-bucket digests.
+
+    `track` reads the current state of given apps; `sync` then applies the global
+    state changes of DrugBatchContract calls in every block since, picking up new
+    registrations as they happen. As in the app registry, the latest registration
+    of a batch ID wins.
+
+    Any app can set a `reg_status` key, so only instances are mirrored: apps whose
+    approval program hash is in `program_hashes` (by default, the hash of the
+    compiled `DrugBatchContract`) and, when `creators` is given, that one of them
+    created. Apps created in a synced block are recognised from their creation,
+    and any other app is looked up on algod once.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_INDEX_PATH,
+        *,
+        program_hashes: Iterable[str] | None = None,
+        creators: Iterable[str] | None = None,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.program_hashes = (
+            frozenset(program_hashes)
+            if program_hashes is not None
+            else frozenset({approval_hash(APPROVAL_PROGRAM_PATH.read_bytes())})
+        )
+        self.creators = frozenset(creators) if creators is not None else None
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # Apps looked up on algod and found not to be instances
+        self._not_instances: set[int] = set()
+
+    def __enter__(self) -> "ChainStatusIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ------------------------------- Lookups ------------------------------- #
+
+    def synced_round(self) -> int | None:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'synced_round'").fetchone()
+        return row[0] if row else None
+
+    def digests(self) -> Digests:
+        """(count, digest) of every non-empty bucket."""
+        with self._lock:
+            return {
+                bucket: (count, digest)
+                for bucket, count, digest in self._db.execute(
+                    "SELECT bucket, count, digest FROM buckets WHERE count > 0"
+                )
+            }
+
+    def statuses(self, buckets: Iterable[str]) -> dict[str, tuple[int, str]]:
+        """Batch ID → (app ID, status) of every batch in the given buckets."""
+        results: dict[str, tuple[int, str]] = {}
+        with self._lock:
+            for chunk in _batched(list(buckets), 500):
+                rows = self._db.execute(
+                    "SELECT batch_id, app_id, status FROM apps"
+                    f" WHERE bucket IN ({', '.join('?' * len(chunk))})",
+                    tuple(chunk),
+                )
+                results.update((batch_id, (app_id, status)) for batch_id, app_id, status in rows)
+        return results
+
+    def instances(self, algod: AlgodClient, app_ids: Iterable[int]) -> set[int]:
+        """The DrugBatchContract instances among `app_ids`."""
+        with self._lock:
+            return {app_id for app_id in app_ids if self._is_instance(app_id, algod)}
+
+    def _recognised(self, program: bytes, creator: str) -> bool:
+        return approval_hash(program) in self.program_hashes and (
+            self.creators is None or creator in self.creators
+        )
+
+    def _is_instance(self, app_id: int, algod: AlgodClient | None) -> bool:
+        # Only instances are ever mirrored
+        if self._db.execute("SELECT 1 FROM apps WHERE app_id = ?", (app_id,)).fetchone():
+            return True
+        if algod is None or app_id in self._not_instances:
+            return False
+        try:
+            params = algod.application_info(app_id)["params"]  # type: ignore[index]
+        except AlgodHTTPError as e:
+            logger.warning(f"Cannot recognise app {app_id}, it may have been deleted: {e}")
+            return False
+        if not self._recognised(base64.b64decode(params["approval-program"]), params["creator"]):
+            self._not_instances.add(app_id)
+            return False
+        return True
+
+    # ------------------------------- Updates ------------------------------- #
+
+    def track(self, algod: AlgodClient, app_ids: Iterable[int]) -> int:
+        """Records the current state of apps; returns how many hold a batch."""
+        app_ids = set(app_ids)
+        instances = self.instances(algod, app_ids)
+        for app_id in sorted(app_ids - instances):
+            logger.warning(f"Not tracking app {app_id}, it is not a DrugBatchContract instance")
+        app_ids = instances
+        with BatchStateReader(algod, cache_size=0) as reader:
+            round_ = reader.last_round()
+            states = reader.get_many(app_ids)
+        with self._lock, self._db:
+            for app_id, state in states.items():
+                self._put_state(app_id, state)
+            # Blocks since an earlier sync are replayed over these states, which
+            # ends on the same values as deltas set keys outright
+            self._db.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('synced_round', ?)", (round_,)
+            )
+        return sum(1 for state in states.values() if state.get("batch_id"))
+
+    def put(self, app_id: int, state: "GlobalStateValue") -> None:
+        """Records an instance's state as read from algod."""
+        with self._lock, self._db:
+            self._put_state(app_id, state)
+
+    def _put_state(self, app_id: int, state: "GlobalStateValue") -> None:
+        self._put(
+            app_id,
+            state.get("batch_id") or None,
+            state.get("reg_status", "pending"),
+            state.get("is_authentic", 1),
+        )
+
+    def _put(self, app_id: int, batch_id: str | None, reg_status: str, is_authentic: int) -> None:
+        status = supabase_status(reg_status, is_authentic)
+        leaf = leaf_hash(batch_id, status) if batch_id else 0
+        bucket = bucket_of(batch_id) if batch_id else None
+        previous = self._db.execute(
+            "SELECT batch_id, bucket, leaf FROM apps WHERE app_id = ?", (app_id,)
+        ).fetchone()
+        if previous == (batch_id, bucket, leaf):
+            self._db.execute(
+                "UPDATE apps SET reg_status = ?, is_authentic = ? WHERE app_id = ?",
+                (reg_status, is_authentic, app_id),
+            )
+            return
+        if previous is not None and previous[1] is not None:
+            self._move(previous[1], -1, previous[2])
+        if batch_id:
+            # A batch registered again in another app leaves the app it was in
+            superseded = self._db.execute(
+                "SELECT app_id, bucket, leaf FROM apps WHERE batch_id = ? AND app_id != ?",
+                (batch_id, app_id),
+            ).fetchone()
+            if superseded is not None:
+                self._move(superseded[1], -1, superseded[2])
+                self._db.execute(
+                    "UPDATE apps SET batch_id = NULL, bucket = NULL, leaf = 0 WHERE app_id = ?",
+                    (superseded[0],),
+                )
+            self._move(bucket, 1, leaf)
+        self._db.execute(
+            "INSERT OR REPLACE INTO apps VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (app_id, batch_id, reg_status, is_authentic, status, bucket, leaf),
+        )
+
+    def _move(self, bucket: str, count: int, leaf: int) -> None:
+        # SQLite has no XOR operator, digests are updated here
+        row = self._db.execute(
+            "SELECT count, digest FROM buckets WHERE bucket = ?", (bucket,)
+        ).fetchone()
+        total, digest = row if row else (0, 0)
+        self._db.execute(
+            "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)", (bucket, total + count, digest ^ leaf)
+        )
+
+    def _drop(self, app_id: int) -> None:
+        row = self._db.execute("SELECT bucket, leaf FROM apps WHERE app_id = ?", (app_id,)).fetchone()
+        if row is not None and row[0] is not None:
+            self._move(row[0], -1, row[1])
+        self._db.execute("DELETE FROM apps WHERE app_id = ?", (app_id,))
+
+    def apply_block(self, round_: int, block: dict, algod: AlgodClient | None = None) -> None:
+        """
+        Applies the batch registrations and status changes of instances in a block.
+        Pass `algod` to recognise instances that were not created in synced blocks.
+        """
+        with self._lock, self._db:
+            for _, app_id, txn, apply_data in app_calls(block):
+                if "apap" in txn:
+                    if self._recognised(txn["apap"], encode_address(txn["snd"])):
+                        if "apid" not in txn:
+                            self._put(app_id, None, "pending", 1)
+                    elif "apid" not in txn or txn.get("apan") == _UPDATE_APPLICATION:
+                        # Created as, or updated into, something else
+                        self._drop(app_id)
+                        self._not_instances.add(app_id)
+                        continue
+                delta = state_delta(apply_data)
+                if not any(key in delta for key in _WATCHED_KEYS):
+                    continue
+                if not self._is_instance(app_id, algod):
+                    continue
+                row = self._db.execute(
+                    "SELECT batch_id, reg_status, is_authentic FROM apps WHERE app_id = ?",
+                    (app_id,),
+                ).fetchone()
+                # An app not seen before starts from the state its constructor sets
+                batch_id, reg_status, is_authentic = row or (None, "pending", 1)
+                if b"batch_id" in delta:
+                    batch_id = _text(delta[b"batch_id"]) or None
+                if b"reg_status" in delta:
+                    reg_status = _text(delta[b"reg_status"])
+                if b"is_authentic" in delta:
+                    is_authentic = delta[b"is_authentic"] or 0
+                self._put(app_id, batch_id, reg_status, typing.cast(int, is_authentic))
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('synced_round', ?)", (round_,)
+            )
+
+    def sync(self, algod: AlgodClient) -> int:
+        """Applies every block since the last sync; returns the round synced to."""
+        last_round = int(algod.status()["last-round"])  # type: ignore[index]
+        synced_round = self.synced_round()
+        if synced_round is None:
+            # Nothing is tracked yet, batches registered from now on are picked up
+            with self._lock, self._db:
+                self._db.execute("INSERT INTO meta VALUES ('synced_round', ?)", (last_round,))
+            return last_round
+        blocks = AlgodBlocks(algod)
+        for round_ in range(synced_round + 1, last_round + 1):
+            raw = blocks.raw_block(round_)
+            response = msgpack.unpackb(raw, raw=False, unicode_errors="surrogateescape")
+            self.apply_block(round_, response["block"], algod)
+        if last_round > synced_round:
+            logger.debug(f"Chain status index synced rounds {synced_round + 1}-{last_round}")
+        return last_round
+
+
+# ----------------------------- Supabase Side ----------------------------- #
+
+
+class SupabaseStatuses:
+    """Digests, rows and repairs of `public.medicines` over a psycopg connection."""
+
+    def __init__(self, conn: "psycopg.Connection"):
+        self.conn = conn
+
+    def digests(self, depth: int, prefixes: Sequence[str] = ("",)) -> Digests:
+        """(count, digest) of each `depth`-digit bucket prefix under `prefixes`."""
+        # One index range scan per parent prefix; the "C" collation of sync_bucket
+        # orders hex digits so that everything under a prefix sorts below prefix || 'g'
+        rows = self.conn.execute(
+            """
+            SELECT left(m.sync_bucket, %(depth)s), count(*), bit_xor(m.sync_leaf)
+            FROM unnest(%(prefixes)s::text[]) AS p(prefix)
+            JOIN public.medicines AS m
+              ON m.sync_bucket >= p.prefix AND m.sync_bucket < p.prefix || 'g'
+            GROUP BY 1
+            """,
+            {"depth": depth, "prefixes": list(prefixes)},
+        )
+        return {prefix: (count, digest) for prefix, count, digest in rows}
+
+    def statuses(self, buckets: Iterable[str]) -> dict[str, tuple[str, int | None]]:
+        """Batch ID → (status, app ID) of every medicine in the given buckets."""
+        results: dict[str, tuple[str, int | None]] = {}
+        for chunk in _batched(list(buckets), DEFAULT_BATCH_SIZE):
+            rows = self.conn.execute(
+                "SELECT batch_id, status, blockchain_app_id FROM public.medicines"
+                " WHERE sync_bucket = ANY(%s)",
+                (list(chunk),),
+            )
+            for batch_id, status, app_id in rows:
+                results[batch_id] = (status, int(app_id) if app_id and app_id.isdigit() else None)
+        return results
+
+    def upsert(self, batches: Sequence[tuple[int, "GlobalStateValue"]]) -> None:
+        """
+        Sets the status of medicines to the one their chain state holds, inserting
+        the batches Supabase has no row for; only `status` of existing rows changes,
+        and only of rows linked to the app the state was read from.
+        """
+        columns: list[list] = [[] for _ in range(8)]
+        for app_id, state in batches:
+            values = (
+                state["batch_id"], state.get("drug_name", ""), state.get("manufacturer", ""),
+                state.get("manufacture_date"), state.get("expiry_date"),
+                state.get("quantity", 0), state.get("producer", ""),
+                supabase_status(state.get("reg_status", "pending"), state.get("is_authentic", 1)),
+            )
+            for column, value in zip(columns, values):
+                column.append(value)
+        app_ids = [str(app_id) for app_id, _ in batches]
+        with self.conn.transaction():
+            self.conn.execute(
+                """
+                INSERT INTO public.medicines (
+                  batch_id, drug_name, manufacturer, manufacture_date, expiry_date,
+                  quantity, producer_wallet, status, blockchain_app_id
+                )
+                SELECT * FROM unnest(
+                  %s::text[], %s::text[], %s::text[], %s::date[], %s::date[],
+                  %s::integer[], %s::text[], %s::text[], %s::text[]
+                )
+                ON CONFLICT (batch_id) DO UPDATE SET status = EXCLUDED.status
+                WHERE medicines.status IS DISTINCT FROM EXCLUDED.status
+                  AND medicines.blockchain_app_id = EXCLUDED.blockchain_app_id
+                """,
+                (*columns, app_ids),
+            )
+
+
+# ------------------------------ Reconciling ------------------------------ #
+
+
+class ReconcileReport(typing.NamedTuple):
+    # Prefixes compared at each depth, from one hex digit down to whole buckets
+    compared: tuple[int, ...]
+    diverged_buckets: int
+    repaired: list[str]
+    # Medicines with no DrugBatchContract app holding their batch ID
+    missing_on_chain: list[str]
+    # Medicines whose `blockchain_app_id` is unset or not an instance, which are
+    # never repaired from another app
+    unlinked: list[str]
+
+
+def reconcile(
+    index: ChainStatusIndex,
+    supabase: SupabaseStatuses,
+    reader: BatchStateReader,
+    *,
+    repair: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ReconcileReport:
+    """
+    Finds the batches whose `medicines.status` differs from their chain state and,
+    with `repair`, upserts the chain's status into Supabase in batches.
+
+    Chain state is re-read from algod for every diverging batch before it is
+    repaired, so a mirror that lags the chain never overwrites Supabase; the mirror
+    is corrected from the same reads. Medicines whose `blockchain_app_id` the
+    mirror does not know yet are looked up the same way, so an empty mirror fills
+    itself on the first run.
+
+    An existing medicine is only repaired from the app its `blockchain_app_id`
+    names, and only once that app is recognised as a DrugBatchContract instance;
+    the mirror's app for a batch ID is used only to insert medicines Supabase has
+    no row for.
+    """
+    chain_buckets = index.digests()
+    prefixes: list[str] = [""]
+    compared: list[int] = []
+    for depth in range(1, BUCKET_DEPTH + 1):
+        chain = rollup(chain_buckets, depth, prefixes)
+        remote = supabase.digests(depth, prefixes)
+        candidates = chain.keys() | remote.keys()
+        compared.append(len(candidates))
+        prefixes = sorted(prefix for prefix in candidates if chain.get(prefix) != remote.get(prefix))
+        if not prefixes:
+            break
+
+    chain_rows = index.statuses(prefixes)
+    remote_rows = supabase.statuses(prefixes)
+    suspects: dict[int, str] = {}
+    missing_on_chain: list[str] = []
+    unlinked: list[str] = []
+    for batch_id in chain_rows.keys() | remote_rows.keys():
+        app_id, chain_status = chain_rows.get(batch_id, (None, None))
+        status, remote_app_id = remote_rows.get(batch_id, (None, None))
+        if chain_status == status:
+            continue
+        if batch_id in remote_rows:
+            if remote_app_id is None:
+                unlinked.append(batch_id)
+                continue
+            app_id = remote_app_id
+        if app_id is None:
+            missing_on_chain.append(batch_id)
+        else:
+            suspects[app_id] = batch_id
+
+    instances = index.instances(reader.algod, suspects)
+    for app_id in suspects.keys() - instances:
+        unlinked.append(suspects.pop(app_id))
+    repairs: list[tuple[int, GlobalStateValue]] = []
+    states = reader.get_many(suspects) if suspects else {}
+    for app_id, batch_id in suspects.items():
+        state = states.get(app_id)
+        if state is not None:
+            index.put(app_id, state)
+        if state is None or state.get("batch_id") != batch_id:
+            if batch_id in remote_rows:
+                missing_on_chain.append(batch_id)
+            continue
+        status = supabase_status(state.get("reg_status", "pending"), state.get("is_authentic", 1))
+        if remote_rows.get(batch_id, (None,))[0] != status:
+            repairs.append((app_id, state))
+
+    if repair:
+        for chunk in _batched(repairs, batch_size):
+            supabase.upsert(chunk)
+    report = ReconcileReport(
+        compared=tuple(compared),
+        diverged_buckets=len(prefixes),
+        repaired=[state["batch_id"] for _, state in repairs],
+        missing_on_chain=sorted(missing_on_chain),
+        unlinked=sorted(unlinked),
+    )
+    logger.info(
+        f"Compared {' / '.join(map(str, report.compared))} prefixes, "
+        f"{report.diverged_buckets} buckets diverged, "
+        f"{len(report.repaired)} batches {'repaired' if repair else 'to repair'}, "
+        f"{len(report.missing_on_chain)} missing on chain, {len(report.unlinked)} unlinked"
+    )
+    return report
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+def main() -> None:
+    import psycopg
+
+    parser = argparse.ArgumentParser(
+        description="Reconcile Supabase medicine statuses with DrugBatchContract state"
+    )
+    parser.add_argument("--index", type=Path, default=DEFAULT_INDEX_PATH)
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Supabase Postgres")
+    parser.add_argument("--app-id", type=int, action="append", dest="app_ids", default=[])
+    parser.add_argument(
+        "--creator", action="append", dest="creators", help="only mirror apps these created"
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Report without repairing")
+    args = parser.parse_args()
+    if not args.dsn:
+        raise Exception("Set DATABASE_URL or pass --dsn")
+
+    algod = algokit_utils.AlgorandClient.from_environment().client.algod
+    with (
+        ChainStatusIndex(args.index, creators=args.creators) as index,
+        BatchStateReader(algod, cache_size=0) as reader,
+        psycopg.connect(args.dsn, autocommit=True) as conn,
+    ):
+        if args.app_ids:
+            index.track(algod, args.app_ids)
+        index.sync(algod)
+        report = reconcile(
+            index,
+            SupabaseStatuses(conn),
+            reader,
+            repair=not args.dry_run,
+            batch_size=args.batch_size,
+        )
+    for batch_id in report.missing_on_chain:
+        logger.warning(f"Batch {batch_id} has no DrugBatchContract app holding it")
+    for batch_id in report.unlinked:
+        logger.warning(f"Medicine {batch_id} is not linked to a DrugBatchContract app")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,362 @@
+import dataclasses
+import logging
+import threading
+import time
+import typing
+from collections import deque
+from collections.abc import Iterable
+
+import algokit_utils
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        DrugBatchContractClient,
+        DrugBatchContractFactory,
+        RegisterArgs,
+    )
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+# Minimum balance of an app account, so it can hold boxes and receive assets
+DEFAULT_FUNDING = algokit_utils.AlgoAmount.from_micro_algo(100_000)
+# Fee cap of a register call that also moves the batch in the registry
+REGISTERED_MAX_FEE = algokit_utils.AlgoAmount.from_micro_algo(2_000)
+# Errors of a register call that was refused before reaching a block: its
+# simulation failed, or algod rejected it (HTTP 400)
+_REJECTED = ("logic eval error", "rejected by logic")
+# Longest validity window of a transaction, after which a register that was sent
+# but not seen confirmed can no longer land
+MAX_VALIDITY_ROUNDS = 1000
+# Box minimum balance of a BatchRegistryContract (2,500 plus 400 per byte of key and
+# value): a position box per indexed app, and a page box per 128 apps of a status
+_REGISTRY_POSITION_MBR = 2_500 + 400 * (9 + 20)
+_REGISTRY_PAGE_MBR = 2_500 + 400 * (17 + 128 * 8)
+# Spare balance the registry keeps per app about to be indexed, plus one partly
+# filled page for each status an indexed app can move to
+REGISTRY_MBR_PER_APP = _REGISTRY_POSITION_MBR + _REGISTRY_PAGE_MBR // 128
+REGISTRY_MBR_RESERVE = 3 * _REGISTRY_PAGE_MBR
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolMetrics:
+    """A snapshot of the pool: its size, lifetime counters and recent refill rate."""
+
+    ready: int
+    target_size: int
+    created: int
+    claimed: int
+    # Claims that found the pool empty and waited for a refill
+    waited_claims: int
+    refills: int
+    # Apps created and funded per second during the last refill
+    refill_rate: float
+    last_refill_seconds: float
+
+
+class AppPool:
+    """
+    Keeps `target_size` empty, funded DrugBatchContract apps ready, so that a new
+    batch is registered with a single `register` call on the producer's critical
+    path instead of a create, a funding payment and then `register`.
+
+    A background thread refills the pool whenever it drops below `low_water`: it
+    creates up to 16 apps per group, then funds them in a second group. Apps are
+    created by `creator`, which is the contract's admin; a producer claims one by
+    registering in it, since an unregistered app accepts any producer.
+
+    Ready apps live in memory. Pass the IDs `ready_app_ids()` returned to a new
+    pool's `ready` to carry them over a restart instead of leaving them unused.
+    Apps whose funding or attaching failed are kept and finished by the next
+    refill before it creates any more; their IDs are logged, so they can be passed
+    to `ready` once finished by hand if the process stops first.
+
+    With `registry_app_id`, every new app is pointed at that BatchRegistryContract
+    before it is pooled, so registering in it also indexes the batch as pending.
+    The registry pays for the boxes that index batches, so every refill first tops
+    its account up to cover `target_size` more batches; `creator` pays for it.
+
+    An app whose `register` was refused goes back to the pool. One whose register
+    failed in any other way (e.g. a confirmation timeout) may have been registered
+    after all, so it is set aside until that register's validity window has
+    passed; a refill then returns it to the pool only if it has no producer.
+    """
+
+    def __init__(
+        self,
+        factory: "DrugBatchContractFactory",
+        creator: str,
+        *,
+        target_size: int = 32,
+        low_water: int | None = None,
+        funding: algokit_utils.AlgoAmount = DEFAULT_FUNDING,
+        ready: Iterable[int] = (),
+        registry_app_id: int | None = None,
+    ):
+        self.factory = factory
+        self.algorand = factory.algorand
+        self.creator = creator
+        self.target_size = target_size
+        self.low_water = target_size // 2 if low_water is None else low_water
+        self.funding = funding
+        self.registry_app_id = registry_app_id
+        self._ready: deque[int] = deque(ready)
+        # Apps of an interrupted refill, created but not funded, or funded but not attached
+        self._unfunded: list[int] = []
+        self._unattached: list[int] = []
+        # Apps whose register may have landed, by the round it was sent at the latest
+        self._quarantined: dict[int, int] = {}
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._created = self._claimed = self._waited = self._refills = 0
+        self._refill_rate = self._last_refill_seconds = 0.0
+        self._last_error: Exception | None = None
+
+    def start(self) -> None:
+        """Starts refilling in the background."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refill_loop, name="app-pool", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops refilling; a refill in progress completes first."""
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "AppPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    # ------------------------------- Claiming ------------------------------- #
+
+    def claim(self, timeout: float | None = None) -> int:
+        """Takes a ready app out of the pool, waiting up to `timeout` for a refill."""
+        with self._condition:
+            if not self._ready:
+                self._waited += 1
+                self._condition.notify_all()
+                if not self._condition.wait_for(lambda: self._ready, timeout):
+                    raise Exception(
+                        f"No pooled app became ready within {timeout}s"
+                        + (f", last refill failed: {self._last_error}" if self._last_error else "")
+                    )
+            app_id = self._ready.popleft()
+            self._claimed += 1
+            if len(self._ready) < self.low_water:
+                self._condition.notify_all()
+        return app_id
+
+    def release(self, app_id: int) -> None:
+        """Returns a claimed app that is still unregistered to the pool."""
+        with self._condition:
+            self._ready.appendleft(app_id)
+            self._condition.notify_all()
+
+    def register(
+        self,
+        args: "RegisterArgs",
+        *,
+        sender: str,
+        signer: algokit_utils.TransactionSigner | None = None,
+        timeout: float | None = None,
+    ) -> "DrugBatchContractClient":
+        """Registers a batch in a pooled app with a single call; returns its client."""
+        from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+            DrugBatchContractClient,
+        )
+
+        app_id = self.claim(timeout)
+        client = DrugBatchContractClient(
+            algorand=self.algorand, app_id=app_id, default_sender=sender, default_signer=signer
+        )
+        try:
+            if self.registry_app_id is None:
+                client.send.register(args=args)
+            else:
+                # The registry's inner call is paid for out of the register fee
+                client.send.register(
+                    args=args,
+                    params=algokit_utils.CommonAppCallParams(max_fee=REGISTERED_MAX_FEE),
+                    send_params=algokit_utils.SendParams(cover_app_call_inner_transaction_fees=True),
+                )
+        except Exception as e:
+            if (isinstance(e, AlgodHTTPError) and e.code == 400) or any(
+                reason in str(e) for reason in _REJECTED
+            ):
+                # A refused call leaves the app unregistered, so it can be reused
+                self.release(app_id)
+            else:
+                status = self.algorand.client.algod.status()
+                last_round = int(status["last-round"])  # type: ignore[index]
+                logger.warning(
+                    f"Setting app {app_id} aside until round {last_round + MAX_VALIDITY_ROUNDS},"
+                    f" its register may have landed: {e}"
+                )
+                with self._condition:
+                    self._quarantined[app_id] = last_round
+            raise
+        return client
+
+    def ready_app_ids(self) -> list[int]:
+        with self._condition:
+            return list(self._ready)
+
+    def metrics(self) -> PoolMetrics:
+        with self._condition:
+            return PoolMetrics(
+                ready=len(self._ready),
+                target_size=self.target_size,
+                created=self._created,
+                claimed=self._claimed,
+                waited_claims=self._waited,
+                refills=self._refills,
+                refill_rate=self._refill_rate,
+                last_refill_seconds=self._last_refill_seconds,
+            )
+
+    # ------------------------------- Refilling ------------------------------- #
+
+    def refill(self) -> int:
+        """Creates and funds apps until the pool is at its target size; returns how many."""
+        self._recheck()
+        if self.registry_app_id is not None:
+            self._top_up_registry()
+        with self._condition:
+            missing = self.target_size - len(self._ready)
+        started = time.monotonic()
+        added = 0
+        while added < missing and not self._stop.is_set():
+            if not self._unfunded and not self._unattached:
+                self._unfunded = self._create(min(MAX_GROUP_SIZE, missing - added))
+                with self._condition:
+                    self._created += len(self._unfunded)
+            try:
+                if self._unfunded:
+                    self._fund(self._unfunded)
+                    self._unattached, self._unfunded = self._unfunded, []
+                self._attach(self._unattached)
+            except Exception:
+                logger.warning(
+                    f"Apps {self._unfunded or self._unattached} are not ready yet, "
+                    "the next refill finishes them"
+                )
+                raise
+            app_ids, self._unattached = self._unattached, []
+            added += len(app_ids)
+            with self._condition:
+                self._ready.extend(app_ids)
+                self._condition.notify_all()
+        if added:
+            elapsed = time.monotonic() - started
+            with self._condition:
+                self._refills += 1
+                self._last_refill_seconds = elapsed
+                self._refill_rate = added / elapsed if elapsed else 0.0
+            logger.info(f"Added {added} apps to the pool in {elapsed:.1f}s")
+        return added
+
+    def _recheck(self) -> None:
+        """Returns set-aside apps whose register can no longer land and did not."""
+        with self._condition:
+            if not self._quarantined:
+                return
+            quarantined = dict(self._quarantined)
+        last_round = int(self.algorand.client.algod.status()["last-round"])  # type: ignore[index]
+        for app_id, sent_round in quarantined.items():
+            if last_round <= sent_round + MAX_VALIDITY_ROUNDS:
+                continue
+            producer = self.algorand.app.get_global_state(app_id).get("producer")
+            with self._condition:
+                del self._quarantined[app_id]
+            if producer is None or not any(producer.value_raw or b""):
+                self.release(app_id)
+            else:
+                logger.info(f"App {app_id} was registered after all, dropping it from the pool")
+
+    def _top_up_registry(self) -> None:
+        """Funds the registry's box minimum balance for the next `target_size` batches."""
+        address = get_application_address(self.registry_app_id)  # type: ignore[arg-type]
+        info = self.algorand.client.algod.account_info(address)
+        spare = int(info["amount"]) - int(info["min-balance"])  # type: ignore[index]
+        needed = self.target_size * REGISTRY_MBR_PER_APP + REGISTRY_MBR_RESERVE
+        if spare >= needed:
+            return
+        self.algorand.send.payment(
+            algokit_utils.PaymentParams(
+                sender=self.creator,
+                receiver=address,
+                amount=algokit_utils.AlgoAmount.from_micro_algo(needed - spare),
+            )
+        )
+        logger.info(f"Topped registry {self.registry_app_id} up by {needed - spare} microAlgo")
+
+    def _create(self, count: int) -> list[int]:
+        composer = self.algorand.new_group()
+        for i in range(count):
+            composer.add_app_create(
+                self.factory.params.create.bare(
+                    params=algokit_utils.CommonAppCallCreateParams(
+                        sender=self.creator,
+                        # Otherwise identical creations would share a transaction ID
+                        note=f"app-pool:{time.time_ns()}:{i}".encode(),
+                    )
+                )
+            )
+        result = composer.send()
+        return [int(confirmation["application-index"]) for confirmation in result.confirmations]  # type: ignore[index]
+
+    def _fund(self, app_ids: list[int]) -> None:
+        if not self.funding.micro_algo:
+            return
+        composer = self.algorand.new_group()
+        for app_id in app_ids:
+            composer.add_payment(
+                algokit_utils.PaymentParams(
+                    sender=self.creator,
+                    receiver=get_application_address(app_id),
+                    amount=self.funding,
+                )
+            )
+        composer.send()
+
+    def _attach(self, app_ids: list[int]) -> None:
+        if self.registry_app_id is None:
+            return
+        composer = self.algorand.new_group()
+        for app_id in app_ids:
+            composer.add_app_call_method_call(
+                self.factory.get_app_client_by_id(app_id).params.set_registry(
+                    args=(self.registry_app_id,),
+                    params=algokit_utils.CommonAppCallParams(sender=self.creator),
+                )
+            )
+        composer.send()
+
+    def _refill_loop(self) -> None:
+        while not self._stop.is_set():
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stop.is_set() or len(self._ready) < self.low_water
+                    or (not self._ready and self.target_size > 0)
+                )
+            if self._stop.is_set():
+                return
+            try:
+                self.refill()
+                self._last_error = None
+            except Exception as e:
+                self._last_error = e
+                logger.exception("App pool refill failed, retrying")
+                self._stop.wait(1)
@@ -0,0 +1,392 @@
+import base64
+import json
+import logging
+import os
+import sqlite3
+import threading
+import typing
+from collections.abc import Iterable
+from pathlib import Path
+
+import algokit_utils
+import msgpack
+from algosdk.encoding import encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.algo_healx.scanner import (
+    APPROVAL_PROGRAM_PATH,
+    AlgodBlocks,
+    app_calls,
+    approval_hash,
+    decode_call,
+)
+from smart_contracts.algo_healx.state_reader import BatchStateReader
+from smart_contracts.artifacts.algo_healx.drug_batch_contract_codec import REGISTER_SELECTOR
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        DrugBatchContractClient,
+    )
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_PATH = Path(os.environ.get("APP_REGISTRY_PATH", ".algokit/app_registry.sqlite"))
+_DEPLOY_NOTE_PREFIX = f"{algokit_utils.APP_DEPLOY_NOTE_DAPP}:j".encode()
+_UPDATE_APPLICATION = 4
+_DELETE_APPLICATION = 5
+# Most blocks `sync` catches up on; non-archival nodes only keep about the last
+# 1000, so a creator further behind is tracked again instead
+MAX_SYNC_ROUNDS = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS apps (
+    creator TEXT NOT NULL,
+    name TEXT NOT NULL,
+    app_id INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    deletable INTEGER,
+    updatable INTEGER,
+    created_round INTEGER NOT NULL,
+    updated_round INTEGER NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (creator, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS apps_app_id ON apps (app_id);
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id TEXT PRIMARY KEY,
+    app_id INTEGER NOT NULL,
+    registered_round INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS instances (
+    app_id INTEGER PRIMARY KEY,
+    creator TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS creators (
+    creator TEXT PRIMARY KEY,
+    synced_round INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class AppRegistry:
+    """
+    Persistent name → app ID and batch ID → app ID index for DrugBatchContract apps,
+    so that resolving an app is one primary-key lookup however many apps its
+    creator has deployed.
+
+    `track` builds a creator's entries once, with the indexer scan algokit's
+    `get_creator_apps_by_name` does; `sync` then keeps every tracked creator up to
+    date from the blocks since, picking up ARC-2 deployments (the `ALGOKIT_DEPLOYER`
+    creation and update notes), deletions and `register` calls. A creator more than
+    `MAX_SYNC_ROUNDS` behind is tracked again rather than caught up. `lookup` returns an
+    `ApplicationLookup` holding just the requested app, which algokit accepts as
+    `app_lookup_cache` and `existing_deployments` in place of its own scan.
+
+    Any app can send a `register` call, so batches are only indexed from instances:
+    apps created by a tracked creator with an approval program hash in
+    `program_hashes` (by default, the hash of the compiled `DrugBatchContract`).
+    `track` finds them among the creator's created apps on algod, unnamed pooled
+    apps included.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_REGISTRY_PATH,
+        *,
+        program_hashes: Iterable[str] | None = None,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.program_hashes = (
+            frozenset(program_hashes)
+            if program_hashes is not None
+            else frozenset({approval_hash(APPROVAL_PROGRAM_PATH.read_bytes())})
+        )
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # Apps looked up on algod and found not to be instances
+        self._not_instances: set[int] = set()
+
+    def __enter__(self) -> "AppRegistry":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ------------------------------- Lookups ------------------------------- #
+
+    def app_id(self, creator: str, name: str) -> int | None:
+        """The app the creator last deployed under `name`, unless it was deleted."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT app_id FROM apps WHERE creator = ? AND name = ? AND NOT deleted",
+                (creator, name),
+            ).fetchone()
+        return row[0] if row else None
+
+    def batch_app_id(self, batch_id: str) -> int | None:
+        """The app a batch was registered in."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT app_id FROM batches WHERE batch_id = ?", (batch_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def lookup(self, creator: str, name: str) -> algokit_utils.ApplicationLookup:
+        """An algokit lookup cache with only the creator's app called `name`, if any."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT app_id, version, deletable, updatable, created_round, updated_round,"
+                " deleted FROM apps WHERE creator = ? AND name = ?",
+                (creator, name),
+            ).fetchone()
+        lookup = algokit_utils.ApplicationLookup(creator=creator)
+        if row is not None:
+            app_id, version, deletable, updatable, created, updated, deleted = row
+            lookup.apps[name] = algokit_utils.ApplicationMetaData(
+                reference=algokit_utils.ApplicationReference(
+                    app_id=app_id, app_address=get_application_address(app_id)
+                ),
+                deploy_metadata=algokit_utils.AppDeploymentMetaData(
+                    name=name,
+                    version=version,
+                    deletable=None if deletable is None else bool(deletable),
+                    updatable=None if updatable is None else bool(updatable),
+                ),
+                created_round=created,
+                updated_round=updated,
+                deleted=bool(deleted),
+            )
+        return lookup
+
+    def get_client(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        creator: str,
+        name: str,
+        default_sender: str | None = None,
+    ) -> "DrugBatchContractClient":
+        """`DrugBatchContractClient.from_creator_and_name`, resolved from the registry."""
+        from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+            DrugBatchContractClient,
+        )
+
+        self.track(algorand, creator)
+        if self.app_id(creator, name) is None:
+            self.sync(algorand)
+        return DrugBatchContractClient.from_creator_and_name(
+            creator_address=creator,
+            app_name=name,
+            algorand=algorand,
+            default_sender=default_sender,
+            app_lookup_cache=self.lookup(creator, name),
+        )
+
+    # ------------------------------- Updates ------------------------------- #
+
+    def track(
+        self, algorand: algokit_utils.AlgorandClient, creator: str, *, refresh: bool = False
+    ) -> None:
+        """Indexes a creator's existing apps and batches, once unless `refresh` is set."""
+        with self._lock:
+            if not refresh and self._db.execute(
+                "SELECT 1 FROM creators WHERE creator = ?", (creator,)
+            ).fetchone():
+                return
+        algod = algorand.client.algod
+        # Anything created after this round is picked up by `sync`
+        synced_round = int(algod.status()["last-round"])  # type: ignore[index]
+        existing = algorand.app_deployer.get_creator_apps_by_name(
+            creator_address=creator, ignore_cache=True
+        )
+        account = typing.cast(dict, algod.account_info(creator))
+        created_apps = account.get("created-apps", [])
+        instances = [
+            app["id"]
+            for app in created_apps
+            if approval_hash(base64.b64decode(app["params"]["approval-program"]))
+            in self.program_hashes
+        ]
+        with BatchStateReader(algorand.client.algod, cache_size=0) as reader:
+            states = reader.get_many(instances)
+
+        with self._lock, self._db:
+            for app in existing.apps.values():
+                self._insert_app(creator, app)
+            self._db.executemany(
+                "INSERT OR IGNORE INTO instances VALUES (?, ?)",
+                [(app_id, creator) for app_id in instances],
+            )
+            # The registration round is not known without the indexer, the
+            # round the batch is known to exist at is recorded instead
+            self._db.executemany(
+                "INSERT INTO batches VALUES (?, ?, ?) ON CONFLICT (batch_id) DO UPDATE"
+                " SET app_id = excluded.app_id, registered_round = excluded.registered_round"
+                " WHERE app_id != excluded.app_id",
+                [
+                    (state["batch_id"], app_id, synced_round)
+                    for app_id, state in states.items()
+                    if state.get("batch_id")
+                ],
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO creators VALUES (?, ?)", (creator, synced_round)
+            )
+        logger.info(f"Indexed {len(existing.apps)} apps created by {creator}")
+
+    def record_deployment(self, creator: str, app: algokit_utils.ApplicationMetaData) -> None:
+        """Records an app deployed or updated under a name, e.g. from a deploy result."""
+        with self._lock, self._db:
+            self._insert_app(creator, app)
+
+    def _insert_app(self, creator: str, app: algokit_utils.ApplicationMetaData) -> None:
+        metadata = app.deploy_metadata
+        self._db.execute(
+            "INSERT OR REPLACE INTO apps VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                creator, metadata.name, app.app_id, metadata.version, metadata.deletable,
+                metadata.updatable, app.created_round, app.updated_round, app.deleted,
+            ),
+        )
+
+    def _app_params(self, algod: AlgodClient, app_id: int) -> dict | None:
+        try:
+            return algod.application_info(app_id)["params"]  # type: ignore[index]
+        except AlgodHTTPError as e:
+            logger.warning(f"Cannot recognise app {app_id}, it may have been deleted: {e}")
+            return None
+
+    def _is_instance(self, app_id: int, algod: AlgodClient | None) -> bool:
+        if self._db.execute("SELECT 1 FROM instances WHERE app_id = ?", (app_id,)).fetchone():
+            return True
+        if algod is None or app_id in self._not_instances:
+            return False
+        params = self._app_params(algod, app_id)
+        tracked = params is not None and self._db.execute(
+            "SELECT 1 FROM creators WHERE creator = ?", (params["creator"],)
+        ).fetchone()
+        program = base64.b64decode(params["approval-program"]) if params else b""
+        if not tracked or approval_hash(program) not in self.program_hashes:
+            self._not_instances.add(app_id)
+            return False
+        self._db.execute(
+            "INSERT OR IGNORE INTO instances VALUES (?, ?)", (app_id, params["creator"])
+        )
+        return True
+
+    def apply_block(self, round_: int, block: dict, algod: AlgodClient | None = None) -> None:
+        """
+        Indexes the deployments, instances and batch registrations of tracked creators
+        in a block. Pass `algod` to recognise instances created before their creator
+        was tracked.
+        """
+        with self._lock:
+            # A creator tracked after this round already has its deployments from `track`
+            creators = {
+                row[0]
+                for row in self._db.execute(
+                    "SELECT creator FROM creators WHERE synced_round < ?", (round_,)
+                )
+            }
+            with self._db:
+                for intra, app_id, txn, apply_data in app_calls(block):
+                    note = txn.get("note", b"")
+                    on_completion = txn.get("apan", 0)
+                    if "apid" not in txn and "apap" in txn:
+                        sender = encode_address(txn["snd"])
+                        if sender in creators and approval_hash(txn["apap"]) in self.program_hashes:
+                            self._db.execute(
+                                "INSERT OR IGNORE INTO instances VALUES (?, ?)", (app_id, sender)
+                            )
+                    metadata = {}
+                    if note.startswith(_DEPLOY_NOTE_PREFIX):
+                        try:
+                            metadata = json.loads(note[len(_DEPLOY_NOTE_PREFIX) :])
+                        except ValueError:
+                            logger.warning(f"Ignoring malformed deploy note of app {app_id}")
+                    if "apid" not in txn and metadata:
+                        sender = encode_address(txn["snd"])
+                        if sender in creators and metadata.get("name"):
+                            self._db.execute(
+                                "INSERT OR REPLACE INTO apps VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                                (
+                                    sender, metadata["name"], app_id,
+                                    metadata.get("version", "1.0"), metadata.get("deletable"),
+                                    metadata.get("updatable"), round_, round_,
+                                ),
+                            )
+                    elif on_completion == _UPDATE_APPLICATION:
+                        if metadata.get("name"):
+                            # algokit's update carries the new version in its deploy note
+                            self._db.execute(
+                                "UPDATE apps SET updated_round = ?, version = ?, deletable = ?,"
+                                " updatable = ? WHERE app_id = ?",
+                                (
+                                    round_, metadata.get("version", "1.0"),
+                                    metadata.get("deletable"), metadata.get("updatable"), app_id,
+                                ),
+                            )
+                        else:
+                            self._db.execute(
+                                "UPDATE apps SET updated_round = ? WHERE app_id = ?",
+                                (round_, app_id),
+                            )
+                        if "apap" in txn and approval_hash(txn["apap"]) not in self.program_hashes:
+                            self._db.execute("DELETE FROM instances WHERE app_id = ?", (app_id,))
+                    elif on_completion == _DELETE_APPLICATION:
+                        self._db.execute("UPDATE apps SET deleted = 1 WHERE app_id = ?", (app_id,))
+
+                    if (txn.get("apaa") or [b""])[0] != REGISTER_SELECTOR:
+                        continue
+                    if not self._is_instance(app_id, algod):
+                        continue
+                    call = decode_call(round_, intra, app_id, txn, apply_data)
+                    if call is not None:
+                        # A producer can register again, the latest registration wins
+                        self._db.execute(
+                            "INSERT OR REPLACE INTO batches VALUES (?, ?, ?)",
+                            (call.args[0], app_id, round_),
+                        )
+                self._db.execute(
+                    "UPDATE creators SET synced_round = ? WHERE synced_round < ?", (round_, round_)
+                )
+
+    def sync(self, algorand: algokit_utils.AlgorandClient) -> int:
+        """
+        Applies every block since the last sync, tracking again any creator more than
+        `MAX_SYNC_ROUNDS` behind; returns the round synced to.
+        """
+        algod = algorand.client.algod
+        last_round = int(algod.status()["last-round"])  # type: ignore[index]
+        with self._lock:
+            behind = [
+                row[0]
+                for row in self._db.execute(
+                    "SELECT creator FROM creators WHERE synced_round < ?",
+                    (last_round - MAX_SYNC_ROUNDS,),
+                )
+            ]
+        for creator in behind:
+            logger.info(
+                f"App registry is over {MAX_SYNC_ROUNDS} rounds behind {creator}, tracking again"
+            )
+            self.track(algorand, creator, refresh=True)
+        with self._lock:
+            row = self._db.execute("SELECT min(synced_round) FROM creators").fetchone()
+        if row[0] is None:
+            return 0
+        synced_round = row[0]
+        blocks = AlgodBlocks(algod)
+        for round_ in range(synced_round + 1, last_round + 1):
+            raw = blocks.raw_block(round_)
+            response = msgpack.unpackb(raw, raw=False, unicode_errors="surrogateescape")
+            self.apply_block(round_, response["block"], algod)
+        if last_round > synced_round:
+            logger.debug(f"App registry synced rounds {synced_round + 1}-{last_round}")
+        return last_round
@@ -0,0 +1,298 @@
+import argparse
+import itertools
+import logging
+import mmap
+import struct
+import threading
+import zlib
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import algokit_utils
+import msgpack
+
+from smart_contracts.algo_healx.scanner import AlgodBlocks, BlockSource
+from smart_contracts.algo_healx.state_cache import touched_app_ids
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_BYTES = 256 * 1024 * 1024
+
+# rounds.idx: a header, then one fixed-size record per round from the first one,
+# so a round's record is found by position. A zero length marks a missing round.
+_INDEX_MAGIC = b"AHXBLK01"
+_HEADER = struct.Struct("<8sQQQ")  # magic, first round, last round + 1, reserved
+_RECORD = struct.Struct("<QII")  # offset, segment, compressed length
+_INDEX_GROWTH = 65_536  # records added each time rounds.idx is extended
+# apps.idx: append-only (app ID, round) pairs, one per app touched by a round
+_APP_RECORD = struct.Struct("<QQ")
+
+
+class BlockArchive:
+    """
+    Local, append-only archive of raw msgpack blocks, readable as a `BlockSource`.
+
+    Blocks are zlib-compressed and appended to segment files that roll over at
+    `segment_bytes`. `rounds.idx` is memory-mapped and maps a round to its segment,
+    offset and length with one lookup, and `apps.idx` records the rounds that touch
+    each app (inner calls included), so a replay of some apps reads only their
+    rounds. A block and its apps.idx records are written out before its rounds.idx
+    record, so an interrupted append leaves at worst an unindexed block and app
+    records of a round that is not archived; the next append writes after them,
+    `rounds_touching` skips such rounds, and `fill` fetches them again.
+
+    There is a single writer; any number of readers, including the scanner's
+    worker processes (the archive pickles to its path and reopens read-only),
+    can read concurrently.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        compression_level: int = 6,
+        readonly: bool = False,
+    ):
+        self.path = Path(path)
+        self.segment_bytes = segment_bytes
+        self.compression_level = compression_level
+        self.readonly = readonly
+        self._lock = threading.Lock()
+        self._segments: dict[int, mmap.mmap] = {}
+        self._apps: dict[int, list[int]] | None = None
+
+        index_path = self.path / "rounds.idx"
+        if readonly:
+            if not index_path.exists():
+                raise Exception(f"No block archive at {self.path}")
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+            if not index_path.exists():
+                index_path.write_bytes(_HEADER.pack(_INDEX_MAGIC, 0, 0, 0))
+        self._index_file = index_path.open("rb" if readonly else "r+b")
+        self._index = self._map(self._index_file)
+        magic, _, _, _ = _HEADER.unpack_from(self._index)
+        if magic != _INDEX_MAGIC:
+            raise Exception(f"{index_path} is not a block archive index")
+
+        if not readonly:
+            segments = sorted(self.path.glob("*.seg"))
+            self._segment = int(segments[-1].stem) if segments else 0
+            self._writer = (self.path / f"{self._segment:06d}.seg").open("ab")
+            self._apps_writer = (self.path / "apps.idx").open("ab")
+            # An append interrupted mid-record leaves a partial one at the end
+            size = self._apps_writer.tell()
+            if size % _APP_RECORD.size:
+                self._apps_writer.truncate(size - size % _APP_RECORD.size)
+
+    def _map(self, f) -> mmap.mmap:
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        return mmap.mmap(f.fileno(), 0, access=access)
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["path"], readonly=True)  # type: ignore[misc]
+
+    def __enter__(self) -> "BlockArchive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ------------------------------- Reading ------------------------------- #
+
+    @property
+    def first_round(self) -> int | None:
+        _, first, end, _ = _HEADER.unpack_from(self._index)
+        return first if end else None
+
+    @property
+    def last_round(self) -> int | None:
+        _, _, end, _ = _HEADER.unpack_from(self._index)
+        return end - 1 if end else None
+
+    def _record(self, round_: int) -> tuple[int, int, int] | None:
+        _, first, end, _ = _HEADER.unpack_from(self._index)
+        if not first <= round_ < end:
+            return None
+        position = _HEADER.size + (round_ - first) * _RECORD.size
+        if position + _RECORD.size > len(self._index):
+            # Another process extended the index since it was mapped
+            self._index = self._map(self._index_file)
+        offset, segment, length = _RECORD.unpack_from(self._index, position)
+        return (offset, segment, length) if length else None
+
+    def __contains__(self, round_: int) -> bool:
+        return self._record(round_) is not None
+
+    def raw_block(self, round_: int) -> bytes:
+        record = self._record(round_)
+        if record is None:
+            raise Exception(f"Round {round_} is not in the block archive at {self.path}")
+        offset, segment, length = record
+        data = self._segments.get(segment)
+        if data is None or offset + length > len(data):
+            if data is not None:
+                data.close()
+            with (self.path / f"{segment:06d}.seg").open("rb") as f:
+                data = self._segments[segment] = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        return zlib.decompress(data[offset : offset + length])
+
+    def block(self, round_: int) -> dict:
+        """The decoded block of a round."""
+        raw = self.raw_block(round_)
+        return msgpack.unpackb(raw, raw=False, unicode_errors="surrogateescape")["block"]
+
+    def _app_index(self) -> dict[int, list[int]]:
+        if self._apps is None:
+            if not self.readonly:
+                self._apps_writer.flush()
+            apps = defaultdict(list)
+            data = (self.path / "apps.idx").read_bytes()
+            data = data[: len(data) - len(data) % _APP_RECORD.size]
+            for app_id, round_ in _APP_RECORD.iter_unpack(data):
+                apps[app_id].append(round_)
+            self._apps = dict(apps)
+        return self._apps
+
+    def app_ids(self) -> list[int]:
+        """Every app touched by an archived round, sorted."""
+        return sorted(self._app_index())
+
+    def rounds_touching(
+        self, app_ids: Iterable[int], first: int = 0, last: int | None = None
+    ) -> list[int]:
+        """The archived rounds in `first`..`last` with a call to any of `app_ids`, sorted."""
+        apps = self._app_index()
+        if last is None:
+            last = self.last_round or 0
+        rounds = {
+            round_
+            for app_id in app_ids
+            for round_ in apps.get(app_id, ())
+            if first <= round_ <= last
+        }
+        # An interrupted append can leave app records of a round it did not archive
+        return sorted(round_ for round_ in rounds if round_ in self)
+
+    # ------------------------------- Writing ------------------------------- #
+
+    def append(self, round_: int, raw: bytes) -> None:
+        """Archives the msgpack `block_info` response of a round, if not already there."""
+        if self.readonly:
+            raise Exception(f"Block archive at {self.path} is open read-only")
+        response = msgpack.unpackb(raw, raw=False, unicode_errors="surrogateescape")
+        touched = touched_app_ids(response["block"])
+        compressed = zlib.compress(raw, self.compression_level)
+
+        with self._lock:
+            _, first, end, _ = _HEADER.unpack_from(self._index)
+            if not end:
+                first = end = round_
+            elif round_ < first:
+                raise Exception(f"Block archive at {self.path} starts at round {first}")
+            if self._record(round_) is not None:
+                return
+
+            if self._writer.tell() and self._writer.tell() + len(compressed) > self.segment_bytes:
+                self._writer.close()
+                self._segment += 1
+                self._writer = (self.path / f"{self._segment:06d}.seg").open("ab")
+            offset = self._writer.tell()
+            self._writer.write(compressed)
+            self._writer.flush()
+            self._apps_writer.write(
+                b"".join(_APP_RECORD.pack(app_id, round_) for app_id in sorted(touched))
+            )
+            self._apps_writer.flush()
+
+            # Publishing the round record last keeps a round that is in the archive
+            # findable through the app index
+            position = _HEADER.size + (round_ - first) * _RECORD.size
+            if position + _RECORD.size > len(self._index):
+                self._index_file.truncate(position + _INDEX_GROWTH * _RECORD.size)
+                self._index = self._map(self._index_file)
+            _RECORD.pack_into(self._index, position, offset, self._segment, len(compressed))
+            _HEADER.pack_into(self._index, 0, _INDEX_MAGIC, first, max(end, round_ + 1), 0)
+
+            if self._apps is not None:
+                for app_id in touched:
+                    self._apps.setdefault(app_id, []).append(round_)
+
+    def fill(self, source: BlockSource, first: int, last: int, *, workers: int = 8) -> int:
+        """
+        Fetches the rounds in `first`..`last` that are not archived yet from `source`
+        on `workers` threads and appends them in order; returns how many were added.
+        A few fetches per worker are in flight at a time, so fetched blocks do not
+        pile up in memory ahead of a slow one.
+        """
+        missing = [round_ for round_ in range(first, last + 1) if round_ not in self]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = iter(missing)
+            in_flight: deque[tuple[int, Future[bytes]]] = deque(
+                (round_, pool.submit(source.raw_block, round_))
+                for round_ in itertools.islice(pending, 4 * workers)
+            )
+            count = 0
+            while in_flight:
+                round_, fetch = in_flight.popleft()
+                raw = fetch.result()
+                for next_round in itertools.islice(pending, 1):
+                    in_flight.append((next_round, pool.submit(source.raw_block, next_round)))
+                self.append(round_, raw)
+                count += 1
+                if count % 10_000 == 0:
+                    self.flush()
+                    logger.info(f"Archived {count} of {len(missing)} rounds, up to {round_}")
+        self.flush()
+        return len(missing)
+
+    def flush(self) -> None:
+        """Writes buffered index records out to the files."""
+        if self.readonly:
+            return
+        with self._lock:
+            self._apps_writer.flush()
+            self._index.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if not self.readonly:
+            self._writer.close()
+            self._apps_writer.close()
+        for data in self._segments.values():
+            data.close()
+        self._index.close()
+        self._index_file.close()
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fetch blocks from algod into a local archive")
+    parser.add_argument("archive", type=Path)
+    parser.add_argument("first", type=int)
+    parser.add_argument("last", type=int)
+    parser.add_argument("--workers", type=int, default=8, help="concurrent algod requests")
+    args = parser.parse_args()
+
+    algod = algokit_utils.AlgorandClient.from_environment().client.algod
+    with BlockArchive(args.archive) as archive:
+        added = archive.fill(AlgodBlocks(algod), args.first, args.last, workers=args.workers)
+        logger.info(
+            f"Added {added} blocks, {args.archive} holds rounds "
+            f"{archive.first_round}-{archive.last_round}"
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,521 @@
+import argparse
+import base64
+import csv
+import dataclasses
+import logging
+import struct
+import typing
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import algokit_utils
+from algosdk.constants import ZERO_ADDRESS
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.algo_healx.state_reader import BatchStateReader
+from smart_contracts.algo_healx.status_index import PAGE_SIZE
+from smart_contracts.algo_healx.streaming_composer import MAX_GROUP_SIZE, MAX_REFERENCES_PER_TXN
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.batch_registry.batch_registry_contract_client import (
+        BatchRegistryContractClient,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Bulk regulator decisions through BatchRegistryContract.approve_many and
+# reject_many, signed in one pass and sent one group after another.
+#
+# Decisions are checked against each batch's state and simulated against the
+# chain first; a call is atomic, so a group that fails simulation is split in half
+# until the decisions that fail are isolated, and those are reported with their
+# error. Moving a batch swap-removes it from its status array, so the page and
+# position boxes a decision touches depend on every decision before it. The
+# registry's index is read once and each decision is applied to a local copy in
+# the order they will run, which gives every call its exact box references before
+# any is sent. Groups are then packed by the references they need, all signed at
+# once, and each is sent once the one before it is confirmed.
+#
+# A group that fails on submission leaves the index other than projected, so the
+# decisions after it are projected and signed again; a group rejected for stale
+# references (another app moved in between) is retried once with them.
+
+# References a decision needs of its own: the batch app, its position box, its page
+# in its old status and the position box of the app swapped into its slot. The
+# pages at the ends of the status arrays are shared by a group's decisions.
+REFERENCES_PER_DECISION = 4
+DECISIONS_PER_CALL = MAX_REFERENCES_PER_TXN // REFERENCES_PER_DECISION
+# Rounds every signed group stays valid, long enough for all groups before it
+VALIDITY_WINDOW = 1000
+# App args are limited to 2048 bytes per transaction
+_MAX_ARGS_BYTES = 2048 - 4 - 2 * 2
+# Submission errors of a call whose references no longer match the index
+_STALE_REFERENCES = ("invalid Box reference", "unavailable Box", "unavailable App")
+
+
+@dataclasses.dataclass(frozen=True)
+class Decision:
+    """Approves the batch in `app_id` with `compliance_score`, or rejects it with `reason`."""
+
+    app_id: int
+    compliance_score: int | None = None
+    reason: str | None = None
+
+    def __post_init__(self) -> None:
+        if (self.compliance_score is None) == (self.reason is None):
+            raise ValueError(f"Decision for app {self.app_id} needs a compliance score or a reason")
+
+    @property
+    def approved(self) -> bool:
+        return self.compliance_score is not None
+
+    @property
+    def args_bytes(self) -> int:
+        # An array element, plus a string's head offset and length prefix
+        return 16 if self.approved else 8 + 4 + len(typing.cast(str, self.reason).encode())
+
+
+@dataclasses.dataclass
+class DecisionOutcome:
+    decision: Decision
+    # The approve_many or reject_many call the decision was sent in
+    tx_id: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.tx_id is not None
+
+
+@dataclasses.dataclass
+class ReviewResult:
+    """Outcome of every decision, in the order they were given."""
+
+    outcomes: list[DecisionOutcome]
+    groups: int
+
+    @property
+    def succeeded(self) -> list[DecisionOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.ok]
+
+    @property
+    def failed(self) -> list[DecisionOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+
+def _split(decisions: Sequence[Decision]) -> list[list[Decision]]:
+    calls: list[list[Decision]] = []
+    for approved in (True, False):
+        call: list[Decision] = []
+        size = 0
+        for decision in decisions:
+            if decision.approved != approved:
+                continue
+            if call and (len(call) == DECISIONS_PER_CALL or size + decision.args_bytes > _MAX_ARGS_BYTES):
+                calls.append(call)
+                call, size = [], 0
+            call.append(decision)
+            size += decision.args_bytes
+        if call:
+            calls.append(call)
+    return calls
+
+
+def pack(decisions: Sequence[Decision]) -> list[list[list[Decision]]]:
+    """
+    Splits decisions into groups of calls: each call holds up to DECISIONS_PER_CALL
+    approvals or rejections within the app-args size limit, and each group up to
+    MAX_GROUP_SIZE calls.
+    """
+    calls = _split(decisions)
+    return [calls[i : i + MAX_GROUP_SIZE] for i in range(0, len(calls), MAX_GROUP_SIZE)]
+
+
+# ------------------------------- Projection ------------------------------- #
+
+
+def _page_key(status: str, index: int) -> bytes:
+    return b"p" + (index // PAGE_SIZE).to_bytes(8, "big") + status.encode()
+
+
+def _position_key(app_id: int) -> bytes:
+    return b"a" + app_id.to_bytes(8, "big")
+
+
+def _decode_position(value: bytes) -> tuple[int, str]:
+    # ARC-4 Position(uint64 index, string status)
+    index, offset = struct.unpack_from(">QH", value)
+    (length,) = struct.unpack_from(">H", value, offset)
+    return index, value[offset + 2 : offset + 2 + length].decode()
+
+
+class _Projection:
+    """
+    A registry's status index as it will be after each decision applied so far: the
+    count of every status, the position of the decided apps and of those swapped
+    into their slots, and the tail slots that swap-removes take apps from.
+    """
+
+    def __init__(
+        self,
+        counts: dict[str, int],
+        positions: dict[int, tuple[int, str]],
+        slots: dict[tuple[str, int], int],
+    ):
+        self.counts = counts
+        self.positions = positions
+        self.slots = slots
+
+    def move(self, app_id: int, status: str) -> set[bytes]:
+        """Moves an app as BatchRegistryContract._move does; returns the boxes it touches."""
+        boxes = {_position_key(app_id)}
+        position = self.positions.get(app_id)
+        if position is not None:
+            index, current = position
+            if current == status:
+                return boxes
+            last = self.counts[current] - 1
+            boxes |= {_page_key(current, index), _page_key(current, last)}
+            if index != last:
+                moved = self.slots[(current, last)]
+                self.slots[(current, index)] = moved
+                self.positions[moved] = (index, current)
+                boxes.add(_position_key(moved))
+            self.counts[current] = last
+        count = self.counts.get(status, 0)
+        boxes.add(_page_key(status, count))
+        self.slots[(status, count)] = app_id
+        self.positions[app_id] = (count, status)
+        self.counts[status] = count + 1
+        return boxes
+
+
+class _Group(typing.NamedTuple):
+    calls: list[list[Decision]]
+    # Registry box names and batch app IDs the group's calls touch
+    boxes: set[bytes]
+    apps: set[int]
+
+    @property
+    def references(self) -> int:
+        return len(self.boxes) + len(self.apps)
+
+
+class BulkReviewer:
+    """Sends many regulator decisions as approve_many/reject_many calls from `regulator`."""
+
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        registry_app_id: int,
+        regulator: str,
+        *,
+        signer: algokit_utils.TransactionSigner | None = None,
+        max_workers: int = 8,
+    ):
+        from smart_contracts.artifacts.batch_registry.batch_registry_contract_client import (
+            BatchRegistryContractClient,
+        )
+
+        self.algorand = algorand
+        self.registry_app_id = registry_app_id
+        self.regulator = regulator
+        self.signer = signer
+        self.client: BatchRegistryContractClient = BatchRegistryContractClient(
+            algorand=algorand,
+            app_id=registry_app_id,
+            default_sender=regulator,
+            default_signer=signer,
+        )
+        # Concurrent registry box reads
+        self.max_workers = max_workers
+
+    def review(self, decisions: Iterable[Decision]) -> ReviewResult:
+        outcomes = [DecisionOutcome(decision) for decision in decisions]
+        by_app = {outcome.decision.app_id: outcome for outcome in self._check(outcomes)}
+        remaining = [
+            decision
+            for group in pack([outcome.decision for outcome in by_app.values()])
+            for decision in self._simulate(group, by_app)
+        ]
+
+        sent = 0
+        retried: set[int] = set()
+        while remaining:
+            groups = self._prepare(remaining)
+            signed = self._sign(groups)
+            remaining = []
+            for i, (group, signed_txns) in enumerate(zip(groups, signed)):
+                sent += 1
+                error = self._send(signed_txns)
+                decisions = [decision for call in group.calls for decision in call]
+                if error is None:
+                    for signed_txn, call in zip(signed_txns, group.calls):
+                        for decision in call:
+                            by_app[decision.app_id].tx_id = signed_txn.get_txid()
+                    continue
+                logger.warning(f"Group of {len(group.calls)} decision calls failed: {error}")
+                # Every later group was projected as if this one had gone through
+                remaining = [d for later in groups[i + 1 :] for call in later.calls for d in call]
+                app_ids = {decision.app_id for decision in decisions}
+                if any(reason in error for reason in _STALE_REFERENCES) and not retried & app_ids:
+                    retried |= app_ids
+                    remaining = decisions + remaining
+                else:
+                    for decision in decisions:
+                        by_app[decision.app_id].error = error
+                if remaining:
+                    logger.info(f"Projecting and signing the other {len(remaining)} again")
+                break
+        return ReviewResult(outcomes=outcomes, groups=sent)
+
+    def _check(self, outcomes: list[DecisionOutcome]) -> list[DecisionOutcome]:
+        """Fails decisions the contracts would reject; returns the rest."""
+        with BatchStateReader(self.algorand.client.algod, cache_size=0) as reader:
+            states = reader.get_many(outcome.decision.app_id for outcome in outcomes)
+        valid = []
+        seen: set[int] = set()
+        for outcome in outcomes:
+            app_id = outcome.decision.app_id
+            state = states.get(app_id)
+            if app_id in seen:
+                outcome.error = "Duplicate decision for the same app"
+            elif state is None:
+                outcome.error = "App does not exist"
+            elif state.get("registry") != self.registry_app_id:
+                outcome.error = f"App is not indexed by registry {self.registry_app_id}"
+            elif state.get("regulator") != self.regulator:
+                outcome.error = f"{self.regulator} is not the batch's regulator"
+            elif state.get("producer", ZERO_ADDRESS) == ZERO_ADDRESS:
+                outcome.error = "Batch is not registered"
+            else:
+                valid.append(outcome)
+            seen.add(app_id)
+        return valid
+
+    def _compose(
+        self, calls: list[list[Decision]], references: list[list[int | bytes]] | None = None
+    ) -> algokit_utils.TransactionComposer:
+        min_fee = self.algorand.get_suggested_params().min_fee
+        composer = self.algorand.new_group()
+        for i, call in enumerate(calls):
+            app_ids = [decision.app_id for decision in call]
+            refs = references[i] if references is not None else []
+            params = algokit_utils.CommonAppCallParams(
+                # One inner call per decision is paid for by the outer call
+                static_fee=algokit_utils.AlgoAmount.from_micro_algo(min_fee * (1 + len(call))),
+                validity_window=VALIDITY_WINDOW,
+                app_references=[ref for ref in refs if isinstance(ref, int)],
+                box_references=[
+                    algokit_utils.BoxReference(0, ref) for ref in refs if isinstance(ref, bytes)
+                ],
+            )
+            if call[0].approved:
+                scores = [typing.cast(int, decision.compliance_score) for decision in call]
+                composer.add_app_call_method_call(
+                    self.client.params.approve_many(args=(app_ids, scores), params=params)
+                )
+            else:
+                reasons = [typing.cast(str, decision.reason) for decision in call]
+                composer.add_app_call_method_call(
+                    self.client.params.reject_many(args=(app_ids, reasons), params=params)
+                )
+        return composer
+
+    def _simulate(
+        self, calls: list[list[Decision]], by_app: dict[int, DecisionOutcome]
+    ) -> list[Decision]:
+        """
+        Simulates a group against the current state; returns its decisions if it
+        passes. A group that fails is split in half, down to single decisions,
+        which are then reported as failed.
+        """
+        decisions = [decision for call in calls for decision in call]
+        try:
+            self._compose(calls).simulate(allow_unnamed_resources=True, skip_signatures=True)
+        except Exception as e:
+            if len(decisions) == 1:
+                by_app[decisions[0].app_id].error = str(e)
+                return []
+            half = len(decisions) // 2
+            return [
+                decision
+                for part in (decisions[:half], decisions[half:])
+                for group in pack(part)
+                for decision in self._simulate(group, by_app)
+            ]
+        return decisions
+
+    def _project(self, app_ids: list[int]) -> _Projection:
+        """Reads the registry's counts, the apps' positions and the tails they swap with."""
+        algod = self.algorand.client.algod
+        info = algod.application_info(self.registry_app_id)
+        counts = {}
+        for entry in info["params"].get("global-state", []):  # type: ignore[index, call-overload]
+            key = base64.b64decode(entry["key"])
+            if key.startswith(b"n"):
+                counts[key[1:].decode()] = entry["value"].get("uint", 0)
+
+        def read(key: bytes) -> bytes | None:
+            try:
+                box = algod.application_box_by_name(self.registry_app_id, key)
+            except AlgodHTTPError as e:
+                if e.code == 404:
+                    return None
+                raise
+            return base64.b64decode(box["value"])  # type: ignore[index, call-overload]
+
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            values = pool.map(read, map(_position_key, app_ids))
+            positions = {
+                app_id: _decode_position(value)
+                for app_id, value in zip(app_ids, values)
+                if value is not None
+            }
+            # Each app leaving a status takes its slot's place from the end, so only
+            # the last `leaving` slots of a status are ever read
+            tails = [
+                (status, page)
+                for status, leaving in Counter(status for _, status in positions.values()).items()
+                for page in range(
+                    max(counts[status] - leaving, 0) // PAGE_SIZE,
+                    (counts[status] - 1) // PAGE_SIZE + 1,
+                )
+            ]
+            pages = pool.map(read, [_page_key(status, page * PAGE_SIZE) for status, page in tails])
+            slots = {
+                (status, page * PAGE_SIZE + slot): app_id
+                for (status, page), value in zip(tails, pages)
+                for slot, (app_id,) in enumerate(struct.iter_unpack(">Q", value or b""))
+            }
+        return _Projection(counts, positions, slots)
+
+    def _prepare(self, decisions: list[Decision]) -> list[_Group]:
+        """
+        Projects the decisions in the order they will run, and packs their calls into
+        groups whose pooled references cover every box and app they touch.
+        """
+        projection = self._project([decision.app_id for decision in decisions])
+        touched = {
+            decision.app_id: projection.move(
+                decision.app_id, "approved" if decision.approved else "rejected"
+            )
+            for call in _split(decisions)
+            for decision in call
+        }
+        groups: list[_Group] = []
+        pending = _split(decisions)
+        while pending:
+            call = pending.pop(0)
+            boxes = set().union(*(touched[decision.app_id] for decision in call))
+            apps = {decision.app_id for decision in call}
+            group = groups[-1] if groups else None
+            if (
+                group is not None
+                and len(group.calls) < MAX_GROUP_SIZE
+                and len(group.boxes | boxes) + len(group.apps | apps)
+                <= (len(group.calls) + 1) * MAX_REFERENCES_PER_TXN
+            ):
+                group.calls.append(call)
+                group.boxes.update(boxes)
+                group.apps.update(apps)
+            elif len(boxes) + len(apps) > MAX_REFERENCES_PER_TXN and len(call) > 1:
+                # Too many references for a call of its own; its decisions go one by one
+                pending[:0] = [[decision] for decision in call]
+            else:
+                groups.append(_Group([call], boxes, apps))
+        return groups
+
+    def _sign(self, groups: list[_Group]) -> list[list]:
+        """Builds every group with its references spread over its calls and signs them at once."""
+        txns = []
+        for group in groups:
+            references: list[int | bytes] = [*sorted(group.apps), *sorted(group.boxes)]
+            per_call = [
+                references[i : i + MAX_REFERENCES_PER_TXN]
+                for i in range(0, len(group.calls) * MAX_REFERENCES_PER_TXN, MAX_REFERENCES_PER_TXN)
+            ]
+            built = self._compose(group.calls, per_call).build()
+            txns.append([txn_with_signer.txn for txn_with_signer in built.transactions])
+        signer = self.signer or self.algorand.account.get_signer(self.regulator)
+        flat = [txn for group_txns in txns for txn in group_txns]
+        # One call of the signer for every group, e.g. one wallet prompt
+        signed = signer.sign_transactions(flat, list(range(len(flat))))
+        result, start = [], 0
+        for group_txns in txns:
+            result.append(signed[start : start + len(group_txns)])
+            start += len(group_txns)
+        return result
+
+    def _send(self, signed_txns: list) -> str | None:
+        """Sends a group and waits until it is confirmed; returns why it did not land."""
+        algod = self.algorand.client.algod
+        try:
+            algod.send_transactions(signed_txns)
+        except AlgodHTTPError as e:
+            # The node answered, so the group was rejected and cannot land
+            return str(e)
+        except Exception as e:
+            logger.warning(f"Sending a group failed, checking whether it landed: {e}")
+        return self._confirm(signed_txns[0].get_txid(), signed_txns[0].transaction.last_valid_round)
+
+    def _confirm(self, tx_id: str, last_valid: int) -> str | None:
+        """Waits until a transaction is confirmed or can no longer be; returns why not."""
+        algod = self.algorand.client.algod
+        round_ = int(algod.status()["last-round"])  # type: ignore[index, call-overload]
+        while True:
+            try:
+                info = algod.pending_transaction_info(tx_id)
+            except AlgodHTTPError as e:
+                # Neither in the pool nor recently confirmed
+                return str(e)
+            if info.get("confirmed-round"):  # type: ignore[union-attr]
+                return None
+            if info.get("pool-error"):  # type: ignore[union-attr]
+                return typing.cast(str, info["pool-error"])  # type: ignore[index, call-overload]
+            if round_ > last_valid:
+                return f"Transaction {tx_id} expired unconfirmed"
+            status = algod.status_after_block(round_)
+            round_ = int(status["last-round"])  # type: ignore[index, call-overload]
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+def read_decisions(path: Path) -> list[Decision]:
+    """Decisions from a CSV with app_id and either compliance_score or reason columns."""
+    with path.open(newline="") as f:
+        return [
+            Decision(
+                int(row["app_id"]),
+                int(row["compliance_score"]) if row.get("compliance_score") else None,
+                row.get("reason") or None,
+            )
+            for row in csv.DictReader(f)
+        ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Approve or reject many batches at once")
+    parser.add_argument("--registry-app-id", type=int, required=True)
+    parser.add_argument("decisions", type=Path, help="CSV of app_id,compliance_score,reason")
+    args = parser.parse_args()
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    regulator = algorand.account.from_environment("REGULATOR")
+    reviewer = BulkReviewer(
+        algorand, args.registry_app_id, regulator.address, signer=regulator.signer
+    )
+    result = reviewer.review(read_decisions(args.decisions))
+    for outcome in result.failed:
+        logger.warning(f"App {outcome.decision.app_id}: {outcome.error}")
+    logger.info(
+        f"{len(result.succeeded)} of {len(result.outcomes)} decisions sent in {result.groups} groups"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
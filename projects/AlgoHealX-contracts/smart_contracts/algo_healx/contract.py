@@ -1,4 +1,71 @@
-from algopy import ARC4Contract, arc4, Global, UInt64, Bytes, String, Account, Txn
+from algopy import ARC4Contract, arc4, Global, UInt64, Bytes, String, Account, Application, Txn, subroutine
+
+
+# ARC-28 events, one per state transition, so indexers can follow a batch from
+# transaction logs alone
+class RegulatorSet(arc4.Struct):
+    regulator: arc4.Address
+    timestamp: arc4.UInt64
+
+
+class Registered(arc4.Struct):
+    batch_id: arc4.String
+    producer: arc4.Address
+    quantity: arc4.UInt64
+    timestamp: arc4.UInt64
+
+
+class StatusUpdated(arc4.Struct):
+    status: arc4.String
+    updated_by: arc4.Address
+    timestamp: arc4.UInt64
+
+
+class Approved(arc4.Struct):
+    regulator: arc4.Address
+    compliance_score: arc4.UInt64
+    timestamp: arc4.UInt64
+
+
+class Rejected(arc4.Struct):
+    regulator: arc4.Address
+    reason: arc4.String
+    timestamp: arc4.UInt64
+
+
+class Transferred(arc4.Struct):
+    sender: arc4.Address
+    receiver: arc4.Address
+    location: arc4.String
+    transfer_count: arc4.UInt64
+    timestamp: arc4.UInt64
+
+
+class Delivered(arc4.Struct):
+    receiver: arc4.Address
+    timestamp: arc4.UInt64
+
+
+class QrSet(arc4.Struct):
+    qr_hash: arc4.DynamicBytes
+    timestamp: arc4.UInt64
+
+
+class Verified(arc4.Struct):
+    verifier: arc4.Address
+    verif_count: arc4.UInt64
+    timestamp: arc4.UInt64
+
+
+class Counterfeit(arc4.Struct):
+    reported_by: arc4.Address
+    timestamp: arc4.UInt64
+
+
+class QuantityUpdated(arc4.Struct):
+    quantity: arc4.UInt64
+    timestamp: arc4.UInt64
+
 
 class DrugBatchContract(ARC4Contract):
     def __init__(self) -> None:
@@ -30,6 +97,24 @@ class DrugBatchContract(ARC4Contract):
         self.is_authentic = UInt64(1)
         self.last_verif_ts = UInt64()
         self.qr_hash = Bytes()
+        # BatchRegistryContract indexing this batch by reg_status, if any
+        self.registry = Application()
+
+    @subroutine
+    def _index(self) -> None:
+        # Moves a registered batch to its reg_status in the registry; the inner call's
+        # fee is pooled, so callers pay one extra minimum fee
+        if self.registry.id != 0 and self.producer != Account():
+            arc4.abi_call("move(string)void", self.reg_status, app_id=self.registry)
+
+    @arc4.abimethod
+    def set_registry(self, registry_app_id: UInt64) -> None:
+        assert Txn.sender == self.admin
+        # The old registry would keep indexing the batch, so a registry is set once;
+        # setting the same one again only re-indexes, which keeps retries harmless
+        assert self.registry.id == 0 or self.registry.id == registry_app_id, "Registry already set"
+        self.registry = Application(registry_app_id)
+        self._index()
 
     @arc4.abimethod
     def set_regulator(self, regulator_addr: Account) -> None:
@@ -37,6 +122,8 @@ class DrugBatchContract(ARC4Contract):
         self.regulator = regulator_addr
         self.reg_status = String("pending")
         self.approval_ts = Global.latest_timestamp
+        arc4.emit(RegulatorSet(arc4.Address(regulator_addr), arc4.UInt64(self.approval_ts)))
+        self._index()
     @arc4.abimethod
     def register(
         self,
@@ -59,26 +146,78 @@ class DrugBatchContract(ARC4Contract):
         self.quantity = quantity
         self.status = String("pending")
         self.timestamp = Global.latest_timestamp
+        arc4.emit(
+            Registered(
+                arc4.String(batch_id),
+                arc4.Address(self.producer),
+                arc4.UInt64(quantity),
+                arc4.UInt64(self.timestamp),
+            )
+        )
+        self._index()
     @arc4.abimethod
     def update_status(self, status_text: String) -> None:
         assert Txn.sender == self.admin or Txn.sender == self.producer or Txn.sender == self.regulator
         self.status = status_text
         self.timestamp = Global.latest_timestamp
+        arc4.emit(
+            StatusUpdated(
+                arc4.String(status_text), arc4.Address(Txn.sender), arc4.UInt64(self.timestamp)
+            )
+        )
     @arc4.abimethod
     def approve(self, compliance_score: UInt64) -> None:
         assert Txn.sender == self.regulator
+        self._approve(Txn.sender, compliance_score)
+        self._index()
+
+    @arc4.abimethod
+    def reject(self, reason_text: String) -> None:
+        assert Txn.sender == self.regulator
+        self._reject(Txn.sender, reason_text)
+        self._index()
+
+    # Decisions relayed by the registry's approve_many and reject_many, which pass
+    # on the sender of their own call as `regulator`. Only registered batches are in
+    # the registry's index; it is on the call stack and moves the batch itself, so
+    # these do not call back into it.
+    @arc4.abimethod
+    def approve_for(self, regulator: Account, compliance_score: UInt64) -> None:
+        assert self.registry.id != 0 and Global.caller_application_id == self.registry.id
+        assert regulator == self.regulator and self.producer != Account()
+        self._approve(regulator, compliance_score)
+
+    @arc4.abimethod
+    def reject_for(self, regulator: Account, reason_text: String) -> None:
+        assert self.registry.id != 0 and Global.caller_application_id == self.registry.id
+        assert regulator == self.regulator and self.producer != Account()
+        self._reject(regulator, reason_text)
+
+    @subroutine
+    def _approve(self, regulator: Account, compliance_score: UInt64) -> None:
         self.reg_status = String("approved")
         self.compliance_score = compliance_score
         self.approval_ts = Global.latest_timestamp
         self.status = String("approved")
+        arc4.emit(
+            Approved(
+                arc4.Address(regulator),
+                arc4.UInt64(compliance_score),
+                arc4.UInt64(self.approval_ts),
+            )
+        )
 
-    @arc4.abimethod
-    def reject(self, reason_text: String) -> None:
-        assert Txn.sender == self.regulator
+    @subroutine
+    def _reject(self, regulator: Account, reason_text: String) -> None:
         self.reg_status = String("rejected")
         self.rej_reason = reason_text
         self.approval_ts = Global.latest_timestamp
         self.status = String("rejected")
+        arc4.emit(
+            Rejected(
+                arc4.Address(regulator), arc4.String(reason_text), arc4.UInt64(self.approval_ts)
+            )
+        )
 
     @arc4.abimethod
     def transfer(self, new_receiver: Account, location: String) -> None:
@@ -93,31 +232,51 @@ class DrugBatchContract(ARC4Contract):
         self.transfer_count += UInt64(1)
         self.last_transfer_ts = Global.latest_timestamp
         self.status = String("in_transit")
+        arc4.emit(
+            Transferred(
+                arc4.Address(self.sender),
+                arc4.Address(new_receiver),
+                arc4.String(location),
+                arc4.UInt64(self.transfer_count),
+                arc4.UInt64(self.last_transfer_ts),
+            )
+        )
 
     @arc4.abimethod
     def mark_delivered(self) -> None:
         assert Txn.sender == self.receiver or Txn.sender == self.admin
         self.status = String("delivered")
         self.last_transfer_ts = Global.latest_timestamp
+        arc4.emit(Delivered(arc4.Address(Txn.sender), arc4.UInt64(self.last_transfer_ts)))
     @arc4.abimethod
     def set_qr(self, qr_hash: Bytes) -> None:
         assert Txn.sender == self.producer or Txn.sender == self.admin
         self.qr_hash = qr_hash
         self.last_verif_ts = Global.latest_timestamp
+        arc4.emit(QrSet(arc4.DynamicBytes(qr_hash), arc4.UInt64(self.last_verif_ts)))
     @arc4.abimethod
     def verify(self, qr_hash: Bytes) -> None:
         assert qr_hash == self.qr_hash
         self.verif_count += UInt64(1)
         self.last_verif_ts = Global.latest_timestamp
+        arc4.emit(
+            Verified(
+                arc4.Address(Txn.sender),
+                arc4.UInt64(self.verif_count),
+                arc4.UInt64(self.last_verif_ts),
+            )
+        )
     @arc4.abimethod
     def mark_counterfeit(self) -> None:
         assert Txn.sender == self.admin or Txn.sender == self.regulator
         self.is_authentic = UInt64(0)
         self.status = String("counterfeit")
         self.last_verif_ts = Global.latest_timestamp
+        arc4.emit(Counterfeit(arc4.Address(Txn.sender), arc4.UInt64(self.last_verif_ts)))
 
     @arc4.abimethod
     def update_quantity(self, new_quantity: UInt64) -> None:
         assert Txn.sender == self.producer or Txn.sender == self.admin
         self.quantity = new_quantity
         self.timestamp = Global.latest_timestamp
+        arc4.emit(QuantityUpdated(arc4.UInt64(new_quantity), arc4.UInt64(self.timestamp)))
@@ -1,4 +1,5 @@
 import logging
+import os
 
 import algokit_utils
 
@@ -7,22 +8,32 @@ logger = logging.getLogger(__name__)
 
 # define deployment behaviour based on supplied app spec
 def deploy() -> None:
-    from smart_contracts.artifacts.algo_healx.algo_healx_client import (
-        HelloArgs,
-        AlgoHealxFactory,
+    from smart_contracts.algo_healx.app_registry import AppRegistry
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        DrugBatchContractFactory,
     )
 
     algorand = algokit_utils.AlgorandClient.from_environment()
     deployer_ = algorand.account.from_environment("DEPLOYER")
 
     factory = algorand.client.get_typed_app_factory(
-        AlgoHealxFactory, default_sender=deployer_.address
-    )
-
-    app_client, result = factory.deploy(
-        on_update=algokit_utils.OnUpdate.AppendApp,
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+        DrugBatchContractFactory, default_sender=deployer_.address
     )
+    app_name = os.environ.get("DRUG_BATCH_APP_NAME", factory.app_name)
+
+    # Resolve the existing deployment from the local registry instead of letting
+    # algokit scan every app the deployer has created
+    with AppRegistry() as registry:
+        registry.track(algorand, deployer_.address)
+        registry.sync(algorand)
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+            app_name=app_name,
+            existing_deployments=registry.lookup(deployer_.address, app_name),
+        )
+        if result.operation_performed != algokit_utils.OperationPerformed.Nothing:
+            registry.record_deployment(deployer_.address, result.app)
 
     if result.operation_performed in [
         algokit_utils.OperationPerformed.Create,
@@ -36,9 +47,6 @@ def deploy() -> None:
             )
         )
 
-    name = "world"
-    response = app_client.send.hello(args=HelloArgs(name=name))
     logger.info(
-        f"Called hello on {app_client.app_name} ({app_client.app_id}) "
-        f"with name={name}, received: {response.abi_return}"
+        f"Deployed {app_client.app_name} ({app_client.app_id}): {result.operation_performed.name}"
     )
@@ -0,0 +1,70 @@
+import base64
+import logging
+import struct
+import typing
+from collections.abc import Container, Iterable, Iterator
+
+from algosdk.error import WrongKeyBytesLengthError
+
+from smart_contracts.artifacts.algo_healx.drug_batch_contract_codec import (
+    EVENTS_BY_SELECTOR,
+)
+
+logger = logging.getLogger(__name__)
+
+# What the generated decoders raise on app args or logs that are not the ARC-4
+# encoding they expect; any app can send those with a DrugBatchContract selector
+DECODE_ERRORS = (struct.error, ValueError, IndexError, TypeError, WrongKeyBytesLengthError)
+
+
+class BlockEvent(typing.NamedTuple):
+    """
+    A DrugBatchContract event found in a block, with the app that emitted it and
+    the position of its top-level transaction in the block.
+    """
+
+    round: int
+    intra: int
+    app_id: int
+    event: tuple
+
+
+def decode_log(log: bytes | str) -> tuple | None:
+    """
+    Decodes one transaction log, base64 or raw, if it is a DrugBatchContract event;
+    a log with an event selector that does not decode is skipped.
+    """
+    raw = base64.b64decode(log) if isinstance(log, str) else log
+    entry = EVENTS_BY_SELECTOR.get(raw[:4])
+    if entry is None:
+        return None
+    try:
+        return entry[1](raw)
+    except DECODE_ERRORS as e:
+        logger.debug(f"Skipping malformed {entry[0]} log: {e}")
+        return None
+
+
+def decode_logs(logs: Iterable[bytes | str]) -> list[tuple]:
+    """Every DrugBatchContract event in a transaction's logs, in emission order."""
+    return [event for event in map(decode_log, logs) if event is not None]
+
+
+def events_in_block(round_: int, block: dict, app_ids: Container[int]) -> Iterator[BlockEvent]:
+    """
+    Walks a block's app calls, inner calls included, and yields the events of those
+    to `app_ids` in order. Any app can log an event selector, so `app_ids` should
+    only hold known DrugBatchContract instances (see `BlockScanner` and
+    `AppRegistry`). Works on both the JSON and msgpack `block_info` formats.
+    """
+    for intra, top_level in enumerate(block.get("txns", [])):
+        pending = [top_level]
+        while pending:
+            signed_txn = pending.pop()
+            txn = signed_txn.get("txn", {})
+            apply_data = signed_txn.get("dt", {})
+            app_id = txn.get("apid") or signed_txn.get("apid")
+            if txn.get("type") == "appl" and app_id in app_ids:
+                for event in decode_logs(apply_data.get("lg", [])):
+                    yield BlockEvent(round_, intra, app_id, event)
+            pending.extend(reversed(apply_data.get("itx", [])))
@@ -0,0 +1,277 @@
+import dataclasses
+import logging
+import math
+import threading
+import typing
+from collections.abc import Sequence
+
+import algokit_utils
+
+from smart_contracts.artifacts.algo_healx.drug_batch_contract_codec import ENCODERS
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        DrugBatchContractClient,
+    )
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+APP_CALL_BUDGET = 700
+# Simulate accepts up to 16 x 20,000 extra opcodes, so an over-budget group
+# still reports what it would have consumed instead of failing.
+SIMULATE_EXTRA_BUDGET = 320_000
+# Fee usage is counted in millionths of the minimum fee
+MIN_FEE_USAGE = 1_000_000
+_ALWAYS_APPROVE = "#pragma version 10\nint 1\n"
+# Methods that also move the batch in its BatchRegistryContract, once one is set
+_REGISTRY_METHODS = frozenset({"set_regulator", "register", "approve", "reject", "set_registry"})
+# A padding call runs the single `int 1` of _ALWAYS_APPROVE
+PADDING_CALL_COST = 1
+
+
+class MethodCall(typing.NamedTuple):
+    """A DrugBatchContract method call, as passed to `client.params.<method>`."""
+
+    client: "DrugBatchContractClient"
+    method: str
+    args: object = None
+    params: algokit_utils.CommonAppCallParams | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class CallEstimate:
+    """
+    Opcode cost and inner transactions of one call, from simulate, and its fee usage
+    (in millionths of the minimum fee).
+    """
+
+    op_cost: int
+    inner_txns: int
+    fee_usage: int
+
+
+@dataclasses.dataclass(frozen=True)
+class GroupEstimate:
+    """What a group of calls needs: per-call estimates, padding calls and total fee."""
+
+    calls: list[CallEstimate]
+    padding_calls: int
+    fee: int
+    simulated: bool
+
+    @property
+    def op_cost(self) -> int:
+        return sum(call.op_cost for call in self.calls)
+
+
+def deploy_padding_app(algorand: algokit_utils.AlgorandClient, sender: str) -> int:
+    """Creates an always-approve app whose calls only add opcode budget to a group."""
+    result = algorand.send.app_create(
+        algokit_utils.AppCreateParams(
+            sender=sender,
+            approval_program=_ALWAYS_APPROVE,
+            clear_state_program=_ALWAYS_APPROVE,
+        )
+    )
+    logger.info(f"Deployed budget padding app {result.app_id}")
+    return result.app_id
+
+
+def _count_inner_txns(txn_result: dict) -> int:
+    inner = txn_result.get("inner-txns", [])
+    return len(inner) + sum(_count_inner_txns(txn) for txn in inner)
+
+
+class FeeEstimator:
+    """
+    Simulates a group of DrugBatchContract calls once, records each call's opcode
+    cost, inner transactions and fee usage, and sends the group with exactly the
+    fee it needs and enough budget padding calls to cover its pooled opcode cost.
+    Fee usage is one minimum fee per transaction, inner transactions included.
+
+    Estimates are cached per method signature, encoded argument size (rounded up
+    to `bucket_bytes`) and, for the methods that call it, whether the app is
+    attached to a BatchRegistryContract, so a group whose calls are all cached is sent
+    without a simulate round-trip. Whether an app is attached is read once per app
+    and read again after `send` sets its registry; call `forget_registry` after
+    setting one any other way. The whole group fee is pooled onto the first call, so its
+    sender pays for the group, and every other transaction is sent with a zero fee.
+
+    Padding calls go to `padding_app_id`, an always-approve app such as the one
+    created by `deploy_padding_app`. When the network charges a per-byte fee
+    (congestion), each transaction keeps algokit's default fee and calls add one
+    minimum fee per inner transaction.
+    """
+
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        *,
+        padding_app_id: int | None = None,
+        bucket_bytes: int = 32,
+    ):
+        self._algorand = algorand
+        self._padding_app_id = padding_app_id
+        self._bucket_bytes = bucket_bytes
+        self._cache: dict[tuple[str, int, bool], CallEstimate] = {}
+        # Registry of each app, 0 until `set_registry` is called on it
+        self._registries: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------ Estimation ------------------------------ #
+
+    def estimate(self, calls: Sequence[MethodCall]) -> GroupEstimate:
+        """Estimates a group, simulating it only if a call is not cached yet."""
+        return self._estimate(calls, [self._build(call) for call in calls])
+
+    def _estimate(
+        self,
+        calls: Sequence[MethodCall],
+        call_params: list[algokit_utils.AppCallMethodCallParams],
+    ) -> GroupEstimate:
+        keys = [self._cache_key(call, params) for call, params in zip(calls, call_params)]
+        with self._lock:
+            cached = [self._cache.get(key) for key in keys]
+
+        simulated = any(estimate is None for estimate in cached)
+        if simulated:
+            estimates = self._simulate(call_params)
+            with self._lock:
+                for key, estimate in zip(keys, estimates):
+                    previous = self._cache.get(key)
+                    if previous is None or estimate.op_cost > previous.op_cost:
+                        self._cache[key] = estimate
+        else:
+            estimates = typing.cast(list[CallEstimate], cached)
+
+        op_cost = sum(estimate.op_cost for estimate in estimates)
+        shortfall = op_cost - APP_CALL_BUDGET * len(calls)
+        padding_calls = max(0, math.ceil(shortfall / (APP_CALL_BUDGET - PADDING_CALL_COST)))
+        if len(calls) + padding_calls > MAX_GROUP_SIZE:
+            raise Exception(
+                f"Group of {len(calls)} calls needs {op_cost} opcodes, more than "
+                f"{MAX_GROUP_SIZE} app calls provide"
+            )
+        usage = sum(estimate.fee_usage for estimate in estimates) + padding_calls * MIN_FEE_USAGE
+        fee = math.ceil(usage * self._algorand.get_suggested_params().min_fee / MIN_FEE_USAGE)
+        return GroupEstimate(
+            calls=estimates, padding_calls=padding_calls, fee=fee, simulated=simulated
+        )
+
+    def _build(self, call: MethodCall) -> algokit_utils.AppCallMethodCallParams:
+        build = getattr(call.client.params, call.method)
+        if call.args is None:
+            return build(params=call.params)
+        return build(args=call.args, params=call.params)
+
+    def _cache_key(
+        self, call: MethodCall, params: algokit_utils.AppCallMethodCallParams
+    ) -> tuple[str, int, bool]:
+        signature = params.method.get_signature()
+        registry_set = params.method.name in _REGISTRY_METHODS and self._registry(params.app_id) != 0
+        encoder = ENCODERS.get(signature)
+        if encoder is None or call.args is None:
+            return signature, 0, registry_set
+        args = call.args if isinstance(call.args, tuple) else dataclasses.astuple(call.args)
+        size = sum(len(arg) for arg in encoder(*args)[1:])
+        return signature, math.ceil(size / self._bucket_bytes), registry_set
+
+    def _registry(self, app_id: int) -> int:
+        with self._lock:
+            registry = self._registries.get(app_id)
+        if registry is None:
+            state = self._algorand.app.get_global_state(app_id).get("registry")
+            registry = typing.cast(int, state.value) if state is not None else 0
+            with self._lock:
+                self._registries[app_id] = registry
+        return registry
+
+    def forget_registry(self, app_id: int) -> None:
+        """Reads an app's registry again on its next estimate, e.g. after setting it."""
+        with self._lock:
+            self._registries.pop(app_id, None)
+
+    def _simulate(
+        self, call_params: list[algokit_utils.AppCallMethodCallParams]
+    ) -> list[CallEstimate]:
+        composer = self._algorand.new_group()
+        for params in call_params:
+            composer.add_app_call_method_call(params)
+        result = composer.simulate(
+            allow_unnamed_resources=True,
+            allow_empty_signatures=True,
+            skip_signatures=True,
+            extra_opcode_budget=SIMULATE_EXTRA_BUDGET,
+        )
+        group = result.simulate_response["txn-groups"][0]
+        op_costs = [txn.get("app-budget-consumed", 0) for txn in group["txn-results"]]
+        inner_txns = [_count_inner_txns(txn["txn-result"]) for txn in group["txn-results"]]
+        return [
+            CallEstimate(
+                op_cost=op_cost, inner_txns=inner, fee_usage=(1 + inner) * MIN_FEE_USAGE
+            )
+            for op_cost, inner in zip(op_costs, inner_txns)
+        ]
+
+    # ------------------------------- Sending ------------------------------- #
+
+    def compose(
+        self, calls: Sequence[MethodCall]
+    ) -> tuple[algokit_utils.TransactionComposer, GroupEstimate]:
+        """Builds the group with pooled fees and padding calls, ready to send."""
+        call_params = [self._build(call) for call in calls]
+        estimate = self._estimate(calls, call_params)
+        if estimate.padding_calls and self._padding_app_id is None:
+            raise Exception(
+                f"Group needs {estimate.padding_calls} budget padding calls, "
+                "but no padding_app_id was given"
+            )
+
+        suggested_params = self._algorand.get_suggested_params()
+        pool_fees = suggested_params.fee == 0
+        if not pool_fees:
+            logger.warning("Network is charging a per-byte fee, using default fees")
+
+        composer = self._algorand.new_group()
+        for i, (params, call_estimate) in enumerate(zip(call_params, estimate.calls)):
+            if pool_fees:
+                fee = estimate.fee if i == 0 else 0
+                params = dataclasses.replace(
+                    params, static_fee=algokit_utils.AlgoAmount.from_micro_algo(fee)
+                )
+            elif call_estimate.inner_txns:
+                # Inner transactions are paid from the fee pool of their outer call
+                params = dataclasses.replace(
+                    params,
+                    extra_fee=algokit_utils.AlgoAmount.from_micro_algo(
+                        suggested_params.min_fee * call_estimate.inner_txns
+                    ),
+                )
+            composer.add_app_call_method_call(params)
+
+        for i in range(estimate.padding_calls):
+            composer.add_app_call(
+                algokit_utils.AppCallParams(
+                    sender=call_params[0].sender,
+                    signer=call_params[0].signer,
+                    app_id=typing.cast(int, self._padding_app_id),
+                    # Identical padding calls would share a transaction ID
+                    note=f"budget-{i}".encode(),
+                    static_fee=algokit_utils.AlgoAmount.from_micro_algo(0) if pool_fees else None,
+                )
+            )
+        return composer, estimate
+
+    def send(
+        self,
+        calls: Sequence[MethodCall],
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        """Estimates (from cache when possible) and sends a group of calls."""
+        composer, _ = self.compose(calls)
+        result = composer.send(send_params)
+        for call in calls:
+            if call.method == "set_registry":
+                self.forget_registry(call.client.app_id)
+        return result
@@ -0,0 +1,139 @@
+import threading
+import typing
+from collections import OrderedDict
+
+import algokit_utils
+from algosdk.logic import get_application_address
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        DrugBatchContractClient,
+        DrugBatchContractCreateTransactionParams,
+        DrugBatchContractParams,
+        DrugBatchContractSend,
+        DrugBatchContractState,
+    )
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class ClientContext:
+    """
+    What every DrugBatchContract client of a service has in common: the Algorand
+    client, default sender and signer, and a bounded cache of full clients.
+
+    A `DrugBatchContractClient` holds its own `AppClient`, app spec accessors and
+    four generated sub-objects, and registers an error transformer with the
+    Algorand client that keeps it alive for as long as the Algorand client is. A
+    service tracking many batches holds `DrugBatchHandle`s instead, and a full
+    client is only built for the `cache_size` apps called most recently; evicted
+    clients are unregistered so they can be freed.
+    """
+
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        *,
+        default_sender: str | None = None,
+        default_signer: algokit_utils.TransactionSigner | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.algorand = algorand
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        self.cache_size = cache_size
+        self._clients: OrderedDict[int, "DrugBatchContractClient"] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def handle(self, app_id: int) -> "DrugBatchHandle":
+        return DrugBatchHandle(app_id, self)
+
+    def client(self, app_id: int) -> "DrugBatchContractClient":
+        """The full client of an app, built on first use and cached."""
+        from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+            DrugBatchContractClient,
+        )
+
+        with self._lock:
+            client = self._clients.get(app_id)
+            if client is not None:
+                self._clients.move_to_end(app_id)
+                return client
+            client = DrugBatchContractClient(
+                algorand=self.algorand,
+                app_id=app_id,
+                default_sender=self.default_sender,
+                default_signer=self.default_signer,
+            )
+            self._clients[app_id] = client
+            while len(self._clients) > self.cache_size:
+                _, evicted = self._clients.popitem(last=False)
+                self._release(evicted)
+        return client
+
+    def clear(self) -> None:
+        """Drops every cached client."""
+        with self._lock:
+            for client in self._clients.values():
+                self._release(client)
+            self._clients.clear()
+
+    def _release(self, client: "DrugBatchContractClient") -> None:
+        # The transformer is a bound method of the AppClient, registered in its
+        # constructor; calls made through `send` map logic errors without it
+        self.algorand.unregister_error_transformer(
+            client.app_client._handle_call_errors_transform
+        )
+
+
+class DrugBatchHandle:
+    """
+    A DrugBatchContract app: its ID and the `ClientContext` it is called through,
+    with the generated client's typed `params`, `create_transaction`, `send` and
+    `state` accessors.
+
+        context = ClientContext(algorand, default_sender=producer)
+        handle = context.handle(app_id)
+        handle.send.transfer(args=(holder, location))
+    """
+
+    __slots__ = ("app_id", "context")
+
+    def __init__(self, app_id: int, context: ClientContext):
+        self.app_id = app_id
+        self.context = context
+
+    def __repr__(self) -> str:
+        return f"DrugBatchHandle(app_id={self.app_id})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DrugBatchHandle):
+            return NotImplemented
+        return self.app_id == other.app_id and self.context is other.context
+
+    def __hash__(self) -> int:
+        return hash(self.app_id)
+
+    @property
+    def app_address(self) -> str:
+        return get_application_address(self.app_id)
+
+    @property
+    def client(self) -> "DrugBatchContractClient":
+        return self.context.client(self.app_id)
+
+    @property
+    def params(self) -> "DrugBatchContractParams":
+        return self.client.params
+
+    @property
+    def create_transaction(self) -> "DrugBatchContractCreateTransactionParams":
+        return self.client.create_transaction
+
+    @property
+    def send(self) -> "DrugBatchContractSend":
+        return self.client.send
+
+    @property
+    def state(self) -> "DrugBatchContractState":
+        return self.client.state
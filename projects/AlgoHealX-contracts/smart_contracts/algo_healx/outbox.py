@@ -0,0 +1,486 @@
+import argparse
+import base64
+import dataclasses
+import hashlib
+import logging
+import sqlite3
+import time
+import typing
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import algokit_utils
+import msgpack
+from algokit_utils.transactions.transaction_composer import (
+    AdditionalAtcContext,
+    prepare_group_for_sending,
+)
+from algosdk import encoding, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.algo_healx.scanner import AlgodBlocks, BlockSource, app_calls
+from smart_contracts.artifacts.algo_healx.drug_batch_contract_codec import ENCODERS
+
+logger = logging.getLogger(__name__)
+
+# Rounds a signed transaction stays valid for. An unconfirmed intent is only signed
+# again once its window has passed, so this bounds how long a lost submission waits.
+DEFAULT_VALIDITY_WINDOW = 50
+DEFAULT_BATCH_SIZE = 256
+_LEASE_DOMAIN = b"algohealx/outbox/"
+# Submission errors after which the intent is failed instead of retried: the
+# contract rejected the call, so sending it again would be rejected too
+_REJECTED = ("logic eval error", "rejected by logic")
+# Submission errors meaning a transaction with this lease is already in the pool or a block
+_ALREADY_SUBMITTED = ("already in ledger", "overlapping lease", "transaction already")
+# Submission errors from references that went stale: another app's move swapped
+# a different batch into the slot this call's registry references point at. The
+# intent is signed again with fresh references instead of failed.
+_STALE_REFERENCES = ("invalid Box reference", "unavailable Box", "unavailable App")
+# Methods that move the batch in its BatchRegistryContract once one is set, through
+# an inner call that needs the registry's app and box references and its own fee
+_REGISTRY_METHODS = frozenset({"set_regulator", "register", "approve", "reject", "set_registry"})
+
+_METHODS_BY_NAME = {signature.split("(")[0]: signature for signature in ENCODERS}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS intents (
+    key TEXT NOT NULL UNIQUE,
+    app_id INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    app_args BLOB NOT NULL,
+    sender TEXT NOT NULL,
+    lease BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempt INTEGER NOT NULL DEFAULT 0,
+    tx_id TEXT,
+    first_valid INTEGER,
+    last_valid INTEGER,
+    signed BLOB,
+    confirmed_round INTEGER,
+    error TEXT,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS intents_status ON intents (status);
+CREATE INDEX IF NOT EXISTS intents_app_id ON intents (app_id, status);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Intent lifecycle: pending → signed → submitted → confirmed, or failed when algod
+# rejects the transaction. A signed or submitted intent whose window passes
+# without its lease appearing in a block goes back to pending.
+PENDING = "pending"
+SIGNED = "signed"
+SUBMITTED = "submitted"
+CONFIRMED = "confirmed"
+FAILED = "failed"
+_UNRESOLVED = (PENDING, SIGNED, SUBMITTED)
+
+
+def intent_lease(key: str) -> bytes:
+    """The 32-byte transaction lease every attempt of an intent is sent with."""
+    return hashlib.sha256(_LEASE_DOMAIN + key.encode()).digest()
+
+
+@dataclasses.dataclass(frozen=True)
+class Intent:
+    key: str
+    app_id: int
+    method: str
+    sender: str
+    status: str
+    attempt: int
+    tx_id: str | None
+    confirmed_round: int | None
+    error: str | None
+
+
+@dataclasses.dataclass(frozen=True)
+class ReconcileResult:
+    confirmed: int
+    expired: int
+    scanned_to: int | None
+
+
+class Outbox:
+    """
+    Durable queue of DrugBatchContract calls that makes each one take effect exactly
+    once, however often it is submitted or the process crashes.
+
+    `add` commits an intent under a caller-chosen idempotency key before anything is
+    signed; adding the same key again is a no-op. Every transaction sent for an
+    intent carries the lease derived from its key, and an attempt's signed bytes
+    and validity window are committed before it is sent. Algorand accepts at most
+    one transaction per sender and lease within overlapping windows, so resending
+    the same bytes is harmless, and a new attempt is only signed once
+    `reconcile` has read every block of the previous window without finding the
+    lease, i.e. once the previous attempt can no longer land.
+
+    `submit` sends pending intents on `workers` threads, at most one in flight per
+    app so calls to a batch land in the order they were added. `reconcile` reads
+    each new block once for all in-flight leases, rather than polling every
+    transaction, and records where it got to, so after a crash it carries on from
+    there. The database is SQLite in WAL mode with synchronous commits.
+
+    Calls that move a batch in its BatchRegistryContract are simulated when they
+    are signed, which fills in the registry's app and box references and raises
+    their fee to cover the inner call. A call the simulation rejects is failed
+    without being sent, and one rejected on submission for a stale reference
+    goes back to pending to be simulated and signed again.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        algorand: algokit_utils.AlgorandClient,
+        *,
+        source: BlockSource | None = None,
+        workers: int = 8,
+        validity_window: int = DEFAULT_VALIDITY_WINDOW,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.algorand = algorand
+        self.algod = algorand.client.algod
+        self.source = source or AlgodBlocks(self.algod)
+        self.workers = workers
+        self.validity_window = validity_window
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # An intent must be on disk before its transaction is signed
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(_SCHEMA)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outbox")
+        # Senders of pending intents that `algorand` has no signer for
+        self._unsignable: set[str] = set()
+
+    def __enter__(self) -> "Outbox":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+        self._db.close()
+
+    # ------------------------------- Intents ------------------------------- #
+
+    def add(self, key: str, app_id: int, method: str, args: Sequence, sender: str) -> bool:
+        """
+        Records a call to make, by method name or signature; returns False if an
+        intent with this key was already recorded.
+        """
+        signature = _METHODS_BY_NAME.get(method, method)
+        encode = ENCODERS.get(signature)
+        if encode is None:
+            raise Exception(f"DrugBatchContract has no method {method}")
+        app_args = msgpack.packb(encode(*args), use_bin_type=True)
+        with self._db:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO intents (key, app_id, method, app_args, sender, lease,"
+                " status, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, app_id, signature, app_args, sender, intent_lease(key), PENDING, time.time()),
+            )
+        return cursor.rowcount == 1
+
+    def get(self, key: str) -> Intent | None:
+        row = self._db.execute(
+            "SELECT key, app_id, method, sender, status, attempt, tx_id, confirmed_round, error"
+            " FROM intents WHERE key = ?",
+            (key,),
+        ).fetchone()
+        return Intent(*row) if row else None
+
+    def counts(self) -> dict[str, int]:
+        """Number of intents in each status."""
+        return dict(self._db.execute("SELECT status, count(*) FROM intents GROUP BY status"))
+
+    def unresolved(self) -> int:
+        return self._db.execute(
+            "SELECT count(*) FROM intents WHERE status IN (?, ?, ?)", _UNRESOLVED
+        ).fetchone()[0]
+
+    # ------------------------------- Submission ------------------------------- #
+
+    def submit(self, limit: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Signs up to `limit` pending intents and sends them, together with signed
+        ones whose send may not have gone through; returns how many were sent.
+        """
+        last_round = int(self.algod.status()["last-round"])  # type: ignore[index]
+        self._sign(last_round, limit)
+        rows = self._db.execute(
+            "SELECT rowid, signed FROM intents WHERE status = ? AND last_valid > ? ORDER BY rowid",
+            (SIGNED, last_round),
+        ).fetchall()
+        outcomes = list(self._pool.map(self._send, [signed for _, signed in rows]))
+        with self._db:
+            for (rowid, _), error in zip(rows, outcomes):
+                if error is None:
+                    self._db.execute(
+                        "UPDATE intents SET status = ? WHERE rowid = ?", (SUBMITTED, rowid)
+                    )
+                elif any(reason in error for reason in _STALE_REFERENCES):
+                    # Rejected before it reached the pool, so this attempt cannot land
+                    # and the lease still guards against an earlier one that did
+                    self._db.execute(
+                        "UPDATE intents SET status = ?, signed = NULL, error = ? WHERE rowid = ?",
+                        (PENDING, error, rowid),
+                    )
+                elif any(reason in error for reason in _REJECTED):
+                    self._db.execute(
+                        "UPDATE intents SET status = ?, error = ? WHERE rowid = ?",
+                        (FAILED, error, rowid),
+                    )
+                else:
+                    # Stays signed, the same bytes are sent again on the next submit
+                    logger.warning(f"Sending outbox intent {rowid} failed, will retry: {error}")
+        return len(rows)
+
+    def _sign(self, last_round: int, limit: int) -> None:
+        # The oldest pending intent of each app that has nothing else in flight
+        rows = self._db.execute(
+            "SELECT rowid, app_id, method, app_args, sender, lease FROM intents AS i"
+            " WHERE status = ? AND NOT EXISTS ("
+            "   SELECT 1 FROM intents AS j WHERE j.app_id = i.app_id AND j.rowid < i.rowid"
+            "   AND j.status IN (?, ?, ?))"
+            " ORDER BY rowid LIMIT ?",
+            (PENDING, *_UNRESOLVED, limit),
+        ).fetchall()
+        signers = {}
+        for sender in {row[4] for row in rows}:
+            try:
+                signers[sender] = self.algorand.account.get_signer(sender)
+                self._unsignable.discard(sender)
+            except ValueError:
+                if sender not in self._unsignable:
+                    logger.warning(f"No signer for {sender}, its outbox intents stay pending")
+                self._unsignable.add(sender)
+        # Already signed attempts are still sent; new ones wait for their signer
+        rows = [row for row in rows if row[4] in signers]
+        if not rows:
+            return
+        params = self.algod.suggested_params()
+        params.flat_fee = True
+        params.fee = params.min_fee
+        params.first = last_round
+        params.last = last_round + self.validity_window
+        txns = [
+            transaction.ApplicationCallTxn(
+                sender,
+                params,
+                app_id,
+                transaction.OnComplete.NoOpOC,
+                app_args=msgpack.unpackb(app_args),
+                lease=lease,
+            )
+            for _, app_id, _, app_args, sender, lease in rows
+        ]
+        # Simulated before the database is locked, they are network round-trips
+        resolved = list(
+            self._pool.map(
+                self._resolve,
+                txns,
+                [method.split("(")[0] for _, _, method, *_ in rows],
+                [signers[txn.sender] for txn in txns],
+            )
+        )
+        # The attempts are committed before any of them is sent
+        with self._db:
+            for (rowid, *_), txn in zip(rows, resolved):
+                if isinstance(txn, str):
+                    if any(reason in txn for reason in _REJECTED):
+                        self._db.execute(
+                            "UPDATE intents SET status = ?, error = ? WHERE rowid = ?",
+                            (FAILED, txn, rowid),
+                        )
+                    else:
+                        logger.warning(
+                            f"Simulating outbox intent {rowid} failed, will retry: {txn}"
+                        )
+                    continue
+                signed = signers[txn.sender].sign_transactions([txn], [0])[0]
+                self._db.execute(
+                    "UPDATE intents SET status = ?, attempt = attempt + 1, tx_id = ?,"
+                    " first_valid = ?, last_valid = ?, signed = ?, error = NULL WHERE rowid = ?",
+                    (
+                        SIGNED, txn.get_txid(), txn.first_valid_round, txn.last_valid_round,
+                        base64.b64decode(encoding.msgpack_encode(signed)), rowid,
+                    ),
+                )
+
+    def _resolve(
+        self, txn: transaction.ApplicationCallTxn, method: str, signer: TransactionSigner
+    ) -> transaction.Transaction | str:
+        """
+        Adds the references and inner fee a registry-moving call needs, by simulating
+        it; returns the error instead if the simulation fails.
+        """
+        if method not in _REGISTRY_METHODS:
+            return txn
+        atc = AtomicTransactionComposer()
+        atc.add_transaction(TransactionWithSigner(txn, signer))
+        # At most one inner call, to the registry's move
+        max_fee = algokit_utils.AlgoAmount.from_micro_algo(2 * txn.fee)
+        try:
+            atc = prepare_group_for_sending(
+                atc,
+                self.algod,
+                populate_app_call_resources=True,
+                cover_app_call_inner_transaction_fees=True,
+                additional_atc_context=AdditionalAtcContext(max_fees={0: max_fee}),
+            )
+        except Exception as e:
+            return str(e)
+        return atc.build_group()[0].txn
+
+    def _send(self, signed: bytes) -> str | None:
+        try:
+            self.algod.send_raw_transaction(base64.b64encode(signed))  # type: ignore[arg-type]
+        except AlgodHTTPError as e:
+            if any(reason in str(e) for reason in _ALREADY_SUBMITTED):
+                return None
+            return str(e)
+        except Exception as e:
+            return str(e)
+        return None
+
+    # ------------------------------- Reconciliation ------------------------------- #
+
+    def _scanned_to(self) -> int | None:
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'scanned_to'").fetchone()
+        return row[0] if row else None
+
+    def reconcile(self, last_round: int | None = None) -> ReconcileResult:
+        """
+        Reads the blocks up to `last_round` that may hold an in-flight intent's
+        lease: marks the intents found as confirmed, and those whose window has
+        passed without them as pending again.
+        """
+        in_flight = self._db.execute(
+            "SELECT rowid, sender, lease, first_valid, last_valid FROM intents"
+            " WHERE status IN (?, ?)",
+            (SIGNED, SUBMITTED),
+        ).fetchall()
+        scanned_to = self._scanned_to()
+        if not in_flight:
+            return ReconcileResult(confirmed=0, expired=0, scanned_to=scanned_to)
+        if last_round is None:
+            last_round = int(self.algod.status()["last-round"])  # type: ignore[index]
+
+        # Rounds committed before an attempt was signed cannot hold it, so blocks
+        # are read once, from wherever the previous reconcile stopped
+        first = min(first_valid for _, _, _, first_valid, _ in in_flight)
+        if scanned_to is not None:
+            first = max(first, scanned_to + 1)
+        last = min(last_round, max(last_valid for *_, last_valid in in_flight))
+        leases = {
+            (encoding.decode_address(sender), lease): rowid
+            for rowid, sender, lease, _, _ in in_flight
+        }
+        found: dict[int, int] = {}
+        for round_ in range(first, last + 1):
+            response = msgpack.unpackb(
+                self.source.raw_block(round_), raw=False, unicode_errors="surrogateescape"
+            )
+            for _, _, txn, _ in app_calls(response["block"]):
+                rowid = leases.get((txn.get("snd"), txn.get("lx")))
+                if rowid is not None:
+                    found[rowid] = round_
+        scanned_to = max(last, scanned_to or 0)
+
+        expired = [
+            rowid
+            for rowid, _, _, _, last_valid in in_flight
+            if rowid not in found and last_valid <= scanned_to
+        ]
+        with self._db:
+            self._db.executemany(
+                "UPDATE intents SET status = ?, confirmed_round = ?, signed = NULL WHERE rowid = ?",
+                [(CONFIRMED, round_, rowid) for rowid, round_ in found.items()],
+            )
+            self._db.executemany(
+                "UPDATE intents SET status = ?, signed = NULL WHERE rowid = ?",
+                [(PENDING, rowid) for rowid in expired],
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('scanned_to', ?)", (scanned_to,)
+            )
+        if expired:
+            logger.info(f"{len(expired)} outbox intents expired unconfirmed and will be re-signed")
+        return ReconcileResult(confirmed=len(found), expired=len(expired), scanned_to=scanned_to)
+
+    def unsignable(self) -> dict[str, int]:
+        """Pending intents that cannot be signed for lack of a signer, by sender."""
+        if not self._unsignable:
+            return {}
+        senders = sorted(self._unsignable)
+        return dict(
+            self._db.execute(
+                "SELECT sender, count(*) FROM intents WHERE status = ?"
+                f" AND sender IN ({', '.join('?' * len(senders))}) GROUP BY sender",
+                (PENDING, *senders),
+            )
+        )
+
+    def drain(self, timeout: float | None = None) -> dict[str, int]:
+        """
+        Submits and reconciles, one round at a time, until no intent is unresolved, or
+        only intents without a signer are left pending (see `unsignable`).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.reconcile()
+        while self.unresolved():
+            if deadline is not None and time.monotonic() > deadline:
+                raise Exception(f"{self.unresolved()} outbox intents unresolved after {timeout}s")
+            self.submit()
+            if self.unresolved() == sum(self.unsignable().values()):
+                break
+            last_round = int(self.algod.status()["last-round"])  # type: ignore[index]
+            status = self.algod.status_after_block(last_round)
+            self.reconcile(int(status["last-round"]))  # type: ignore[index]
+        return self.counts()
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Reconcile an outbox against the chain and submit what is left, e.g. after a crash"
+    )
+    parser.add_argument("outbox", type=Path)
+    parser.add_argument("--workers", type=int, default=8, help="concurrent submissions")
+    parser.add_argument("--timeout", type=float, default=None)
+    parser.add_argument(
+        "--sender-env",
+        action="append",
+        default=[],
+        help="name of a sender account to load from the environment (<NAME>_MNEMONIC),"
+        " repeated for each sender; intents of other senders are only resent if signed",
+    )
+    args = parser.parse_args()
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    for name in args.sender_env:
+        algorand.account.from_environment(name)
+    with Outbox(args.outbox, algorand, workers=args.workers) as outbox:
+        logger.info(f"Outbox {args.outbox}: {outbox.counts()}")
+        logger.info(f"Drained: {outbox.drain(args.timeout)}")
+        for sender, count in outbox.unsignable().items():
+            logger.warning(f"{count} intents of {sender} left pending, pass its --sender-env")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,227 @@
+import argparse
+import functools
+import hashlib
+import hmac
+import json
+import logging
+import struct
+import typing
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts.algo_healx.state_reader import BatchStateReader
+
+logger = logging.getLogger(__name__)
+
+# Compact QR payloads for DrugBatchContract batches, replacing the JSON text in
+# `medicines.qr_code_data`.
+#
+#   version   1 byte, PAYLOAD_VERSION
+#   app_id    unsigned LEB128
+#   batch key BATCH_KEY_SIZE bytes, sha256(batch_id) truncated
+#   serial    unsigned LEB128, the unit's number within the print run
+#   tag       TAG_SIZE bytes, HMAC-SHA256 of the bytes above keyed with the app's
+#             on-chain `qr_hash`, truncated
+#
+# The bytes are base45 encoded (RFC 9285), whose alphabet is the QR alphanumeric
+# set, so a label fits in about 35 characters. A scanner resolves the app from the
+# payload itself, reads its global state and checks the batch key and tag locally.
+# `qr_hash` is public state, so the tag does not stop someone who reads the chain
+# from minting labels; it rejects damaged or made-up payloads, labels pointing at
+# the wrong app, and every label printed before `set_qr` changed the app's key,
+# which is how a print run is revoked.
+
+PAYLOAD_VERSION = 1
+BATCH_KEY_SIZE = 6
+TAG_SIZE = 8
+
+_BASE45_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
+# Base45 character → value, 0xFF for anything else
+_BASE45_VALUES = bytes(
+    _BASE45_ALPHABET.find(chr(char)) if chr(char) in _BASE45_ALPHABET else 0xFF
+    for char in range(256)
+)
+
+
+class QrPayload(typing.NamedTuple):
+    app_id: int
+    batch_key: bytes
+    serial: int
+    tag: bytes
+    # Everything the tag covers
+    signed: bytes
+
+
+# -------------------------------- Base45 -------------------------------- #
+
+
+@functools.cache
+def _base45_pairs() -> list[str]:
+    # The three characters of every 16-bit value, built on first use (~30 ms)
+    alphabet = _BASE45_ALPHABET
+    return [alphabet[n % 45] + alphabet[n // 45 % 45] + alphabet[n // 2025] for n in range(1 << 16)]
+
+
+def b45encode(data: bytes) -> str:
+    pairs = len(data) // 2
+    text = "".join(map(_base45_pairs().__getitem__, struct.unpack(f">{pairs}H", data[: 2 * pairs])))
+    if len(data) % 2:
+        d, c = divmod(data[-1], 45)
+        text += _BASE45_ALPHABET[c] + _BASE45_ALPHABET[d]
+    return text
+
+
+def b45decode(text: str) -> bytes:
+    values = text.encode("latin-1", errors="replace").translate(_BASE45_VALUES)
+    if 0xFF in values:
+        char = text[values.index(0xFF)]
+        raise ValueError(f"{char!r} is not a base45 character")
+    if len(values) % 3 == 1:
+        raise ValueError("Base45 text cannot have a length of 1 modulo 3")
+    out = bytearray()
+    for i in range(0, len(values) - 2, 3):
+        n = values[i] + values[i + 1] * 45 + values[i + 2] * 2025
+        if n > 0xFFFF:
+            raise ValueError(f"Base45 triplet {text[i:i + 3]!r} is out of range")
+        out += n.to_bytes(2, "big")
+    if len(values) % 3 == 2:
+        n = values[-2] + values[-1] * 45
+        if n > 0xFF:
+            raise ValueError(f"Base45 pair {text[-2:]!r} is out of range")
+        out.append(n)
+    return bytes(out)
+
+
+# ------------------------------- Payloads ------------------------------- #
+
+
+def _uvarint(value: int) -> bytes:
+    if value < 0:
+        raise ValueError(f"{value} cannot be encoded as an unsigned varint")
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_uvarint(data: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while offset < len(data):
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+    raise ValueError("QR payload ends inside a varint")
+
+
+def batch_key(batch_id: str) -> bytes:
+    return hashlib.sha256(batch_id.encode()).digest()[:BATCH_KEY_SIZE]
+
+
+def _header(app_id: int, batch_id: str) -> bytes:
+    return bytes((PAYLOAD_VERSION,)) + _uvarint(app_id) + batch_key(batch_id)
+
+
+def encode_payload(app_id: int, batch_id: str, serial: int, qr_hash: bytes) -> str:
+    """The base45 QR text of one unit of a batch."""
+    signed = _header(app_id, batch_id) + _uvarint(serial)
+    tag = hmac.new(qr_hash, signed, hashlib.sha256).digest()[:TAG_SIZE]
+    return b45encode(signed + tag)
+
+
+def decode_payload(text: str) -> QrPayload:
+    """Parses QR text; raises ValueError if it is not a payload this version reads."""
+    data = b45decode(text.strip())
+    if not data or data[0] != PAYLOAD_VERSION:
+        raise ValueError(f"Unsupported QR payload version {data[0] if data else None}")
+    app_id, offset = _read_uvarint(data, 1)
+    key = data[offset : offset + BATCH_KEY_SIZE]
+    serial, offset = _read_uvarint(data, offset + BATCH_KEY_SIZE)
+    if len(data) != offset + TAG_SIZE:
+        raise ValueError(f"QR payload has {len(data) - offset} bytes after its serial, not {TAG_SIZE}")
+    return QrPayload(app_id, key, serial, data[offset:], data[:offset])
+
+
+def verify_payload(payload: QrPayload, batch_id: str, qr_hash: bytes) -> bool:
+    """Whether a payload belongs to the batch and key its app holds on chain."""
+    expected = hmac.new(qr_hash, payload.signed, hashlib.sha256).digest()[:TAG_SIZE]
+    return hmac.compare_digest(payload.batch_key, batch_key(batch_id)) and hmac.compare_digest(
+        payload.tag, expected
+    )
+
+
+def print_run(app_id: int, batch_id: str, qr_hash: bytes, serials: Iterable[int]) -> Iterator[str]:
+    """
+    QR texts for many units of a batch.
+
+    HMAC-SHA256 is computed by hand with the key pads and the header every unit
+    shares absorbed once, so each unit only hashes its serial and the inner digest.
+    """
+    header = _header(app_id, batch_id)
+    key = (qr_hash if len(qr_hash) <= 64 else hashlib.sha256(qr_hash).digest()).ljust(64, b"\0")
+    inner = hashlib.sha256(bytes(byte ^ 0x36 for byte in key) + header)
+    outer = hashlib.sha256(bytes(byte ^ 0x5C for byte in key))
+    for serial in serials:
+        serial_bytes = _uvarint(serial)
+        unit_inner = inner.copy()
+        unit_inner.update(serial_bytes)
+        unit_outer = outer.copy()
+        unit_outer.update(unit_inner.digest())
+        yield b45encode(header + serial_bytes + unit_outer.digest()[:TAG_SIZE])
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate and check compact QR payloads")
+    commands = parser.add_subparsers(dest="command", required=True)
+    generate = commands.add_parser("print-run", help="QR texts for a print run, one per line")
+    generate.add_argument("--app-id", type=int, required=True)
+    generate.add_argument("--first-serial", type=int, default=1)
+    generate.add_argument("--count", type=int, required=True)
+    generate.add_argument("--out", type=Path, required=True)
+    check = commands.add_parser("verify", help="Resolve and check a scanned QR text")
+    check.add_argument("text")
+    args = parser.parse_args()
+
+    payload = decode_payload(args.text) if args.command == "verify" else None
+    app_id = payload.app_id if payload is not None else args.app_id
+    # The app is read straight from algod, no Supabase lookup is needed
+    algod = algokit_utils.AlgorandClient.from_environment().client.algod
+    with BatchStateReader(algod, cache_size=0) as reader:
+        state = reader.get(app_id)
+    if state is None:
+        raise Exception(f"App {app_id} does not exist")
+    if not state.get("qr_hash"):
+        raise Exception(f"App {app_id} has no QR key, call set_qr first")
+
+    if payload is None:
+        serials = range(args.first_serial, args.first_serial + args.count)
+        with args.out.open("w") as f:
+            for text in print_run(app_id, state["batch_id"], state["qr_hash"], serials):
+                f.write(text + "\n")
+        logger.info(f"Wrote {args.count} QR payloads for batch {state['batch_id']} to {args.out}")
+    else:
+        print(
+            json.dumps(
+                {
+                    "appId": payload.app_id,
+                    "batchId": state["batch_id"],
+                    "serial": payload.serial,
+                    "valid": verify_payload(payload, state["batch_id"], state["qr_hash"]),
+                    "status": state.get("status"),
+                }
+            )
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,375 @@
+import argparse
+import dataclasses
+import functools
+import importlib.util
+import json
+import logging
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import algopy
+from algopy_testing import algopy_testing_context
+from algosdk.abi import Method
+from algosdk.encoding import encode_address
+from algosdk.logic import get_application_address
+
+from smart_contracts.algo_healx.block_archive import BlockArchive
+from smart_contracts.algo_healx.events import decode_logs
+from smart_contracts.algo_healx.scanner import (
+    APPROVAL_PROGRAM_PATH,
+    ScannedCall,
+    StateValue,
+    app_calls,
+    approval_hash,
+    decode_call,
+    state_delta,
+)
+
+logger = logging.getLogger(__name__)
+
+CONTRACT_PATH = Path(__file__).parent / "contract.py"
+CONTRACT_CLASS = "DrugBatchContract"
+
+# Emulator types of the ABI argument types DrugBatchContract methods take
+_ARG_TYPES: dict[str, type] = {
+    "address": algopy.Account,
+    "string": algopy.String,
+    "uint64": algopy.UInt64,
+    "byte[]": algopy.Bytes,
+}
+
+# ----------------------------- Recorded History ----------------------------- #
+
+
+@dataclasses.dataclass(frozen=True)
+class RecordedCall:
+    """A call from the chain, with its block timestamp and the global state it changed."""
+
+    call: ScannedCall
+    timestamp: int
+    # None for a deleted key
+    delta: dict[bytes, StateValue | None]
+
+
+@dataclasses.dataclass(frozen=True)
+class AppHistory:
+    """Everything that happened to one DrugBatchContract instance, from its creation."""
+
+    app_id: int
+    creator: str
+    created_round: int
+    created_timestamp: int
+    initial_state: dict[bytes, StateValue]
+    calls: list[RecordedCall]
+
+
+def load_history(archive: BlockArchive, app_id: int) -> AppHistory:
+    """Reads an app's creation, calls and state changes from the archive."""
+    history: AppHistory | None = None
+    for round_ in archive.rounds_touching([app_id]):
+        block = archive.block(round_)
+        timestamp = block.get("ts", 0)
+        for intra, called, txn, apply_data in app_calls(block):
+            if called != app_id:
+                continue
+            delta = state_delta(apply_data)
+            if history is None:
+                if txn.get("apid") or "apap" not in txn:
+                    raise Exception(
+                        f"App {app_id} was created before the archive starts at round "
+                        f"{archive.first_round}"
+                    )
+                history = AppHistory(
+                    app_id=app_id,
+                    creator=encode_address(txn["snd"]),
+                    created_round=round_,
+                    created_timestamp=timestamp,
+                    initial_state={k: v for k, v in delta.items() if v is not None},
+                    calls=[],
+                )
+                continue
+            call = decode_call(round_, intra, app_id, txn, apply_data)
+            if call is None:
+                logger.warning(f"Skipping a non-ABI call to app {app_id} in round {round_}")
+                continue
+            history.calls.append(RecordedCall(call=call, timestamp=timestamp, delta=delta))
+    if history is None:
+        raise Exception(f"App {app_id} is not in the archive")
+    return history
+
+
+def instances(archive: BlockArchive, program_hashes: Iterable[str] | None = None) -> list[int]:
+    """Apps created in the archive with a DrugBatchContract approval program."""
+    hashes = (
+        set(program_hashes)
+        if program_hashes is not None
+        else {approval_hash(APPROVAL_PROGRAM_PATH.read_bytes())}
+    )
+    found = []
+    for app_id in archive.app_ids():
+        first_round = archive.rounds_touching([app_id])[0]
+        for _, called, txn, _ in app_calls(archive.block(first_round)):
+            if called == app_id and not txn.get("apid") and "apap" in txn:
+                if approval_hash(txn["apap"]) in hashes:
+                    found.append(app_id)
+                break
+    return found
+
+
+# ---------------------------------- Replay ---------------------------------- #
+
+
+@dataclasses.dataclass(frozen=True)
+class Divergence:
+    """A replayed call that behaved differently from the recorded one."""
+
+    round: int
+    intra: int
+    method: str
+    # "rejected", "events" or "state"
+    kind: str
+    detail: str
+
+
+@dataclasses.dataclass
+class AppReport:
+    """Outcome of replaying one app's history."""
+
+    app_id: int
+    calls: int = 0
+    method_calls: Counter = dataclasses.field(default_factory=Counter)
+    divergences: list[Divergence] = dataclasses.field(default_factory=list)
+    # Set when the history could not be replayed at all
+    error: str | None = None
+
+
+@functools.cache
+def _contract_class(contract_path: Path) -> type:
+    spec = importlib.util.spec_from_file_location("_replayed_contract", contract_path)
+    if spec is None or spec.loader is None:
+        raise Exception(f"Cannot load a contract from {contract_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, CONTRACT_CLASS)
+
+
+@functools.cache
+def _arg_types(signature: str) -> list[type]:
+    return [_ARG_TYPES[str(arg.type)] for arg in Method.from_signature(signature).args]
+
+
+def _skip_inner_call(*args: object, **kwargs: object) -> None:
+    # The emulator cannot execute inner app calls. The only one DrugBatchContract
+    # makes moves the batch in its BatchRegistryContract, which changes neither the
+    # batch's own state nor its events, so replay leaves it out.
+    return None
+
+
+def _caller_app(state: dict[bytes, StateValue], sender: str) -> int:
+    # Calls relayed by the batch's registry (approve_many, reject_many) are inner
+    # calls sent by the registry's app account
+    registry = state.get(b"registry")
+    if isinstance(registry, int) and registry and get_application_address(registry) == sender:
+        return registry
+    return 0
+
+
+def _state_diff(
+    replayed: dict[bytes, StateValue], recorded: dict[bytes, StateValue]
+) -> dict[bytes, tuple[StateValue | None, StateValue | None]]:
+    return {
+        key: (replayed.get(key), recorded.get(key))
+        for key in replayed.keys() | recorded.keys()
+        if replayed.get(key) != recorded.get(key)
+    }
+
+
+def replay_history(history: AppHistory, contract_path: Path = CONTRACT_PATH) -> AppReport:
+    """
+    Re-executes a recorded history against the contract at `contract_path` in the
+    emulator, with each call's original sender, round and block timestamp.
+
+    A call diverges if the contract rejects it, if its events differ from the
+    recorded ones, or if global state afterwards differs from the recorded state.
+    After a state divergence the emulated state is reset to the recorded one, so
+    every divergence is reported against the call that caused it.
+    """
+    contract_class = _contract_class(contract_path)
+    report = AppReport(app_id=history.app_id)
+    with (
+        algopy_testing_context() as ctx,
+        mock.patch.object(algopy.arc4, "abi_call", _skip_inner_call),
+    ):
+        ctx.ledger.patch_global_fields(
+            round=algopy.UInt64(history.created_round),
+            latest_timestamp=algopy.UInt64(history.created_timestamp),
+        )
+        with ctx.txn.create_group(active_txn_overrides={"sender": algopy.Account(history.creator)}):
+            contract = contract_class()
+        app = ctx.ledger.get_app(contract)
+        # The ledger has no public accessor for the whole global state
+        state: dict[bytes, StateValue] = ctx.ledger._get_app_data(app).global_state
+        recorded = dict(history.initial_state)
+
+        def check_state(round_: int, intra: int, method: str) -> None:
+            diff = _state_diff(state, recorded)
+            if not diff:
+                return
+            detail = ", ".join(
+                f"{key!r}: {replayed!r} != {expected!r}"
+                for key, (replayed, expected) in sorted(diff.items())
+            )
+            report.divergences.append(Divergence(round_, intra, method, "state", detail))
+            for key, (_, expected) in diff.items():
+                ctx.ledger.set_global_state(app, key, expected)
+
+        check_state(history.created_round, 0, "create")
+        for step in history.calls:
+            call = step.call
+            report.calls += 1
+            report.method_calls[call.method] += 1
+            ctx.ledger.patch_global_fields(
+                round=algopy.UInt64(call.round),
+                latest_timestamp=algopy.UInt64(step.timestamp),
+                caller_application_id=algopy.UInt64(_caller_app(state, call.sender)),
+            )
+            method = getattr(contract, call.method.split("(")[0])
+            args = [
+                arg_type(value) for arg_type, value in zip(_arg_types(call.method), call.args)
+            ]
+            try:
+                with ctx.txn.create_group(active_txn_overrides={"sender": algopy.Account(call.sender)}):
+                    method(*args)
+            except Exception as e:
+                report.divergences.append(
+                    Divergence(call.round, call.intra, call.method, "rejected", repr(e))
+                )
+            else:
+                txn = ctx.txn.last_active
+                logs = [txn.logs(i) for i in range(int(txn.num_logs))]
+                events = tuple(decode_logs(logs))
+                if events != call.events:
+                    report.divergences.append(
+                        Divergence(
+                            call.round, call.intra, call.method, "events",
+                            f"{events} != {call.events}",
+                        )
+                    )
+
+            for key, value in step.delta.items():
+                if value is None:
+                    recorded.pop(key, None)
+                else:
+                    recorded[key] = value
+            check_state(call.round, call.intra, call.method)
+    return report
+
+
+def _replay_app(archive: BlockArchive, contract_path: Path, app_id: int) -> AppReport:
+    try:
+        return replay_history(load_history(archive, app_id), contract_path)
+    except Exception as e:
+        return AppReport(app_id=app_id, error=str(e))
+
+
+class ReplayEngine:
+    """
+    Replays DrugBatchContract histories from a `BlockArchive` against a candidate
+    `contract.py`, one app per task on `workers` processes. App histories are
+    independent, so a full replay scales with cores; each worker loads the
+    contract and reads the archive once.
+    """
+
+    def __init__(
+        self,
+        archive: BlockArchive,
+        contract_path: Path = CONTRACT_PATH,
+        *,
+        workers: int = 1,
+    ):
+        self.archive = archive
+        self.contract_path = contract_path.resolve()
+        self.workers = workers
+
+    def replay(self, app_ids: Iterable[int] | None = None) -> Iterator[AppReport]:
+        """Yields a report per app, in `app_ids` order (default: every instance)."""
+        app_ids = list(app_ids) if app_ids is not None else instances(self.archive)
+        replay = functools.partial(_replay_app, self.archive, self.contract_path)
+        if self.workers <= 1:
+            yield from map(replay, app_ids)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            chunksize = max(1, len(app_ids) // (self.workers * 8))
+            yield from pool.map(replay, app_ids, chunksize=chunksize)
+
+
+def cost_deltas(
+    reports: Iterable[AppReport], before: dict[str, int], after: dict[str, int]
+) -> list[tuple[str, int, int | None, int | None]]:
+    """
+    (method, replayed calls, static cost before, static cost after) per method.
+    The emulator runs Python rather than TEAL, so costs come from the compiled
+    programs' static analysis, weighted by how often the history calls each method.
+    """
+    calls: Counter = Counter()
+    for report in reports:
+        calls.update(report.method_calls)
+    return [
+        (method, calls[method], before.get(method), after.get(method))
+        for method in sorted(calls.keys() | before.keys() | after.keys())
+    ]
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+def _method_costs(path: Path | None) -> dict[str, int]:
+    # program_baseline.json, as written by the build
+    return json.loads(path.read_text())["method_costs"] if path else {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay archived DrugBatchContract histories against a contract"
+    )
+    parser.add_argument("archive", type=Path)
+    parser.add_argument("--contract", type=Path, default=CONTRACT_PATH)
+    parser.add_argument("--app-id", type=int, action="append", dest="app_ids")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--costs-before", type=Path, help="program baseline of the deployed contract")
+    parser.add_argument("--costs-after", type=Path, help="program baseline of the candidate")
+    args = parser.parse_args()
+
+    engine = ReplayEngine(BlockArchive(args.archive, readonly=True), args.contract, workers=args.workers)
+    reports = []
+    for report in engine.replay(args.app_ids):
+        reports.append(report)
+        if report.error:
+            logger.warning(f"App {report.app_id} not replayed: {report.error}")
+        for divergence in report.divergences:
+            logger.warning(
+                f"App {report.app_id} round {divergence.round} [{divergence.intra}] "
+                f"{divergence.method} {divergence.kind}: {divergence.detail}"
+            )
+
+    print(f"{'method':<60} {'calls':>8} {'before':>8} {'after':>8} {'total delta':>12}")
+    for method, calls, before, after in cost_deltas(
+        reports, _method_costs(args.costs_before), _method_costs(args.costs_after)
+    ):
+        total = "" if before is None or after is None else f"{(after - before) * calls:>+12}"
+        before_text = "-" if before is None else before
+        after_text = "-" if after is None else after
+        print(f"{method:<60} {calls:>8} {before_text:>8} {after_text:>8} {total}")
+
+    diverged = sum(1 for report in reports if report.divergences or report.error)
+    logger.info(f"Replayed {len(reports)} apps, {diverged} diverged")
+    if diverged:
+        raise Exception(f"{diverged} of {len(reports)} app histories diverged")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
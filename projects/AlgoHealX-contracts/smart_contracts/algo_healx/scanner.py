@@ -0,0 +1,384 @@
+import argparse
+import base64
+import hashlib
+import itertools
+import json
+import logging
+import re
+import typing
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+import algokit_utils
+import msgpack
+from algosdk.encoding import encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.algo_healx.events import DECODE_ERRORS, decode_logs
+from smart_contracts.artifacts.algo_healx.drug_batch_contract_codec import (
+    DECODERS_BY_SELECTOR,
+)
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_PROGRAM_PATH = (
+    Path(__file__).parent.parent / "artifacts" / "algo_healx" / "DrugBatchContract.approval.bin"
+)
+DEFAULT_CHUNK_ROUNDS = 1_000
+_DELTA_SET_BYTES = 1
+_DELTA_SET_UINT = 2
+
+StateValue: typing.TypeAlias = int | bytes
+
+# Every ABI call carries its selector as a 4-byte msgpack bin (0xc4 0x04) in its
+# app args, and every app creation or update an `apap` field (a 4-byte fixstr key,
+# 0xa4). A block without either holds nothing the scanner needs and is skipped
+# without decoding it.
+_PREFILTER = re.compile(
+    b"\xa4apap|\xc4\x04(?:"
+    + b"|".join(re.escape(selector) for selector in DECODERS_BY_SELECTOR)
+    + b")"
+)
+
+
+def approval_hash(program: bytes) -> str:
+    """The hash an app's approval program is recognised by."""
+    return hashlib.sha256(program).hexdigest()
+
+
+class BlockSource(typing.Protocol):
+    """Where the scanner reads blocks from; must be picklable to reach worker processes."""
+
+    def raw_block(self, round_: int) -> bytes:
+        """The msgpack-encoded `block_info` response for a round."""
+        ...
+
+
+class AlgodBlocks:
+    """Reads blocks from an algod node, which needs to be an archival one for old rounds."""
+
+    def __init__(self, algod: AlgodClient):
+        self.algod = algod
+
+    def raw_block(self, round_: int) -> bytes:
+        return typing.cast(bytes, self.algod.block_info(round_num=round_, response_format="msgpack"))
+
+
+class ScannedCall(typing.NamedTuple):
+    """
+    A DrugBatchContract method call found in a block, inner calls included, with its
+    decoded arguments and the events it emitted.
+    """
+
+    round: int
+    intra: int
+    app_id: int
+    sender: str
+    method: str
+    args: tuple
+    events: tuple
+
+
+class _Undecided(typing.NamedTuple):
+    """A call with a DrugBatchContract selector to an app the worker could not recognise."""
+
+    round: int
+    intra: int
+    app_id: int
+    txn: dict
+    apply_data: dict
+
+
+class _Chunk(typing.NamedTuple):
+    # In block order, with calls left for the scanner to recognise in place
+    calls: list[ScannedCall | _Undecided]
+    # Approval program hash of every app created or updated in the chunk
+    programs: dict[int, str]
+    blocks_decoded: int
+
+
+# ------------------------------ Range Worker ------------------------------ #
+
+
+def _logs(apply_data: dict) -> list[bytes]:
+    # Logs are msgpack strings that need not be valid UTF-8
+    return [log.encode("utf-8", "surrogateescape") for log in apply_data.get("lg", [])]
+
+
+def app_calls(block: dict) -> Iterator[tuple[int, int, dict, dict]]:
+    """
+    Yields (intra, app ID, txn, apply data) for every app call in a msgpack-decoded
+    block, inner calls included, in execution order.
+    """
+    for intra, top_level in enumerate(block.get("txns", [])):
+        pending = [top_level]
+        while pending:
+            signed_txn = pending.pop()
+            txn = signed_txn.get("txn", {})
+            apply_data = signed_txn.get("dt", {})
+            pending.extend(reversed(apply_data.get("itx", [])))
+            if txn.get("type") == "appl":
+                yield intra, txn.get("apid") or signed_txn.get("apid"), txn, apply_data
+
+
+def _as_bytes(value: str | bytes) -> bytes:
+    # Msgpack strings in blocks need not be valid UTF-8
+    return value if isinstance(value, bytes) else value.encode("utf-8", "surrogateescape")
+
+
+def state_delta(apply_data: dict) -> dict[bytes, StateValue | None]:
+    """The global state an app call changed, from its apply data; None for a deleted key."""
+    delta: dict[bytes, StateValue | None] = {}
+    for key, value in apply_data.get("gd", {}).items():
+        # Zero values are omitted from the msgpack encoding
+        action = value.get("at")
+        if action == _DELTA_SET_BYTES:
+            delta[_as_bytes(key)] = _as_bytes(value.get("bs", b""))
+        elif action == _DELTA_SET_UINT:
+            delta[_as_bytes(key)] = value.get("ui", 0)
+        else:
+            delta[_as_bytes(key)] = None
+    return delta
+
+
+def decode_call(
+    round_: int, intra: int, app_id: int, txn: dict, apply_data: dict
+) -> ScannedCall | None:
+    """
+    Decodes an app call if it calls a DrugBatchContract method. Any app can send a
+    DrugBatchContract selector, so a call whose arguments do not decode is logged
+    and skipped.
+    """
+    app_args = txn.get("apaa") or [b""]
+    decoder = DECODERS_BY_SELECTOR.get(app_args[0])
+    if decoder is None:
+        return None
+    method, decode = decoder
+    try:
+        return ScannedCall(
+            round=round_,
+            intra=intra,
+            app_id=app_id,
+            sender=encode_address(txn["snd"]),
+            method=method,
+            args=decode(app_args),
+            events=tuple(decode_logs(_logs(apply_data))),
+        )
+    except DECODE_ERRORS as e:
+        logger.warning(f"Skipping malformed {method} call to app {app_id} in round {round_}: {e}")
+        return None
+
+
+def _scan_block(
+    round_: int,
+    block: dict,
+    app_ids: frozenset[int] | None,
+    program_hashes: frozenset[str],
+    programs: dict[int, str | None],
+    chunk: _Chunk,
+) -> None:
+    for intra, app_id, txn, apply_data in app_calls(block):
+        if "apap" in txn:
+            programs[app_id] = chunk.programs[app_id] = approval_hash(txn["apap"])
+        if app_ids is not None:
+            if app_id not in app_ids:
+                continue
+        elif app_id not in programs:
+            # Left for the scanner, which looks the app up once for every chunk
+            if (txn.get("apaa") or [b""])[0] in DECODERS_BY_SELECTOR:
+                chunk.calls.append(_Undecided(round_, intra, app_id, txn, apply_data))
+            continue
+        elif programs[app_id] not in program_hashes:
+            continue
+        call = decode_call(round_, intra, app_id, txn, apply_data)
+        if call is not None:
+            chunk.calls.append(call)
+
+
+def _scan_rounds(
+    source: BlockSource,
+    rounds: Sequence[int],
+    app_ids: frozenset[int] | None,
+    program_hashes: frozenset[str],
+    programs: dict[int, str | None],
+) -> _Chunk:
+    """
+    Scans a chunk of rounds; runs in a worker process. Without `app_ids`, only calls
+    to apps whose approval program hash is known, from `programs` or from their
+    creation in the chunk, are decoded.
+    """
+    chunk = _Chunk(calls=[], programs={}, blocks_decoded=0)
+    programs = dict(programs)
+    decoded = 0
+    for round_ in rounds:
+        raw = source.raw_block(round_)
+        if not _PREFILTER.search(raw):
+            continue
+        response = msgpack.unpackb(raw, raw=False, unicode_errors="surrogateescape")
+        _scan_block(round_, response["block"], app_ids, program_hashes, programs, chunk)
+        decoded += 1
+    return chunk._replace(blocks_decoded=decoded)
+
+
+# --------------------------------- Scanner --------------------------------- #
+
+
+class BlockScanner:
+    """
+    Finds every DrugBatchContract call in a round range in a single pass over its
+    blocks, decoding arguments with the generated codec and events from the logs.
+
+    Calls are filtered by `app_ids` when given. Otherwise every app whose approval
+    program hash is in `program_hashes` (by default, the hash of the compiled
+    `DrugBatchContract`) is recognised as an instance: apps created or updated in
+    the range are matched by the program they were given, and any other app is
+    looked up on `algod` once. Only calls to recognised apps are decoded, and a call
+    that does not decode is skipped.
+
+    The range is split into chunks of `chunk_rounds` that `workers` processes
+    fetch and scan independently, so a backfill scales with cores until the block
+    source saturates. Blocks with neither a DrugBatchContract selector nor an app
+    creation or update are skipped with a byte search before msgpack decoding.
+    Chunks are merged back in round order. With `app_ids` and a `BlockArchive` as
+    the source, only the rounds its app index lists are read at all.
+    """
+
+    def __init__(
+        self,
+        source: BlockSource,
+        *,
+        app_ids: Iterable[int] | None = None,
+        program_hashes: Iterable[str] | None = None,
+        algod: AlgodClient | None = None,
+        workers: int = 1,
+        chunk_rounds: int = DEFAULT_CHUNK_ROUNDS,
+    ):
+        if app_ids is None and algod is None and isinstance(source, AlgodBlocks):
+            algod = source.algod
+        self.source = source
+        self.app_ids = frozenset(app_ids) if app_ids is not None else None
+        self.program_hashes = (
+            frozenset(program_hashes)
+            if program_hashes is not None
+            else frozenset({approval_hash(APPROVAL_PROGRAM_PATH.read_bytes())})
+        )
+        self.algod = algod
+        self.workers = workers
+        self.chunk_rounds = chunk_rounds
+        self._programs: dict[int, str | None] = {}
+
+    def scan(self, first: int, last: int) -> Iterator[ScannedCall]:
+        """Yields the calls of rounds `first` to `last` inclusive, in block order."""
+        # An archive knows which rounds touch the given apps, so only those are read
+        rounds: Sequence[int] = range(first, last + 1)
+        if self.app_ids is not None and hasattr(self.source, "rounds_touching"):
+            rounds = self.source.rounds_touching(self.app_ids, first, last)
+        chunks = [
+            rounds[start : start + self.chunk_rounds]
+            for start in range(0, len(rounds), self.chunk_rounds)
+        ]
+        decoded = 0
+        for chunk in self._chunks(chunks):
+            decoded += chunk.blocks_decoded
+            for call in chunk.calls:
+                if isinstance(call, _Undecided):
+                    if not self._is_instance(call.app_id):
+                        continue
+                    call = decode_call(*call)
+                    if call is None:
+                        continue
+                yield call
+            self._programs.update(chunk.programs)
+        logger.info(
+            f"Scanned rounds {first}-{last}, decoded {decoded} of {len(rounds)} blocks read"
+        )
+
+    def _chunks(self, chunks: list[Sequence[int]]) -> Iterator[_Chunk]:
+        if self.workers <= 1:
+            for rounds in chunks:
+                yield _scan_rounds(*self._worker_args(rounds))
+            return
+
+        # Keep a few chunks per worker in flight, so that workers stay busy while
+        # a slow chunk holds back the merge without results piling up unbounded.
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = iter(chunks)
+            in_flight: deque[Future[_Chunk]] = deque()
+            for rounds in itertools.islice(pending, 4 * self.workers):
+                in_flight.append(pool.submit(_scan_rounds, *self._worker_args(rounds)))
+            while in_flight:
+                chunk = in_flight.popleft().result()
+                for rounds in itertools.islice(pending, 1):
+                    in_flight.append(pool.submit(_scan_rounds, *self._worker_args(rounds)))
+                yield chunk
+
+    def _worker_args(self, rounds: Sequence[int]) -> tuple:
+        # Workers are given the programs looked up so far, so that they decode the
+        # calls of those apps themselves
+        return self.source, rounds, self.app_ids, self.program_hashes, self._programs
+
+    def _is_instance(self, app_id: int) -> bool:
+        if app_id not in self._programs:
+            self._programs[app_id] = self._lookup_program(app_id)
+        return self._programs[app_id] in self.program_hashes
+
+    def _lookup_program(self, app_id: int) -> str | None:
+        if self.algod is None:
+            logger.warning(f"App {app_id} was not created in the range and no algod was given")
+            return None
+        try:
+            params = self.algod.application_info(app_id)["params"]  # type: ignore[index]
+        except AlgodHTTPError as e:
+            logger.warning(f"Cannot recognise app {app_id}, it may have been deleted: {e}")
+            return None
+        return approval_hash(base64.b64decode(params["approval-program"]))
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+def _jsonable(value: object) -> object:
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    if isinstance(value, tuple) and hasattr(value, "_asdict"):
+        return {key: _jsonable(item) for key, item in value._asdict().items()}
+    if isinstance(value, tuple | list):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Scan a round range for DrugBatchContract calls and events"
+    )
+    parser.add_argument("first", type=int)
+    parser.add_argument("last", type=int)
+    parser.add_argument("--out", type=Path, required=True, help="JSON lines output")
+    parser.add_argument("--app-id", type=int, action="append", dest="app_ids")
+    parser.add_argument("--program-hash", action="append", dest="program_hashes")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-rounds", type=int, default=DEFAULT_CHUNK_ROUNDS)
+    args = parser.parse_args()
+
+    algod = algokit_utils.AlgorandClient.from_environment().client.algod
+    scanner = BlockScanner(
+        AlgodBlocks(algod),
+        app_ids=args.app_ids,
+        program_hashes=args.program_hashes,
+        workers=args.workers,
+        chunk_rounds=args.chunk_rounds,
+    )
+    count = 0
+    with args.out.open("w") as f:
+        for call in scanner.scan(args.first, args.last):
+            f.write(json.dumps(_jsonable(call)) + "\n")
+            count += 1
+    logger.info(f"Wrote {count} calls to {args.out}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
@@ -0,0 +1,190 @@
+import dataclasses
+import logging
+import threading
+import typing
+from collections import deque
+from collections.abc import Iterable
+
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.algo_healx.state_reader import BatchStateReader
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        GlobalStateValue,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Consecutive algod waits without a new block before a `min_round` read gives up
+_MAX_STALLED_WAITS = 3
+
+
+@dataclasses.dataclass(frozen=True)
+class StateSnapshot:
+    """Global state of one app, valid as of `round`."""
+
+    app_id: int
+    round: int
+    state: "GlobalStateValue"
+
+
+def touched_app_ids(block: dict) -> set[int]:
+    """Collects the IDs of every app called or created in a block, inner calls included."""
+    touched: set[int] = set()
+    pending = list(block.get("txns", []))
+    while pending:
+        signed_txn = pending.pop()
+        txn = signed_txn.get("txn", {})
+        if txn.get("type") == "appl":
+            app_id = txn.get("apid") or signed_txn.get("apid")
+            if app_id:
+                touched.add(app_id)
+        pending.extend(signed_txn.get("dt", {}).get("itx", []))
+    return touched
+
+
+class StateCache:
+    """
+    Round-consistent cache of DrugBatchContract global state.
+
+    A background follower reads every new block, extracts the app IDs touched by its
+    app calls and invalidates (or, with `refresh_touched`, re-fetches) only those
+    entries. Untouched entries stay valid, so each read reports the round its state
+    is known to be current at. Pass the confirmed round of your own submission as
+    `min_round` to read your writes.
+    """
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        reader: BatchStateReader | None = None,
+        *,
+        refresh_touched: bool = False,
+        touch_window: int = 1_000,
+    ) -> None:
+        self.algod = algod
+        self.reader = reader or BatchStateReader(algod, cache_size=0)
+        self.refresh_touched = refresh_touched
+        self._entries: dict[int, tuple[int, GlobalStateValue]] = {}
+        # Touched app IDs of the most recent blocks, used to reject fetches that
+        # raced with a block touching the same app.
+        self._recent_touches: deque[tuple[int, set[int]]] = deque(maxlen=touch_window)
+        self._synced_round = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def synced_round(self) -> int:
+        """The last block applied by the follower."""
+        return self._synced_round
+
+    def start(self, from_round: int | None = None) -> None:
+        """Starts following blocks after `from_round` (default: the current round)."""
+        if self._thread is not None:
+            raise Exception("State cache follower is already running")
+        self._synced_round = (
+            from_round if from_round is not None else self.reader.last_round()
+        )
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._follow, name="state-cache-follower", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the follower; it exits after the current algod wait returns."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get(self, app_id: int, min_round: int | None = None) -> StateSnapshot | None:
+        """Returns an app's state, current as of at least `min_round` if given."""
+        return self.get_many([app_id], min_round).get(app_id)
+
+    def get_many(
+        self, app_ids: Iterable[int], min_round: int | None = None
+    ) -> dict[int, StateSnapshot]:
+        """Returns cached snapshots, fetching apps that are missing or older than `min_round`."""
+        snapshots: dict[int, StateSnapshot] = {}
+        missing: list[int] = []
+        with self._lock:
+            for app_id in dict.fromkeys(app_ids):
+                entry = self._entries.get(app_id)
+                if entry is not None:
+                    valid_round = max(entry[0], self._synced_round)
+                    if min_round is None or valid_round >= min_round:
+                        snapshots[app_id] = StateSnapshot(app_id, valid_round, entry[1])
+                        continue
+                missing.append(app_id)
+
+        if missing:
+            fetch_round = self.reader.last_round()
+            if min_round is not None:
+                fetch_round = self._wait_for_round(fetch_round, min_round)
+            fetched = self.reader.get_many(missing)
+            self._store(fetched, fetch_round)
+            for app_id, state in fetched.items():
+                snapshots[app_id] = StateSnapshot(app_id, fetch_round, state)
+        return snapshots
+
+    def _wait_for_round(self, last_round: int, min_round: int) -> int:
+        """Waits until algod reaches `min_round`; a wait can time out before it does."""
+        stalled = 0
+        while last_round < min_round:
+            status = self.algod.status_after_block(last_round)
+            next_round = int(status["last-round"])  # type: ignore[index]
+            stalled = stalled + 1 if next_round <= last_round else 0
+            if stalled >= _MAX_STALLED_WAITS:
+                raise Exception(f"algod is stuck at round {last_round}, waiting for {min_round}")
+            last_round = max(last_round, next_round)
+        return last_round
+
+    def note_submission(self, app_id: int) -> None:
+        """Drops an app's entry after a local write so the next read re-fetches it."""
+        with self._lock:
+            self._entries.pop(app_id, None)
+
+    def apply_block(self, round_: int, block: dict) -> None:
+        """Invalidates or refreshes the cached apps touched by block `round_`."""
+        touched = touched_app_ids(block)
+        with self._lock:
+            self._recent_touches.append((round_, touched))
+            stale = [app_id for app_id in touched if app_id in self._entries]
+            for app_id in stale:
+                del self._entries[app_id]
+            self._synced_round = round_
+        if stale:
+            logger.debug(f"Block {round_} touched {len(stale)} cached apps")
+            if self.refresh_touched:
+                self._store(self.reader.get_many(stale), round_)
+
+    def _store(self, fetched: dict[int, "GlobalStateValue"], fetch_round: int) -> None:
+        with self._lock:
+            oldest_tracked = (
+                self._recent_touches[0][0] if self._recent_touches else self._synced_round
+            )
+            if fetch_round < oldest_tracked - 1:
+                return
+            raced = set().union(
+                *(touched for round_, touched in self._recent_touches if round_ > fetch_round)
+            )
+            for app_id, state in fetched.items():
+                if app_id not in raced:
+                    self._entries[app_id] = (fetch_round, state)
+
+    def _follow(self) -> None:
+        while not self._stop.is_set():
+            try:
+                status = self.algod.status_after_block(self._synced_round)
+                last_round = int(status["last-round"])  # type: ignore[index]
+                for round_ in range(self._synced_round + 1, last_round + 1):
+                    if self._stop.is_set():
+                        return
+                    block = self.algod.block_info(round_num=round_)
+                    self.apply_block(round_, block["block"])  # type: ignore[index]
+            except Exception:
+                logger.exception("State cache follower failed, retrying")
+                self._stop.wait(1)
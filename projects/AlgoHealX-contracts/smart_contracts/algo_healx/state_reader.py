@@ -0,0 +1,169 @@
+import base64
+import json
+import logging
+import threading
+import typing
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from algosdk.encoding import encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        GlobalStateValue,
+    )
+
+logger = logging.getLogger(__name__)
+
+APP_SPEC_PATH = (
+    Path(__file__).parent.parent
+    / "artifacts"
+    / "algo_healx"
+    / "DrugBatchContract.arc56.json"
+)
+
+# ------------------------- Global State Decoding ------------------------- #
+
+_VALUE_DECODERS: dict[str, Callable[[dict], object]] = {
+    "AVMUint64": lambda value: value.get("uint", 0),
+    "AVMBytes": lambda value: base64.b64decode(value.get("bytes", "")),
+    "AVMString": lambda value: base64.b64decode(value.get("bytes", "")).decode(
+        "utf-8", errors="replace"
+    ),
+    "address": lambda value: encode_address(base64.b64decode(value.get("bytes", ""))),
+}
+
+GlobalSchema = dict[str, tuple[str, Callable[[dict], object]]]
+
+
+def load_global_schema(app_spec_path: Path = APP_SPEC_PATH) -> GlobalSchema:
+    """Maps each base64 global-state key in the ARC-56 spec to its name and decoder."""
+    spec = json.loads(app_spec_path.read_text())
+    return {
+        key_info["key"]: (name, _VALUE_DECODERS[key_info["valueType"]])
+        for name, key_info in spec["state"]["keys"]["global"].items()
+    }
+
+
+def decode_global_state(
+    raw_state: Iterable[dict], schema: GlobalSchema
+) -> "GlobalStateValue":
+    """Decodes algod's raw global-state key/value pairs without building an AppClient."""
+    state: dict[str, object] = {}
+    for entry in raw_state:
+        key_info = schema.get(entry["key"])
+        if key_info is None:
+            continue
+        name, decode = key_info
+        state[name] = decode(entry["value"])
+    return typing.cast("GlobalStateValue", state)
+
+
+# --------------------------- Batch State Reader --------------------------- #
+
+
+class BatchStateReader:
+    """
+    Reads DrugBatchContract global state for many apps at once.
+
+    Apps are fetched concurrently on a bounded thread pool and decoded straight from
+    the raw algod response. Decoded snapshots are kept in an LRU cache keyed on
+    (app_id, round); algod only serves current state, so a snapshot is tagged with
+    the last round observed before it was fetched and is at least that fresh, and
+    only snapshots of algod's current last round are served from the cache.
+    """
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        *,
+        max_workers: int = 32,
+        cache_size: int = 100_000,
+        app_spec_path: Path = APP_SPEC_PATH,
+    ) -> None:
+        self.algod = algod
+        self.cache_size = cache_size
+        self._schema = load_global_schema(app_spec_path)
+        self._cache: OrderedDict[tuple[int, int], GlobalStateValue] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="batch-state"
+        )
+
+    def __enter__(self) -> "BatchStateReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the fetch pool."""
+        self._pool.shutdown(wait=True)
+
+    def last_round(self) -> int:
+        """Returns the latest round known to algod."""
+        return int(self.algod.status()["last-round"])
+
+    def get(self, app_id: int) -> "GlobalStateValue | None":
+        """Returns the current global state of a single app, or None if it does not exist."""
+        return self.get_many([app_id]).get(app_id)
+
+    def get_many(self, app_ids: Iterable[int]) -> dict[int, "GlobalStateValue"]:
+        """
+        Returns current decoded global state for every existing app in `app_ids`,
+        at least as fresh as the `last_round()` of the call.
+
+        Repeat reads within a round (e.g. a dashboard's page loads) are served from
+        the cache; apps that no longer exist are omitted.
+        """
+        round_ = self.last_round()
+
+        results: dict[int, GlobalStateValue] = {}
+        missing: list[int] = []
+        with self._lock:
+            for app_id in dict.fromkeys(app_ids):
+                state = self._cache.get((app_id, round_))
+                if state is None:
+                    missing.append(app_id)
+                else:
+                    self._cache.move_to_end((app_id, round_))
+                    results[app_id] = state
+
+        if missing:
+            logger.debug(f"Fetching global state for {len(missing)} apps at {round_}")
+            for app_id, fetched in zip(missing, self._pool.map(self._fetch, missing)):
+                if fetched is None:
+                    continue
+                results[app_id] = fetched
+                self._cache_put((app_id, round_), fetched)
+        return results
+
+    def invalidate(self, app_id: int) -> None:
+        """Drops every cached snapshot of an app."""
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == app_id]:
+                del self._cache[key]
+
+    def _fetch(self, app_id: int) -> "GlobalStateValue | None":
+        try:
+            app_info = self.algod.application_info(app_id)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                logger.warning(f"App {app_id} not found, skipping")
+                return None
+            raise
+        raw_state = app_info["params"].get("global-state", [])  # type: ignore[index]
+        return decode_global_state(raw_state, self._schema)
+
+    def _cache_put(self, key: tuple[int, int], state: "GlobalStateValue") -> None:
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            self._cache[key] = state
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
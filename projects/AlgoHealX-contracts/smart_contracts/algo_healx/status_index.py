@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import struct
+
+import algokit_utils
+
+from smart_contracts._helpers.async_algod import AsyncAlgod
+
+logger = logging.getLogger(__name__)
+
+# Reads the status index a BatchRegistryContract keeps of DrugBatchContract apps
+# (see smart_contracts/batch_registry/contract.py) straight from its state rather
+# than by simulating `list_by_status`: the count of each status is a global uint
+# and every PAGE_SIZE app IDs of it are one box, so a page of the regulator's queue
+# costs one or two box reads whatever the number of batches, and a whole status is
+# read with all of its pages fetched concurrently.
+#
+# Pages are read independently, so an app that moves while they are being read
+# can be missed or, when the last app of a status takes its slot, seen twice;
+# duplicates are dropped, and the next read picks up whatever was missed.
+
+# PAGE_SIZE of BatchRegistryContract
+PAGE_SIZE = 128
+_PAGE_PREFIX = b"p"
+_COUNT_PREFIX = b"n"
+
+
+def _page_key(status: str, page: int) -> bytes:
+    return _PAGE_PREFIX + page.to_bytes(8, "big") + status.encode()
+
+
+class StatusIndex:
+    """Paginated reads of a BatchRegistryContract's apps by `reg_status`."""
+
+    def __init__(self, algod: AsyncAlgod, registry_app_id: int):
+        self.algod = algod
+        self.registry_app_id = registry_app_id
+
+    async def counts(self) -> dict[str, int]:
+        """The number of indexed apps in every status."""
+        info = await self.algod.application_info(self.registry_app_id)
+        counts = {}
+        for entry in info["params"].get("global-state", []):
+            key = base64.b64decode(entry["key"])
+            if key.startswith(_COUNT_PREFIX):
+                counts[key[len(_COUNT_PREFIX) :].decode()] = entry["value"].get("uint", 0)
+        return counts
+
+    async def count(self, status: str) -> int:
+        return (await self.counts()).get(status, 0)
+
+    async def page(
+        self, status: str, cursor: int, limit: int, total: int | None = None
+    ) -> list[int]:
+        """
+        Up to `limit` app IDs of a status from position `cursor` on. Pass the status's
+        `total` if it is already known, to save reading the registry's global state.
+        """
+        if total is None:
+            total = await self.count(status)
+        end = min(cursor + limit, total)
+        if cursor >= end:
+            return []
+        pages = range(cursor // PAGE_SIZE, (end - 1) // PAGE_SIZE + 1)
+        values = await asyncio.gather(
+            *(self.algod.application_box(self.registry_app_id, _page_key(status, page)) for page in pages)
+        )
+        app_ids: dict[int, None] = {}
+        for page, value in zip(pages, values):
+            # A page that is gone emptied after the count was read
+            if value is None:
+                continue
+            start = max(cursor - page * PAGE_SIZE, 0)
+            stop = min(end - page * PAGE_SIZE, PAGE_SIZE)
+            app_ids.update(dict.fromkeys(struct.unpack_from(f">{stop - start}Q", value, start * 8)))
+        return list(app_ids)
+
+    async def list(self, status: str) -> list[int]:
+        """Every app ID of a status, with all its pages read concurrently."""
+        total = await self.count(status)
+        return await self.page(status, 0, total, total)
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    algod = AsyncAlgod.from_algod(algokit_utils.AlgorandClient.from_environment().client.algod)
+    async with algod:
+        index = StatusIndex(algod, args.registry_app_id)
+        total = await index.count(args.status)
+        limit = total if args.limit is None else args.limit
+        app_ids = await index.page(args.status, args.cursor, limit, total)
+    end = min(args.cursor + limit, total)
+    return {
+        "status": args.status,
+        "total": total,
+        "cursor": args.cursor,
+        "nextCursor": end if end < total else None,
+        "appIds": app_ids,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List DrugBatchContract apps by reg_status")
+    parser.add_argument("--registry-app-id", type=int, required=True)
+    parser.add_argument("--status", default="pending")
+    parser.add_argument("--cursor", type=int, default=0)
+    parser.add_argument("--limit", type=int, help="defaults to the whole status")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(_run(args))))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
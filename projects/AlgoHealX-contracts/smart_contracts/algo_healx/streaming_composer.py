@@ -0,0 +1,342 @@
+import dataclasses
+import logging
+import threading
+import typing
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import algokit_utils
+from algokit_utils.config import config
+from algokit_utils.transactions.transaction_composer import (
+    AdditionalAtcContext,
+    prepare_group_for_sending,
+)
+from algosdk.atomic_transaction_composer import AtomicTransactionComposerStatus
+from algosdk.error import AlgodHTTPError
+
+if typing.TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+    from smart_contracts.artifacts.algo_healx.drug_batch_contract_client import (
+        DrugBatchContractClient,
+    )
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+# Each app call adds this much to the group's pooled opcode budget
+APP_CALL_BUDGET = 700
+# Foreign accounts/apps/assets/boxes per transaction, pooled across the group
+MAX_REFERENCES_PER_TXN = 8
+
+
+@dataclasses.dataclass
+class CallOutcome:
+    """Result of one queued method call."""
+
+    index: int
+    app_id: int
+    method: str
+    tx_id: str | None = None
+    return_value: object = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclasses.dataclass
+class StreamResult:
+    """Aggregate result of a StreamingComposer, in the order calls were added."""
+
+    outcomes: list[CallOutcome]
+    groups: int
+
+    @property
+    def succeeded(self) -> list[CallOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.ok]
+
+    @property
+    def failed(self) -> list[CallOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+
+@dataclasses.dataclass
+class _QueuedCall:
+    outcome: CallOutcome
+    params: "algokit_utils.AppCallMethodCallParams"
+    algorand: "algokit_utils.AlgorandClient"
+    cost: int
+    references: int
+
+
+class StreamingComposer:
+    """
+    Accepts any number of DrugBatchContract method calls and submits them as atomic
+    groups that respect the group size, pooled opcode budget and pooled reference
+    limits. Each group is submitted as soon as it is full, on a thread pool, while
+    more calls are being added.
+
+    With `order_by_app=True` (the default), a group waits for every earlier group
+    that touches one of its apps, so calls to the same batch land in the order they
+    were added, and calls queued after a failed call to the same app are skipped.
+
+    `costs` maps method names to their estimated opcode cost; methods not listed
+    are assumed to fit in a single call's budget. If a group fails, its calls are
+    retried one at a time so that each failure is attributed to the right call. A
+    group is only retried once it is known not to have landed: it was refused by
+    simulation or by algod, or, after a send or confirmation error, its first
+    transaction was dropped from the pool or outlived its validity window.
+
+    `add` is meant to be called from a single thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 8,
+        max_group_size: int = MAX_GROUP_SIZE,
+        costs: Mapping[str, int] | None = None,
+        order_by_app: bool = True,
+        retry_individually: bool = True,
+        send_params: "algokit_utils.SendParams | None" = None,
+    ):
+        if not 1 <= max_group_size <= MAX_GROUP_SIZE:
+            raise Exception(f"max_group_size must be between 1 and {MAX_GROUP_SIZE}")
+        self._max_group_size = max_group_size
+        self._costs = dict(costs or {})
+        self._order_by_app = order_by_app
+        self._retry_individually = retry_individually
+        self._send_params = send_params
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="streaming-composer"
+        )
+        self._outcomes: list[CallOutcome] = []
+        self._pending: list[_QueuedCall] = []
+        self._futures: list[Future] = []
+        self._last_group_for_app: dict[int, Future] = {}
+        self._failed_apps: set[int] = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "StreamingComposer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._executor.shutdown(wait=True)
+
+    # ------------------------------ Queueing ------------------------------ #
+
+    def add(
+        self,
+        client: "DrugBatchContractClient",
+        method: str,
+        args: object = None,
+        params: "algokit_utils.CommonAppCallParams | None" = None,
+    ) -> int:
+        """Queues `client.<method>(args)` and returns its index in the result."""
+        build = getattr(client.params, method)
+        call_params = build(params=params) if args is None else build(args=args, params=params)
+        references = sum(
+            len(getattr(call_params, field) or ())
+            for field in (
+                "account_references",
+                "app_references",
+                "asset_references",
+                "box_references",
+            )
+        )
+        cost = self._costs.get(method, 0)
+        if cost > APP_CALL_BUDGET * self._max_group_size:
+            raise Exception(f"{method} needs {cost} opcodes, more than a full group provides")
+        if references > MAX_REFERENCES_PER_TXN * self._max_group_size:
+            raise Exception(f"{method} needs {references} references, more than a group allows")
+
+        outcome = CallOutcome(index=len(self._outcomes), app_id=client.app_id, method=method)
+        self._outcomes.append(outcome)
+        call = _QueuedCall(outcome, call_params, client.algorand, cost, references)
+
+        if not self._fits(call):
+            self._flush()
+        self._pending.append(call)
+        if len(self._pending) == self._max_group_size:
+            self._flush()
+        return outcome.index
+
+    def send(self) -> StreamResult:
+        """Submits the last partial group and waits for every group to finish."""
+        self._flush()
+        for future in self._futures:
+            future.result()
+        return StreamResult(outcomes=list(self._outcomes), groups=len(self._futures))
+
+    def _fits(self, call: _QueuedCall) -> bool:
+        size = len(self._pending) + 1
+        cost = sum(queued.cost for queued in self._pending) + call.cost
+        references = sum(queued.references for queued in self._pending) + call.references
+        return (
+            size <= self._max_group_size
+            and cost <= APP_CALL_BUDGET * size
+            and references <= MAX_REFERENCES_PER_TXN * size
+        )
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        calls, self._pending = self._pending, []
+        app_ids = {call.outcome.app_id for call in calls}
+        dependencies: set[Future] = set()
+        if self._order_by_app:
+            dependencies = {
+                self._last_group_for_app[app_id]
+                for app_id in app_ids
+                if app_id in self._last_group_for_app
+            }
+        future = self._executor.submit(self._submit_group, calls, dependencies)
+        self._futures.append(future)
+        if self._order_by_app:
+            for app_id in app_ids:
+                self._last_group_for_app[app_id] = future
+
+    # ----------------------------- Submission ----------------------------- #
+
+    def _submit_group(self, calls: list[_QueuedCall], dependencies: set[Future]) -> None:
+        for dependency in dependencies:
+            dependency.result()
+
+        calls = [call for call in calls if not self._skipped(call)]
+        if not calls:
+            return
+
+        try:
+            error = self._send(calls)
+        except Exception as e:
+            logger.warning(f"Group of {len(calls)} calls may have landed, not retrying: {e}")
+            for call in calls:
+                call.outcome.error = e
+            self._mark_failed(calls)
+            return
+        if error is None:
+            return
+        logger.warning(f"Group of {len(calls)} calls failed: {error}")
+        if not self._retry_individually or len(calls) == 1:
+            for call in calls:
+                call.outcome.error = error
+            self._mark_failed(calls)
+            return
+
+        for call in calls:
+            if self._skipped(call):
+                continue
+            try:
+                error = self._send([call])
+            except Exception as e:
+                error = e
+            if error is not None:
+                call.outcome.error = error
+                self._mark_failed([call])
+
+    def _send(self, calls: list[_QueuedCall]) -> Exception | None:
+        """
+        Sends a group and waits until it is confirmed; returns why it did not land, or
+        raises if that cannot be told.
+        """
+        algorand = calls[0].algorand
+        algod = algorand.client.algod
+        composer = algorand.new_group()
+        for call in calls:
+            composer.add_app_call_method_call(call.params)
+        params = self._send_params or algokit_utils.SendParams()
+        populate = params.get("populate_app_call_resources")
+        if populate is None:
+            populate = config.populate_app_call_resource
+        cover = bool(params.get("cover_app_call_inner_transaction_fees"))
+        try:
+            atc = composer.build().atc
+            if populate or cover:
+                # Prepared here rather than by `composer.send`, so the IDs of the
+                # transactions that are sent are known if sending them fails
+                atc = prepare_group_for_sending(
+                    atc,
+                    algod,
+                    populate,
+                    cover,
+                    AdditionalAtcContext(
+                        max_fees={
+                            i: call.params.max_fee
+                            for i, call in enumerate(calls)
+                            if call.params.max_fee is not None
+                        },
+                        suggested_params=algod.suggested_params() if cover else None,
+                    ),
+                )
+            group = [txn.txn for txn in atc.build_group()]
+        except Exception as e:
+            # Refused by simulation, before anything was sent
+            return e
+
+        last_valid = max(txn.last_valid_round for txn in group)
+        wait_rounds = params.get("max_rounds_to_wait") or (
+            last_valid - min(txn.first_valid_round for txn in group) + 1
+        )
+        try:
+            response = atc.execute(algod, wait_rounds)
+        except AlgodHTTPError as e:
+            if atc.status < AtomicTransactionComposerStatus.SUBMITTED:
+                # The node answered, so the group was rejected and cannot land
+                return e
+            logger.warning(f"Confirming group {group[0].get_txid()} failed, checking it: {e}")
+        except Exception as e:
+            logger.warning(
+                f"Sending group {group[0].get_txid()} failed, checking whether it landed: {e}"
+            )
+        else:
+            for call, result in zip(calls, response.results):
+                call.outcome.tx_id = result.tx_id
+                call.outcome.return_value = result.return_value
+            return None
+
+        reason = self._confirm(algod, group[0].get_txid(), last_valid)
+        if reason is not None:
+            return Exception(reason)
+        for call, (index, method) in zip(calls, atc.method_dict.items()):
+            tx_id = group[index].get_txid()
+            result = atc.parse_result(method, tx_id, algod.pending_transaction_info(tx_id))
+            call.outcome.tx_id = tx_id
+            call.outcome.return_value = result.return_value
+        return None
+
+    @staticmethod
+    def _confirm(algod: "AlgodClient", tx_id: str, last_valid: int) -> str | None:
+        """Waits until a transaction is confirmed or can no longer be; returns why not."""
+        round_ = int(algod.status()["last-round"])  # type: ignore[index, call-overload]
+        while True:
+            try:
+                info = algod.pending_transaction_info(tx_id)
+            except AlgodHTTPError as e:
+                # Neither in the pool nor recently confirmed
+                return str(e)
+            if info.get("confirmed-round"):  # type: ignore[union-attr]
+                return None
+            if info.get("pool-error"):  # type: ignore[union-attr]
+                return typing.cast(str, info["pool-error"])  # type: ignore[index, call-overload]
+            if round_ > last_valid:
+                return f"Transaction {tx_id} expired unconfirmed"
+            status = algod.status_after_block(round_)
+            round_ = int(status["last-round"])  # type: ignore[index, call-overload]
+
+    def _skipped(self, call: _QueuedCall) -> bool:
+        """Fails `call` without sending it if an earlier call to its app failed."""
+        if not self._order_by_app:
+            return False
+        with self._lock:
+            skipped = call.outcome.app_id in self._failed_apps
+        if skipped:
+            call.outcome.error = Exception(
+                f"Skipped: an earlier call to app {call.outcome.app_id} failed"
+            )
+        return skipped
+
+    def _mark_failed(self, calls: list[_QueuedCall]) -> None:
+        with self._lock:
+            self._failed_apps.update(call.outcome.app_id for call in calls)
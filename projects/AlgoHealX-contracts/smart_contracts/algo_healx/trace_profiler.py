@@ -0,0 +1,239 @@
+import bisect
+import dataclasses
+import json
+import logging
+import typing
+from collections import Counter
+from pathlib import Path
+
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    TransactionWithSigner,
+)
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateTraceConfig
+
+from smart_contracts._helpers.program_stats import OPCODE_COSTS
+from smart_contracts.artifacts.algo_healx.drug_batch_contract_codec import (
+    DECODERS_BY_SELECTOR,
+)
+
+if typing.TYPE_CHECKING:
+    import algokit_utils
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_MAP_PATH = (
+    Path(__file__).parent.parent
+    / "artifacts"
+    / "algo_healx"
+    / "DrugBatchContract.approval.puya.map"
+)
+SIMULATE_EXTRA_BUDGET = 320_000
+
+# ----------------------------- Source Mapping ----------------------------- #
+
+_BASE64 = {
+    c: i
+    for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")
+}
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    values = []
+    value = shift = 0
+    for char in segment:
+        digit = _BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+    return values
+
+
+class ProgramMap:
+    """PC to source line, opcode and enclosing subroutine, from a `.puya.map` file."""
+
+    def __init__(self, map_path: Path = APPROVAL_MAP_PATH):
+        source_map = json.loads(map_path.read_text())
+        offset = source_map.get("op_pc_offset", 0)
+        sources = [(map_path.parent / source).resolve() for source in source_map["sources"]]
+        self.source_lines = {
+            source: source.read_text().splitlines() if source.exists() else []
+            for source in sources
+        }
+
+        self.lines: dict[int, tuple[Path, int]] = {}
+        source_index = line = 0
+        for pc, segments in enumerate(source_map["mappings"].split(";")):
+            for segment in filter(None, segments.split(",")):
+                fields = _decode_vlq(segment)
+                if len(fields) >= 4:
+                    source_index += fields[1]
+                    line += fields[2]
+                    self.lines.setdefault(pc + offset, (sources[source_index], line + 1))
+
+        self.ops: dict[int, str] = {}
+        subroutines = []
+        for pc, event in source_map["pc_events"].items():
+            if "op" in event:
+                self.ops[int(pc)] = event["op"].split()[0]
+            if "subroutine" in event:
+                name = event["subroutine"].rsplit(".", 2)
+                subroutines.append((int(pc), ".".join(name[-2:])))
+        subroutines.sort()
+        self._subroutine_pcs = [pc for pc, _ in subroutines]
+        self._subroutine_names = [name for _, name in subroutines]
+
+    def subroutine_at(self, pc: int) -> str:
+        i = bisect.bisect_right(self._subroutine_pcs, pc) - 1
+        return self._subroutine_names[i] if i >= 0 else "main"
+
+    def line_at(self, pc: int) -> str:
+        if pc not in self.lines:
+            return "(compiler generated)"
+        source, line = self.lines[pc]
+        return f"{source.name}:{line}"
+
+    def source_text(self, label: str) -> str:
+        for source, lines in self.source_lines.items():
+            prefix = f"{source.name}:"
+            if label.startswith(prefix):
+                line = int(label[len(prefix) :])
+                return lines[line - 1].strip() if line <= len(lines) else ""
+        return ""
+
+
+# ---------------------------- Trace Profiling ---------------------------- #
+
+
+@dataclasses.dataclass
+class CallProfile:
+    """Opcode cost of one app call, per source line and per folded stack."""
+
+    method: str
+    app_id: int
+    op_cost: int
+    failed: bool
+    lines: Counter = dataclasses.field(default_factory=Counter)
+    stacks: Counter = dataclasses.field(default_factory=Counter)
+
+
+class TraceProfiler:
+    """
+    Profiling mode for DrugBatchContract calls: simulates a group with execution
+    tracing, maps every executed PC back to `contract.py` through the `.puya.map`
+    and aggregates opcode cost per source line and per folded call stack
+    (`method;subroutine;...;contract.py:LINE`), ready for `flamegraph.pl` or
+    speedscope.
+
+    `send` swaps in for `composer.send()`: it records the profile of a group whose
+    simulation fails or whose costliest call reaches `slow_ops`, and raises with
+    the failure message instead of sending a group that would be rejected.
+    """
+
+    def __init__(self, algod: AlgodClient, program_map: ProgramMap | None = None):
+        self._algod = algod
+        self.program_map = program_map or ProgramMap()
+        self.calls = 0
+        self.lines: Counter = Counter()
+        self.stacks: Counter = Counter()
+
+    def capture(
+        self, composer: "algokit_utils.TransactionComposer"
+    ) -> tuple[list[CallProfile], str | None]:
+        """Simulates the group with tracing and returns its profiles and failure message."""
+        atc = AtomicTransactionComposer()
+        for txn in composer.build_transactions().transactions:
+            atc.add_transaction(TransactionWithSigner(txn=txn, signer=EmptySigner()))
+        simulation = atc.simulate(
+            self._algod,
+            SimulateRequest(
+                txn_groups=[],
+                allow_empty_signatures=True,
+                allow_unnamed_resources=True,
+                allow_more_logs=True,
+                extra_opcode_budget=SIMULATE_EXTRA_BUDGET,
+                exec_trace_config=SimulateTraceConfig(enable=True),
+            ),
+        )
+        group = simulation.simulate_response["txn-groups"][0]
+
+        profiles = []
+        for txn_result, txn in zip(group["txn-results"], atc.txn_list):
+            # Only calls into DrugBatchContract match the program map
+            app_args = getattr(txn.txn, "app_args", None) or [b""]
+            trace = txn_result.get("exec-trace", {}).get("approval-program-trace")
+            if app_args[0] not in DECODERS_BY_SELECTOR or trace is None:
+                continue
+            method, _ = DECODERS_BY_SELECTOR[app_args[0]]
+            op_cost = txn_result.get("app-budget-consumed", 0)
+            profiles.append(self._profile(method, txn.txn.index, op_cost, trace))
+        failure = simulation.failure_message or None
+        if failure:
+            for profile in profiles:
+                profile.failed = True
+            logger.warning(f"Simulated group failed at {simulation.failed_at}: {failure}")
+        return profiles, failure
+
+    def record(self, profiles: list[CallProfile]) -> None:
+        """Adds call profiles to the aggregate."""
+        for profile in profiles:
+            self.calls += 1
+            self.lines.update(profile.lines)
+            self.stacks.update(profile.stacks)
+
+    def send(
+        self,
+        composer: "algokit_utils.TransactionComposer",
+        send_params: "algokit_utils.SendParams | None" = None,
+        *,
+        slow_ops: int | None = None,
+    ) -> "algokit_utils.SendAtomicTransactionComposerResults":
+        """Sends a group, profiling it first if it fails or is slow in simulation."""
+        profiles, failure = self.capture(composer)
+        slowest = max((profile.op_cost for profile in profiles), default=0)
+        if failure or slow_ops is None or slowest >= slow_ops:
+            self.record(profiles)
+        if failure:
+            raise Exception(f"Simulated group failed: {failure}")
+        return composer.send(send_params)
+
+    def _profile(self, method: str, app_id: int, op_cost: int, trace: list[dict]) -> CallProfile:
+        program_map = self.program_map
+        profile = CallProfile(method=method, app_id=app_id, op_cost=op_cost, failed=False)
+        callers: list[str] = []
+        for step in trace:
+            pc = step["pc"]
+            op = program_map.ops.get(pc, "")
+            cost = OPCODE_COSTS.get(op, 1)
+            subroutine = program_map.subroutine_at(pc)
+            line = program_map.line_at(pc)
+            profile.lines[line] += cost
+            profile.stacks[";".join([method, *callers, subroutine, line])] += cost
+            if op == "callsub":
+                callers.append(subroutine)
+            elif op == "retsub" and callers:
+                callers.pop()
+        return profile
+
+    # ------------------------------- Export ------------------------------- #
+
+    def write_folded(self, path: Path) -> None:
+        """Writes the aggregate as folded stacks, one `frame;frame;... cost` per line."""
+        with path.open("w") as f:
+            for stack, cost in sorted(self.stacks.items()):
+                f.write(f"{stack} {cost}\n")
+
+    def report(self, top: int = 20) -> str:
+        """The costliest source lines across every recorded call."""
+        total = sum(self.lines.values()) or 1
+        rows = [f"{'line':<22} {'cost':>10} {'share':>6}  source  ({self.calls} calls)"]
+        for line, cost in self.lines.most_common(top):
+            rows.append(
+                f"{line:<22} {cost:>10} {cost / total:>6.1%}  {self.program_map.source_text(line)}"
+            )
+        return "\n".join(rows)
@@ -0,0 +1,737 @@
+import argparse
+import asyncio
+import contextlib
+import datetime
+import json
+import logging
+import os
+import signal
+import typing
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+
+import algokit_utils
+import msgpack
+
+from smart_contracts._helpers.async_algod import AsyncAlgod
+from smart_contracts.algo_healx.scanner import app_calls
+
+if typing.TYPE_CHECKING:
+    import psycopg
+
+logger = logging.getLogger(__name__)
+
+# An asyncio HTTP service answering verify-medicine requests with the same body
+# and errors as the edge function and `public.verify_medicine`.
+#
+# A batch's result is cached as a snapshot: the response body, built by Postgres
+# exactly as the RPC builds it, plus what the verification log row needs. Snapshots
+# live in an in-process LRU and optionally in a cache shared by every instance.
+# They are dropped when Postgres announces a change to the batch on the
+# `batch_changed` channel (migration 20251202090000), when a listener reconnects
+# and finds the batch's `updated_at` moved on, and, when following the chain, in
+# the round the batch's app is called. Verifications are queued and written to
+# `public.verifications` with COPY in batches instead of one insert per request.
+#
+# Needs the `psycopg` package (and `redis` for a shared cache), from the optional
+# `services` dependency group (`poetry install --with services`); both are
+# imported where they are first used.
+
+DEFAULT_PORT = 8080
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CACHE_SIZE = 100_000
+DEFAULT_SHARED_TTL_SECONDS = 60.0
+DEFAULT_WRITE_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.05
+# Verify requests are a few short fields; larger bodies are refused unread
+MAX_BODY_BYTES = 16 * 1024
+MAX_HEADER_LINES = 64
+# A request's line, headers and body must arrive within this, and a keep-alive
+# connection idle for longer is closed
+REQUEST_TIMEOUT_SECONDS = 10.0
+CHANNEL = "batch_changed"
+# Invalidations remembered to keep loads that raced them out of the cache
+_INVALIDATION_HISTORY = 10_000
+_SHARED_KEY_PREFIX = "algohealx:verify:"
+
+_CORS_HEADERS = (
+    "Access-Control-Allow-Origin: *\r\n"
+    "Access-Control-Allow-Headers: authorization, x-client-info, apikey, content-type\r\n"
+)
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    503: "Service Unavailable",
+}
+
+# The body `public.verify_medicine` returns, without recording the verification
+_SNAPSHOT_QUERY = """
+SELECT
+  m.id,
+  m.blockchain_app_id,
+  m.status = 'approved',
+  m.updated_at,
+  jsonb_build_object(
+    'isAuthentic', m.status = 'approved',
+    'status', m.status,
+    'batchId', m.batch_id,
+    'drugName', m.drug_name,
+    'manufacturer', m.manufacturer,
+    'expiryDate', m.expiry_date,
+    'quantity', m.quantity,
+    'registrationTxHash', m.blockchain_tx_hash,
+    'approvalTxHash', (
+      SELECT blockchain_tx_hash
+      FROM public.regulatory_approvals
+      WHERE medicine_id = m.id
+      ORDER BY created_at DESC
+      LIMIT 1
+    ),
+    'supplyChainEvents', (
+      SELECT COALESCE(
+        jsonb_agg(
+          jsonb_build_object(
+            'eventType', event_type,
+            'location', location,
+            'timestamp', created_at,
+            'blockchainTxHash', blockchain_tx_hash
+          )
+          ORDER BY created_at
+        ),
+        '[]'::jsonb
+      )
+      FROM public.supply_chain_events
+      WHERE batch_id = m.batch_id
+    )
+  )::text
+FROM public.medicines AS m
+WHERE m.batch_id = %s
+"""
+
+
+class Snapshot(typing.NamedTuple):
+    """A batch's verify-medicine response body and what its verifications record."""
+
+    medicine_id: uuid.UUID
+    app_id: int | None
+    is_authentic: bool
+    updated_at: datetime.datetime
+    body: bytes
+
+    def pack(self) -> bytes:
+        return typing.cast(
+            bytes,
+            msgpack.packb(
+                [
+                    self.medicine_id.bytes,
+                    self.app_id,
+                    self.is_authentic,
+                    self.updated_at.isoformat(),
+                    self.body,
+                ]
+            ),
+        )
+
+    @classmethod
+    def unpack(cls, packed: bytes) -> "Snapshot":
+        medicine_id, app_id, is_authentic, updated_at, body = msgpack.unpackb(packed)
+        return cls(
+            uuid.UUID(bytes=medicine_id),
+            app_id,
+            is_authentic,
+            datetime.datetime.fromisoformat(updated_at),
+            body,
+        )
+
+
+# ------------------------------- Caching ------------------------------- #
+
+
+class SharedCache(typing.Protocol):
+    """A cache every instance of the service reads and writes, e.g. `RedisCache`."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class RedisCache:
+    """A `SharedCache` on Redis; needs the `redis` package."""
+
+    def __init__(self, url: str):
+        import redis.asyncio
+
+        self._redis = redis.asyncio.Redis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        return typing.cast(bytes | None, await self._redis.get(key))
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._redis.set(key, value, px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+class SnapshotCache:
+    """
+    Batch snapshots in an in-process LRU, backed by an optional `SharedCache`.
+
+    A load reads the invalidation counter before querying Postgres and its snapshot
+    is only cached if the batch has not been invalidated since, so a change that
+    commits while a request is in flight is not hidden behind the older snapshot.
+    Entries in the shared cache expire after `shared_ttl`, which bounds how long an
+    instance that missed a notification can serve an older snapshot to the others.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_CACHE_SIZE,
+        shared: SharedCache | None = None,
+        shared_ttl: float = DEFAULT_SHARED_TTL_SECONDS,
+    ):
+        self.size = size
+        self.shared = shared
+        self.shared_ttl = shared_ttl
+        self.hits = 0
+        self.misses = 0
+        self._local: OrderedDict[str, Snapshot] = OrderedDict()
+        self._batches_by_app: dict[int, str] = {}
+        self._counter = 0
+        self._invalidated: OrderedDict[str, int] = OrderedDict()
+        # Invalidations at or before this count have been forgotten
+        self._horizon = 0
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    def versions(self) -> dict[str, datetime.datetime]:
+        """The `updated_at` of every batch cached in-process."""
+        return {batch_id: snapshot.updated_at for batch_id, snapshot in self._local.items()}
+
+    def token(self) -> int:
+        """Taken before a load; pass it to `put`."""
+        return self._counter
+
+    async def get(self, batch_id: str) -> Snapshot | None:
+        snapshot = self._local.get(batch_id)
+        if snapshot is not None:
+            self._local.move_to_end(batch_id)
+            self.hits += 1
+            return snapshot
+        if self.shared is not None:
+            token = self.token()
+            packed = await self.shared.get(_SHARED_KEY_PREFIX + batch_id)
+            if packed is not None:
+                snapshot = Snapshot.unpack(packed)
+                self._put_local(batch_id, snapshot, token)
+                self.hits += 1
+                return snapshot
+        self.misses += 1
+        return None
+
+    async def put(self, batch_id: str, snapshot: Snapshot, token: int) -> None:
+        if not self._put_local(batch_id, snapshot, token):
+            return
+        if self.shared is not None:
+            await self.shared.set(_SHARED_KEY_PREFIX + batch_id, snapshot.pack(), self.shared_ttl)
+
+    def _put_local(self, batch_id: str, snapshot: Snapshot, token: int) -> bool:
+        if self._invalidated.get(batch_id, 0) > token or self._horizon > token:
+            return False
+        if self.size <= 0:
+            return True
+        self._local[batch_id] = snapshot
+        self._local.move_to_end(batch_id)
+        if snapshot.app_id is not None:
+            self._batches_by_app[snapshot.app_id] = batch_id
+        while len(self._local) > self.size:
+            _, evicted = self._local.popitem(last=False)
+            if evicted.app_id is not None:
+                self._batches_by_app.pop(evicted.app_id, None)
+        return True
+
+    async def invalidate(self, batch_ids: Iterable[str]) -> None:
+        """Drops the snapshots of batches, here and in the shared cache."""
+        batch_ids = list(batch_ids)
+        for batch_id in batch_ids:
+            self._counter += 1
+            snapshot = self._local.pop(batch_id, None)
+            if snapshot is not None and snapshot.app_id is not None:
+                self._batches_by_app.pop(snapshot.app_id, None)
+            self._invalidated[batch_id] = self._counter
+            self._invalidated.move_to_end(batch_id)
+            while len(self._invalidated) > _INVALIDATION_HISTORY:
+                _, self._horizon = self._invalidated.popitem(last=False)
+        if self.shared is not None:
+            for batch_id in batch_ids:
+                await self.shared.delete(_SHARED_KEY_PREFIX + batch_id)
+
+    async def invalidate_apps(self, app_ids: Iterable[int]) -> None:
+        """Drops the snapshots of the batches cached for these apps."""
+        batch_ids = [self._batches_by_app[app_id] for app_id in app_ids if app_id in self._batches_by_app]
+        if batch_ids:
+            await self.invalidate(batch_ids)
+
+    def clear(self) -> None:
+        self._counter += 1
+        self._horizon = self._counter
+        self._local.clear()
+        self._batches_by_app.clear()
+        self._invalidated.clear()
+
+
+# ------------------------------- Postgres ------------------------------- #
+
+
+class ConnectionPool:
+    """
+    Up to `size` async Postgres connections, opened on first use and reused by
+    every request; a request waits for a free connection instead of opening one.
+    """
+
+    def __init__(self, dsn: str, size: int = DEFAULT_POOL_SIZE):
+        self.dsn = dsn
+        self.size = size
+        self._idle: asyncio.Queue["psycopg.AsyncConnection | None"] = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+
+    async def _connect(self) -> "psycopg.AsyncConnection":
+        import psycopg
+
+        # Timestamps in results are rendered the way PostgREST sessions render them
+        return await psycopg.AsyncConnection.connect(
+            self.dsn, autocommit=True, options="-c TimeZone=UTC"
+        )
+
+    @contextlib.asynccontextmanager
+    async def connection(self) -> AsyncIterator["psycopg.AsyncConnection"]:
+        conn = await self._idle.get()
+        try:
+            if conn is None or conn.closed:
+                conn = await self._connect()
+            yield conn
+        finally:
+            self._idle.put_nowait(None if conn is None or conn.broken else conn)
+
+    async def close(self) -> None:
+        for _ in range(self.size):
+            conn = await self._idle.get()
+            if conn is not None:
+                await conn.close()
+
+
+class VerificationWriter:
+    """
+    Appends verification rows to `public.verifications` in the background, one
+    COPY per batch of up to `batch_size` rows, flushed at least every
+    `flush_interval` seconds. Requests wait once `max_pending` rows are queued, so
+    a database outage slows verification down instead of dropping its log.
+
+    A batch the database refuses (a row it cannot store, or whose medicine was
+    deleted) is split in half until the offending rows are found, which are
+    logged and dropped; other errors are retried. If the writer stops, `record`
+    raises instead of letting requests queue up behind it.
+    """
+
+    _COPY = (
+        "COPY public.verifications (batch_id, medicine_id, verifier_address,"
+        " verification_method, is_authentic, created_at) FROM STDIN"
+    )
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        *,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = 100_000,
+    ):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self._queue: asyncio.Queue[tuple] = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        self._task.add_done_callback(self._stopped)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @staticmethod
+    def _stopped(task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.critical(f"Verification writer stopped: {task.exception()!r}")
+
+    async def record(
+        self,
+        batch_id: str,
+        snapshot: Snapshot,
+        verifier_address: str | None,
+        verification_method: str,
+    ) -> None:
+        if not self.running:
+            raise Exception("Verification writer is not running")
+        await self._queue.put(
+            (
+                batch_id,
+                snapshot.medicine_id,
+                verifier_address,
+                verification_method,
+                snapshot.is_authentic,
+                datetime.datetime.now(datetime.UTC),
+            )
+        )
+
+    async def close(self) -> None:
+        """Writes every queued row, then stops."""
+        await self._queue.join()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _run(self) -> None:
+        while True:
+            rows = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+            while len(rows) < self.batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            self.written += await self._flush(rows)
+            for _ in rows:
+                self._queue.task_done()
+
+    async def _flush(self, rows: list[tuple]) -> int:
+        """Writes rows, dropping those the database refuses; returns how many it wrote."""
+        import psycopg
+
+        while True:
+            try:
+                await self._write(rows)
+                return len(rows)
+            except (psycopg.DataError, psycopg.IntegrityError, psycopg.ProgrammingError) as e:
+                # Sending the same rows again would fail the same way
+                if len(rows) == 1:
+                    logger.error(f"Dropping verification {rows[0]!r}: {e}")
+                    return 0
+                half = len(rows) // 2
+                return await self._flush(rows[:half]) + await self._flush(rows[half:])
+            except psycopg.Error as e:
+                logger.error(f"Writing {len(rows)} verifications failed, retrying: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _write(self, rows: list[tuple]) -> None:
+        async with self.pool.connection() as conn:
+            async with conn.cursor() as cursor:
+                async with cursor.copy(self._COPY) as copy:
+                    for row in rows:
+                        await copy.write_row(row)
+
+
+# ------------------------------- Service ------------------------------- #
+
+
+class VerifyService:
+    """
+    verify-medicine over HTTP: `POST` a JSON body with `batchId` and optionally
+    `verificationMethod` and `verifierAddress`; the response is the
+    `verify_medicine` result, or `{"error": ...}` with status 400.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache: SnapshotCache | None = None,
+        algod: AsyncAlgod | None = None,
+    ):
+        self.dsn = dsn
+        self.pool = ConnectionPool(dsn, pool_size)
+        self.cache = cache if cache is not None else SnapshotCache()
+        self.writer = VerificationWriter(self.pool)
+        self.algod = algod
+        self._tasks: list[asyncio.Task[None]] = []
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str = "0.0.0.0", port: int = DEFAULT_PORT) -> None:
+        self.writer.start()
+        self._tasks.append(asyncio.create_task(self._listen()))
+        if self.algod is not None:
+            self._tasks.append(asyncio.create_task(self._follow_chain()))
+        self._server = await asyncio.start_server(self._serve, host, port)
+        logger.info(f"Serving verify-medicine on {host}:{port}")
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.writer.close()
+        await self.pool.close()
+        logger.info(f"Stopped after writing {self.writer.written} verifications")
+
+    async def verify(
+        self,
+        batch_id: str,
+        verification_method: str = "qr_scan",
+        verifier_address: str | None = None,
+    ) -> bytes | None:
+        """The response body for a batch, or None if there is no such medicine."""
+        snapshot = await self.cache.get(batch_id)
+        if snapshot is None:
+            token = self.cache.token()
+            snapshot = await self._load(batch_id)
+            if snapshot is None:
+                return None
+            await self.cache.put(batch_id, snapshot, token)
+        await self.writer.record(batch_id, snapshot, verifier_address, verification_method)
+        return snapshot.body
+
+    async def _load(self, batch_id: str) -> Snapshot | None:
+        async with self.pool.connection() as conn:
+            row = await (await conn.execute(_SNAPSHOT_QUERY, (batch_id,))).fetchone()
+        if row is None:
+            return None
+        medicine_id, app_id, is_authentic, updated_at, body = row
+        return Snapshot(
+            medicine_id,
+            int(app_id) if app_id and app_id.isdigit() else None,
+            is_authentic,
+            updated_at,
+            body.encode(),
+        )
+
+    # ---------------------------- Invalidation ---------------------------- #
+
+    async def _listen(self) -> None:
+        import psycopg
+
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self.dsn, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    await self._revalidate(conn)
+                    async for notify in conn.notifies():
+                        await self.cache.invalidate([notify.payload])
+            except psycopg.OperationalError as e:
+                logger.warning(f"Lost the {CHANNEL} listener, reconnecting: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _revalidate(self, conn: "psycopg.AsyncConnection") -> None:
+        """Drops snapshots whose medicine changed while no listener was connected."""
+        cached = self.cache.versions()
+        if not cached:
+            return
+        cursor = await conn.execute(
+            "SELECT batch_id, updated_at FROM public.medicines WHERE batch_id = ANY(%s)",
+            (list(cached),),
+        )
+        current = dict(await cursor.fetchall())
+        stale = [batch_id for batch_id, updated_at in cached.items() if current.get(batch_id) != updated_at]
+        await self.cache.invalidate(stale)
+        logger.info(f"Revalidated {len(cached)} snapshots, {len(stale)} were stale")
+
+    async def _follow_chain(self) -> None:
+        assert self.algod is not None
+        round_: int | None = None
+        while True:
+            try:
+                if round_ is None:
+                    round_ = int((await self.algod.status())["last-round"])
+                last_round = (await self.algod.status_after_block(round_))["last-round"]
+                for next_round in range(round_ + 1, last_round + 1):
+                    raw = await self.algod.raw_block(next_round)
+                    block = msgpack.unpackb(raw, raw=False, unicode_errors="surrogateescape")
+                    await self.cache.invalidate_apps(
+                        {app_id for _, app_id, _, _ in app_calls(block["block"])}
+                    )
+                    round_ = next_round
+            except Exception as e:
+                logger.warning(f"Following the chain failed after round {round_}, retrying: {e}")
+                await asyncio.sleep(1.0)
+
+    # -------------------------------- HTTP -------------------------------- #
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), REQUEST_TIMEOUT_SECONDS)
+                except TimeoutError:
+                    break
+                if request is None:
+                    break
+                method, version, headers, body = request
+                keep_alive = version == "HTTP/1.1" and headers.get("connection") != "close"
+                if body is None:
+                    # The rest of the request is left unread, so the connection cannot be reused
+                    status, payload = 400, _error("Invalid request body")
+                    keep_alive = False
+                else:
+                    status, payload = await self._respond(method, body)
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS[status]}\r\n{_CORS_HEADERS}"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(payload)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode("latin-1")
+                    + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, body: bytes) -> tuple[int, bytes]:
+        import psycopg
+
+        if method == "OPTIONS":
+            return 200, b""
+        if method != "POST":
+            return 405, _error("Method not allowed")
+        try:
+            request = json.loads(body or b"{}")
+            batch_id = request.get("batchId")
+        except (ValueError, AttributeError):
+            return 400, _error("Invalid request body")
+        if not batch_id or not isinstance(batch_id, str):
+            return 400, _error("Batch ID is required")
+        try:
+            verification_method = _text(request.get("verificationMethod")) or "qr_scan"
+            verifier_address = _text(request.get("verifierAddress"))
+        except ValueError as e:
+            return 400, _error(str(e))
+        if not self.writer.running:
+            return 503, _error("Verification failed")
+        try:
+            result = await self.verify(batch_id, verification_method, verifier_address)
+        except psycopg.Error as e:
+            logger.error(f"Error verifying medicine {batch_id}: {e}")
+            return 400, _error("Verification failed")
+        if result is None:
+            return 400, _error("Medicine not found")
+        return 200, result
+
+
+def _error(message: str) -> bytes:
+    return json.dumps({"error": message}).encode()
+
+
+def _text(value: object) -> str | None:
+    # Postgres text cannot hold NUL, so a client could otherwise fail a whole COPY
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError("Verification fields must be strings")
+    return value.replace("\x00", "")
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> tuple[str, str, dict[str, str], bytes | None] | None:
+    """
+    A request's method, version, headers and body, or None once the client closes
+    the connection. The body is None, and left unread, for a request that is
+    refused: too many header lines, a body too large, or a chunked body, whose
+    chunks would otherwise be read as the next request.
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    method, _, version = request_line.decode("latin-1").split()
+    headers: dict[str, str] = {}
+    lines = 0
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        lines += 1
+        if lines > MAX_HEADER_LINES:
+            return method, version, headers, None
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = headers.get("content-length", "0")
+    if "transfer-encoding" in headers or not length.isdigit() or int(length) > MAX_BODY_BYTES:
+        return method, version, headers, None
+    return method, version, headers, await reader.readexactly(int(length))
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+async def serve(args: argparse.Namespace) -> None:
+    shared = RedisCache(args.redis_url) if args.redis_url else None
+    algod = None
+    if args.follow_chain:
+        algod = AsyncAlgod.from_algod(algokit_utils.AlgorandClient.from_environment().client.algod)
+    service = VerifyService(
+        args.dsn,
+        pool_size=args.pool_size,
+        cache=SnapshotCache(args.cache_size, shared, args.shared_ttl),
+        algod=algod,
+    )
+    # Queued verifications are written before the service exits
+    stopped = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        asyncio.get_running_loop().add_signal_handler(signum, stopped.set)
+    await service.start(args.host, args.port)
+    try:
+        await stopped.wait()
+    finally:
+        await service.close()
+        if algod is not None:
+            await algod.aclose()
+        if shared is not None:
+            await shared.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve verify-medicine from Postgres with cached batch snapshots"
+    )
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Supabase Postgres")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE)
+    parser.add_argument("--redis-url", help="Share snapshots between instances through Redis")
+    parser.add_argument("--shared-ttl", type=float, default=DEFAULT_SHARED_TTL_SECONDS)
+    parser.add_argument(
+        "--follow-chain",
+        action="store_true",
+        help="Also drop a batch's snapshot when its app is called, using the algod from the environment",
+    )
+    args = parser.parse_args()
+    if not args.dsn:
+        raise Exception("Set DATABASE_URL or pass --dsn")
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
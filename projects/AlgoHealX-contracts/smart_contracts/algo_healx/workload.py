@@ -0,0 +1,443 @@
+import argparse
+import base64
+import csv
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import random
+import typing
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from algosdk.encoding import encode_address
+from nacl.signing import SigningKey
+
+logger = logging.getLogger(__name__)
+
+# ABI signatures of the DrugBatchContract methods a workload calls
+SET_REGULATOR = "set_regulator(address)void"
+REGISTER = "register(string,string,string,string,string,uint64)void"
+SET_QR = "set_qr(byte[])void"
+APPROVE = "approve(uint64)void"
+REJECT = "reject(string)void"
+TRANSFER = "transfer(address,string)void"
+MARK_DELIVERED = "mark_delivered()void"
+VERIFY = "verify(byte[])void"
+MARK_COUNTERFEIT = "mark_counterfeit()void"
+
+# Column order of the Supabase rows, matching the migrations
+TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "medicines": (
+        "id", "batch_id", "drug_name", "manufacturer", "manufacture_date",
+        "expiry_date", "quantity", "producer_wallet", "status", "qr_code_data",
+        "qr_code_hash", "created_at", "updated_at",
+    ),
+    "regulatory_approvals": (
+        "id", "medicine_id", "regulator_wallet", "status", "compliance_score",
+        "rejection_reason", "approved_at", "created_at",
+    ),
+    "supply_chain_events": (
+        "id", "medicine_id", "batch_id", "event_type", "sender_wallet",
+        "receiver_wallet", "location", "created_at",
+    ),
+    "verifications": (
+        "id", "medicine_id", "batch_id", "verifier_address", "is_authentic",
+        "verification_method", "created_at",
+    ),
+}
+
+_DRUG_NAMES = (
+    "Amoxicillin", "Paracetamol", "Ibuprofen", "Metformin", "Atorvastatin",
+    "Omeprazole", "Amlodipine", "Azithromycin", "Cetirizine", "Insulin Glargine",
+)
+_LOCATIONS = (
+    "Mumbai", "Delhi", "Bengaluru", "Hyderabad", "Chennai", "Kolkata", "Pune",
+    "Ahmedabad", "Jaipur", "Lucknow", "Nagpur", "Indore", "Kochi", "Guwahati",
+)
+_REJECTION_REASONS = (
+    "Incomplete documentation",
+    "Failed stability testing",
+    "Labelling non-compliant",
+    "Manufacturing site not certified",
+)
+_HOUR = 3_600
+_DAY = 24 * _HOUR
+
+
+class ContractCall(typing.NamedTuple):
+    """One DrugBatchContract method call, in submission order within its batch."""
+
+    batch_id: str
+    method: str
+    args: tuple
+    sender: str
+    timestamp: int
+    # False for calls the contract is expected to reject, e.g. counterfeit scans
+    expect_success: bool = True
+
+
+class SupabaseRow(typing.NamedTuple):
+    """One row for a Supabase table, values ordered as in TABLE_COLUMNS."""
+
+    table: str
+    values: tuple
+
+    def as_dict(self) -> dict[str, object]:
+        return dict(zip(TABLE_COLUMNS[self.table], self.values))
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkloadConfig:
+    batches: int = 1_000
+    producers: int = 50
+    regulators: int = 5
+    distributors: int = 500
+    consumers: int = 10_000
+    max_hops: int = 4
+    mean_verifications: float = 20.0
+    rejection_rate: float = 0.05
+    # Probability that a scan is of a counterfeit pack; the first one gets the
+    # batch flagged with mark_counterfeit
+    counterfeit_rate: float = 0.01
+    start_timestamp: int = 1_735_689_600  # 2025-01-01T00:00:00Z
+    span_days: int = 365
+    seed: int = 0
+
+
+@dataclasses.dataclass
+class _BatchPlan:
+    """Everything that happens to one batch, from which calls and rows are projected."""
+
+    index: int
+    batch_id: str
+    medicine_id: str
+    producer: str
+    regulator: str
+    drug_name: str
+    manufacturer: str
+    manufacture_date: str
+    expiry_date: str
+    quantity: int
+    qr_data: str
+    qr_hash: bytes
+    registered_at: int
+    decided_at: int
+    approved: bool
+    compliance_score: int
+    rejection_reason: str
+    approval_id: str
+    hops: list[tuple[str, str, str, int, str]]  # event id, sender, receiver, ts, location
+    delivered: tuple[str, int] | None  # event id, ts
+    scans: list[tuple[str, str, int, bool]]  # verification id, verifier, ts, authentic
+    counterfeit_at: int | None
+
+
+@functools.lru_cache(maxsize=65_536)
+def _derive_account(seed: int, role: str, index: int) -> tuple[str, str]:
+    """Derives a deterministic (address, private key) pair for a workload role."""
+    key = SigningKey(hashlib.sha256(f"{seed}:{role}:{index}".encode()).digest())
+    public_key = bytes(key.verify_key)
+    return encode_address(public_key), base64.b64encode(bytes(key) + public_key).decode()
+
+
+def _iso(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class WorkloadGenerator:
+    """
+    Reproducible synthetic supply-chain workload.
+
+    Each batch is generated from its own RNG seeded with (seed, batch index), so any
+    range of batches can be produced independently, in any order or process, and
+    always yields the same calls and rows. Output is streamed batch by batch.
+    """
+
+    def __init__(self, config: WorkloadConfig) -> None:
+        self.config = config
+
+    def account(self, role: str, index: int) -> str:
+        """Address of a producer, regulator, distributor or consumer in this workload."""
+        return _derive_account(self.config.seed, role, index)[0]
+
+    def private_key(self, role: str, index: int) -> str:
+        """Private key of a workload account, for signing calls on a localnet."""
+        return _derive_account(self.config.seed, role, index)[1]
+
+    def calls(self, start: int = 0, stop: int | None = None) -> Iterator[ContractCall]:
+        """Yields the contract calls of batches [start, stop) in submission order."""
+        for index in range(start, self.config.batches if stop is None else stop):
+            yield from self._calls_for(self._plan(index))
+
+    def rows(self, start: int = 0, stop: int | None = None) -> Iterator[SupabaseRow]:
+        """Yields the Supabase rows of batches [start, stop)."""
+        for index in range(start, self.config.batches if stop is None else stop):
+            yield from self._rows_for(self._plan(index))
+
+    def write_calls_jsonl(self, path: Path, start: int = 0, stop: int | None = None) -> int:
+        """Writes calls as JSON lines, bytes arguments base64 encoded; returns the count."""
+        count = 0
+        with path.open("w") as f:
+            for call in self.calls(start, stop):
+                record = call._asdict()
+                record["args"] = [
+                    base64.b64encode(arg).decode() if isinstance(arg, bytes) else arg
+                    for arg in call.args
+                ]
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        return count
+
+    def write_supabase_csv(self, out_dir: Path, start: int = 0, stop: int | None = None) -> int:
+        """Writes one CSV per table, loadable with COPY ... CSV HEADER; returns the row count."""
+        out_dir.mkdir(parents=True, exist_ok=True)
+        files = {table: (out_dir / f"{table}.csv").open("w", newline="") for table in TABLE_COLUMNS}
+        try:
+            writers = {table: csv.writer(f) for table, f in files.items()}
+            for table, writer in writers.items():
+                writer.writerow(TABLE_COLUMNS[table])
+            count = 0
+            for row in self.rows(start, stop):
+                writers[row.table].writerow(row.values)
+                count += 1
+            return count
+        finally:
+            for f in files.values():
+                f.close()
+
+    def _plan(self, index: int) -> _BatchPlan:
+        config = self.config
+        rng = random.Random(config.seed * 1_000_003 + index)
+
+        def new_id() -> str:
+            return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+        producer_index = rng.randrange(config.producers)
+        batch_id = f"BATCH-{config.seed}-{index:08d}"
+        drug_name = rng.choice(_DRUG_NAMES)
+        manufacturer = f"Manufacturer {producer_index}"
+        registered_at = (
+            config.start_timestamp
+            + index * config.span_days * _DAY // max(config.batches, 1)
+            + rng.randrange(_HOUR)
+        )
+        manufacture_date = datetime.fromtimestamp(
+            registered_at - rng.randrange(30) * _DAY, timezone.utc
+        ).date()
+        expiry_date = manufacture_date.replace(year=manufacture_date.year + rng.choice((1, 2, 3)))
+        qr_data = json.dumps(
+            {
+                "batchId": batch_id,
+                "drugName": drug_name,
+                "manufacturer": manufacturer,
+                "timestamp": _iso(registered_at),
+            }
+        )
+
+        plan = _BatchPlan(
+            index=index,
+            batch_id=batch_id,
+            medicine_id=new_id(),
+            producer=self.account("producer", producer_index),
+            regulator=self.account("regulator", rng.randrange(config.regulators)),
+            drug_name=drug_name,
+            manufacturer=manufacturer,
+            manufacture_date=manufacture_date.isoformat(),
+            expiry_date=expiry_date.isoformat(),
+            quantity=rng.randrange(100, 100_000, 100),
+            qr_data=qr_data,
+            qr_hash=hashlib.sha256(qr_data.encode()).digest(),
+            registered_at=registered_at,
+            decided_at=registered_at + rng.randrange(_HOUR, 72 * _HOUR),
+            approved=rng.random() >= config.rejection_rate,
+            compliance_score=rng.randrange(60, 101),
+            rejection_reason=rng.choice(_REJECTION_REASONS),
+            approval_id=new_id(),
+            hops=[],
+            delivered=None,
+            scans=[],
+            counterfeit_at=None,
+        )
+        if not plan.approved:
+            return plan
+
+        holder, now = plan.producer, plan.decided_at
+        for _ in range(rng.randint(1, config.max_hops)):
+            now += rng.randrange(6 * _HOUR, 96 * _HOUR)
+            receiver = self.account("distributor", rng.randrange(config.distributors))
+            plan.hops.append((new_id(), holder, receiver, now, rng.choice(_LOCATIONS)))
+            holder = receiver
+        now += rng.randrange(_HOUR, 24 * _HOUR)
+        plan.delivered = (new_id(), now)
+
+        for _ in range(int(rng.expovariate(1 / config.mean_verifications))):
+            now += rng.randrange(60, 2 * _DAY)
+            authentic = plan.counterfeit_at is None and rng.random() >= config.counterfeit_rate
+            verifier = self.account("consumer", rng.randrange(config.consumers))
+            plan.scans.append((new_id(), verifier, now, authentic))
+            if not authentic and plan.counterfeit_at is None:
+                plan.counterfeit_at = now + rng.randrange(_HOUR, 24 * _HOUR)
+        return plan
+
+    def _calls_for(self, plan: _BatchPlan) -> Iterator[ContractCall]:
+        batch_id, producer = plan.batch_id, plan.producer
+        yield ContractCall(batch_id, SET_REGULATOR, (plan.regulator,), producer, plan.registered_at)
+        yield ContractCall(
+            batch_id,
+            REGISTER,
+            (
+                batch_id,
+                plan.drug_name,
+                plan.manufacturer,
+                plan.manufacture_date,
+                plan.expiry_date,
+                plan.quantity,
+            ),
+            producer,
+            plan.registered_at,
+        )
+        yield ContractCall(batch_id, SET_QR, (plan.qr_hash,), producer, plan.registered_at)
+        if not plan.approved:
+            yield ContractCall(
+                batch_id, REJECT, (plan.rejection_reason,), plan.regulator, plan.decided_at
+            )
+            return
+        yield ContractCall(
+            batch_id, APPROVE, (plan.compliance_score,), plan.regulator, plan.decided_at
+        )
+
+        # transfer() authorises the account recorded as the previous sender, which
+        # lags the current holder by one hop
+        for hop, (_, _, receiver, timestamp, location) in enumerate(plan.hops):
+            caller = producer if hop < 2 else plan.hops[hop - 2][2]
+            yield ContractCall(batch_id, TRANSFER, (receiver, location), caller, timestamp)
+        if plan.delivered is not None:
+            yield ContractCall(batch_id, MARK_DELIVERED, (), plan.hops[-1][2], plan.delivered[1])
+
+        counterfeit_pending = plan.counterfeit_at is not None
+        for _, verifier, timestamp, authentic in plan.scans:
+            if counterfeit_pending and timestamp > typing.cast(int, plan.counterfeit_at):
+                counterfeit_pending = False
+                yield ContractCall(
+                    batch_id, MARK_COUNTERFEIT, (), plan.regulator, typing.cast(int, plan.counterfeit_at)
+                )
+            qr_hash = plan.qr_hash if authentic else hashlib.sha256(plan.qr_hash).digest()
+            yield ContractCall(batch_id, VERIFY, (qr_hash,), verifier, timestamp, authentic)
+        if counterfeit_pending:
+            yield ContractCall(
+                batch_id, MARK_COUNTERFEIT, (), plan.regulator, typing.cast(int, plan.counterfeit_at)
+            )
+
+    def _rows_for(self, plan: _BatchPlan) -> Iterator[SupabaseRow]:
+        if not plan.approved:
+            status = "rejected"
+        elif plan.counterfeit_at is not None:
+            status = "counterfeit"
+        else:
+            status = "approved"
+        registered_at = _iso(plan.registered_at)
+        yield SupabaseRow(
+            "medicines",
+            (
+                plan.medicine_id, plan.batch_id, plan.drug_name, plan.manufacturer,
+                plan.manufacture_date, plan.expiry_date, plan.quantity, plan.producer,
+                status, plan.qr_data, plan.qr_hash.hex(), registered_at, registered_at,
+            ),
+        )
+        decided_at = _iso(plan.decided_at)
+        yield SupabaseRow(
+            "regulatory_approvals",
+            (
+                plan.approval_id, plan.medicine_id, plan.regulator,
+                "approved" if plan.approved else "rejected",
+                plan.compliance_score if plan.approved else None,
+                None if plan.approved else plan.rejection_reason,
+                decided_at if plan.approved else None,
+                decided_at,
+            ),
+        )
+        for event_id, sender, receiver, timestamp, location in plan.hops:
+            yield SupabaseRow(
+                "supply_chain_events",
+                (
+                    event_id, plan.medicine_id, plan.batch_id, "transfer",
+                    sender, receiver, location, _iso(timestamp),
+                ),
+            )
+        if plan.delivered is not None:
+            event_id, timestamp = plan.delivered
+            _, _, receiver, _, location = plan.hops[-1]
+            yield SupabaseRow(
+                "supply_chain_events",
+                (
+                    event_id, plan.medicine_id, plan.batch_id, "delivered",
+                    receiver, receiver, location, _iso(timestamp),
+                ),
+            )
+        for verification_id, verifier, timestamp, authentic in plan.scans:
+            yield SupabaseRow(
+                "verifications",
+                (
+                    verification_id, plan.medicine_id, plan.batch_id, verifier,
+                    authentic, "qr_scan", _iso(timestamp),
+                ),
+            )
+
+
+# --------------------------- Command Line --------------------------- #
+
+
+def _write_shard(
+    config: WorkloadConfig, out_dir: Path, output: str, shard: int, shards: int
+) -> int:
+    start = config.batches * shard // shards
+    stop = config.batches * (shard + 1) // shards
+    generator = WorkloadGenerator(config)
+    shard_dir = out_dir / f"shard-{shard:03d}"
+    if output == "calls":
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        return generator.write_calls_jsonl(shard_dir / "calls.jsonl", start, stop)
+    return generator.write_supabase_csv(shard_dir, start, stop)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate a reproducible synthetic AlgoHealX workload"
+    )
+    parser.add_argument("output", choices=("calls", "rows"))
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--batches", type=int, default=WorkloadConfig.batches)
+    parser.add_argument("--seed", type=int, default=WorkloadConfig.seed)
+    parser.add_argument("--mean-verifications", type=float, default=WorkloadConfig.mean_verifications)
+    parser.add_argument("--max-hops", type=int, default=WorkloadConfig.max_hops)
+    parser.add_argument("--rejection-rate", type=float, default=WorkloadConfig.rejection_rate)
+    parser.add_argument("--counterfeit-rate", type=float, default=WorkloadConfig.counterfeit_rate)
+    parser.add_argument("--shards", type=int, default=1, help="number of output shards")
+    parser.add_argument("--workers", type=int, default=1, help="processes writing shards")
+    args = parser.parse_args()
+
+    config = WorkloadConfig(
+        batches=args.batches,
+        seed=args.seed,
+        mean_verifications=args.mean_verifications,
+        max_hops=args.max_hops,
+        rejection_rate=args.rejection_rate,
+        counterfeit_rate=args.counterfeit_rate,
+    )
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [
+            pool.submit(_write_shard, config, args.out, args.output, shard, args.shards)
+            for shard in range(args.shards)
+        ]
+        total = sum(future.result() for future in futures)
+    logger.info(f"Wrote {total} {args.output} for {config.batches} batches to {args.out}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    main()
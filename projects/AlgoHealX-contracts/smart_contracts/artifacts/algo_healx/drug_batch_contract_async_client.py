@@ -0,0 +1,665 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts/_helpers/async_client.py.
+# DO NOT MODIFY IT BY HAND.
+from __future__ import annotations
+
+import base64
+import dataclasses
+import typing
+
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.encoding import encode_address
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers.async_algod import (
+    AsyncAlgod,
+    AsyncComposer,
+    CallParams,
+    SendParams,
+    SendResult,
+    SimulateResult,
+)
+
+from . import drug_batch_contract_codec as _codec
+
+if typing.TYPE_CHECKING:
+    from .drug_batch_contract_client import (
+        SetRegistryArgs,
+        SetRegulatorArgs,
+        RegisterArgs,
+        UpdateStatusArgs,
+        ApproveArgs,
+        RejectArgs,
+        ApproveForArgs,
+        RejectForArgs,
+        TransferArgs,
+        SetQrArgs,
+        VerifyArgs,
+        UpdateQuantityArgs,
+        GlobalStateValue,
+    )
+
+
+def _args(args: typing.Any) -> tuple:
+    """Positional values of an args tuple or one of the typed client's `<Method>Args`"""
+    if dataclasses.is_dataclass(args):
+        return tuple(getattr(args, field.name) for field in dataclasses.fields(args))
+    return tuple(args)
+
+
+_VALUE_DECODERS = {
+    "AVMUint64": lambda value: value.get("uint", 0),
+    "AVMBytes": lambda value: base64.b64decode(value.get("bytes", "")),
+    "AVMString": lambda value: base64.b64decode(value.get("bytes", "")).decode("utf-8", errors="replace"),
+    "address": lambda value: encode_address(base64.b64decode(value.get("bytes", ""))),
+}
+
+
+class AsyncDrugBatchContractComposer:
+    """A group of DrugBatchContract calls and other transactions, sent or simulated together"""
+
+    def __init__(self, client: "AsyncDrugBatchContractClient"):
+        self.client = client
+        self.composer = AsyncComposer(
+            client.algod,
+            default_sender=client.default_sender,
+            default_signer=client.default_signer,
+        )
+
+    def set_registry(
+        self,
+        args: tuple[int] | "SetRegistryArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a set_registry(uint64)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_set_registry(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def set_regulator(
+        self,
+        args: tuple[str] | "SetRegulatorArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a set_regulator(address)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_set_regulator(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def register(
+        self,
+        args: tuple[str, str, str, str, str, int] | "RegisterArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a register(string,string,string,string,string,uint64)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_register(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def update_status(
+        self,
+        args: tuple[str] | "UpdateStatusArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a update_status(string)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_update_status(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def approve(
+        self,
+        args: tuple[int] | "ApproveArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a approve(uint64)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_approve(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def reject(
+        self,
+        args: tuple[str] | "RejectArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a reject(string)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_reject(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def approve_for(
+        self,
+        args: tuple[str, int] | "ApproveForArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a approve_for(address,uint64)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_approve_for(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def reject_for(
+        self,
+        args: tuple[str, str] | "RejectForArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a reject_for(address,string)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_reject_for(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def transfer(
+        self,
+        args: tuple[str, str] | "TransferArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a transfer(address,string)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_transfer(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def mark_delivered(
+        self,
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a mark_delivered()void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_mark_delivered(), params, decode_return=None
+        )
+        return self
+
+    def set_qr(
+        self,
+        args: tuple[bytes | str] | "SetQrArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a set_qr(byte[])void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_set_qr(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def verify(
+        self,
+        args: tuple[bytes | str] | "VerifyArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a verify(byte[])void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_verify(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def mark_counterfeit(
+        self,
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a mark_counterfeit()void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_mark_counterfeit(), params, decode_return=None
+        )
+        return self
+
+    def update_quantity(
+        self,
+        args: tuple[int] | "UpdateQuantityArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncDrugBatchContractComposer":
+        """Adds a update_quantity(uint64)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_update_quantity(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def add_transaction(
+        self, txn: transaction.Transaction, signer: TransactionSigner | None = None
+    ) -> "AsyncDrugBatchContractComposer":
+        self.composer.add_transaction(txn, signer)
+        return self
+
+    async def build(self) -> list[transaction.Transaction]:
+        return await self.composer.build()
+
+    async def send(self, send_params: SendParams | None = None) -> SendResult[typing.Any]:
+        return await self.composer.send(send_params)
+
+    async def simulate(self, **options: typing.Any) -> SimulateResult[typing.Any]:
+        return await self.composer.simulate(**options)
+
+
+class AsyncDrugBatchContractSend:
+    def __init__(self, client: "AsyncDrugBatchContractClient"):
+        self.client = client
+
+    async def set_registry(
+        self,
+        args: tuple[int] | "SetRegistryArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().set_registry(args, params)
+        return await composer.send(send_params)
+
+    async def set_regulator(
+        self,
+        args: tuple[str] | "SetRegulatorArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().set_regulator(args, params)
+        return await composer.send(send_params)
+
+    async def register(
+        self,
+        args: tuple[str, str, str, str, str, int] | "RegisterArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().register(args, params)
+        return await composer.send(send_params)
+
+    async def update_status(
+        self,
+        args: tuple[str] | "UpdateStatusArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().update_status(args, params)
+        return await composer.send(send_params)
+
+    async def approve(
+        self,
+        args: tuple[int] | "ApproveArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().approve(args, params)
+        return await composer.send(send_params)
+
+    async def reject(
+        self,
+        args: tuple[str] | "RejectArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().reject(args, params)
+        return await composer.send(send_params)
+
+    async def approve_for(
+        self,
+        args: tuple[str, int] | "ApproveForArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().approve_for(args, params)
+        return await composer.send(send_params)
+
+    async def reject_for(
+        self,
+        args: tuple[str, str] | "RejectForArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().reject_for(args, params)
+        return await composer.send(send_params)
+
+    async def transfer(
+        self,
+        args: tuple[str, str] | "TransferArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().transfer(args, params)
+        return await composer.send(send_params)
+
+    async def mark_delivered(
+        self,
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().mark_delivered(params)
+        return await composer.send(send_params)
+
+    async def set_qr(
+        self,
+        args: tuple[bytes | str] | "SetQrArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().set_qr(args, params)
+        return await composer.send(send_params)
+
+    async def verify(
+        self,
+        args: tuple[bytes | str] | "VerifyArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().verify(args, params)
+        return await composer.send(send_params)
+
+    async def mark_counterfeit(
+        self,
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().mark_counterfeit(params)
+        return await composer.send(send_params)
+
+    async def update_quantity(
+        self,
+        args: tuple[int] | "UpdateQuantityArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().update_quantity(args, params)
+        return await composer.send(send_params)
+
+
+class AsyncDrugBatchContractCreateTransactionParams:
+    def __init__(self, client: "AsyncDrugBatchContractClient"):
+        self.client = client
+
+    async def set_registry(
+        self,
+        args: tuple[int] | "SetRegistryArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().set_registry(args, params)
+        return (await composer.build())[0]
+
+    async def set_regulator(
+        self,
+        args: tuple[str] | "SetRegulatorArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().set_regulator(args, params)
+        return (await composer.build())[0]
+
+    async def register(
+        self,
+        args: tuple[str, str, str, str, str, int] | "RegisterArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().register(args, params)
+        return (await composer.build())[0]
+
+    async def update_status(
+        self,
+        args: tuple[str] | "UpdateStatusArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().update_status(args, params)
+        return (await composer.build())[0]
+
+    async def approve(
+        self,
+        args: tuple[int] | "ApproveArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().approve(args, params)
+        return (await composer.build())[0]
+
+    async def reject(
+        self,
+        args: tuple[str] | "RejectArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().reject(args, params)
+        return (await composer.build())[0]
+
+    async def approve_for(
+        self,
+        args: tuple[str, int] | "ApproveForArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().approve_for(args, params)
+        return (await composer.build())[0]
+
+    async def reject_for(
+        self,
+        args: tuple[str, str] | "RejectForArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().reject_for(args, params)
+        return (await composer.build())[0]
+
+    async def transfer(
+        self,
+        args: tuple[str, str] | "TransferArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().transfer(args, params)
+        return (await composer.build())[0]
+
+    async def mark_delivered(
+        self,
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().mark_delivered(params)
+        return (await composer.build())[0]
+
+    async def set_qr(
+        self,
+        args: tuple[bytes | str] | "SetQrArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().set_qr(args, params)
+        return (await composer.build())[0]
+
+    async def verify(
+        self,
+        args: tuple[bytes | str] | "VerifyArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().verify(args, params)
+        return (await composer.build())[0]
+
+    async def mark_counterfeit(
+        self,
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().mark_counterfeit(params)
+        return (await composer.build())[0]
+
+    async def update_quantity(
+        self,
+        args: tuple[int] | "UpdateQuantityArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().update_quantity(args, params)
+        return (await composer.build())[0]
+
+
+_GLOBAL_STATE = {
+    'YWRtaW4=': ('admin', _VALUE_DECODERS['address']),
+    'cHJvZHVjZXI=': ('producer', _VALUE_DECODERS['address']),
+    'cmVndWxhdG9y': ('regulator', _VALUE_DECODERS['address']),
+    'YmF0Y2hfaWQ=': ('batch_id', _VALUE_DECODERS['AVMString']),
+    'ZHJ1Z19uYW1l': ('drug_name', _VALUE_DECODERS['AVMString']),
+    'bWFudWZhY3R1cmVy': ('manufacturer', _VALUE_DECODERS['AVMString']),
+    'bWFudWZhY3R1cmVfZGF0ZQ==': ('manufacture_date', _VALUE_DECODERS['AVMString']),
+    'ZXhwaXJ5X2RhdGU=': ('expiry_date', _VALUE_DECODERS['AVMString']),
+    'cXVhbnRpdHk=': ('quantity', _VALUE_DECODERS['AVMUint64']),
+    'c3RhdHVz': ('status', _VALUE_DECODERS['AVMString']),
+    'dGltZXN0YW1w': ('timestamp', _VALUE_DECODERS['AVMUint64']),
+    'cmVnX3N0YXR1cw==': ('reg_status', _VALUE_DECODERS['AVMString']),
+    'cmVqX3JlYXNvbg==': ('rej_reason', _VALUE_DECODERS['AVMString']),
+    'Y29tcGxpYW5jZV9zY29yZQ==': ('compliance_score', _VALUE_DECODERS['AVMUint64']),
+    'YXBwcm92YWxfdHM=': ('approval_ts', _VALUE_DECODERS['AVMUint64']),
+    'c2VuZGVy': ('sender', _VALUE_DECODERS['address']),
+    'cmVjZWl2ZXI=': ('receiver', _VALUE_DECODERS['address']),
+    'Y3VycmVudF9sb2NhdGlvbg==': ('current_location', _VALUE_DECODERS['AVMString']),
+    'dHJhbnNmZXJfY291bnQ=': ('transfer_count', _VALUE_DECODERS['AVMUint64']),
+    'bGFzdF90cmFuc2Zlcl90cw==': ('last_transfer_ts', _VALUE_DECODERS['AVMUint64']),
+    'dmVyaWZfY291bnQ=': ('verif_count', _VALUE_DECODERS['AVMUint64']),
+    'aXNfYXV0aGVudGlj': ('is_authentic', _VALUE_DECODERS['AVMUint64']),
+    'bGFzdF92ZXJpZl90cw==': ('last_verif_ts', _VALUE_DECODERS['AVMUint64']),
+    'cXJfaGFzaA==': ('qr_hash', _VALUE_DECODERS['AVMBytes']),
+    'cmVnaXN0cnk=': ('registry', _VALUE_DECODERS['AVMUint64']),
+}
+
+
+class _GlobalState:
+    def __init__(self, client: "AsyncDrugBatchContractClient"):
+        self.client = client
+
+    async def get_all(self) -> "GlobalStateValue":
+        """Get all current keyed values from global_state state"""
+        info = await self.client.algod.application_info(self.client.app_id)
+        state = {}
+        for entry in info["params"].get("global-state", []):
+            key = _GLOBAL_STATE.get(entry["key"])
+            if key is not None:
+                name, decode = key
+                state[name] = decode(entry["value"])
+        return typing.cast("GlobalStateValue", state)
+
+    async def admin(self) -> str | None:
+        """Get the current value of the admin key in global_state state"""
+        return (await self.get_all()).get('admin')
+
+    async def producer(self) -> str | None:
+        """Get the current value of the producer key in global_state state"""
+        return (await self.get_all()).get('producer')
+
+    async def regulator(self) -> str | None:
+        """Get the current value of the regulator key in global_state state"""
+        return (await self.get_all()).get('regulator')
+
+    async def batch_id(self) -> str | None:
+        """Get the current value of the batch_id key in global_state state"""
+        return (await self.get_all()).get('batch_id')
+
+    async def drug_name(self) -> str | None:
+        """Get the current value of the drug_name key in global_state state"""
+        return (await self.get_all()).get('drug_name')
+
+    async def manufacturer(self) -> str | None:
+        """Get the current value of the manufacturer key in global_state state"""
+        return (await self.get_all()).get('manufacturer')
+
+    async def manufacture_date(self) -> str | None:
+        """Get the current value of the manufacture_date key in global_state state"""
+        return (await self.get_all()).get('manufacture_date')
+
+    async def expiry_date(self) -> str | None:
+        """Get the current value of the expiry_date key in global_state state"""
+        return (await self.get_all()).get('expiry_date')
+
+    async def quantity(self) -> int | None:
+        """Get the current value of the quantity key in global_state state"""
+        return (await self.get_all()).get('quantity')
+
+    async def status(self) -> str | None:
+        """Get the current value of the status key in global_state state"""
+        return (await self.get_all()).get('status')
+
+    async def timestamp(self) -> int | None:
+        """Get the current value of the timestamp key in global_state state"""
+        return (await self.get_all()).get('timestamp')
+
+    async def reg_status(self) -> str | None:
+        """Get the current value of the reg_status key in global_state state"""
+        return (await self.get_all()).get('reg_status')
+
+    async def rej_reason(self) -> str | None:
+        """Get the current value of the rej_reason key in global_state state"""
+        return (await self.get_all()).get('rej_reason')
+
+    async def compliance_score(self) -> int | None:
+        """Get the current value of the compliance_score key in global_state state"""
+        return (await self.get_all()).get('compliance_score')
+
+    async def approval_ts(self) -> int | None:
+        """Get the current value of the approval_ts key in global_state state"""
+        return (await self.get_all()).get('approval_ts')
+
+    async def sender(self) -> str | None:
+        """Get the current value of the sender key in global_state state"""
+        return (await self.get_all()).get('sender')
+
+    async def receiver(self) -> str | None:
+        """Get the current value of the receiver key in global_state state"""
+        return (await self.get_all()).get('receiver')
+
+    async def current_location(self) -> str | None:
+        """Get the current value of the current_location key in global_state state"""
+        return (await self.get_all()).get('current_location')
+
+    async def transfer_count(self) -> int | None:
+        """Get the current value of the transfer_count key in global_state state"""
+        return (await self.get_all()).get('transfer_count')
+
+    async def last_transfer_ts(self) -> int | None:
+        """Get the current value of the last_transfer_ts key in global_state state"""
+        return (await self.get_all()).get('last_transfer_ts')
+
+    async def verif_count(self) -> int | None:
+        """Get the current value of the verif_count key in global_state state"""
+        return (await self.get_all()).get('verif_count')
+
+    async def is_authentic(self) -> int | None:
+        """Get the current value of the is_authentic key in global_state state"""
+        return (await self.get_all()).get('is_authentic')
+
+    async def last_verif_ts(self) -> int | None:
+        """Get the current value of the last_verif_ts key in global_state state"""
+        return (await self.get_all()).get('last_verif_ts')
+
+    async def qr_hash(self) -> bytes | None:
+        """Get the current value of the qr_hash key in global_state state"""
+        return (await self.get_all()).get('qr_hash')
+
+    async def registry(self) -> int | None:
+        """Get the current value of the registry key in global_state state"""
+        return (await self.get_all()).get('registry')
+
+
+class AsyncDrugBatchContractState:
+    def __init__(self, client: "AsyncDrugBatchContractClient"):
+        self.global_state = _GlobalState(client)
+
+
+class AsyncDrugBatchContractClient:
+    """
+    asyncio client for a DrugBatchContract app, over an `AsyncAlgod` shared by every client
+    of a service:
+
+        async with AsyncAlgod.from_algod(algorand.client.algod, concurrency=64) as algod:
+            client = AsyncDrugBatchContractClient(algod, app_id, default_sender=sender, default_signer=signer)
+            await client.send.<method>(args=(...))
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgod,
+        app_id: int,
+        *,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+    ):
+        self.algod = algod
+        self.app_id = app_id
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        self.send = AsyncDrugBatchContractSend(self)
+        self.create_transaction = AsyncDrugBatchContractCreateTransactionParams(self)
+        self.state = AsyncDrugBatchContractState(self)
+
+    @property
+    def app_address(self) -> str:
+        return get_application_address(self.app_id)
+
+    def new_group(self) -> AsyncDrugBatchContractComposer:
+        return AsyncDrugBatchContractComposer(self)
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "regulator_addr"}], "name": "set_regulator", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "batch_id"}, {"type": "string", "name": "drug_name"}, {"type": "string", "name": "manufacturer"}, {"type": "string", "name": "manufacture_date"}, {"type": "string", "name": "expiry_date"}, {"type": "uint64", "name": "quantity"}], "name": "register", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "status_text"}], "name": "update_status", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "compliance_score"}], "name": "approve", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "reason_text"}], "name": "reject", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "new_receiver"}, {"type": "string", "name": "location"}], "name": "transfer", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "mark_delivered", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "qr_hash"}], "name": "set_qr", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "qr_hash"}], "name": "verify", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "mark_counterfeit", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "new_quantity"}], "name": "update_quantity", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_info", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_status", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_history", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "DrugBatchContract", "state": {"keys": {"box": {}, "global": {"admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "address"}, "producer": {"key": "cHJvZHVjZXI=", "keyType": "AVMString", "valueType": "address"}, "regulator": {"key": "cmVndWxhdG9y", "keyType": "AVMString", "valueType": "address"}, "batch_id": {"key": "YmF0Y2hfaWQ=", "keyType": "AVMString", "valueType": "AVMString"}, "drug_name": {"key": "ZHJ1Z19uYW1l", "keyType": "AVMString", "valueType": "AVMString"}, "manufacturer": {"key": "bWFudWZhY3R1cmVy", "keyType": "AVMString", "valueType": "AVMString"}, "manufacture_date": {"key": "bWFudWZhY3R1cmVfZGF0ZQ==", "keyType": "AVMString", "valueType": "AVMString"}, "expiry_date": {"key": "ZXhwaXJ5X2RhdGU=", "keyType": "AVMString", "valueType": "AVMString"}, "quantity": {"key": "cXVhbnRpdHk=", "keyType": "AVMString", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMString", "valueType": "AVMString"}, "timestamp": {"key": "dGltZXN0YW1w", "keyType": "AVMString", "valueType": "AVMUint64"}, "reg_status": {"key": "cmVnX3N0YXR1cw==", "keyType": "AVMString", "valueType": "AVMString"}, "rej_reason": {"key": "cmVqX3JlYXNvbg==", "keyType": "AVMString", "valueType": "AVMString"}, "compliance_score": {"key": "Y29tcGxpYW5jZV9zY29yZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "approval_ts": {"key": "YXBwcm92YWxfdHM=", "keyType": "AVMString", "valueType": "AVMUint64"}, "sender": {"key": "c2VuZGVy", "keyType": "AVMString", "valueType": "address"}, "receiver": {"key": "cmVjZWl2ZXI=", "keyType": "AVMString", "valueType": "address"}, "current_location": {"key": "Y3VycmVudF9sb2NhdGlvbg==", "keyType": "AVMString", "valueType": "AVMString"}, "transfer_count": {"key": "dHJhbnNmZXJfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "last_transfer_ts": {"key": "bGFzdF90cmFuc2Zlcl90cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "verif_count": {"key": "dmVyaWZfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_authentic": {"key": "aXNfYXV0aGVudGlj", "keyType": "AVMString", "valueType": "AVMUint64"}, "last_verif_ts": {"key": "bGFzdF92ZXJpZl90cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "qr_hash": {"key": "cXJfaGFzaA==", "keyType": "AVMString", "valueType": "AVMBytes"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 15, "ints": 9}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyAEAAECCCYcBWFkbWluCHByb2R1Y2VyAAZzdGF0dXMJcmVndWxhdG9yCXRpbWVzdGFtcApyZWdfc3RhdHVzC2FwcHJvdmFsX3RzBnNlbmRlcghyZWNlaXZlcg50cmFuc2Zlcl9jb3VudA1sYXN0X3ZlcmlmX3RzCHF1YW50aXR5B3BlbmRpbmcQbGFzdF90cmFuc2Zlcl90cwt2ZXJpZl9jb3VudAdxcl9oYXNoCGJhdGNoX2lkCWRydWdfbmFtZQxtYW51ZmFjdHVyZXIQbWFudWZhY3R1cmVfZGF0ZQtleHBpcnlfZGF0ZQpyZWpfcmVhc29uEGNvbXBsaWFuY2Vfc2NvcmUQY3VycmVudF9sb2NhdGlvbgxpc19hdXRoZW50aWMIYXBwcm92ZWQIcmVqZWN0ZWQxGEAAcCgyCWcpMgNnJwQyA2cnESpnJxIqZycTKmcnFCpnJxUqZycMImcrgAx1bnJlZ2lzdGVyZWRnJwUiZycGJw1nJxYqZycXImcnByJnJwgyA2cnCTIDZycYKmcnCiJnJw4iZycPImcnGSNnJwsiZycQKmcxG0EAdzEZFEQxGESCDgS/dGt4BBtmgNoER1r/+ASt1jBuBLyyEPYEd7CcegReI9V+BP2ucKUEb62H7QSlsNe2BDhbuckEY/Aq6gQAjAacBFc/xdc2GgCODgAPADAAywELATEBXgHyAiECVwKAArUABQADAAEAI0MjQyNDMRkUMRgUEEM2GgFJFYEgEkQxACIoZUQSRCcETGcnBicNZycHMgdnI0M2GgFJIlkkCEsBFRJEVwIANhoCSSJZJAhLARUSRFcCADYaA0kiWSQISwEVEkRXAgA2GgRJIlkkCEsBFRJEVwIANhoFSSJZJAhLARUSRFcCADYaBkkVJRJEFyIpZUQyAxJBAC0pMQBnJxFLBmcnEksFZycTSwRnJxRLA2cnFUsCZycMSwFnKycNZycFMgdnI0MxACIpZUQSREL/zDYaAUkiWSQISwEVEkRXAgAxACIoZUQSQAAVMQAiKWVEEkAACzEAIicEZUQSQQANI0QrSwFnJwUyB2cjQyJC//A2GgFJFSUSRBcxACInBGVEEkQnBicaZycXTGcnBzIHZysnGmcjQzYaAUkiWSQISwEVEkRXAgAxACInBGVEEkQnBicbZycWTGcnBzIHZysnG2cjQzYaAUkVgSASRDYaAkkiWSQISwEVEkRXAgAiJwplREAATDEAIillRBJAAAoxACIoZUQSQQA0I0QiKWVEJwhMZycJSwJnJxhLAWciJwplRCMIJwpMZycOMgdnK4AKaW5fdHJhbnNpdGcjQyJC/8kxACInCGVEEkAACjEAIihlRBJBAA4jRCInCWVEJwhMZ0L/ryJC/+8xACInCWVEEkAACjEAIihlRBJBABYjRCuACWRlbGl2ZXJlZGcnDjIHZyNDIkL/5zYaAUkiWSQISwEVEkRXAgAxACIpZUQSQAAKMQAiKGVEEkEADiNEJxBLAWcnCzIHZyNDIkL/7zYaAUkiWSQISwEVEkRXAgAiJxBlRBJEIicPZUQjCCcPTGcnCzIHZyNDMQAiKGVEEkAACzEAIicEZUQSQQAcI0QnGSJnK4ALY291bnRlcmZlaXRnJwsyB2cjQyJC/+E2GgFJFSUSRBcxACIpZUQSQAAKMQAiKGVEEkEADiNEJwxLAWcnBTIHZyNDIkL/7w==", "clear": "C4EBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMiA4CiAgICBieXRlY2Jsb2NrICJhZG1pbiIgInByb2R1Y2VyIiAweCAic3RhdHVzIiAicmVndWxhdG9yIiAidGltZXN0YW1wIiAicmVnX3N0YXR1cyIgImFwcHJvdmFsX3RzIiAic2VuZGVyIiAicmVjZWl2ZXIiICJ0cmFuc2Zlcl9jb3VudCIgImxhc3RfdmVyaWZfdHMiICJxdWFudGl0eSIgInBlbmRpbmciICJsYXN0X3RyYW5zZmVyX3RzIiAidmVyaWZfY291bnQiICJxcl9oYXNoIiAiYmF0Y2hfaWQiICJkcnVnX25hbWUiICJtYW51ZmFjdHVyZXIiICJtYW51ZmFjdHVyZV9kYXRlIiAiZXhwaXJ5X2RhdGUiICJyZWpfcmVhc29uIiAiY29tcGxpYW5jZV9zY29yZSIgImN1cnJlbnRfbG9jYXRpb24iICJpc19hdXRoZW50aWMiICJhcHByb3ZlZCIgInJlamVjdGVkIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NAogICAgLy8gc2VsZi5hZG1pbiA9IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGJ5dGVjXzAgLy8gImFkbWluIgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NQogICAgLy8gc2VsZi5wcm9kdWNlciA9IEFjY291bnQoKQogICAgYnl0ZWNfMSAvLyAicHJvZHVjZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo2CiAgICAvLyBzZWxmLnJlZ3VsYXRvciA9IEFjY291bnQoKQogICAgYnl0ZWMgNCAvLyAicmVndWxhdG9yIgogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NwogICAgLy8gc2VsZi5iYXRjaF9pZCA9IFN0cmluZygpCiAgICBieXRlYyAxNyAvLyAiYmF0Y2hfaWQiCiAgICBieXRlY18yIC8vICIiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6OAogICAgLy8gc2VsZi5kcnVnX25hbWUgPSBTdHJpbmcoKQogICAgYnl0ZWMgMTggLy8gImRydWdfbmFtZSIKICAgIGJ5dGVjXzIgLy8gIiIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo5CiAgICAvLyBzZWxmLm1hbnVmYWN0dXJlciA9IFN0cmluZygpCiAgICBieXRlYyAxOSAvLyAibWFudWZhY3R1cmVyIgogICAgYnl0ZWNfMiAvLyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEwCiAgICAvLyBzZWxmLm1hbnVmYWN0dXJlX2RhdGUgPSBTdHJpbmcoKQogICAgYnl0ZWMgMjAgLy8gIm1hbnVmYWN0dXJlX2RhdGUiCiAgICBieXRlY18yIC8vICIiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTEKICAgIC8vIHNlbGYuZXhwaXJ5X2RhdGUgPSBTdHJpbmcoKQogICAgYnl0ZWMgMjEgLy8gImV4cGlyeV9kYXRlIgogICAgYnl0ZWNfMiAvLyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEyCiAgICAvLyBzZWxmLnF1YW50aXR5ID0gVUludDY0KCkKICAgIGJ5dGVjIDEyIC8vICJxdWFudGl0eSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTMKICAgIC8vIHNlbGYuc3RhdHVzID0gU3RyaW5nKCJ1bnJlZ2lzdGVyZWQiKQogICAgYnl0ZWNfMyAvLyAic3RhdHVzIgogICAgcHVzaGJ5dGVzICJ1bnJlZ2lzdGVyZWQiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQKICAgIC8vIHNlbGYudGltZXN0YW1wID0gVUludDY0KCkKICAgIGJ5dGVjIDUgLy8gInRpbWVzdGFtcCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTUKICAgIC8vIHNlbGYucmVnX3N0YXR1cyA9IFN0cmluZygicGVuZGluZyIpCiAgICBieXRlYyA2IC8vICJyZWdfc3RhdHVzIgogICAgYnl0ZWMgMTMgLy8gInBlbmRpbmciCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTYKICAgIC8vIHNlbGYucmVqX3JlYXNvbiA9IFN0cmluZygpCiAgICBieXRlYyAyMiAvLyAicmVqX3JlYXNvbiIKICAgIGJ5dGVjXzIgLy8gIiIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNwogICAgLy8gc2VsZi5jb21wbGlhbmNlX3Njb3JlID0gVUludDY0KCkKICAgIGJ5dGVjIDIzIC8vICJjb21wbGlhbmNlX3Njb3JlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxOAogICAgLy8gc2VsZi5hcHByb3ZhbF90cyA9IFVJbnQ2NCgpCiAgICBieXRlYyA3IC8vICJhcHByb3ZhbF90cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTkKICAgIC8vIHNlbGYuc2VuZGVyID0gQWNjb3VudCgpCiAgICBieXRlYyA4IC8vICJzZW5kZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMAogICAgLy8gc2VsZi5yZWNlaXZlciA9IEFjY291bnQoKQogICAgYnl0ZWMgOSAvLyAicmVjZWl2ZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMQogICAgLy8gc2VsZi5jdXJyZW50X2xvY2F0aW9uID0gU3RyaW5nKCkKICAgIGJ5dGVjIDI0IC8vICJjdXJyZW50X2xvY2F0aW9uIgogICAgYnl0ZWNfMiAvLyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIyCiAgICAvLyBzZWxmLnRyYW5zZmVyX2NvdW50ID0gVUludDY0KCkKICAgIGJ5dGVjIDEwIC8vICJ0cmFuc2Zlcl9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjMKICAgIC8vIHNlbGYubGFzdF90cmFuc2Zlcl90cyA9IFVJbnQ2NCgpCiAgICBieXRlYyAxNCAvLyAibGFzdF90cmFuc2Zlcl90cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjQKICAgIC8vIHNlbGYudmVyaWZfY291bnQgPSBVSW50NjQoKQogICAgYnl0ZWMgMTUgLy8gInZlcmlmX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNQogICAgLy8gc2VsZi5pc19hdXRoZW50aWMgPSBVSW50NjQoMSkKICAgIGJ5dGVjIDI1IC8vICJpc19hdXRoZW50aWMiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI2CiAgICAvLyBzZWxmLmxhc3RfdmVyaWZfdHMgPSBVSW50NjQoKQogICAgYnl0ZWMgMTEgLy8gImxhc3RfdmVyaWZfdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI3CiAgICAvLyBzZWxmLnFyX2hhc2ggPSBCeXRlcygpCiAgICBieXRlYyAxNiAvLyAicXJfaGFzaCIKICAgIGJ5dGVjXzIgLy8gMHgKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIKICAgIC8vIGNsYXNzIERydWdCYXRjaENvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAyMwogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIHB1c2hieXRlc3MgMHhiZjc0NmI3OCAweDFiNjY4MGRhIDB4NDc1YWZmZjggMHhhZGQ2MzA2ZSAweGJjYjIxMGY2IDB4NzdiMDljN2EgMHg1ZTIzZDU3ZSAweGZkYWU3MGE1IDB4NmZhZDg3ZWQgMHhhNWIwZDdiNiAweDM4NWJiOWM5IDB4NjNmMDJhZWEgMHgwMDhjMDY5YyAweDU3M2ZjNWQ3IC8vIG1ldGhvZCAic2V0X3JlZ3VsYXRvcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInJlZ2lzdGVyKHN0cmluZyxzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcsdWludDY0KXZvaWQiLCBtZXRob2QgInVwZGF0ZV9zdGF0dXMoc3RyaW5nKXZvaWQiLCBtZXRob2QgImFwcHJvdmUodWludDY0KXZvaWQiLCBtZXRob2QgInJlamVjdChzdHJpbmcpdm9pZCIsIG1ldGhvZCAidHJhbnNmZXIoYWRkcmVzcyxzdHJpbmcpdm9pZCIsIG1ldGhvZCAibWFya19kZWxpdmVyZWQoKXZvaWQiLCBtZXRob2QgInNldF9xcihieXRlW10pdm9pZCIsIG1ldGhvZCAidmVyaWZ5KGJ5dGVbXSl2b2lkIiwgbWV0aG9kICJtYXJrX2NvdW50ZXJmZWl0KCl2b2lkIiwgbWV0aG9kICJ1cGRhdGVfcXVhbnRpdHkodWludDY0KXZvaWQiLCBtZXRob2QgImdldF9pbmZvKCl2b2lkIiwgbWV0aG9kICJnZXRfc3RhdHVzKCl2b2lkIiwgbWV0aG9kICJnZXRfaGlzdG9yeSgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHNldF9yZWd1bGF0b3IgcmVnaXN0ZXIgdXBkYXRlX3N0YXR1cyBhcHByb3ZlIHJlamVjdCB0cmFuc2ZlciBtYXJrX2RlbGl2ZXJlZCBzZXRfcXIgdmVyaWZ5IG1hcmtfY291bnRlcmZlaXQgdXBkYXRlX3F1YW50aXR5IG1haW5fZ2V0X2luZm9fcm91dGVAMTcgbWFpbl9nZXRfc3RhdHVzX3JvdXRlQDE4IG1haW5fZ2V0X2hpc3Rvcnlfcm91dGVAMTkKICAgIGVycgoKbWFpbl9nZXRfaGlzdG9yeV9yb3V0ZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEzNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9zdGF0dXNfcm91dGVAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfaW5mb19yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEyNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDIzOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgICYmCiAgICByZXR1cm4gLy8gb24gZXJyb3I6IE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AgJiYgY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3Quc2V0X3JlZ3VsYXRvcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9yZWd1bGF0b3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgdWludDhbMzJdCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTozMQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MzIKICAgIC8vIHNlbGYucmVndWxhdG9yID0gcmVndWxhdG9yX2FkZHIKICAgIGJ5dGVjIDQgLy8gInJlZ3VsYXRvciIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTozMwogICAgLy8gc2VsZi5yZWdfc3RhdHVzID0gU3RyaW5nKCJwZW5kaW5nIikKICAgIGJ5dGVjIDYgLy8gInJlZ19zdGF0dXMiCiAgICBieXRlYyAxMyAvLyAicGVuZGluZyIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTozNAogICAgLy8gc2VsZi5hcHByb3ZhbF90cyA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieXRlYyA3IC8vICJhcHByb3ZhbF90cyIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QucmVnaXN0ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjM2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1dGY4W10pCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3V0ZjhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIChsZW4rdXRmOFtdKQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1dGY4W10pCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3V0ZjhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NDYKICAgIC8vIGlmIHNlbGYucHJvZHVjZXIgPT0gQWNjb3VudCgpOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInByb2R1Y2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2R1Y2VyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgYnogcmVnaXN0ZXJfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBzZWxmLnByb2R1Y2VyID0gVHhuLnNlbmRlcgogICAgYnl0ZWNfMSAvLyAicHJvZHVjZXIiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAoKcmVnaXN0ZXJfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NTAKICAgIC8vIHNlbGYuYmF0Y2hfaWQgPSBiYXRjaF9pZAogICAgYnl0ZWMgMTcgLy8gImJhdGNoX2lkIgogICAgZGlnIDYKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo1MQogICAgLy8gc2VsZi5kcnVnX25hbWUgPSBkcnVnX25hbWUKICAgIGJ5dGVjIDE4IC8vICJkcnVnX25hbWUiCiAgICBkaWcgNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjUyCiAgICAvLyBzZWxmLm1hbnVmYWN0dXJlciA9IG1hbnVmYWN0dXJlcgogICAgYnl0ZWMgMTkgLy8gIm1hbnVmYWN0dXJlciIKICAgIGRpZyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NTMKICAgIC8vIHNlbGYubWFudWZhY3R1cmVfZGF0ZSA9IG1hbnVmYWN0dXJlX2RhdGUKICAgIGJ5dGVjIDIwIC8vICJtYW51ZmFjdHVyZV9kYXRlIgogICAgZGlnIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo1NAogICAgLy8gc2VsZi5leHBpcnlfZGF0ZSA9IGV4cGlyeV9kYXRlCiAgICBieXRlYyAyMSAvLyAiZXhwaXJ5X2RhdGUiCiAgICBkaWcgMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjU1CiAgICAvLyBzZWxmLnF1YW50aXR5ID0gcXVhbnRpdHkKICAgIGJ5dGVjIDEyIC8vICJxdWFudGl0eSIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NTYKICAgIC8vIHNlbGYuc3RhdHVzID0gU3RyaW5nKCJwZW5kaW5nIikKICAgIGJ5dGVjXzMgLy8gInN0YXR1cyIKICAgIGJ5dGVjIDEzIC8vICJwZW5kaW5nIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjU3CiAgICAvLyBzZWxmLnRpbWVzdGFtcCA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieXRlYyA1IC8vICJ0aW1lc3RhbXAiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKcmVnaXN0ZXJfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo0OQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5wcm9kdWNlcgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInByb2R1Y2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2R1Y2VyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgYiByZWdpc3Rlcl9hZnRlcl9pZl9lbHNlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC51cGRhdGVfc3RhdHVzW3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX3N0YXR1czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjU5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1dGY4W10pCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4gb3IgVHhuLnNlbmRlciA9PSBzZWxmLnByb2R1Y2VyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5yZWd1bGF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBibnogdXBkYXRlX3N0YXR1c19ib29sX3RydWVANAogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInByb2R1Y2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2R1Y2VyIGV4aXN0cwogICAgPT0KICAgIGJueiB1cGRhdGVfc3RhdHVzX2Jvb2xfdHJ1ZUA0CiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicmVndWxhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ3VsYXRvciBleGlzdHMKICAgID09CiAgICBieiB1cGRhdGVfc3RhdHVzX2Jvb2xfZmFsc2VANQoKdXBkYXRlX3N0YXR1c19ib29sX3RydWVANDoKICAgIGludGNfMSAvLyAxCgp1cGRhdGVfc3RhdHVzX2Jvb2xfbWVyZ2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjYxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5wcm9kdWNlciBvciBUeG4uc2VuZGVyID09IHNlbGYucmVndWxhdG9yCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLnN0YXR1cyA9IHN0YXR1c190ZXh0CiAgICBieXRlY18zIC8vICJzdGF0dXMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjYzCiAgICAvLyBzZWxmLnRpbWVzdGFtcCA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieXRlYyA1IC8vICJ0aW1lc3RhbXAiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdXBkYXRlX3N0YXR1c19ib29sX2ZhbHNlQDU6CiAgICBpbnRjXzAgLy8gMAogICAgYiB1cGRhdGVfc3RhdHVzX2Jvb2xfbWVyZ2VANgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX2hlYWx4LmNvbnRyYWN0LkRydWdCYXRjaENvbnRyYWN0LmFwcHJvdmVbcm91dGluZ10oKSAtPiB2b2lkOgphcHByb3ZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciB1aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjY3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnJlZ3VsYXRvcgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInJlZ3VsYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWd1bGF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo2OAogICAgLy8gc2VsZi5yZWdfc3RhdHVzID0gU3RyaW5nKCJhcHByb3ZlZCIpCiAgICBieXRlYyA2IC8vICJyZWdfc3RhdHVzIgogICAgYnl0ZWMgMjYgLy8gImFwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjY5CiAgICAvLyBzZWxmLmNvbXBsaWFuY2Vfc2NvcmUgPSBjb21wbGlhbmNlX3Njb3JlCiAgICBieXRlYyAyMyAvLyAiY29tcGxpYW5jZV9zY29yZSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5hcHByb3ZhbF90cyA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieXRlYyA3IC8vICJhcHByb3ZhbF90cyIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo3MQogICAgLy8gc2VsZi5zdGF0dXMgPSBTdHJpbmcoImFwcHJvdmVkIikKICAgIGJ5dGVjXzMgLy8gInN0YXR1cyIKICAgIGJ5dGVjIDI2IC8vICJhcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QucmVqZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKcmVqZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3V0ZjhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo3NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5yZWd1bGF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJyZWd1bGF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVndWxhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NzYKICAgIC8vIHNlbGYucmVnX3N0YXR1cyA9IFN0cmluZygicmVqZWN0ZWQiKQogICAgYnl0ZWMgNiAvLyAicmVnX3N0YXR1cyIKICAgIGJ5dGVjIDI3IC8vICJyZWplY3RlZCIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo3NwogICAgLy8gc2VsZi5yZWpfcmVhc29uID0gcmVhc29uX3RleHQKICAgIGJ5dGVjIDIyIC8vICJyZWpfcmVhc29uIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBzZWxmLmFwcHJvdmFsX3RzID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDcgLy8gImFwcHJvdmFsX3RzIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojc5CiAgICAvLyBzZWxmLnN0YXR1cyA9IFN0cmluZygicmVqZWN0ZWQiKQogICAgYnl0ZWNfMyAvLyAic3RhdHVzIgogICAgYnl0ZWMgMjcgLy8gInJlamVjdGVkIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjczCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC50cmFuc2Zlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnRyYW5zZmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHVpbnQ4WzMyXQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3V0ZjhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo4MwogICAgLy8gaWYgc2VsZi50cmFuc2Zlcl9jb3VudCA9PSBVSW50NjQoMCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gInRyYW5zZmVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyYW5zZmVyX2NvdW50IGV4aXN0cwogICAgYm56IHRyYW5zZmVyX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo4NAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5wcm9kdWNlciBvciBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4KICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJwcm9kdWNlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9kdWNlciBleGlzdHMKICAgID09CiAgICBibnogdHJhbnNmZXJfYm9vbF90cnVlQDQKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBieiB0cmFuc2Zlcl9ib29sX2ZhbHNlQDUKCnRyYW5zZmVyX2Jvb2xfdHJ1ZUA0OgogICAgaW50Y18xIC8vIDEKCnRyYW5zZmVyX2Jvb2xfbWVyZ2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnByb2R1Y2VyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo4NQogICAgLy8gc2VsZi5zZW5kZXIgPSBzZWxmLnByb2R1Y2VyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicHJvZHVjZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvZHVjZXIgZXhpc3RzCiAgICBieXRlYyA4IC8vICJzZW5kZXIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAoKdHJhbnNmZXJfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBzZWxmLnJlY2VpdmVyID0gbmV3X3JlY2VpdmVyCiAgICBieXRlYyA5IC8vICJyZWNlaXZlciIKICAgIGRpZyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6OTAKICAgIC8vIHNlbGYuY3VycmVudF9sb2NhdGlvbiA9IGxvY2F0aW9uCiAgICBieXRlYyAyNCAvLyAiY3VycmVudF9sb2NhdGlvbiIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6OTEKICAgIC8vIHNlbGYudHJhbnNmZXJfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gInRyYW5zZmVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyYW5zZmVyX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDEwIC8vICJ0cmFuc2Zlcl9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo5MgogICAgLy8gc2VsZi5sYXN0X3RyYW5zZmVyX3RzID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDE0IC8vICJsYXN0X3RyYW5zZmVyX3RzIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjkzCiAgICAvLyBzZWxmLnN0YXR1cyA9IFN0cmluZygiaW5fdHJhbnNpdCIpCiAgICBieXRlY18zIC8vICJzdGF0dXMiCiAgICBwdXNoYnl0ZXMgImluX3RyYW5zaXQiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdHJhbnNmZXJfYm9vbF9mYWxzZUA1OgogICAgaW50Y18wIC8vIDAKICAgIGIgdHJhbnNmZXJfYm9vbF9tZXJnZUA2Cgp0cmFuc2Zlcl9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnNlbmRlciBvciBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4KICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJzZW5kZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2VuZGVyIGV4aXN0cwogICAgPT0KICAgIGJueiB0cmFuc2Zlcl9ib29sX3RydWVAOQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGJ6IHRyYW5zZmVyX2Jvb2xfZmFsc2VAMTAKCnRyYW5zZmVyX2Jvb2xfdHJ1ZUA5OgogICAgaW50Y18xIC8vIDEKCnRyYW5zZmVyX2Jvb2xfbWVyZ2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo4NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5zZW5kZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLnNlbmRlciA9IHNlbGYucmVjZWl2ZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJyZWNlaXZlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWNlaXZlciBleGlzdHMKICAgIGJ5dGVjIDggLy8gInNlbmRlciIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIHRyYW5zZmVyX2FmdGVyX2lmX2Vsc2VAMTIKCnRyYW5zZmVyX2Jvb2xfZmFsc2VAMTA6CiAgICBpbnRjXzAgLy8gMAogICAgYiB0cmFuc2Zlcl9ib29sX21lcmdlQDExCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QubWFya19kZWxpdmVyZWRbcm91dGluZ10oKSAtPiB2b2lkOgptYXJrX2RlbGl2ZXJlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnJlY2VpdmVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gInJlY2VpdmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlY2VpdmVyIGV4aXN0cwogICAgPT0KICAgIGJueiBtYXJrX2RlbGl2ZXJlZF9ib29sX3RydWVAMwogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGJ6IG1hcmtfZGVsaXZlcmVkX2Jvb2xfZmFsc2VANAoKbWFya19kZWxpdmVyZWRfYm9vbF90cnVlQDM6CiAgICBpbnRjXzEgLy8gMQoKbWFya19kZWxpdmVyZWRfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6OTcKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYucmVjZWl2ZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBzZWxmLnN0YXR1cyA9IFN0cmluZygiZGVsaXZlcmVkIikKICAgIGJ5dGVjXzMgLy8gInN0YXR1cyIKICAgIHB1c2hieXRlcyAiZGVsaXZlcmVkIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojk5CiAgICAvLyBzZWxmLmxhc3RfdHJhbnNmZXJfdHMgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgYnl0ZWMgMTQgLy8gImxhc3RfdHJhbnNmZXJfdHMiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6OTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFya19kZWxpdmVyZWRfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgbWFya19kZWxpdmVyZWRfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3Quc2V0X3FyW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3FyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTAxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1aW50OFtdKQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEwMwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5wcm9kdWNlciBvciBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4KICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJwcm9kdWNlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9kdWNlciBleGlzdHMKICAgID09CiAgICBibnogc2V0X3FyX2Jvb2xfdHJ1ZUAzCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYnogc2V0X3FyX2Jvb2xfZmFsc2VANAoKc2V0X3FyX2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18xIC8vIDEKCnNldF9xcl9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMDMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYucHJvZHVjZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEwNAogICAgLy8gc2VsZi5xcl9oYXNoID0gcXJfaGFzaAogICAgYnl0ZWMgMTYgLy8gInFyX2hhc2giCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEwNQogICAgLy8gc2VsZi5sYXN0X3ZlcmlmX3RzID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDExIC8vICJsYXN0X3ZlcmlmX3RzIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpzZXRfcXJfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgc2V0X3FyX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX2hlYWx4LmNvbnRyYWN0LkRydWdCYXRjaENvbnRyYWN0LnZlcmlmeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZlcmlmeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIChsZW4rdWludDhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMDkKICAgIC8vIGFzc2VydCBxcl9oYXNoID09IHNlbGYucXJfaGFzaAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vICJxcl9oYXNoIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnFyX2hhc2ggZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTAKICAgIC8vIHNlbGYudmVyaWZfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTUgLy8gInZlcmlmX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZlcmlmX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDE1IC8vICJ2ZXJpZl9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTEKICAgIC8vIHNlbGYubGFzdF92ZXJpZl90cyA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieXRlYyAxMSAvLyAibGFzdF92ZXJpZl90cyIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX2hlYWx4LmNvbnRyYWN0LkRydWdCYXRjaENvbnRyYWN0Lm1hcmtfY291bnRlcmZlaXRbcm91dGluZ10oKSAtPiB2b2lkOgptYXJrX2NvdW50ZXJmZWl0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTE1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5yZWd1bGF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBibnogbWFya19jb3VudGVyZmVpdF9ib29sX3RydWVAMwogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInJlZ3VsYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWd1bGF0b3IgZXhpc3RzCiAgICA9PQogICAgYnogbWFya19jb3VudGVyZmVpdF9ib29sX2ZhbHNlQDQKCm1hcmtfY291bnRlcmZlaXRfYm9vbF90cnVlQDM6CiAgICBpbnRjXzEgLy8gMQoKbWFya19jb3VudGVyZmVpdF9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4gb3IgVHhuLnNlbmRlciA9PSBzZWxmLnJlZ3VsYXRvcgogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTYKICAgIC8vIHNlbGYuaXNfYXV0aGVudGljID0gVUludDY0KDApCiAgICBieXRlYyAyNSAvLyAiaXNfYXV0aGVudGljIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTcKICAgIC8vIHNlbGYuc3RhdHVzID0gU3RyaW5nKCJjb3VudGVyZmVpdCIpCiAgICBieXRlY18zIC8vICJzdGF0dXMiCiAgICBwdXNoYnl0ZXMgImNvdW50ZXJmZWl0IgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjExOAogICAgLy8gc2VsZi5sYXN0X3ZlcmlmX3RzID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDExIC8vICJsYXN0X3ZlcmlmX3RzIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjExMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYXJrX2NvdW50ZXJmZWl0X2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIG1hcmtfY291bnRlcmZlaXRfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QudXBkYXRlX3F1YW50aXR5W3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX3F1YW50aXR5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTIwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgdWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMjIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYucHJvZHVjZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicHJvZHVjZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvZHVjZXIgZXhpc3RzCiAgICA9PQogICAgYm56IHVwZGF0ZV9xdWFudGl0eV9ib29sX3RydWVAMwogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGJ6IHVwZGF0ZV9xdWFudGl0eV9ib29sX2ZhbHNlQDQKCnVwZGF0ZV9xdWFudGl0eV9ib29sX3RydWVAMzoKICAgIGludGNfMSAvLyAxCgp1cGRhdGVfcXVhbnRpdHlfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTIyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnByb2R1Y2VyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMjMKICAgIC8vIHNlbGYucXVhbnRpdHkgPSBuZXdfcXVhbnRpdHkKICAgIGJ5dGVjIDEyIC8vICJxdWFudGl0eSIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTI0CiAgICAvLyBzZWxmLnRpbWVzdGFtcCA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieXRlYyA1IC8vICJ0aW1lc3RhbXAiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTIwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnVwZGF0ZV9xdWFudGl0eV9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiB1cGRhdGVfcXVhbnRpdHlfYm9vbF9tZXJnZUA1Cg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [436], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [559], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [574, 769, 943, 1020, 1059, 1121, 1190, 1262], "errorMessage": "check self.admin exists"}, {"pc": [685, 742, 779, 933, 953, 1111, 1252], "errorMessage": "check self.producer exists"}, {"pc": [1164], "errorMessage": "check self.qr_hash exists"}, {"pc": [1031, 1049], "errorMessage": "check self.receiver exists"}, {"pc": [790, 827, 872, 1201], "errorMessage": "check self.regulator exists"}, {"pc": [1010], "errorMessage": "check self.sender exists"}, {"pc": [924, 972], "errorMessage": "check self.transfer_count exists"}, {"pc": [1171], "errorMessage": "check self.verif_count exists"}, {"pc": [1102, 1156], "errorMessage": "invalid number of bytes for (len+uint8[])"}, {"pc": [605, 621, 637, 653, 669, 760, 862, 916], "errorMessage": "invalid number of bytes for (len+utf8[])"}, {"pc": [680, 819, 1245], "errorMessage": "invalid number of bytes for uint64"}, {"pc": [568, 903], "errorMessage": "invalid number of bytes for uint8[32]"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "registry_app_id"}], "name": "set_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "regulator_addr"}], "name": "set_regulator", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "regulator"}, {"type": "uint64", "name": "timestamp"}], "name": "RegulatorSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "batch_id"}, {"type": "string", "name": "drug_name"}, {"type": "string", "name": "manufacturer"}, {"type": "string", "name": "manufacture_date"}, {"type": "string", "name": "expiry_date"}, {"type": "uint64", "name": "quantity"}], "name": "register", "returns": {"type": "void"}, "events": [{"args": [{"type": "string", "name": "batch_id"}, {"type": "address", "name": "producer"}, {"type": "uint64", "name": "quantity"}, {"type": "uint64", "name": "timestamp"}], "name": "Registered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "status_text"}], "name": "update_status", "returns": {"type": "void"}, "events": [{"args": [{"type": "string", "name": "status"}, {"type": "address", "name": "updated_by"}, {"type": "uint64", "name": "timestamp"}], "name": "StatusUpdated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "compliance_score"}], "name": "approve", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "regulator"}, {"type": "uint64", "name": "compliance_score"}, {"type": "uint64", "name": "timestamp"}], "name": "Approved"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "reason_text"}], "name": "reject", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "regulator"}, {"type": "string", "name": "reason"}, {"type": "uint64", "name": "timestamp"}], "name": "Rejected"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "regulator"}, {"type": "uint64", "name": "compliance_score"}], "name": "approve_for", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "regulator"}, {"type": "uint64", "name": "compliance_score"}, {"type": "uint64", "name": "timestamp"}], "name": "Approved"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "regulator"}, {"type": "string", "name": "reason_text"}], "name": "reject_for", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "regulator"}, {"type": "string", "name": "reason"}, {"type": "uint64", "name": "timestamp"}], "name": "Rejected"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "new_receiver"}, {"type": "string", "name": "location"}], "name": "transfer", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "sender"}, {"type": "address", "name": "receiver"}, {"type": "string", "name": "location"}, {"type": "uint64", "name": "transfer_count"}, {"type": "uint64", "name": "timestamp"}], "name": "Transferred"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "mark_delivered", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "receiver"}, {"type": "uint64", "name": "timestamp"}], "name": "Delivered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "qr_hash"}], "name": "set_qr", "returns": {"type": "void"}, "events": [{"args": [{"type": "byte[]", "name": "qr_hash"}, {"type": "uint64", "name": "timestamp"}], "name": "QrSet"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "qr_hash"}], "name": "verify", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "verifier"}, {"type": "uint64", "name": "verif_count"}, {"type": "uint64", "name": "timestamp"}], "name": "Verified"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "mark_counterfeit", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "reported_by"}, {"type": "uint64", "name": "timestamp"}], "name": "Counterfeit"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "new_quantity"}], "name": "update_quantity", "returns": {"type": "void"}, "events": [{"args": [{"type": "uint64", "name": "quantity"}, {"type": "uint64", "name": "timestamp"}], "name": "QuantityUpdated"}], "readonly": false, "recommendations": {}}], "name": "DrugBatchContract", "state": {"keys": {"box": {}, "global": {"admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "address"}, "producer": {"key": "cHJvZHVjZXI=", "keyType": "AVMString", "valueType": "address"}, "regulator": {"key": "cmVndWxhdG9y", "keyType": "AVMString", "valueType": "address"}, "batch_id": {"key": "YmF0Y2hfaWQ=", "keyType": "AVMString", "valueType": "AVMString"}, "drug_name": {"key": "ZHJ1Z19uYW1l", "keyType": "AVMString", "valueType": "AVMString"}, "manufacturer": {"key": "bWFudWZhY3R1cmVy", "keyType": "AVMString", "valueType": "AVMString"}, "manufacture_date": {"key": "bWFudWZhY3R1cmVfZGF0ZQ==", "keyType": "AVMString", "valueType": "AVMString"}, "expiry_date": {"key": "ZXhwaXJ5X2RhdGU=", "keyType": "AVMString", "valueType": "AVMString"}, "quantity": {"key": "cXVhbnRpdHk=", "keyType": "AVMString", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMString", "valueType": "AVMString"}, "timestamp": {"key": "dGltZXN0YW1w", "keyType": "AVMString", "valueType": "AVMUint64"}, "reg_status": {"key": "cmVnX3N0YXR1cw==", "keyType": "AVMString", "valueType": "AVMString"}, "rej_reason": {"key": "cmVqX3JlYXNvbg==", "keyType": "AVMString", "valueType": "AVMString"}, "compliance_score": {"key": "Y29tcGxpYW5jZV9zY29yZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "approval_ts": {"key": "YXBwcm92YWxfdHM=", "keyType": "AVMString", "valueType": "AVMUint64"}, "sender": {"key": "c2VuZGVy", "keyType": "AVMString", "valueType": "address"}, "receiver": {"key": "cmVjZWl2ZXI=", "keyType": "AVMString", "valueType": "address"}, "current_location": {"key": "Y3VycmVudF9sb2NhdGlvbg==", "keyType": "AVMString", "valueType": "AVMString"}, "transfer_count": {"key": "dHJhbnNmZXJfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "last_transfer_ts": {"key": "bGFzdF90cmFuc2Zlcl90cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "verif_count": {"key": "dmVyaWZfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_authentic": {"key": "aXNfYXV0aGVudGlj", "keyType": "AVMString", "valueType": "AVMUint64"}, "last_verif_ts": {"key": "bGFzdF92ZXJpZl90cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "qr_hash": {"key": "cXJfaGFzaA==", "keyType": "AVMString", "valueType": "AVMBytes"}, "registry": {"key": "cmVnaXN0cnk=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 15, "ints": 10}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyAEAAECCCYdCHByb2R1Y2VyBWFkbWluCHJlZ2lzdHJ5CXJlZ3VsYXRvcgZzdGF0dXMLYXBwcm92YWxfdHMKcmVnX3N0YXR1cwZzZW5kZXIOdHJhbnNmZXJfY291bnQJdGltZXN0YW1wCHJlY2VpdmVyEGxhc3RfdHJhbnNmZXJfdHMLdmVyaWZfY291bnQNbGFzdF92ZXJpZl90cwhxdWFudGl0eQdwZW5kaW5nB3FyX2hhc2gIYmF0Y2hfaWQJZHJ1Z19uYW1lDG1hbnVmYWN0dXJlchBtYW51ZmFjdHVyZV9kYXRlC2V4cGlyeV9kYXRlCnJlal9yZWFzb24QY29tcGxpYW5jZV9zY29yZRBjdXJyZW50X2xvY2F0aW9uDGlzX2F1dGhlbnRpYwIAKghhcHByb3ZlZAhyZWplY3RlZDEYQAB7KTIJZygyA2crMgNnJxGAAGcnEoAAZycTgABnJxSAAGcnFYAAZycOImcnBIAMdW5yZWdpc3RlcmVkZycJImcnBicPZycWgABnJxciZycFImcnBzIDZycKMgNnJxiAAGcnCCJnJwsiZycMImcnGSNnJw0iZycQgABnKiJnMRtBAHExGRREMRhEgg4ErV6Z6QS/dGt4BBtmgNoER1r/+ASt1jBuBLyyEPYEwIg8EwTy+biaBHewnHoEXiPVfgT9rnClBG+th+0EpbDXtgQ4W7nJNhoAjg4ACQA6AGsBLAGGAaIBxQIOAl4DIwNjA68D8wQ4ADEZFDEYFBBDNhoBSRUlEkQXMQAiKWVEEkQiKmVEQQAKIiplREsBEkEACyNEKksBZ4gERCNDIkL/8jYaAUkVgSASRDEAIillRBJEK0sBZycGJw9nMgcnBUsBZxZQgASPaSxSTFCwiAQPI0M2GgFHAiJZJAhLARUSRFcCADYaAkkiWSQISwEVEkRXAgA2GgNJIlkkCEsBFRJEVwIANhoESSJZJAhLARUSRFcCADYaBUkiWSQISwEVEkRXAgA2GgZHAhUlEkQXIihlRDIDEkEAUSgxAGcnEUsHZycSSwZnJxNLBWcnFEsEZycVSwNnJw5LAWcnBCcPZzIHJwlLAWciKGVETBaAAgAyTwJQSwNQTFBLCFCABP6MNq9MULCIA1kjQzEAIihlRBJEQv+oNhoBRwIiWSQISwEVEkRXAgAxACIpZUQSQAAUMQAiKGVEEkAACjEAIitlRBJBACcjRCcESwFnMgcnCUsBZzEATBYnGk8CUExQSwJQgAT2IdanTFCwI0MiQv/WNhoBSRUlEkQXMQAiK2VEEkQxAEyIAxOIAtgjQzYaAUkiWSQISwEVEkRXAgAxACIrZUQSRDEATIgDIYgCtSNDNhoBSRWBIBJENhoCSRUlEkQXIiplREEALDINIiplRBJBACIjRCIrZURLAhJBABIiKGVEMgMTQQAII0RKiAKsI0MiQv/1IkL/2zYaAUkVgSASRDYaAkkiWSQISwEVEkRXAgAiKmVEQQAsMg0iKmVEEkEAIiNEIitlREsCEkEAEiIoZUQyAxNBAAgjREqIAo0jQyJC//UiQv/bNhoBSRWBIBJENhoCRwIiWSQISwEVEkRXAgAiJwhlREAAfDEAIihlRBJAAAoxACIpZUQSQQBkI0QiKGVEJwdMZycKSwNJTgJnJxhLAmciJwhlRCMIJwhMZycLMgdnJwSACmluX3RyYW5zaXRnIicHZUQiJwhlRBYiJwtlRBZPAk8DUIACAFJQTwJQTFBLAlCABLZpN2tMULAjQyJC/5kxACInB2VEEkAACjEAIillRBJBAA4jRCInCmVEJwdMZ0L/fyJC/+8xACInCmVEEkAACjEAIillRBJBACcjRCcEgAlkZWxpdmVyZWRnMgcnC0sBZzEATBZQgATzsyO9TFCwI0MiQv/WNhoBRwIiWSQISwEVEkRXAgAxACIoZUQSQAAKMQAiKWVEEkEAIyNEJxBLAWcyBycNSwFnFoACAApMUEsCUIAELjFDDUxQsCNDIkL/2jYaAUkiWSQISwEVEkRXAgAiJxBlRBJEIicMZUQjCCcMTGcyBycNSwFnMQAiJwxlRBZPAhZOAlBMUIAEfps/l0xQsCNDMQAiKWVEEkAACjEAIitlRBJBAC0jRCcZImcnBIALY291bnRlcmZlaXRnMgcnDUsBZzEATBZQgARLosEETFCwI0MiQv/QNhoBRwIVJRJEFzEAIihlRBJAAAoxACIpZUQSQQAeI0QnDksBZzIHJwlLAWcWSwJMUIAErDVOB0xQsCNDIkL/3yIqZURBADAiKGVEMgMTQQAmsSInBmVESRUWVwYCTFAiKmVEshiABCApqhmyGrIagQayECKyAbOJigIAJwYnG2cnF4v/ZycFMgdnJwQnG2eL/xYiJwVlRBaL/k8CUExQgARtp0QITFCwiYoCACcGJxxnJxaL/2cnBTIHZycEJxxni/8VFlcGAov/UCInBWVEFov+JxpQTFBMUIAEre3/b0xQsIk=", "clear": "C4EBQw=="}, "events": [{"args": [{"type": "address", "name": "regulator"}, {"type": "uint64", "name": "timestamp"}], "name": "RegulatorSet"}, {"args": [{"type": "string", "name": "batch_id"}, {"type": "address", "name": "producer"}, {"type": "uint64", "name": "quantity"}, {"type": "uint64", "name": "timestamp"}], "name": "Registered"}, {"args": [{"type": "string", "name": "status"}, {"type": "address", "name": "updated_by"}, {"type": "uint64", "name": "timestamp"}], "name": "StatusUpdated"}, {"args": [{"type": "address", "name": "regulator"}, {"type": "uint64", "name": "compliance_score"}, {"type": "uint64", "name": "timestamp"}], "name": "Approved"}, {"args": [{"type": "address", "name": "regulator"}, {"type": "string", "name": "reason"}, {"type": "uint64", "name": "timestamp"}], "name": "Rejected"}, {"args": [{"type": "address", "name": "sender"}, {"type": "address", "name": "receiver"}, {"type": "string", "name": "location"}, {"type": "uint64", "name": "transfer_count"}, {"type": "uint64", "name": "timestamp"}], "name": "Transferred"}, {"args": [{"type": "address", "name": "receiver"}, {"type": "uint64", "name": "timestamp"}], "name": "Delivered"}, {"args": [{"type": "byte[]", "name": "qr_hash"}, {"type": "uint64", "name": "timestamp"}], "name": "QrSet"}, {"args": [{"type": "address", "name": "verifier"}, {"type": "uint64", "name": "verif_count"}, {"type": "uint64", "name": "timestamp"}], "name": "Verified"}, {"args": [{"type": "address", "name": "reported_by"}, {"type": "uint64", "name": "timestamp"}], "name": "Counterfeit"}, {"args": [{"type": "uint64", "name": "quantity"}, {"type": "uint64", "name": "timestamp"}], "name": "QuantityUpdated"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMiA4CiAgICBieXRlY2Jsb2NrICJwcm9kdWNlciIgImFkbWluIiAicmVnaXN0cnkiICJyZWd1bGF0b3IiICJzdGF0dXMiICJhcHByb3ZhbF90cyIgInJlZ19zdGF0dXMiICJzZW5kZXIiICJ0cmFuc2Zlcl9jb3VudCIgInRpbWVzdGFtcCIgInJlY2VpdmVyIiAibGFzdF90cmFuc2Zlcl90cyIgInZlcmlmX2NvdW50IiAibGFzdF92ZXJpZl90cyIgInF1YW50aXR5IiAicGVuZGluZyIgInFyX2hhc2giICJiYXRjaF9pZCIgImRydWdfbmFtZSIgIm1hbnVmYWN0dXJlciIgIm1hbnVmYWN0dXJlX2RhdGUiICJleHBpcnlfZGF0ZSIgInJlal9yZWFzb24iICJjb21wbGlhbmNlX3Njb3JlIiAiY3VycmVudF9sb2NhdGlvbiIgImlzX2F1dGhlbnRpYyIgMHgwMDJhICJhcHByb3ZlZCIgInJlamVjdGVkIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NzIKICAgIC8vIHNlbGYuYWRtaW4gPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBieXRlY18xIC8vICJhZG1pbiIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjczCiAgICAvLyBzZWxmLnByb2R1Y2VyID0gQWNjb3VudCgpCiAgICBieXRlY18wIC8vICJwcm9kdWNlciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBzZWxmLnJlZ3VsYXRvciA9IEFjY291bnQoKQogICAgYnl0ZWNfMyAvLyAicmVndWxhdG9yIgogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NzUKICAgIC8vIHNlbGYuYmF0Y2hfaWQgPSBTdHJpbmcoKQogICAgYnl0ZWMgMTcgLy8gImJhdGNoX2lkIgogICAgcHVzaGJ5dGVzICIiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6NzYKICAgIC8vIHNlbGYuZHJ1Z19uYW1lID0gU3RyaW5nKCkKICAgIGJ5dGVjIDE4IC8vICJkcnVnX25hbWUiCiAgICBwdXNoYnl0ZXMgIiIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo3OQogICAgLy8gc2VsZi5tYW51ZmFjdHVyZXIgPSBTdHJpbmcoKQogICAgYnl0ZWMgMTkgLy8gIm1hbnVmYWN0dXJlciIKICAgIHB1c2hieXRlcyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjgwCiAgICAvLyBzZWxmLm1hbnVmYWN0dXJlX2RhdGUgPSBTdHJpbmcoKQogICAgYnl0ZWMgMjAgLy8gIm1hbnVmYWN0dXJlX2RhdGUiCiAgICBwdXNoYnl0ZXMgIiIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo4MQogICAgLy8gc2VsZi5leHBpcnlfZGF0ZSA9IFN0cmluZygpCiAgICBieXRlYyAyMSAvLyAiZXhwaXJ5X2RhdGUiCiAgICBwdXNoYnl0ZXMgIiIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo4MgogICAgLy8gc2VsZi5xdWFudGl0eSA9IFVJbnQ2NCgpCiAgICBieXRlYyAxNCAvLyAicXVhbnRpdHkiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjgzCiAgICAvLyBzZWxmLnN0YXR1cyA9IFN0cmluZygidW5yZWdpc3RlcmVkIikKICAgIGJ5dGVjIDQgLy8gInN0YXR1cyIKICAgIHB1c2hieXRlcyAidW5yZWdpc3RlcmVkIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBzZWxmLnRpbWVzdGFtcCA9IFVJbnQ2NCgpCiAgICBieXRlYyA5IC8vICJ0aW1lc3RhbXAiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLnJlZ19zdGF0dXMgPSBTdHJpbmcoInBlbmRpbmciKQogICAgYnl0ZWMgNiAvLyAicmVnX3N0YXR1cyIKICAgIGJ5dGVjIDE1IC8vICJwZW5kaW5nIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBzZWxmLnJlal9yZWFzb24gPSBTdHJpbmcoKQogICAgYnl0ZWMgMjIgLy8gInJlal9yZWFzb24iCiAgICBwdXNoYnl0ZXMgIiIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo4NwogICAgLy8gc2VsZi5jb21wbGlhbmNlX3Njb3JlID0gVUludDY0KCkKICAgIGJ5dGVjIDIzIC8vICJjb21wbGlhbmNlX3Njb3JlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5hcHByb3ZhbF90cyA9IFVJbnQ2NCgpCiAgICBieXRlYyA1IC8vICJhcHByb3ZhbF90cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6ODkKICAgIC8vIHNlbGYuc2VuZGVyID0gQWNjb3VudCgpCiAgICBieXRlYyA3IC8vICJzZW5kZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo5MAogICAgLy8gc2VsZi5yZWNlaXZlciA9IEFjY291bnQoKQogICAgYnl0ZWMgMTAgLy8gInJlY2VpdmVyIgogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6OTEKICAgIC8vIHNlbGYuY3VycmVudF9sb2NhdGlvbiA9IFN0cmluZygpCiAgICBieXRlYyAyNCAvLyAiY3VycmVudF9sb2NhdGlvbiIKICAgIHB1c2hieXRlcyAiIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjkyCiAgICAvLyBzZWxmLnRyYW5zZmVyX2NvdW50ID0gVUludDY0KCkKICAgIGJ5dGVjIDggLy8gInRyYW5zZmVyX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo5NQogICAgLy8gc2VsZi5sYXN0X3RyYW5zZmVyX3RzID0gVUludDY0KCkKICAgIGJ5dGVjIDExIC8vICJsYXN0X3RyYW5zZmVyX3RzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo5NgogICAgLy8gc2VsZi52ZXJpZl9jb3VudCA9IFVJbnQ2NCgpCiAgICBieXRlYyAxMiAvLyAidmVyaWZfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBzZWxmLmlzX2F1dGhlbnRpYyA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgMjUgLy8gImlzX2F1dGhlbnRpYyIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6OTgKICAgIC8vIHNlbGYubGFzdF92ZXJpZl90cyA9IFVJbnQ2NCgpCiAgICBieXRlYyAxMyAvLyAibGFzdF92ZXJpZl90cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6OTkKICAgIC8vIHNlbGYucXJfaGFzaCA9IEJ5dGVzKCkKICAgIGJ5dGVjIDE2IC8vICJxcl9oYXNoIgogICAgcHVzaGJ5dGVzIDB4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTAwLTEwMQogICAgLy8gIyBCYXRjaFJlZ2lzdHJ5Q29udHJhY3QgaW5kZXhpbmcgdGhpcyBiYXRjaCBieSByZWdfc3RhdHVzLCBpZiBhbnkKICAgIC8vIHNlbGYucmVnaXN0cnkgPSBBcHBsaWNhdGlvbigpCiAgICBieXRlY18yIC8vICJyZWdpc3RyeSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weTo3MAogICAgLy8gY2xhc3MgRHJ1Z0JhdGNoQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDIzCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydAogICAgcHVzaGJ5dGVzcyAweGFkNWU5OWU5IDB4YmY3NDZiNzggMHgxYjY2ODBkYSAweDQ3NWFmZmY4IDB4YWRkNjMwNmUgMHhiY2IyMTBmNiAweGMwODgzYzEzIDB4ZjJmOWI4OWEgMHg3N2IwOWM3YSAweDVlMjNkNTdlIDB4ZmRhZTcwYTUgMHg2ZmFkODdlZCAweGE1YjBkN2I2IDB4Mzg1YmI5YzkgLy8gbWV0aG9kICJzZXRfcmVnaXN0cnkodWludDY0KXZvaWQiLCBtZXRob2QgInNldF9yZWd1bGF0b3IoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJyZWdpc3RlcihzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ1cGRhdGVfc3RhdHVzKHN0cmluZyl2b2lkIiwgbWV0aG9kICJhcHByb3ZlKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZWplY3Qoc3RyaW5nKXZvaWQiLCBtZXRob2QgImFwcHJvdmVfZm9yKGFkZHJlc3MsdWludDY0KXZvaWQiLCBtZXRob2QgInJlamVjdF9mb3IoYWRkcmVzcyxzdHJpbmcpdm9pZCIsIG1ldGhvZCAidHJhbnNmZXIoYWRkcmVzcyxzdHJpbmcpdm9pZCIsIG1ldGhvZCAibWFya19kZWxpdmVyZWQoKXZvaWQiLCBtZXRob2QgInNldF9xcihieXRlW10pdm9pZCIsIG1ldGhvZCAidmVyaWZ5KGJ5dGVbXSl2b2lkIiwgbWV0aG9kICJtYXJrX2NvdW50ZXJmZWl0KCl2b2lkIiwgbWV0aG9kICJ1cGRhdGVfcXVhbnRpdHkodWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBzZXRfcmVnaXN0cnkgc2V0X3JlZ3VsYXRvciByZWdpc3RlciB1cGRhdGVfc3RhdHVzIGFwcHJvdmUgcmVqZWN0IGFwcHJvdmVfZm9yIHJlamVjdF9mb3IgdHJhbnNmZXIgbWFya19kZWxpdmVyZWQgc2V0X3FyIHZlcmlmeSBtYXJrX2NvdW50ZXJmZWl0IHVwZGF0ZV9xdWFudGl0eQogICAgZXJyCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDIzOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgICYmCiAgICByZXR1cm4gLy8gb24gZXJyb3I6IE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AgJiYgY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3Quc2V0X3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTEwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgdWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4KICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjExMy0xMTUKICAgIC8vICMgVGhlIG9sZCByZWdpc3RyeSB3b3VsZCBrZWVwIGluZGV4aW5nIHRoZSBiYXRjaCwgc28gYSByZWdpc3RyeSBpcyBzZXQgb25jZTsKICAgIC8vICMgc2V0dGluZyB0aGUgc2FtZSBvbmUgYWdhaW4gb25seSByZS1pbmRleGVzLCB3aGljaCBrZWVwcyByZXRyaWVzIGhhcm1sZXNzCiAgICAvLyBhc3NlcnQgc2VsZi5yZWdpc3RyeS5pZCA9PSAwIG9yIHNlbGYucmVnaXN0cnkuaWQgPT0gcmVnaXN0cnlfYXBwX2lkLCAiUmVnaXN0cnkgYWxyZWFkeSBzZXQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicmVnaXN0cnkiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnkgZXhpc3RzCiAgICBieiBzZXRfcmVnaXN0cnlfYm9vbF90cnVlQDMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJyZWdpc3RyeSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeSBleGlzdHMKICAgIGRpZyAxCiAgICA9PQogICAgYnogc2V0X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VANAoKc2V0X3JlZ2lzdHJ5X2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18xIC8vIDEKCnNldF9yZWdpc3RyeV9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTMtMTE1CiAgICAvLyAjIFRoZSBvbGQgcmVnaXN0cnkgd291bGQga2VlcCBpbmRleGluZyB0aGUgYmF0Y2gsIHNvIGEgcmVnaXN0cnkgaXMgc2V0IG9uY2U7CiAgICAvLyAjIHNldHRpbmcgdGhlIHNhbWUgb25lIGFnYWluIG9ubHkgcmUtaW5kZXhlcywgd2hpY2gga2VlcHMgcmV0cmllcyBoYXJtbGVzcwogICAgLy8gYXNzZXJ0IHNlbGYucmVnaXN0cnkuaWQgPT0gMCBvciBzZWxmLnJlZ2lzdHJ5LmlkID09IHJlZ2lzdHJ5X2FwcF9pZCwgIlJlZ2lzdHJ5IGFscmVhZHkgc2V0IgogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5IGFscmVhZHkgc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTYKICAgIC8vIHNlbGYucmVnaXN0cnkgPSBBcHBsaWNhdGlvbihyZWdpc3RyeV9hcHBfaWQpCiAgICBieXRlY18yIC8vICJyZWdpc3RyeSIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTE3CiAgICAvLyBzZWxmLl9pbmRleCgpCiAgICBjYWxsc3ViIF9pbmRleAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTEwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnNldF9yZWdpc3RyeV9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBzZXRfcmVnaXN0cnlfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3Quc2V0X3JlZ3VsYXRvcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9yZWd1bGF0b3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHVpbnQ4WzMyXQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTIxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMjIKICAgIC8vIHNlbGYucmVndWxhdG9yID0gcmVndWxhdG9yX2FkZHIKICAgIGJ5dGVjXzMgLy8gInJlZ3VsYXRvciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTIzCiAgICAvLyBzZWxmLnJlZ19zdGF0dXMgPSBTdHJpbmcoInBlbmRpbmciKQogICAgYnl0ZWMgNiAvLyAicmVnX3N0YXR1cyIKICAgIGJ5dGVjIDE1IC8vICJwZW5kaW5nIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEyNAogICAgLy8gc2VsZi5hcHByb3ZhbF90cyA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBieXRlYyA1IC8vICJhcHByb3ZhbF90cyIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTI1CiAgICAvLyBhcmM0LmVtaXQoUmVndWxhdG9yU2V0KGFyYzQuQWRkcmVzcyhyZWd1bGF0b3JfYWRkciksIGFyYzQuVUludDY0KHNlbGYuYXBwcm92YWxfdHMpKSkKICAgIGl0b2IKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4OGY2OTJjNTIgLy8gbWV0aG9kICJSZWd1bGF0b3JTZXQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEyNgogICAgLy8gc2VsZi5faW5kZXgoKQogICAgY2FsbHN1YiBfaW5kZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjExOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QucmVnaXN0ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpyZWdpc3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIChsZW4rdXRmOFtdKQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1dGY4W10pCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3V0ZjhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIChsZW4rdXRmOFtdKQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1dGY4W10pCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciB1aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjEzNwogICAgLy8gaWYgc2VsZi5wcm9kdWNlciA9PSBBY2NvdW50KCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicHJvZHVjZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvZHVjZXIgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBieiByZWdpc3Rlcl9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTM4CiAgICAvLyBzZWxmLnByb2R1Y2VyID0gVHhuLnNlbmRlcgogICAgYnl0ZWNfMCAvLyAicHJvZHVjZXIiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAoKcmVnaXN0ZXJfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQxCiAgICAvLyBzZWxmLmJhdGNoX2lkID0gYmF0Y2hfaWQKICAgIGJ5dGVjIDE3IC8vICJiYXRjaF9pZCIKICAgIGRpZyA3CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQyCiAgICAvLyBzZWxmLmRydWdfbmFtZSA9IGRydWdfbmFtZQogICAgYnl0ZWMgMTggLy8gImRydWdfbmFtZSIKICAgIGRpZyA2CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQzCiAgICAvLyBzZWxmLm1hbnVmYWN0dXJlciA9IG1hbnVmYWN0dXJlcgogICAgYnl0ZWMgMTkgLy8gIm1hbnVmYWN0dXJlciIKICAgIGRpZyA1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQ0CiAgICAvLyBzZWxmLm1hbnVmYWN0dXJlX2RhdGUgPSBtYW51ZmFjdHVyZV9kYXRlCiAgICBieXRlYyAyMCAvLyAibWFudWZhY3R1cmVfZGF0ZSIKICAgIGRpZyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQ1CiAgICAvLyBzZWxmLmV4cGlyeV9kYXRlID0gZXhwaXJ5X2RhdGUKICAgIGJ5dGVjIDIxIC8vICJleHBpcnlfZGF0ZSIKICAgIGRpZyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQ2CiAgICAvLyBzZWxmLnF1YW50aXR5ID0gcXVhbnRpdHkKICAgIGJ5dGVjIDE0IC8vICJxdWFudGl0eSIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQ3CiAgICAvLyBzZWxmLnN0YXR1cyA9IFN0cmluZygicGVuZGluZyIpCiAgICBieXRlYyA0IC8vICJzdGF0dXMiCiAgICBieXRlYyAxNSAvLyAicGVuZGluZyIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNDgKICAgIC8vIHNlbGYudGltZXN0YW1wID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGJ5dGVjIDkgLy8gInRpbWVzdGFtcCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTUyCiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5wcm9kdWNlciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicHJvZHVjZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvZHVjZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNTQKICAgIC8vIGFyYzQuVUludDY0KHNlbGYudGltZXN0YW1wKSwKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE1MC0xNTUKICAgIC8vIFJlZ2lzdGVyZWQoCiAgICAvLyAgICAgYXJjNC5TdHJpbmcoYmF0Y2hfaWQpLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLnByb2R1Y2VyKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChxdWFudGl0eSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi50aW1lc3RhbXApLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDAzMgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDgKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQ5LTE1NgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFJlZ2lzdGVyZWQoCiAgICAvLyAgICAgICAgIGFyYzQuU3RyaW5nKGJhdGNoX2lkKSwKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKHNlbGYucHJvZHVjZXIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChxdWFudGl0eSksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYudGltZXN0YW1wKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhmZThjMzZhZiAvLyBtZXRob2QgIlJlZ2lzdGVyZWQoc3RyaW5nLGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTU3CiAgICAvLyBzZWxmLl9pbmRleCgpCiAgICBjYWxsc3ViIF9pbmRleAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTI3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnJlZ2lzdGVyX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTQwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnByb2R1Y2VyCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicHJvZHVjZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvZHVjZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICBiIHJlZ2lzdGVyX2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX2hlYWx4LmNvbnRyYWN0LkRydWdCYXRjaENvbnRyYWN0LnVwZGF0ZV9zdGF0dXNbcm91dGluZ10oKSAtPiB2b2lkOgp1cGRhdGVfc3RhdHVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTU4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1dGY4W10pCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTYwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5wcm9kdWNlciBvciBUeG4uc2VuZGVyID09IHNlbGYucmVndWxhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYm56IHVwZGF0ZV9zdGF0dXNfYm9vbF90cnVlQDQKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJwcm9kdWNlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9kdWNlciBleGlzdHMKICAgID09CiAgICBibnogdXBkYXRlX3N0YXR1c19ib29sX3RydWVANAogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInJlZ3VsYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWd1bGF0b3IgZXhpc3RzCiAgICA9PQogICAgYnogdXBkYXRlX3N0YXR1c19ib29sX2ZhbHNlQDUKCnVwZGF0ZV9zdGF0dXNfYm9vbF90cnVlQDQ6CiAgICBpbnRjXzEgLy8gMQoKdXBkYXRlX3N0YXR1c19ib29sX21lcmdlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNjAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4gb3IgVHhuLnNlbmRlciA9PSBzZWxmLnByb2R1Y2VyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5yZWd1bGF0b3IKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTYxCiAgICAvLyBzZWxmLnN0YXR1cyA9IHN0YXR1c190ZXh0CiAgICBieXRlYyA0IC8vICJzdGF0dXMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE2MgogICAgLy8gc2VsZi50aW1lc3RhbXAgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYnl0ZWMgOSAvLyAidGltZXN0YW1wIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNjUKICAgIC8vIGFyYzQuU3RyaW5nKHN0YXR1c190ZXh0KSwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NChzZWxmLnRpbWVzdGFtcCkKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE2NC0xNjYKICAgIC8vIFN0YXR1c1VwZGF0ZWQoCiAgICAvLyAgICAgYXJjNC5TdHJpbmcoc3RhdHVzX3RleHQpLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGFyYzQuVUludDY0KHNlbGYudGltZXN0YW1wKQogICAgLy8gKQogICAgYnl0ZWMgMjYgLy8gMHgwMDJhCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNjMtMTY3CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgU3RhdHVzVXBkYXRlZCgKICAgIC8vICAgICAgICAgYXJjNC5TdHJpbmcoc3RhdHVzX3RleHQpLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGFyYzQuVUludDY0KHNlbGYudGltZXN0YW1wKQogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGY2MjFkNmE3IC8vIG1ldGhvZCAiU3RhdHVzVXBkYXRlZChzdHJpbmcsYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE1OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp1cGRhdGVfc3RhdHVzX2Jvb2xfZmFsc2VANToKICAgIGludGNfMCAvLyAwCiAgICBiIHVwZGF0ZV9zdGF0dXNfYm9vbF9tZXJnZUA2CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QuYXBwcm92ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmFwcHJvdmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciB1aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE3MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5yZWd1bGF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJyZWd1bGF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVndWxhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTcxCiAgICAvLyBzZWxmLl9hcHByb3ZlKFR4bi5zZW5kZXIsIGNvbXBsaWFuY2Vfc2NvcmUpCiAgICB0eG4gU2VuZGVyCiAgICBzd2FwCiAgICBjYWxsc3ViIF9hcHByb3ZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNzIKICAgIC8vIHNlbGYuX2luZGV4KCkKICAgIGNhbGxzdWIgX2luZGV4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxNjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvX2hlYWx4LmNvbnRyYWN0LkRydWdCYXRjaENvbnRyYWN0LnJlamVjdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlamVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE3NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIChsZW4rdXRmOFtdKQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE3NgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5yZWd1bGF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJyZWd1bGF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVndWxhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTc3CiAgICAvLyBzZWxmLl9yZWplY3QoVHhuLnNlbmRlciwgcmVhc29uX3RleHQpCiAgICB0eG4gU2VuZGVyCiAgICBzd2FwCiAgICBjYWxsc3ViIF9yZWplY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE3OAogICAgLy8gc2VsZi5faW5kZXgoKQogICAgY2FsbHN1YiBfaW5kZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE3NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QuYXBwcm92ZV9mb3Jbcm91dGluZ10oKSAtPiB2b2lkOgphcHByb3ZlX2ZvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE4MC0xODQKICAgIC8vICMgRGVjaXNpb25zIHJlbGF5ZWQgYnkgdGhlIHJlZ2lzdHJ5J3MgYXBwcm92ZV9tYW55IGFuZCByZWplY3RfbWFueSwgd2hpY2ggcGFzcwogICAgLy8gIyBvbiB0aGUgc2VuZGVyIG9mIHRoZWlyIG93biBjYWxsIGFzIGByZWd1bGF0b3JgLiBPbmx5IHJlZ2lzdGVyZWQgYmF0Y2hlcyBhcmUgaW4KICAgIC8vICMgdGhlIHJlZ2lzdHJ5J3MgaW5kZXg7IGl0IGlzIG9uIHRoZSBjYWxsIHN0YWNrIGFuZCBtb3ZlcyB0aGUgYmF0Y2ggaXRzZWxmLCBzbwogICAgLy8gIyB0aGVzZSBkbyBub3QgY2FsbCBiYWNrIGludG8gaXQuCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciB1aW50OFszMl0KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgdWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxODYKICAgIC8vIGFzc2VydCBzZWxmLnJlZ2lzdHJ5LmlkICE9IDAgYW5kIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgPT0gc2VsZi5yZWdpc3RyeS5pZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJlZ2lzdHJ5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5IGV4aXN0cwogICAgYnogYXBwcm92ZV9mb3JfYm9vbF9mYWxzZUA0CiAgICBnbG9iYWwgQ2FsbGVyQXBwbGljYXRpb25JRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJlZ2lzdHJ5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5IGV4aXN0cwogICAgPT0KICAgIGJ6IGFwcHJvdmVfZm9yX2Jvb2xfZmFsc2VANAogICAgaW50Y18xIC8vIDEKCmFwcHJvdmVfZm9yX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE4NgogICAgLy8gYXNzZXJ0IHNlbGYucmVnaXN0cnkuaWQgIT0gMCBhbmQgR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCA9PSBzZWxmLnJlZ2lzdHJ5LmlkCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE4NwogICAgLy8gYXNzZXJ0IHJlZ3VsYXRvciA9PSBzZWxmLnJlZ3VsYXRvciBhbmQgc2VsZi5wcm9kdWNlciAhPSBBY2NvdW50KCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJyZWd1bGF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVndWxhdG9yIGV4aXN0cwogICAgZGlnIDIKICAgID09CiAgICBieiBhcHByb3ZlX2Zvcl9ib29sX2ZhbHNlQDgKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJwcm9kdWNlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9kdWNlciBleGlzdHMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGJ6IGFwcHJvdmVfZm9yX2Jvb2xfZmFsc2VAOAogICAgaW50Y18xIC8vIDEKCmFwcHJvdmVfZm9yX2Jvb2xfbWVyZ2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE4NwogICAgLy8gYXNzZXJ0IHJlZ3VsYXRvciA9PSBzZWxmLnJlZ3VsYXRvciBhbmQgc2VsZi5wcm9kdWNlciAhPSBBY2NvdW50KCkKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTg4CiAgICAvLyBzZWxmLl9hcHByb3ZlKHJlZ3VsYXRvciwgY29tcGxpYW5jZV9zY29yZSkKICAgIGR1cDIKICAgIGNhbGxzdWIgX2FwcHJvdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE4MC0xODQKICAgIC8vICMgRGVjaXNpb25zIHJlbGF5ZWQgYnkgdGhlIHJlZ2lzdHJ5J3MgYXBwcm92ZV9tYW55IGFuZCByZWplY3RfbWFueSwgd2hpY2ggcGFzcwogICAgLy8gIyBvbiB0aGUgc2VuZGVyIG9mIHRoZWlyIG93biBjYWxsIGFzIGByZWd1bGF0b3JgLiBPbmx5IHJlZ2lzdGVyZWQgYmF0Y2hlcyBhcmUgaW4KICAgIC8vICMgdGhlIHJlZ2lzdHJ5J3MgaW5kZXg7IGl0IGlzIG9uIHRoZSBjYWxsIHN0YWNrIGFuZCBtb3ZlcyB0aGUgYmF0Y2ggaXRzZWxmLCBzbwogICAgLy8gIyB0aGVzZSBkbyBub3QgY2FsbCBiYWNrIGludG8gaXQuCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmFwcHJvdmVfZm9yX2Jvb2xfZmFsc2VAODoKICAgIGludGNfMCAvLyAwCiAgICBiIGFwcHJvdmVfZm9yX2Jvb2xfbWVyZ2VAOQoKYXBwcm92ZV9mb3JfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgYXBwcm92ZV9mb3JfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QucmVqZWN0X2Zvcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlamVjdF9mb3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxOTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHVpbnQ4WzMyXQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3V0ZjhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxOTIKICAgIC8vIGFzc2VydCBzZWxmLnJlZ2lzdHJ5LmlkICE9IDAgYW5kIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgPT0gc2VsZi5yZWdpc3RyeS5pZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJlZ2lzdHJ5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5IGV4aXN0cwogICAgYnogcmVqZWN0X2Zvcl9ib29sX2ZhbHNlQDQKICAgIGdsb2JhbCBDYWxsZXJBcHBsaWNhdGlvbklECiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicmVnaXN0cnkiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnkgZXhpc3RzCiAgICA9PQogICAgYnogcmVqZWN0X2Zvcl9ib29sX2ZhbHNlQDQKICAgIGludGNfMSAvLyAxCgpyZWplY3RfZm9yX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE5MgogICAgLy8gYXNzZXJ0IHNlbGYucmVnaXN0cnkuaWQgIT0gMCBhbmQgR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCA9PSBzZWxmLnJlZ2lzdHJ5LmlkCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE5MwogICAgLy8gYXNzZXJ0IHJlZ3VsYXRvciA9PSBzZWxmLnJlZ3VsYXRvciBhbmQgc2VsZi5wcm9kdWNlciAhPSBBY2NvdW50KCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJyZWd1bGF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVndWxhdG9yIGV4aXN0cwogICAgZGlnIDIKICAgID09CiAgICBieiByZWplY3RfZm9yX2Jvb2xfZmFsc2VAOAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInByb2R1Y2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2R1Y2VyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYnogcmVqZWN0X2Zvcl9ib29sX2ZhbHNlQDgKICAgIGludGNfMSAvLyAxCgpyZWplY3RfZm9yX2Jvb2xfbWVyZ2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE5MwogICAgLy8gYXNzZXJ0IHJlZ3VsYXRvciA9PSBzZWxmLnJlZ3VsYXRvciBhbmQgc2VsZi5wcm9kdWNlciAhPSBBY2NvdW50KCkKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTk0CiAgICAvLyBzZWxmLl9yZWplY3QocmVndWxhdG9yLCByZWFzb25fdGV4dCkKICAgIGR1cDIKICAgIGNhbGxzdWIgX3JlamVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTkwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnJlamVjdF9mb3JfYm9vbF9mYWxzZUA4OgogICAgaW50Y18wIC8vIDAKICAgIGIgcmVqZWN0X2Zvcl9ib29sX21lcmdlQDkKCnJlamVjdF9mb3JfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgcmVqZWN0X2Zvcl9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC50cmFuc2Zlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnRyYW5zZmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjIyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciB1aW50OFszMl0KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1dGY4W10pCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjI0CiAgICAvLyBpZiBzZWxmLnRyYW5zZmVyX2NvdW50ID09IFVJbnQ2NCgwKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJ0cmFuc2Zlcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50cmFuc2Zlcl9jb3VudCBleGlzdHMKICAgIGJueiB0cmFuc2Zlcl9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjI1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnByb2R1Y2VyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInByb2R1Y2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2R1Y2VyIGV4aXN0cwogICAgPT0KICAgIGJueiB0cmFuc2Zlcl9ib29sX3RydWVANAogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGJ6IHRyYW5zZmVyX2Jvb2xfZmFsc2VANQoKdHJhbnNmZXJfYm9vbF90cnVlQDQ6CiAgICBpbnRjXzEgLy8gMQoKdHJhbnNmZXJfYm9vbF9tZXJnZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjI1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnByb2R1Y2VyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMjYKICAgIC8vIHNlbGYuc2VuZGVyID0gc2VsZi5wcm9kdWNlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInByb2R1Y2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2R1Y2VyIGV4aXN0cwogICAgYnl0ZWMgNyAvLyAic2VuZGVyIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKCnRyYW5zZmVyX2FmdGVyX2lmX2Vsc2VAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMzAKICAgIC8vIHNlbGYucmVjZWl2ZXIgPSBuZXdfcmVjZWl2ZXIKICAgIGJ5dGVjIDEwIC8vICJyZWNlaXZlciIKICAgIGRpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMzEKICAgIC8vIHNlbGYuY3VycmVudF9sb2NhdGlvbiA9IGxvY2F0aW9uCiAgICBieXRlYyAyNCAvLyAiY3VycmVudF9sb2NhdGlvbiIKICAgIGRpZyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjMyCiAgICAvLyBzZWxmLnRyYW5zZmVyX2NvdW50ICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInRyYW5zZmVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyYW5zZmVyX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDggLy8gInRyYW5zZmVyX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIzMwogICAgLy8gc2VsZi5sYXN0X3RyYW5zZmVyX3RzID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDExIC8vICJsYXN0X3RyYW5zZmVyX3RzIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIzNAogICAgLy8gc2VsZi5zdGF0dXMgPSBTdHJpbmcoImluX3RyYW5zaXQiKQogICAgYnl0ZWMgNCAvLyAic3RhdHVzIgogICAgcHVzaGJ5dGVzICJpbl90cmFuc2l0IgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIzNwogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYuc2VuZGVyKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJzZW5kZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2VuZGVyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjQwCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnRyYW5zZmVyX2NvdW50KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJ0cmFuc2Zlcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50cmFuc2Zlcl9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI0MQogICAgLy8gYXJjNC5VSW50NjQoc2VsZi5sYXN0X3RyYW5zZmVyX3RzKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAibGFzdF90cmFuc2Zlcl90cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sYXN0X3RyYW5zZmVyX3RzIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjM2LTI0MgogICAgLy8gVHJhbnNmZXJyZWQoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYuc2VuZGVyKSwKICAgIC8vICAgICBhcmM0LkFkZHJlc3MobmV3X3JlY2VpdmVyKSwKICAgIC8vICAgICBhcmM0LlN0cmluZyhsb2NhdGlvbiksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi50cmFuc2Zlcl9jb3VudCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi5sYXN0X3RyYW5zZmVyX3RzKSwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwNTIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjM1LTI0MwogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFRyYW5zZmVycmVkKAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3Moc2VsZi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3MobmV3X3JlY2VpdmVyKSwKICAgIC8vICAgICAgICAgYXJjNC5TdHJpbmcobG9jYXRpb24pLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzZWxmLnRyYW5zZmVyX2NvdW50KSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoc2VsZi5sYXN0X3RyYW5zZmVyX3RzKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhiNjY5Mzc2YiAvLyBtZXRob2QgIlRyYW5zZmVycmVkKGFkZHJlc3MsYWRkcmVzcyxzdHJpbmcsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjIyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnRyYW5zZmVyX2Jvb2xfZmFsc2VANToKICAgIGludGNfMCAvLyAwCiAgICBiIHRyYW5zZmVyX2Jvb2xfbWVyZ2VANgoKdHJhbnNmZXJfZWxzZV9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMjgKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuc2VuZGVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInNlbmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zZW5kZXIgZXhpc3RzCiAgICA9PQogICAgYm56IHRyYW5zZmVyX2Jvb2xfdHJ1ZUA5CiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYnogdHJhbnNmZXJfYm9vbF9mYWxzZUAxMAoKdHJhbnNmZXJfYm9vbF90cnVlQDk6CiAgICBpbnRjXzEgLy8gMQoKdHJhbnNmZXJfYm9vbF9tZXJnZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIyOAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5zZW5kZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIyOQogICAgLy8gc2VsZi5zZW5kZXIgPSBzZWxmLnJlY2VpdmVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gInJlY2VpdmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlY2VpdmVyIGV4aXN0cwogICAgYnl0ZWMgNyAvLyAic2VuZGVyIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgdHJhbnNmZXJfYWZ0ZXJfaWZfZWxzZUAxMgoKdHJhbnNmZXJfYm9vbF9mYWxzZUAxMDoKICAgIGludGNfMCAvLyAwCiAgICBiIHRyYW5zZmVyX2Jvb2xfbWVyZ2VAMTEKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC5tYXJrX2RlbGl2ZXJlZFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm1hcmtfZGVsaXZlcmVkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjQ3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnJlY2VpdmVyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJyZWNlaXZlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWNlaXZlciBleGlzdHMKICAgID09CiAgICBibnogbWFya19kZWxpdmVyZWRfYm9vbF90cnVlQDMKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBieiBtYXJrX2RlbGl2ZXJlZF9ib29sX2ZhbHNlQDQKCm1hcmtfZGVsaXZlcmVkX2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18xIC8vIDEKCm1hcmtfZGVsaXZlcmVkX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI0NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5yZWNlaXZlciBvciBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjQ4CiAgICAvLyBzZWxmLnN0YXR1cyA9IFN0cmluZygiZGVsaXZlcmVkIikKICAgIGJ5dGVjIDQgLy8gInN0YXR1cyIKICAgIHB1c2hieXRlcyAiZGVsaXZlcmVkIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI0OQogICAgLy8gc2VsZi5sYXN0X3RyYW5zZmVyX3RzID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGJ5dGVjIDExIC8vICJsYXN0X3RyYW5zZmVyX3RzIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNTAKICAgIC8vIGFyYzQuZW1pdChEZWxpdmVyZWQoYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NChzZWxmLmxhc3RfdHJhbnNmZXJfdHMpKSkKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4ZjNiMzIzYmQgLy8gbWV0aG9kICJEZWxpdmVyZWQoYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYXJrX2RlbGl2ZXJlZF9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBtYXJrX2RlbGl2ZXJlZF9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC5zZXRfcXJbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfcXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3VpbnQ4W10pCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjUzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnByb2R1Y2VyIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInByb2R1Y2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2R1Y2VyIGV4aXN0cwogICAgPT0KICAgIGJueiBzZXRfcXJfYm9vbF90cnVlQDMKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBieiBzZXRfcXJfYm9vbF9mYWxzZUA0CgpzZXRfcXJfYm9vbF90cnVlQDM6CiAgICBpbnRjXzEgLy8gMQoKc2V0X3FyX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI1MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5wcm9kdWNlciBvciBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjU0CiAgICAvLyBzZWxmLnFyX2hhc2ggPSBxcl9oYXNoCiAgICBieXRlYyAxNiAvLyAicXJfaGFzaCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjU1CiAgICAvLyBzZWxmLmxhc3RfdmVyaWZfdHMgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYnl0ZWMgMTMgLy8gImxhc3RfdmVyaWZfdHMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI1NgogICAgLy8gYXJjNC5lbWl0KFFyU2V0KGFyYzQuRHluYW1pY0J5dGVzKHFyX2hhc2gpLCBhcmM0LlVJbnQ2NChzZWxmLmxhc3RfdmVyaWZfdHMpKSkKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweDAwMGEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MmUzMTQzMGQgLy8gbWV0aG9kICJRclNldChieXRlW10sdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKc2V0X3FyX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIHNldF9xcl9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC52ZXJpZnlbcm91dGluZ10oKSAtPiB2b2lkOgp2ZXJpZnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3VpbnQ4W10pCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjU5CiAgICAvLyBhc3NlcnQgcXJfaGFzaCA9PSBzZWxmLnFyX2hhc2gKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAicXJfaGFzaCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xcl9oYXNoIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjYwCiAgICAvLyBzZWxmLnZlcmlmX2NvdW50ICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJ2ZXJpZl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52ZXJpZl9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAxMiAvLyAidmVyaWZfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjYxCiAgICAvLyBzZWxmLmxhc3RfdmVyaWZfdHMgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYnl0ZWMgMTMgLy8gImxhc3RfdmVyaWZfdHMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI2NAogICAgLy8gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjY1CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnZlcmlmX2NvdW50KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAidmVyaWZfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmVyaWZfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNjYKICAgIC8vIGFyYzQuVUludDY0KHNlbGYubGFzdF92ZXJpZl90cyksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI2My0yNjcKICAgIC8vIFZlcmlmaWVkKAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLnZlcmlmX2NvdW50KSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLmxhc3RfdmVyaWZfdHMpLAogICAgLy8gKQogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI2Mi0yNjgKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBWZXJpZmllZCgKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzZWxmLnZlcmlmX2NvdW50KSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoc2VsZi5sYXN0X3ZlcmlmX3RzKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg3ZTliM2Y5NyAvLyBtZXRob2QgIlZlcmlmaWVkKGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC5tYXJrX2NvdW50ZXJmZWl0W3JvdXRpbmddKCkgLT4gdm9pZDoKbWFya19jb3VudGVyZmVpdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI3MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbiBvciBUeG4uc2VuZGVyID09IHNlbGYucmVndWxhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYm56IG1hcmtfY291bnRlcmZlaXRfYm9vbF90cnVlQDMKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJyZWd1bGF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVndWxhdG9yIGV4aXN0cwogICAgPT0KICAgIGJ6IG1hcmtfY291bnRlcmZlaXRfYm9vbF9mYWxzZUA0CgptYXJrX2NvdW50ZXJmZWl0X2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18xIC8vIDEKCm1hcmtfY291bnRlcmZlaXRfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjcxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi5yZWd1bGF0b3IKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjcyCiAgICAvLyBzZWxmLmlzX2F1dGhlbnRpYyA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMjUgLy8gImlzX2F1dGhlbnRpYyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjczCiAgICAvLyBzZWxmLnN0YXR1cyA9IFN0cmluZygiY291bnRlcmZlaXQiKQogICAgYnl0ZWMgNCAvLyAic3RhdHVzIgogICAgcHVzaGJ5dGVzICJjb3VudGVyZmVpdCIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNzQKICAgIC8vIHNlbGYubGFzdF92ZXJpZl90cyA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBieXRlYyAxMyAvLyAibGFzdF92ZXJpZl90cyIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6Mjc1CiAgICAvLyBhcmM0LmVtaXQoQ291bnRlcmZlaXQoYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NChzZWxmLmxhc3RfdmVyaWZfdHMpKSkKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4NGJhMmMxMDQgLy8gbWV0aG9kICJDb3VudGVyZmVpdChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjY5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1hcmtfY291bnRlcmZlaXRfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgbWFya19jb3VudGVyZmVpdF9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC51cGRhdGVfcXVhbnRpdHlbcm91dGluZ10oKSAtPiB2b2lkOgp1cGRhdGVfcXVhbnRpdHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciB1aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI3OQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5wcm9kdWNlciBvciBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4KICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJwcm9kdWNlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9kdWNlciBleGlzdHMKICAgID09CiAgICBibnogdXBkYXRlX3F1YW50aXR5X2Jvb2xfdHJ1ZUAzCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYnogdXBkYXRlX3F1YW50aXR5X2Jvb2xfZmFsc2VANAoKdXBkYXRlX3F1YW50aXR5X2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18xIC8vIDEKCnVwZGF0ZV9xdWFudGl0eV9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNzkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYucHJvZHVjZXIgb3IgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjI4MAogICAgLy8gc2VsZi5xdWFudGl0eSA9IG5ld19xdWFudGl0eQogICAgYnl0ZWMgMTQgLy8gInF1YW50aXR5IgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyODEKICAgIC8vIHNlbGYudGltZXN0YW1wID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGJ5dGVjIDkgLy8gInRpbWVzdGFtcCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjgyCiAgICAvLyBhcmM0LmVtaXQoUXVhbnRpdHlVcGRhdGVkKGFyYzQuVUludDY0KG5ld19xdWFudGl0eSksIGFyYzQuVUludDY0KHNlbGYudGltZXN0YW1wKSkpCiAgICBpdG9iCiAgICBkaWcgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhhYzM1NGUwNyAvLyBtZXRob2QgIlF1YW50aXR5VXBkYXRlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyNzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdXBkYXRlX3F1YW50aXR5X2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIHVwZGF0ZV9xdWFudGl0eV9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC5faW5kZXgoKSAtPiB2b2lkOgpfaW5kZXg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToxMDUtMTA3CiAgICAvLyAjIE1vdmVzIGEgcmVnaXN0ZXJlZCBiYXRjaCB0byBpdHMgcmVnX3N0YXR1cyBpbiB0aGUgcmVnaXN0cnk7IHRoZSBpbm5lciBjYWxsJ3MKICAgIC8vICMgZmVlIGlzIHBvb2xlZCwgc28gY2FsbGVycyBwYXkgb25lIGV4dHJhIG1pbmltdW0gZmVlCiAgICAvLyBpZiBzZWxmLnJlZ2lzdHJ5LmlkICE9IDAgYW5kIHNlbGYucHJvZHVjZXIgIT0gQWNjb3VudCgpOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJlZ2lzdHJ5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5IGV4aXN0cwogICAgYnogX2luZGV4X2FmdGVyX2lmX2Vsc2VANAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInByb2R1Y2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2R1Y2VyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYnogX2luZGV4X2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MTA4CiAgICAvLyBhcmM0LmFiaV9jYWxsKCJtb3ZlKHN0cmluZyl2b2lkIiwgc2VsZi5yZWdfc3RhdHVzLCBhcHBfaWQ9c2VsZi5yZWdpc3RyeSkKICAgIGl0eG5fYmVnaW4KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJyZWdfc3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ19zdGF0dXMgZXhpc3RzCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInJlZ2lzdHJ5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5IGV4aXN0cwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHgyMDI5YWExOSAvLyBtZXRob2QgIm1vdmUoc3RyaW5nKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CgpfaW5kZXhfYWZ0ZXJfaWZfZWxzZUA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29faGVhbHguY29udHJhY3QuRHJ1Z0JhdGNoQ29udHJhY3QuX2FwcHJvdmUocmVndWxhdG9yOiBieXRlcywgY29tcGxpYW5jZV9zY29yZTogdWludDY0KSAtPiB2b2lkOgpfYXBwcm92ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE5Ni0xOTcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2FwcHJvdmUoc2VsZiwgcmVndWxhdG9yOiBBY2NvdW50LCBjb21wbGlhbmNlX3Njb3JlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE5OAogICAgLy8gc2VsZi5yZWdfc3RhdHVzID0gU3RyaW5nKCJhcHByb3ZlZCIpCiAgICBieXRlYyA2IC8vICJyZWdfc3RhdHVzIgogICAgYnl0ZWMgMjcgLy8gImFwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjE5OQogICAgLy8gc2VsZi5jb21wbGlhbmNlX3Njb3JlID0gY29tcGxpYW5jZV9zY29yZQogICAgYnl0ZWMgMjMgLy8gImNvbXBsaWFuY2Vfc2NvcmUiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMDAKICAgIC8vIHNlbGYuYXBwcm92YWxfdHMgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgYnl0ZWMgNSAvLyAiYXBwcm92YWxfdHMiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjAxCiAgICAvLyBzZWxmLnN0YXR1cyA9IFN0cmluZygiYXBwcm92ZWQiKQogICAgYnl0ZWMgNCAvLyAic3RhdHVzIgogICAgYnl0ZWMgMjcgLy8gImFwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIwNQogICAgLy8gYXJjNC5VSW50NjQoY29tcGxpYW5jZV9zY29yZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIwNgogICAgLy8gYXJjNC5VSW50NjQoc2VsZi5hcHByb3ZhbF90cyksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiYXBwcm92YWxfdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxfdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMDMtMjA3CiAgICAvLyBBcHByb3ZlZCgKICAgIC8vICAgICBhcmM0LkFkZHJlc3MocmVndWxhdG9yKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChjb21wbGlhbmNlX3Njb3JlKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLmFwcHJvdmFsX3RzKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjAyLTIwOAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEFwcHJvdmVkKAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3MocmVndWxhdG9yKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoY29tcGxpYW5jZV9zY29yZSksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYuYXBwcm92YWxfdHMpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDZkYTc0NDA4IC8vIG1ldGhvZCAiQXBwcm92ZWQoYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb19oZWFseC5jb250cmFjdC5EcnVnQmF0Y2hDb250cmFjdC5fcmVqZWN0KHJlZ3VsYXRvcjogYnl0ZXMsIHJlYXNvbl90ZXh0OiBieXRlcykgLT4gdm9pZDoKX3JlamVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIxMC0yMTEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3JlamVjdChzZWxmLCByZWd1bGF0b3I6IEFjY291bnQsIHJlYXNvbl90ZXh0OiBTdHJpbmcpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIxMgogICAgLy8gc2VsZi5yZWdfc3RhdHVzID0gU3RyaW5nKCJyZWplY3RlZCIpCiAgICBieXRlYyA2IC8vICJyZWdfc3RhdHVzIgogICAgYnl0ZWMgMjggLy8gInJlamVjdGVkIgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIxMwogICAgLy8gc2VsZi5yZWpfcmVhc29uID0gcmVhc29uX3RleHQKICAgIGJ5dGVjIDIyIC8vICJyZWpfcmVhc29uIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29faGVhbHgvY29udHJhY3QucHk6MjE0CiAgICAvLyBzZWxmLmFwcHJvdmFsX3RzID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDUgLy8gImFwcHJvdmFsX3RzIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIxNQogICAgLy8gc2VsZi5zdGF0dXMgPSBTdHJpbmcoInJlamVjdGVkIikKICAgIGJ5dGVjIDQgLy8gInN0YXR1cyIKICAgIGJ5dGVjIDI4IC8vICJyZWplY3RlZCIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMTgKICAgIC8vIGFyYzQuQWRkcmVzcyhyZWd1bGF0b3IpLCBhcmM0LlN0cmluZyhyZWFzb25fdGV4dCksIGFyYzQuVUludDY0KHNlbGYuYXBwcm92YWxfdHMpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiYXBwcm92YWxfdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxfdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb19oZWFseC9jb250cmFjdC5weToyMTctMjE5CiAgICAvLyBSZWplY3RlZCgKICAgIC8vICAgICBhcmM0LkFkZHJlc3MocmVndWxhdG9yKSwgYXJjNC5TdHJpbmcocmVhc29uX3RleHQpLCBhcmM0LlVJbnQ2NChzZWxmLmFwcHJvdmFsX3RzKQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlYyAyNiAvLyAweDAwMmEKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvX2hlYWx4L2NvbnRyYWN0LnB5OjIxNi0yMjAKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBSZWplY3RlZCgKICAgIC8vICAgICAgICAgYXJjNC5BZGRyZXNzKHJlZ3VsYXRvciksIGFyYzQuU3RyaW5nKHJlYXNvbl90ZXh0KSwgYXJjNC5VSW50NjQoc2VsZi5hcHByb3ZhbF90cykKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhhZGVkZmY2ZiAvLyBtZXRob2QgIlJlamVjdGVkKGFkZHJlc3Msc3RyaW5nLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [458], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [575], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [611], "errorMessage": "Registry already set"}, {"pc": [590, 639, 889, 1222, 1347, 1386, 1466, 1583, 1672], "errorMessage": "check self.admin exists"}, {"pc": [1797, 1853], "errorMessage": "check self.approval_ts exists"}, {"pc": [1296], "errorMessage": "check self.last_transfer_ts exists"}, {"pc": [768, 824, 861, 899, 1070, 1150, 1212, 1232, 1456, 1662, 1721], "errorMessage": "check self.producer exists"}, {"pc": [1530], "errorMessage": "check self.qr_hash exists"}, {"pc": [1358, 1376], "errorMessage": "check self.receiver exists"}, {"pc": [1733], "errorMessage": "check self.reg_status exists"}, {"pc": [596, 603, 1041, 1050, 1121, 1130, 1714, 1745], "errorMessage": "check self.registry exists"}, {"pc": [909, 971, 1006, 1060, 1140, 1593], "errorMessage": "check self.regulator exists"}, {"pc": [1285, 1337], "errorMessage": "check self.sender exists"}, {"pc": [1203, 1254, 1290], "errorMessage": "check self.transfer_count exists"}, {"pc": [1537, 1557], "errorMessage": "check self.verif_count exists"}, {"pc": [1447, 1522], "errorMessage": "invalid number of bytes for (len+uint8[])"}, {"pc": [687, 703, 719, 735, 751, 880, 997, 1114, 1195], "errorMessage": "invalid number of bytes for (len+utf8[])"}, {"pc": [583, 763, 964, 1036, 1655], "errorMessage": "invalid number of bytes for uint64"}, {"pc": [633, 1028, 1101, 1181], "errorMessage": "invalid number of bytes for uint8[32]"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,15 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetRegistryArgs:
+    """Dataclass for set_registry arguments"""
+    registry_app_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_registry(uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class SetRegulatorArgs:
     """Dataclass for set_regulator arguments"""
@@ -114,6 +123,26 @@ class RejectArgs:
     def abi_method_signature(self) -> str:
         return "reject(string)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ApproveForArgs:
+    """Dataclass for approve_for arguments"""
+    regulator: str
+    compliance_score: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "approve_for(address,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RejectForArgs:
+    """Dataclass for reject_for arguments"""
+    regulator: str
+    reason_text: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "reject_for(address,string)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class TransferArgs:
     """Dataclass for transfer arguments"""
@@ -156,6 +185,19 @@ class DrugBatchContractParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    def set_registry(
+        self,
+        args: tuple[int] | SetRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_registry(uint64)void",
+            "args": method_args,
+        }))
+
     def set_regulator(
         self,
         args: tuple[str] | SetRegulatorArgs,
@@ -221,57 +263,46 @@ class DrugBatchContractParams:
             "args": method_args,
         }))
 
-    def transfer(
+    def approve_for(
         self,
-        args: tuple[str, str] | TransferArgs,
+        args: tuple[str, int] | ApproveForArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "transfer(address,string)void",
+            "method": "approve_for(address,uint64)void",
             "args": method_args,
         }))
 
-    def mark_delivered(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.AppCallMethodCallParams:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mark_delivered()void",
-        }))
-
-    def set_qr(
+    def reject_for(
         self,
-        args: tuple[bytes | str] | SetQrArgs,
+        args: tuple[str, str] | RejectForArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_qr(byte[])void",
+            "method": "reject_for(address,string)void",
             "args": method_args,
         }))
 
-    def verify(
+    def transfer(
         self,
-        args: tuple[bytes | str] | VerifyArgs,
+        args: tuple[str, str] | TransferArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify(byte[])void",
+            "method": "transfer(address,string)void",
             "args": method_args,
         }))
 
-    def mark_counterfeit(
+    def mark_delivered(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -279,34 +310,36 @@ class DrugBatchContractParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "mark_counterfeit()void",
+            "method": "mark_delivered()void",
         }))
 
-    def update_quantity(
+    def set_qr(
         self,
-        args: tuple[int] | UpdateQuantityArgs,
+        args: tuple[bytes | str] | SetQrArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_quantity(uint64)void",
+            "method": "set_qr(byte[])void",
             "args": method_args,
         }))
 
-    def get_info(
+    def verify(
         self,
+        args: tuple[bytes | str] | VerifyArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_info()void",
+            "method": "verify(byte[])void",
+            "args": method_args,
         }))
 
-    def get_status(
+    def mark_counterfeit(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -314,18 +347,20 @@ class DrugBatchContractParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_status()void",
+            "method": "mark_counterfeit()void",
         }))
 
-    def get_history(
+    def update_quantity(
         self,
+        args: tuple[int] | UpdateQuantityArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_history()void",
+            "method": "update_quantity(uint64)void",
+            "args": method_args,
         }))
 
     def clear_state(
@@ -343,6 +378,19 @@ class DrugBatchContractCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    def set_registry(
+        self,
+        args: tuple[int] | SetRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_registry(uint64)void",
+            "args": method_args,
+        }))
+
     def set_regulator(
         self,
         args: tuple[str] | SetRegulatorArgs,
@@ -408,57 +456,46 @@ class DrugBatchContractCreateTransactionParams:
             "args": method_args,
         }))
 
-    def transfer(
+    def approve_for(
         self,
-        args: tuple[str, str] | TransferArgs,
+        args: tuple[str, int] | ApproveForArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "transfer(address,string)void",
+            "method": "approve_for(address,uint64)void",
             "args": method_args,
         }))
 
-    def mark_delivered(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mark_delivered()void",
-        }))
-
-    def set_qr(
+    def reject_for(
         self,
-        args: tuple[bytes | str] | SetQrArgs,
+        args: tuple[str, str] | RejectForArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_qr(byte[])void",
+            "method": "reject_for(address,string)void",
             "args": method_args,
         }))
 
-    def verify(
+    def transfer(
         self,
-        args: tuple[bytes | str] | VerifyArgs,
+        args: tuple[str, str] | TransferArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify(byte[])void",
+            "method": "transfer(address,string)void",
             "args": method_args,
         }))
 
-    def mark_counterfeit(
+    def mark_delivered(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -466,34 +503,36 @@ class DrugBatchContractCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "mark_counterfeit()void",
+            "method": "mark_delivered()void",
         }))
 
-    def update_quantity(
+    def set_qr(
         self,
-        args: tuple[int] | UpdateQuantityArgs,
+        args: tuple[bytes | str] | SetQrArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_quantity(uint64)void",
+            "method": "set_qr(byte[])void",
             "args": method_args,
         }))
 
-    def get_info(
+    def verify(
         self,
+        args: tuple[bytes | str] | VerifyArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_info()void",
+            "method": "verify(byte[])void",
+            "args": method_args,
         }))
 
-    def get_status(
+    def mark_counterfeit(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -501,18 +540,20 @@ class DrugBatchContractCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_status()void",
+            "method": "mark_counterfeit()void",
         }))
 
-    def get_history(
+    def update_quantity(
         self,
+        args: tuple[int] | UpdateQuantityArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_history()void",
+            "method": "update_quantity(uint64)void",
+            "args": method_args,
         }))
 
     def clear_state(
@@ -530,6 +571,22 @@ class DrugBatchContractSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    def set_registry(
+        self,
+        args: tuple[int] | SetRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_registry(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def set_regulator(
         self,
         args: tuple[str] | SetRegulatorArgs,
@@ -610,9 +667,9 @@ class DrugBatchContractSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def transfer(
+    def approve_for(
         self,
-        args: tuple[str, str] | TransferArgs,
+        args: tuple[str, int] | ApproveForArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -620,29 +677,15 @@ class DrugBatchContractSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "transfer(address,string)void",
+            "method": "approve_for(address,uint64)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def mark_delivered(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mark_delivered()void",
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
-
-    def set_qr(
+    def reject_for(
         self,
-        args: tuple[bytes | str] | SetQrArgs,
+        args: tuple[str, str] | RejectForArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -650,15 +693,15 @@ class DrugBatchContractSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_qr(byte[])void",
+            "method": "reject_for(address,string)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def verify(
+    def transfer(
         self,
-        args: tuple[bytes | str] | VerifyArgs,
+        args: tuple[str, str] | TransferArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -666,13 +709,13 @@ class DrugBatchContractSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify(byte[])void",
+            "method": "transfer(address,string)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def mark_counterfeit(
+    def mark_delivered(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
@@ -681,14 +724,14 @@ class DrugBatchContractSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "mark_counterfeit()void",
+            "method": "mark_delivered()void",
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def update_quantity(
+    def set_qr(
         self,
-        args: tuple[int] | UpdateQuantityArgs,
+        args: tuple[bytes | str] | SetQrArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -696,27 +739,29 @@ class DrugBatchContractSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_quantity(uint64)void",
+            "method": "set_qr(byte[])void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def get_info(
+    def verify(
         self,
+        args: tuple[bytes | str] | VerifyArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_info()void",
+            "method": "verify(byte[])void",
+            "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def get_status(
+    def mark_counterfeit(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
@@ -725,21 +770,23 @@ class DrugBatchContractSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_status()void",
+            "method": "mark_counterfeit()void",
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def get_history(
+    def update_quantity(
         self,
+        args: tuple[int] | UpdateQuantityArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_history()void",
+            "method": "update_quantity(uint64)void",
+            "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
@@ -781,6 +828,7 @@ class GlobalStateValue(typing.TypedDict):
     is_authentic: int
     last_verif_ts: int
     qr_hash: bytes
+    registry: int
 
 class DrugBatchContractState:
     """Methods to access state for the current DrugBatchContract app"""
@@ -1010,6 +1058,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
         return typing.cast(bytes, value)
 
+    @property
+    def registry(self) -> int:
+        """Get the current value of the registry key in global_state state"""
+        value = self.app_client.state.global_state.get_value("registry")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class DrugBatchContractClient:
     """Client for interacting with DrugBatchContract smart contract"""
 
@@ -1156,85 +1212,85 @@ class DrugBatchContractClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["set_regulator(address)void"],
+        method: typing.Literal["set_registry(uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["register(string,string,string,string,string,uint64)void"],
+        method: typing.Literal["set_regulator(address)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["update_status(string)void"],
+        method: typing.Literal["register(string,string,string,string,string,uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["approve(uint64)void"],
+        method: typing.Literal["update_status(string)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["reject(string)void"],
+        method: typing.Literal["approve(uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["transfer(address,string)void"],
+        method: typing.Literal["reject(string)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["mark_delivered()void"],
+        method: typing.Literal["approve_for(address,uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["set_qr(byte[])void"],
+        method: typing.Literal["reject_for(address,string)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["verify(byte[])void"],
+        method: typing.Literal["transfer(address,string)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["mark_counterfeit()void"],
+        method: typing.Literal["mark_delivered()void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["update_quantity(uint64)void"],
+        method: typing.Literal["set_qr(byte[])void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_info()void"],
+        method: typing.Literal["verify(byte[])void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_status()void"],
+        method: typing.Literal["mark_counterfeit()void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_history()void"],
+        method: typing.Literal["update_quantity(uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
@@ -1419,6 +1475,26 @@ class DrugBatchContractFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
+    def set_registry(
+        self,
+        args: tuple[int] | SetRegistryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_registry(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_registry(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def set_regulator(
         self,
         args: tuple[str] | SetRegulatorArgs,
@@ -1519,176 +1595,159 @@ class DrugBatchContractFactoryCreateParams:
             compilation_params=compilation_params
         )
 
-    def transfer(
+    def approve_for(
         self,
-        args: tuple[str, str] | TransferArgs,
+        args: tuple[str, int] | ApproveForArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the transfer(address,string)void ABI method"""
+        """Creates a new instance using the approve_for(address,uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "transfer(address,string)void",
+                "method": "approve_for(address,uint64)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def mark_delivered(
+    def reject_for(
         self,
+        args: tuple[str, str] | RejectForArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the mark_delivered()void ABI method"""
+        """Creates a new instance using the reject_for(address,string)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "mark_delivered()void",
-                "args": None,
-                }
-            ),
-            compilation_params=compilation_params
-        )
-
-    def set_qr(
-        self,
-        args: tuple[bytes | str] | SetQrArgs,
-        *,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the set_qr(byte[])void ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.create(
-            algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "set_qr(byte[])void",
+                "method": "reject_for(address,string)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def verify(
+    def transfer(
         self,
-        args: tuple[bytes | str] | VerifyArgs,
+        args: tuple[str, str] | TransferArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the verify(byte[])void ABI method"""
+        """Creates a new instance using the transfer(address,string)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "verify(byte[])void",
+                "method": "transfer(address,string)void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def mark_counterfeit(
+    def mark_delivered(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the mark_counterfeit()void ABI method"""
+        """Creates a new instance using the mark_delivered()void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "mark_counterfeit()void",
+                "method": "mark_delivered()void",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def update_quantity(
+    def set_qr(
         self,
-        args: tuple[int] | UpdateQuantityArgs,
+        args: tuple[bytes | str] | SetQrArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the update_quantity(uint64)void ABI method"""
+        """Creates a new instance using the set_qr(byte[])void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "update_quantity(uint64)void",
+                "method": "set_qr(byte[])void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_info(
+    def verify(
         self,
+        args: tuple[bytes | str] | VerifyArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_info()void ABI method"""
+        """Creates a new instance using the verify(byte[])void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_info()void",
-                "args": None,
+                "method": "verify(byte[])void",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_status(
+    def mark_counterfeit(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_status()void ABI method"""
+        """Creates a new instance using the mark_counterfeit()void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_status()void",
+                "method": "mark_counterfeit()void",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_history(
+    def update_quantity(
         self,
+        args: tuple[int] | UpdateQuantityArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_history()void ABI method"""
+        """Creates a new instance using the update_quantity(uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_history()void",
-                "args": None,
+                "method": "update_quantity(uint64)void",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
@@ -1795,6 +1854,24 @@ class DrugBatchContractComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
+    def set_registry(
+        self,
+        args: tuple[int] | SetRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DrugBatchContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_registry(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_registry(uint64)void", v
+            )
+        )
+        return self
+
     def set_regulator(
         self,
         args: tuple[str] | SetRegulatorArgs,
@@ -1885,159 +1962,144 @@ class DrugBatchContractComposer:
         )
         return self
 
-    def transfer(
+    def approve_for(
         self,
-        args: tuple[str, str] | TransferArgs,
+        args: tuple[str, int] | ApproveForArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DrugBatchContractComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.transfer(
+            self.client.params.approve_for(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "transfer(address,string)void", v
-            )
-        )
-        return self
-
-    def mark_delivered(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None
-    ) -> "DrugBatchContractComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.mark_delivered(
-                
-                params=params,
-            )
-        )
-        self._result_mappers.append(
-            lambda v: self.client.decode_return_value(
-                "mark_delivered()void", v
+                "approve_for(address,uint64)void", v
             )
         )
         return self
 
-    def set_qr(
+    def reject_for(
         self,
-        args: tuple[bytes | str] | SetQrArgs,
+        args: tuple[str, str] | RejectForArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DrugBatchContractComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.set_qr(
+            self.client.params.reject_for(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "set_qr(byte[])void", v
+                "reject_for(address,string)void", v
             )
         )
         return self
 
-    def verify(
+    def transfer(
         self,
-        args: tuple[bytes | str] | VerifyArgs,
+        args: tuple[str, str] | TransferArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DrugBatchContractComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.verify(
+            self.client.params.transfer(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "verify(byte[])void", v
+                "transfer(address,string)void", v
             )
         )
         return self
 
-    def mark_counterfeit(
+    def mark_delivered(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DrugBatchContractComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.mark_counterfeit(
+            self.client.params.mark_delivered(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "mark_counterfeit()void", v
+                "mark_delivered()void", v
             )
         )
         return self
 
-    def update_quantity(
+    def set_qr(
         self,
-        args: tuple[int] | UpdateQuantityArgs,
+        args: tuple[bytes | str] | SetQrArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DrugBatchContractComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.update_quantity(
+            self.client.params.set_qr(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "update_quantity(uint64)void", v
+                "set_qr(byte[])void", v
             )
         )
         return self
 
-    def get_info(
+    def verify(
         self,
+        args: tuple[bytes | str] | VerifyArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DrugBatchContractComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_info(
-                
+            self.client.params.verify(
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_info()void", v
+                "verify(byte[])void", v
             )
         )
         return self
 
-    def get_status(
+    def mark_counterfeit(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DrugBatchContractComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_status(
+            self.client.params.mark_counterfeit(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_status()void", v
+                "mark_counterfeit()void", v
             )
         )
         return self
 
-    def get_history(
+    def update_quantity(
         self,
+        args: tuple[int] | UpdateQuantityArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DrugBatchContractComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_history(
-                
+            self.client.params.update_quantity(
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_history()void", v
+                "update_quantity(uint64)void", v
             )
         )
         return self
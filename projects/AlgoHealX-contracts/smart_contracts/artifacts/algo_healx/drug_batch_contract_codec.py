@@ -0,0 +1,614 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts/_helpers/arc4_codec.py.
+# DO NOT MODIFY IT BY HAND.
+import functools
+import struct
+import typing
+
+from algosdk.encoding import decode_address as _checked_decode_address
+from algosdk.encoding import encode_address as _checked_encode_address
+
+_UINT8 = struct.Struct(">B")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_address(address: str) -> bytes:
+    return _checked_decode_address(address)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_address(public_key: bytes) -> str:
+    return _checked_encode_address(public_key)
+
+
+def _prefixed(value: bytes) -> bytes:
+    return _UINT16.pack(len(value)) + value
+
+
+def _unprefixed(encoded: bytes) -> bytes:
+    (length,) = _UINT16.unpack_from(encoded)
+    if len(encoded) != length + 2:
+        raise ValueError(f"Expected {length} bytes after the length prefix, got {len(encoded) - 2}")
+    return encoded[2:]
+
+
+def _dynamic(log: bytes, head: int) -> bytes:
+    # Offsets in an event's head are relative to the tuple, after the 4-byte selector
+    start = 4 + _UINT16.unpack_from(log, head)[0]
+    (length,) = _UINT16.unpack_from(log, start)
+    return log[start + 2 : start + 2 + length]
+
+
+def _pack_uint_array(values: list[int], code: str) -> bytes:
+    return _UINT16.pack(len(values)) + struct.pack(f">{len(values)}{code}", *values)
+
+
+def _pack_string_array(values: list[str]) -> bytes:
+    tails = [_prefixed(value.encode()) for value in values]
+    heads = []
+    offset = 2 * len(tails)
+    for tail in tails:
+        heads.append(_UINT16.pack(offset))
+        offset += len(tail)
+    return _UINT16.pack(len(tails)) + b"".join(heads) + b"".join(tails)
+
+
+def _string_array(encoded: bytes) -> list[str]:
+    (length,) = _UINT16.unpack_from(encoded)
+    values = []
+    for i in range(length):
+        start = 2 + _UINT16.unpack_from(encoded, 2 + 2 * i)[0]
+        (size,) = _UINT16.unpack_from(encoded, start)
+        values.append(encoded[start + 2 : start + 2 + size].decode())
+    return values
+
+
+def _uint_array(encoded: bytes, code: str, size: int) -> list[int]:
+    (length,) = _UINT16.unpack_from(encoded)
+    if len(encoded) != 2 + length * size:
+        raise ValueError(f"Expected {length} {size}-byte elements after the length prefix")
+    return list(struct.unpack_from(f">{length}{code}", encoded, 2))
+
+
+def _unreturned(log: bytes) -> bytes:
+    if not log.startswith(RETURN_PREFIX):
+        raise ValueError("Log is not an ARC-4 return value")
+    return log[4:]
+
+
+
+SET_REGISTRY_SELECTOR = bytes.fromhex('ad5e99e9')
+
+
+def encode_set_registry(registry_app_id: int) -> list[bytes]:
+    """App args for set_registry(uint64)void"""
+    return [
+        SET_REGISTRY_SELECTOR,
+        _UINT64.pack(registry_app_id),
+    ]
+
+
+def decode_set_registry(app_args: list[bytes]) -> tuple[int]:
+    """Arguments of a set_registry(uint64)void call, from its app args"""
+    return (
+        _UINT64.unpack(app_args[1])[0],
+    )
+
+
+SET_REGULATOR_SELECTOR = bytes.fromhex('bf746b78')
+
+
+def encode_set_regulator(regulator_addr: str) -> list[bytes]:
+    """App args for set_regulator(address)void"""
+    return [
+        SET_REGULATOR_SELECTOR,
+        _decode_address(regulator_addr),
+    ]
+
+
+def decode_set_regulator(app_args: list[bytes]) -> tuple[str]:
+    """Arguments of a set_regulator(address)void call, from its app args"""
+    return (
+        _encode_address(app_args[1]),
+    )
+
+
+REGISTER_SELECTOR = bytes.fromhex('1b6680da')
+
+
+def encode_register(batch_id: str, drug_name: str, manufacturer: str, manufacture_date: str, expiry_date: str, quantity: int) -> list[bytes]:
+    """App args for register(string,string,string,string,string,uint64)void"""
+    return [
+        REGISTER_SELECTOR,
+        _prefixed(batch_id.encode()),
+        _prefixed(drug_name.encode()),
+        _prefixed(manufacturer.encode()),
+        _prefixed(manufacture_date.encode()),
+        _prefixed(expiry_date.encode()),
+        _UINT64.pack(quantity),
+    ]
+
+
+def decode_register(app_args: list[bytes]) -> tuple[str, str, str, str, str, int]:
+    """Arguments of a register(string,string,string,string,string,uint64)void call, from its app args"""
+    return (
+        _unprefixed(app_args[1]).decode(),
+        _unprefixed(app_args[2]).decode(),
+        _unprefixed(app_args[3]).decode(),
+        _unprefixed(app_args[4]).decode(),
+        _unprefixed(app_args[5]).decode(),
+        _UINT64.unpack(app_args[6])[0],
+    )
+
+
+UPDATE_STATUS_SELECTOR = bytes.fromhex('475afff8')
+
+
+def encode_update_status(status_text: str) -> list[bytes]:
+    """App args for update_status(string)void"""
+    return [
+        UPDATE_STATUS_SELECTOR,
+        _prefixed(status_text.encode()),
+    ]
+
+
+def decode_update_status(app_args: list[bytes]) -> tuple[str]:
+    """Arguments of a update_status(string)void call, from its app args"""
+    return (
+        _unprefixed(app_args[1]).decode(),
+    )
+
+
+APPROVE_SELECTOR = bytes.fromhex('add6306e')
+
+
+def encode_approve(compliance_score: int) -> list[bytes]:
+    """App args for approve(uint64)void"""
+    return [
+        APPROVE_SELECTOR,
+        _UINT64.pack(compliance_score),
+    ]
+
+
+def decode_approve(app_args: list[bytes]) -> tuple[int]:
+    """Arguments of a approve(uint64)void call, from its app args"""
+    return (
+        _UINT64.unpack(app_args[1])[0],
+    )
+
+
+REJECT_SELECTOR = bytes.fromhex('bcb210f6')
+
+
+def encode_reject(reason_text: str) -> list[bytes]:
+    """App args for reject(string)void"""
+    return [
+        REJECT_SELECTOR,
+        _prefixed(reason_text.encode()),
+    ]
+
+
+def decode_reject(app_args: list[bytes]) -> tuple[str]:
+    """Arguments of a reject(string)void call, from its app args"""
+    return (
+        _unprefixed(app_args[1]).decode(),
+    )
+
+
+APPROVE_FOR_SELECTOR = bytes.fromhex('c0883c13')
+
+
+def encode_approve_for(regulator: str, compliance_score: int) -> list[bytes]:
+    """App args for approve_for(address,uint64)void"""
+    return [
+        APPROVE_FOR_SELECTOR,
+        _decode_address(regulator),
+        _UINT64.pack(compliance_score),
+    ]
+
+
+def decode_approve_for(app_args: list[bytes]) -> tuple[str, int]:
+    """Arguments of a approve_for(address,uint64)void call, from its app args"""
+    return (
+        _encode_address(app_args[1]),
+        _UINT64.unpack(app_args[2])[0],
+    )
+
+
+REJECT_FOR_SELECTOR = bytes.fromhex('f2f9b89a')
+
+
+def encode_reject_for(regulator: str, reason_text: str) -> list[bytes]:
+    """App args for reject_for(address,string)void"""
+    return [
+        REJECT_FOR_SELECTOR,
+        _decode_address(regulator),
+        _prefixed(reason_text.encode()),
+    ]
+
+
+def decode_reject_for(app_args: list[bytes]) -> tuple[str, str]:
+    """Arguments of a reject_for(address,string)void call, from its app args"""
+    return (
+        _encode_address(app_args[1]),
+        _unprefixed(app_args[2]).decode(),
+    )
+
+
+TRANSFER_SELECTOR = bytes.fromhex('77b09c7a')
+
+
+def encode_transfer(new_receiver: str, location: str) -> list[bytes]:
+    """App args for transfer(address,string)void"""
+    return [
+        TRANSFER_SELECTOR,
+        _decode_address(new_receiver),
+        _prefixed(location.encode()),
+    ]
+
+
+def decode_transfer(app_args: list[bytes]) -> tuple[str, str]:
+    """Arguments of a transfer(address,string)void call, from its app args"""
+    return (
+        _encode_address(app_args[1]),
+        _unprefixed(app_args[2]).decode(),
+    )
+
+
+MARK_DELIVERED_SELECTOR = bytes.fromhex('5e23d57e')
+
+
+def encode_mark_delivered() -> list[bytes]:
+    """App args for mark_delivered()void"""
+    return [
+        MARK_DELIVERED_SELECTOR,
+    ]
+
+
+def decode_mark_delivered(app_args: list[bytes]) -> tuple[()]:
+    """Arguments of a mark_delivered()void call, from its app args"""
+    return (
+    )
+
+
+SET_QR_SELECTOR = bytes.fromhex('fdae70a5')
+
+
+def encode_set_qr(qr_hash: bytes | str) -> list[bytes]:
+    """App args for set_qr(byte[])void"""
+    return [
+        SET_QR_SELECTOR,
+        _prefixed(qr_hash.encode() if isinstance(qr_hash, str) else qr_hash),
+    ]
+
+
+def decode_set_qr(app_args: list[bytes]) -> tuple[bytes]:
+    """Arguments of a set_qr(byte[])void call, from its app args"""
+    return (
+        _unprefixed(app_args[1]),
+    )
+
+
+VERIFY_SELECTOR = bytes.fromhex('6fad87ed')
+
+
+def encode_verify(qr_hash: bytes | str) -> list[bytes]:
+    """App args for verify(byte[])void"""
+    return [
+        VERIFY_SELECTOR,
+        _prefixed(qr_hash.encode() if isinstance(qr_hash, str) else qr_hash),
+    ]
+
+
+def decode_verify(app_args: list[bytes]) -> tuple[bytes]:
+    """Arguments of a verify(byte[])void call, from its app args"""
+    return (
+        _unprefixed(app_args[1]),
+    )
+
+
+MARK_COUNTERFEIT_SELECTOR = bytes.fromhex('a5b0d7b6')
+
+
+def encode_mark_counterfeit() -> list[bytes]:
+    """App args for mark_counterfeit()void"""
+    return [
+        MARK_COUNTERFEIT_SELECTOR,
+    ]
+
+
+def decode_mark_counterfeit(app_args: list[bytes]) -> tuple[()]:
+    """Arguments of a mark_counterfeit()void call, from its app args"""
+    return (
+    )
+
+
+UPDATE_QUANTITY_SELECTOR = bytes.fromhex('385bb9c9')
+
+
+def encode_update_quantity(new_quantity: int) -> list[bytes]:
+    """App args for update_quantity(uint64)void"""
+    return [
+        UPDATE_QUANTITY_SELECTOR,
+        _UINT64.pack(new_quantity),
+    ]
+
+
+def decode_update_quantity(app_args: list[bytes]) -> tuple[int]:
+    """Arguments of a update_quantity(uint64)void call, from its app args"""
+    return (
+        _UINT64.unpack(app_args[1])[0],
+    )
+
+
+class RegulatorSetEvent(typing.NamedTuple):
+    """RegulatorSet(address,uint64) ARC-28 event"""
+
+    regulator: str
+    timestamp: int
+
+
+REGULATOR_SET_EVENT_SELECTOR = bytes.fromhex('8f692c52')
+
+
+def decode_regulator_set_event(log: bytes) -> RegulatorSetEvent:
+    """Fields of a RegulatorSet event, from its log"""
+    return RegulatorSetEvent(
+        _encode_address(log[4:36]),
+        _UINT64.unpack_from(log, 36)[0],
+    )
+
+
+class RegisteredEvent(typing.NamedTuple):
+    """Registered(string,address,uint64,uint64) ARC-28 event"""
+
+    batch_id: str
+    producer: str
+    quantity: int
+    timestamp: int
+
+
+REGISTERED_EVENT_SELECTOR = bytes.fromhex('fe8c36af')
+
+
+def decode_registered_event(log: bytes) -> RegisteredEvent:
+    """Fields of a Registered event, from its log"""
+    return RegisteredEvent(
+        _dynamic(log, 4).decode(),
+        _encode_address(log[6:38]),
+        _UINT64.unpack_from(log, 38)[0],
+        _UINT64.unpack_from(log, 46)[0],
+    )
+
+
+class StatusUpdatedEvent(typing.NamedTuple):
+    """StatusUpdated(string,address,uint64) ARC-28 event"""
+
+    status: str
+    updated_by: str
+    timestamp: int
+
+
+STATUS_UPDATED_EVENT_SELECTOR = bytes.fromhex('f621d6a7')
+
+
+def decode_status_updated_event(log: bytes) -> StatusUpdatedEvent:
+    """Fields of a StatusUpdated event, from its log"""
+    return StatusUpdatedEvent(
+        _dynamic(log, 4).decode(),
+        _encode_address(log[6:38]),
+        _UINT64.unpack_from(log, 38)[0],
+    )
+
+
+class ApprovedEvent(typing.NamedTuple):
+    """Approved(address,uint64,uint64) ARC-28 event"""
+
+    regulator: str
+    compliance_score: int
+    timestamp: int
+
+
+APPROVED_EVENT_SELECTOR = bytes.fromhex('6da74408')
+
+
+def decode_approved_event(log: bytes) -> ApprovedEvent:
+    """Fields of a Approved event, from its log"""
+    return ApprovedEvent(
+        _encode_address(log[4:36]),
+        _UINT64.unpack_from(log, 36)[0],
+        _UINT64.unpack_from(log, 44)[0],
+    )
+
+
+class RejectedEvent(typing.NamedTuple):
+    """Rejected(address,string,uint64) ARC-28 event"""
+
+    regulator: str
+    reason: str
+    timestamp: int
+
+
+REJECTED_EVENT_SELECTOR = bytes.fromhex('adedff6f')
+
+
+def decode_rejected_event(log: bytes) -> RejectedEvent:
+    """Fields of a Rejected event, from its log"""
+    return RejectedEvent(
+        _encode_address(log[4:36]),
+        _dynamic(log, 36).decode(),
+        _UINT64.unpack_from(log, 38)[0],
+    )
+
+
+class TransferredEvent(typing.NamedTuple):
+    """Transferred(address,address,string,uint64,uint64) ARC-28 event"""
+
+    sender: str
+    receiver: str
+    location: str
+    transfer_count: int
+    timestamp: int
+
+
+TRANSFERRED_EVENT_SELECTOR = bytes.fromhex('b669376b')
+
+
+def decode_transferred_event(log: bytes) -> TransferredEvent:
+    """Fields of a Transferred event, from its log"""
+    return TransferredEvent(
+        _encode_address(log[4:36]),
+        _encode_address(log[36:68]),
+        _dynamic(log, 68).decode(),
+        _UINT64.unpack_from(log, 70)[0],
+        _UINT64.unpack_from(log, 78)[0],
+    )
+
+
+class DeliveredEvent(typing.NamedTuple):
+    """Delivered(address,uint64) ARC-28 event"""
+
+    receiver: str
+    timestamp: int
+
+
+DELIVERED_EVENT_SELECTOR = bytes.fromhex('f3b323bd')
+
+
+def decode_delivered_event(log: bytes) -> DeliveredEvent:
+    """Fields of a Delivered event, from its log"""
+    return DeliveredEvent(
+        _encode_address(log[4:36]),
+        _UINT64.unpack_from(log, 36)[0],
+    )
+
+
+class QrSetEvent(typing.NamedTuple):
+    """QrSet(byte[],uint64) ARC-28 event"""
+
+    qr_hash: bytes
+    timestamp: int
+
+
+QR_SET_EVENT_SELECTOR = bytes.fromhex('2e31430d')
+
+
+def decode_qr_set_event(log: bytes) -> QrSetEvent:
+    """Fields of a QrSet event, from its log"""
+    return QrSetEvent(
+        _dynamic(log, 4),
+        _UINT64.unpack_from(log, 6)[0],
+    )
+
+
+class VerifiedEvent(typing.NamedTuple):
+    """Verified(address,uint64,uint64) ARC-28 event"""
+
+    verifier: str
+    verif_count: int
+    timestamp: int
+
+
+VERIFIED_EVENT_SELECTOR = bytes.fromhex('7e9b3f97')
+
+
+def decode_verified_event(log: bytes) -> VerifiedEvent:
+    """Fields of a Verified event, from its log"""
+    return VerifiedEvent(
+        _encode_address(log[4:36]),
+        _UINT64.unpack_from(log, 36)[0],
+        _UINT64.unpack_from(log, 44)[0],
+    )
+
+
+class CounterfeitEvent(typing.NamedTuple):
+    """Counterfeit(address,uint64) ARC-28 event"""
+
+    reported_by: str
+    timestamp: int
+
+
+COUNTERFEIT_EVENT_SELECTOR = bytes.fromhex('4ba2c104')
+
+
+def decode_counterfeit_event(log: bytes) -> CounterfeitEvent:
+    """Fields of a Counterfeit event, from its log"""
+    return CounterfeitEvent(
+        _encode_address(log[4:36]),
+        _UINT64.unpack_from(log, 36)[0],
+    )
+
+
+class QuantityUpdatedEvent(typing.NamedTuple):
+    """QuantityUpdated(uint64,uint64) ARC-28 event"""
+
+    quantity: int
+    timestamp: int
+
+
+QUANTITY_UPDATED_EVENT_SELECTOR = bytes.fromhex('ac354e07')
+
+
+def decode_quantity_updated_event(log: bytes) -> QuantityUpdatedEvent:
+    """Fields of a QuantityUpdated event, from its log"""
+    return QuantityUpdatedEvent(
+        _UINT64.unpack_from(log, 4)[0],
+        _UINT64.unpack_from(log, 12)[0],
+    )
+
+
+ENCODERS = {
+    'set_registry(uint64)void': encode_set_registry,
+    'set_regulator(address)void': encode_set_regulator,
+    'register(string,string,string,string,string,uint64)void': encode_register,
+    'update_status(string)void': encode_update_status,
+    'approve(uint64)void': encode_approve,
+    'reject(string)void': encode_reject,
+    'approve_for(address,uint64)void': encode_approve_for,
+    'reject_for(address,string)void': encode_reject_for,
+    'transfer(address,string)void': encode_transfer,
+    'mark_delivered()void': encode_mark_delivered,
+    'set_qr(byte[])void': encode_set_qr,
+    'verify(byte[])void': encode_verify,
+    'mark_counterfeit()void': encode_mark_counterfeit,
+    'update_quantity(uint64)void': encode_update_quantity,
+}
+
+
+DECODERS_BY_SELECTOR = {
+    SET_REGISTRY_SELECTOR: ('set_registry(uint64)void', decode_set_registry),
+    SET_REGULATOR_SELECTOR: ('set_regulator(address)void', decode_set_regulator),
+    REGISTER_SELECTOR: ('register(string,string,string,string,string,uint64)void', decode_register),
+    UPDATE_STATUS_SELECTOR: ('update_status(string)void', decode_update_status),
+    APPROVE_SELECTOR: ('approve(uint64)void', decode_approve),
+    REJECT_SELECTOR: ('reject(string)void', decode_reject),
+    APPROVE_FOR_SELECTOR: ('approve_for(address,uint64)void', decode_approve_for),
+    REJECT_FOR_SELECTOR: ('reject_for(address,string)void', decode_reject_for),
+    TRANSFER_SELECTOR: ('transfer(address,string)void', decode_transfer),
+    MARK_DELIVERED_SELECTOR: ('mark_delivered()void', decode_mark_delivered),
+    SET_QR_SELECTOR: ('set_qr(byte[])void', decode_set_qr),
+    VERIFY_SELECTOR: ('verify(byte[])void', decode_verify),
+    MARK_COUNTERFEIT_SELECTOR: ('mark_counterfeit()void', decode_mark_counterfeit),
+    UPDATE_QUANTITY_SELECTOR: ('update_quantity(uint64)void', decode_update_quantity),
+}
+
+
+EVENTS_BY_SELECTOR = {
+    REGULATOR_SET_EVENT_SELECTOR: ('RegulatorSet(address,uint64)', decode_regulator_set_event),
+    REGISTERED_EVENT_SELECTOR: ('Registered(string,address,uint64,uint64)', decode_registered_event),
+    STATUS_UPDATED_EVENT_SELECTOR: ('StatusUpdated(string,address,uint64)', decode_status_updated_event),
+    APPROVED_EVENT_SELECTOR: ('Approved(address,uint64,uint64)', decode_approved_event),
+    REJECTED_EVENT_SELECTOR: ('Rejected(address,string,uint64)', decode_rejected_event),
+    TRANSFERRED_EVENT_SELECTOR: ('Transferred(address,address,string,uint64,uint64)', decode_transferred_event),
+    DELIVERED_EVENT_SELECTOR: ('Delivered(address,uint64)', decode_delivered_event),
+    QR_SET_EVENT_SELECTOR: ('QrSet(byte[],uint64)', decode_qr_set_event),
+    VERIFIED_EVENT_SELECTOR: ('Verified(address,uint64,uint64)', decode_verified_event),
+    COUNTERFEIT_EVENT_SELECTOR: ('Counterfeit(address,uint64)', decode_counterfeit_event),
+    QUANTITY_UPDATED_EVENT_SELECTOR: ('QuantityUpdated(uint64,uint64)', decode_quantity_updated_event),
+}
@@ -0,0 +1,260 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts/_helpers/async_client.py.
+# DO NOT MODIFY IT BY HAND.
+from __future__ import annotations
+
+import base64
+import dataclasses
+import typing
+
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.encoding import encode_address
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers.async_algod import (
+    AsyncAlgod,
+    AsyncComposer,
+    CallParams,
+    SendParams,
+    SendResult,
+    SimulateResult,
+)
+
+from . import batch_registry_contract_codec as _codec
+
+if typing.TYPE_CHECKING:
+    from .batch_registry_contract_client import (
+        MoveArgs,
+        ApproveManyArgs,
+        RejectManyArgs,
+        CountByStatusArgs,
+        ListByStatusArgs,
+    )
+
+
+def _args(args: typing.Any) -> tuple:
+    """Positional values of an args tuple or one of the typed client's `<Method>Args`"""
+    if dataclasses.is_dataclass(args):
+        return tuple(getattr(args, field.name) for field in dataclasses.fields(args))
+    return tuple(args)
+
+
+_VALUE_DECODERS = {
+    "AVMUint64": lambda value: value.get("uint", 0),
+    "AVMBytes": lambda value: base64.b64decode(value.get("bytes", "")),
+    "AVMString": lambda value: base64.b64decode(value.get("bytes", "")).decode("utf-8", errors="replace"),
+    "address": lambda value: encode_address(base64.b64decode(value.get("bytes", ""))),
+}
+
+
+class AsyncBatchRegistryContractComposer:
+    """A group of BatchRegistryContract calls and other transactions, sent or simulated together"""
+
+    def __init__(self, client: "AsyncBatchRegistryContractClient"):
+        self.client = client
+        self.composer = AsyncComposer(
+            client.algod,
+            default_sender=client.default_sender,
+            default_signer=client.default_signer,
+        )
+
+    def move(
+        self,
+        args: tuple[str] | "MoveArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncBatchRegistryContractComposer":
+        """Adds a move(string)void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_move(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def approve_many(
+        self,
+        args: tuple[list[int], list[int]] | "ApproveManyArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncBatchRegistryContractComposer":
+        """Adds a approve_many(uint64[],uint64[])void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_approve_many(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def reject_many(
+        self,
+        args: tuple[list[int], list[str]] | "RejectManyArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncBatchRegistryContractComposer":
+        """Adds a reject_many(uint64[],string[])void call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_reject_many(*_args(args)), params, decode_return=None
+        )
+        return self
+
+    def count_by_status(
+        self,
+        args: tuple[str] | "CountByStatusArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncBatchRegistryContractComposer":
+        """Adds a count_by_status(string)uint64 call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_count_by_status(*_args(args)), params, decode_return=_codec.decode_count_by_status_return
+        )
+        return self
+
+    def list_by_status(
+        self,
+        args: tuple[str, int, int] | "ListByStatusArgs",
+        params: CallParams | None = None,
+    ) -> "AsyncBatchRegistryContractComposer":
+        """Adds a list_by_status(string,uint64,uint64)uint64[] call"""
+        self.composer.add_app_call(
+            self.client.app_id, _codec.encode_list_by_status(*_args(args)), params, decode_return=_codec.decode_list_by_status_return
+        )
+        return self
+
+    def add_transaction(
+        self, txn: transaction.Transaction, signer: TransactionSigner | None = None
+    ) -> "AsyncBatchRegistryContractComposer":
+        self.composer.add_transaction(txn, signer)
+        return self
+
+    async def build(self) -> list[transaction.Transaction]:
+        return await self.composer.build()
+
+    async def send(self, send_params: SendParams | None = None) -> SendResult[typing.Any]:
+        return await self.composer.send(send_params)
+
+    async def simulate(self, **options: typing.Any) -> SimulateResult[typing.Any]:
+        return await self.composer.simulate(**options)
+
+
+class AsyncBatchRegistryContractSend:
+    def __init__(self, client: "AsyncBatchRegistryContractClient"):
+        self.client = client
+
+    async def move(
+        self,
+        args: tuple[str] | "MoveArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().move(args, params)
+        return await composer.send(send_params)
+
+    async def approve_many(
+        self,
+        args: tuple[list[int], list[int]] | "ApproveManyArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().approve_many(args, params)
+        return await composer.send(send_params)
+
+    async def reject_many(
+        self,
+        args: tuple[list[int], list[str]] | "RejectManyArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SendResult[None]:
+        composer = self.client.new_group().reject_many(args, params)
+        return await composer.send(send_params)
+
+    async def count_by_status(
+        self,
+        args: tuple[str] | "CountByStatusArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SimulateResult[int]:
+        composer = self.client.new_group().count_by_status(args, params)
+        return await composer.simulate()
+
+    async def list_by_status(
+        self,
+        args: tuple[str, int, int] | "ListByStatusArgs",
+        params: CallParams | None = None,
+        send_params: SendParams | None = None,
+    ) -> SimulateResult[list[int]]:
+        composer = self.client.new_group().list_by_status(args, params)
+        return await composer.simulate()
+
+
+class AsyncBatchRegistryContractCreateTransactionParams:
+    def __init__(self, client: "AsyncBatchRegistryContractClient"):
+        self.client = client
+
+    async def move(
+        self,
+        args: tuple[str] | "MoveArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().move(args, params)
+        return (await composer.build())[0]
+
+    async def approve_many(
+        self,
+        args: tuple[list[int], list[int]] | "ApproveManyArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().approve_many(args, params)
+        return (await composer.build())[0]
+
+    async def reject_many(
+        self,
+        args: tuple[list[int], list[str]] | "RejectManyArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().reject_many(args, params)
+        return (await composer.build())[0]
+
+    async def count_by_status(
+        self,
+        args: tuple[str] | "CountByStatusArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().count_by_status(args, params)
+        return (await composer.build())[0]
+
+    async def list_by_status(
+        self,
+        args: tuple[str, int, int] | "ListByStatusArgs",
+        params: CallParams | None = None,
+    ) -> transaction.Transaction:
+        composer = self.client.new_group().list_by_status(args, params)
+        return (await composer.build())[0]
+
+
+class AsyncBatchRegistryContractClient:
+    """
+    asyncio client for a BatchRegistryContract app, over an `AsyncAlgod` shared by every client
+    of a service:
+
+        async with AsyncAlgod.from_algod(algorand.client.algod, concurrency=64) as algod:
+            client = AsyncBatchRegistryContractClient(algod, app_id, default_sender=sender, default_signer=signer)
+            await client.send.<method>(args=(...))
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgod,
+        app_id: int,
+        *,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+    ):
+        self.algod = algod
+        self.app_id = app_id
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        self.send = AsyncBatchRegistryContractSend(self)
+        self.create_transaction = AsyncBatchRegistryContractCreateTransactionParams(self)
+
+    @property
+    def app_address(self) -> str:
+        return get_application_address(self.app_id)
+
+    def new_group(self) -> AsyncBatchRegistryContractComposer:
+        return AsyncBatchRegistryContractComposer(self)
@@ -0,0 +1,1159 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "status"}], "name": "move", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "app_ids"}, {"type": "uint64[]", "name": "compliance_scores"}], "name": "approve_many", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "app_ids"}, {"type": "string[]", "name": "reasons"}], "name": "reject_many", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "status"}], "name": "count_by_status", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "status"}, {"type": "uint64", "name": "cursor"}, {"type": "uint64", "name": "limit"}], "name": "list_by_status", "returns": {"type": "uint64[]"}, "desc": "Up to `limit` app IDs of a status from position `cursor` on.", "events": [], "readonly": true, "recommendations": {}}], "name": "BatchRegistryContract", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"positions": {"keyType": "uint64", "valueType": "Position", "prefix": "YQ=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 8}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"Position": [{"name": "index", "type": "uint64"}, {"name": "status", "type": "string"}]}, "byteCode": {"approval": "CyAECAABgAEmBAFuAXAABBUffHUxG0EAMjEZFEQxGESCBQQgKaoZBH4etoQE5mvrfgTR3sOdBE9ToR02GgCOBQAJACUAowEmAUIAMRkUMRgUEEM2GgFJI1mBAghLARUSRFcCADINRDINTIgB1iRDNhoBRwIjWUlOAkkiC4ECCE8CFRJENhoCSU4CSSNZSSILgQIITwIVEkQSRCNJSwMMQQBJSwNXAgBLAUlOAiILTEsBW7ExAEsFVwIATwMiWEsCshiABMCIPBOyGkyyGrIagQayECOyAbOACGFwcHJvdmVkiAFfJAhFAUL/sCRDNhoBRwIjWUlOAkkiC4ECCE8CFRJENhoCSU4CI1lJTgISRCNJSwQMQQBXSwRXAgBLAUlOAiILW7ExAEsFVwIASwNLBgxESwOBAgtLAUxZSlmBAghYSwKyGIAE8vm4mrIaTLIashqBBrIQI7IBs4AIcmVqZWN0ZWSIANwkCEUBQv+iJEM2GgFJI1mBAghLARUSRFcCAChMUGQWK0xQsCRDIypHAzYaAUkjWYECCEsBFRJEVwIASTYaAkkVIhJEF0w2GgNJFSISRBdJTgIoTwJQZEyBfw1BAASBf0UCSwJLAQ1BAANJRQNLAksCCElFCUsBDUEAA0lFCCpFCUsCRQdLBksIDEEAPksGJQpJRQYkCCULSUUHSwgNQQAESwdFBksEFilMUEsEUEsHSSUYIgtLCElOBE8CCSILuksKTFBFCkUHQv+6SwdLAwkWVwYCSwlQK0xQsCRDigIAI0cGKkcDi/5yB0EA9YsLMgkSQQDtJESL/hZJjAKAAWFMUEmMAb1FAUEAhIsBvkRJIllLARVSVwIASYwFi/8SQQABiYsBIyK6SYwAF0mMCCiLBUlOAlBJjAZkJAlJjAlJJQoWKUxQTwJQjAQTQQAqiwklGCILiwRMIrqLCEklChYpTFCLBVBMJRgiC0sCuxcWgAFhTFAjiwC7iwklGCILQAAEiwS8RIsGiwlniwG8SCiL/1BJjAZkSYwHSSUKFilMUIv/UIwDJRgiC0mMCkAAB4sDgYAIuUSLA4sKiwK7iwdJFov/FRZXBgKL/1BMgAIAClBMUIsBSbxITL8kCIsGTGeJI0L/EA==", "clear": "C4EBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayA4IDAgMSAxMjgKICAgIGJ5dGVjYmxvY2sgMHg2ZSAweDcwIDB4IDB4MTUxZjdjNzUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weTo2NQogICAgLy8gY2xhc3MgQmF0Y2hSZWdpc3RyeUNvbnRyYWN0KEFSQzRDb250cmFjdCwgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKGdsb2JhbF91aW50cz1NQVhfU1RBVFVTRVMpKToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDE0CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydAogICAgcHVzaGJ5dGVzcyAweDIwMjlhYTE5IDB4N2UxZWI2ODQgMHhlNjZiZWI3ZSAweGQxZGVjMzlkIDB4NGY1M2ExMWQgLy8gbWV0aG9kICJtb3ZlKHN0cmluZyl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX21hbnkodWludDY0W10sdWludDY0W10pdm9pZCIsIG1ldGhvZCAicmVqZWN0X21hbnkodWludDY0W10sc3RyaW5nW10pdm9pZCIsIG1ldGhvZCAiY291bnRfYnlfc3RhdHVzKHN0cmluZyl1aW50NjQiLCBtZXRob2QgImxpc3RfYnlfc3RhdHVzKHN0cmluZyx1aW50NjQsdWludDY0KXVpbnQ2NFtdIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbW92ZSBhcHByb3ZlX21hbnkgcmVqZWN0X21hbnkgY291bnRfYnlfc3RhdHVzIGxpc3RfYnlfc3RhdHVzCiAgICBlcnIKCm1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMTQ6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgJiYKICAgIHJldHVybiAvLyBvbiBlcnJvcjogT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcCAmJiBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKCgovLyBzbWFydF9jb250cmFjdHMuYmF0Y2hfcmVnaXN0cnkuY29udHJhY3QuQmF0Y2hSZWdpc3RyeUNvbnRyYWN0Lm1vdmVbcm91dGluZ10oKSAtPiB2b2lkOgptb3ZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1dGY4W10pCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxCiAgICAvLyBhc3NlcnQgR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCwgIk9ubHkgYSBiYXRjaCBhcHAgY2FuIG1vdmUgaXRzZWxmIgogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBPbmx5IGEgYmF0Y2ggYXBwIGNhbiBtb3ZlIGl0c2VsZgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyCiAgICAvLyBzZWxmLl9tb3ZlKEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQsIHN0YXR1cykKICAgIGdsb2JhbCBDYWxsZXJBcHBsaWNhdGlvbklECiAgICBzd2FwCiAgICBjYWxsc3ViIF9tb3ZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6NjkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5iYXRjaF9yZWdpc3RyeS5jb250cmFjdC5CYXRjaFJlZ2lzdHJ5Q29udHJhY3QuYXBwcm92ZV9tYW55W3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV9tYW55OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1aW50NjRbXSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgaW50Y18wIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgKGxlbit1aW50NjRbXSkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weTo4MAogICAgLy8gYXNzZXJ0IGFwcF9pZHMubGVuZ3RoID09IGNvbXBsaWFuY2Vfc2NvcmVzLmxlbmd0aCwgIk9uZSBjb21wbGlhbmNlIHNjb3JlIHBlciBhcHAiCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uZSBjb21wbGlhbmNlIHNjb3JlIHBlciBhcHAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weTo4MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFwcF9pZHMubGVuZ3RoKToKICAgIGludGNfMSAvLyAwCgphcHByb3ZlX21hbnlfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXBwX2lkcy5sZW5ndGgpOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogYXBwcm92ZV9tYW55X2FmdGVyX2ZvckA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6ODIKICAgIC8vIGFwcCA9IGFwcF9pZHNbaV0uYXNfdWludDY0KCkKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18wIC8vIDgKICAgICoKICAgIHN3YXAKICAgIGRpZyAxCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzLTg4CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgICJhcHByb3ZlX2ZvcihhZGRyZXNzLHVpbnQ2NCl2b2lkIiwKICAgIC8vICAgICBUeG4uc2VuZGVyLAogICAgLy8gICAgIGNvbXBsaWFuY2Vfc2NvcmVzW2ldLAogICAgLy8gICAgIGFwcF9pZD1BcHBsaWNhdGlvbihhcHApLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBUeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBjb21wbGlhbmNlX3Njb3Jlc1tpXSwKICAgIGRpZyA1CiAgICBleHRyYWN0IDIgMAogICAgdW5jb3ZlciAzCiAgICBpbnRjXzAgLy8gOAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6ODMtODgKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgImFwcHJvdmVfZm9yKGFkZHJlc3MsdWludDY0KXZvaWQiLAogICAgLy8gICAgIFR4bi5zZW5kZXIsCiAgICAvLyAgICAgY29tcGxpYW5jZV9zY29yZXNbaV0sCiAgICAvLyAgICAgYXBwX2lkPUFwcGxpY2F0aW9uKGFwcCksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhjMDg4M2MxMyAvLyBtZXRob2QgImFwcHJvdmVfZm9yKGFkZHJlc3MsdWludDY0KXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBzZWxmLl9tb3ZlKGFwcCwgU3RyaW5nKCJhcHByb3ZlZCIpKQogICAgcHVzaGJ5dGVzICJhcHByb3ZlZCIKICAgIGNhbGxzdWIgX21vdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weTo4MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFwcF9pZHMubGVuZ3RoKToKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgYXBwcm92ZV9tYW55X2Zvcl9oZWFkZXJAMgoKYXBwcm92ZV9tYW55X2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYmF0Y2hfcmVnaXN0cnkuY29udHJhY3QuQmF0Y2hSZWdpc3RyeUNvbnRyYWN0LnJlamVjdF9tYW55W3JvdXRpbmddKCkgLT4gdm9pZDoKcmVqZWN0X21hbnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6OTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gOAogICAgKgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3VpbnQ2NFtdKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6OTcKICAgIC8vIGFzc2VydCBhcHBfaWRzLmxlbmd0aCA9PSByZWFzb25zLmxlbmd0aCwgIk9uZSByZWFzb24gcGVyIGFwcCIKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBjb3ZlciAyCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uZSByZWFzb24gcGVyIGFwcAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXBwX2lkcy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDAKCnJlamVjdF9tYW55X2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weTo5OAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFwcF9pZHMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDQKICAgIDwKICAgIGJ6IHJlamVjdF9tYW55X2FmdGVyX2ZvckA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6OTkKICAgIC8vIGFwcCA9IGFwcF9pZHNbaV0uYXNfdWludDY0KCkKICAgIGRpZyA0CiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18wIC8vIDgKICAgICoKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTAwLTEwMgogICAgLy8gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICAicmVqZWN0X2ZvcihhZGRyZXNzLHN0cmluZyl2b2lkIiwgVHhuLnNlbmRlciwgcmVhc29uc1tpXSwgYXBwX2lkPUFwcGxpY2F0aW9uKGFwcCkKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMDEKICAgIC8vICJyZWplY3RfZm9yKGFkZHJlc3Msc3RyaW5nKXZvaWQiLCBUeG4uc2VuZGVyLCByZWFzb25zW2ldLCBhcHBfaWQ9QXBwbGljYXRpb24oYXBwKQogICAgdHhuIFNlbmRlcgogICAgZGlnIDUKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMwogICAgZGlnIDYKICAgIDwKICAgIGFzc2VydCAvLyBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDMKICAgIHB1c2hpbnQgMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZXh0cmFjdDMKICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMDAtMTAyCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgICJyZWplY3RfZm9yKGFkZHJlc3Msc3RyaW5nKXZvaWQiLCBUeG4uc2VuZGVyLCByZWFzb25zW2ldLCBhcHBfaWQ9QXBwbGljYXRpb24oYXBwKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZjJmOWI4OWEgLy8gbWV0aG9kICJyZWplY3RfZm9yKGFkZHJlc3Msc3RyaW5nKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMwogICAgLy8gc2VsZi5fbW92ZShhcHAsIFN0cmluZygicmVqZWN0ZWQiKSkKICAgIHB1c2hieXRlcyAicmVqZWN0ZWQiCiAgICBjYWxsc3ViIF9tb3ZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6OTgKICAgIC8vIGZvciBpIGluIHVyYW5nZShhcHBfaWRzLmxlbmd0aCk6CiAgICBpbnRjXzIgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIHJlamVjdF9tYW55X2Zvcl9oZWFkZXJAMgoKcmVqZWN0X21hbnlfYWZ0ZXJfZm9yQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6OTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5iYXRjaF9yZWdpc3RyeS5jb250cmFjdC5CYXRjaFJlZ2lzdHJ5Q29udHJhY3QuY291bnRfYnlfc3RhdHVzW3JvdXRpbmddKCkgLT4gdm9pZDoKY291bnRfYnlfc3RhdHVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIChsZW4rdXRmOFtdKQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weTo1MgogICAgLy8gcmV0dXJuIGIibiIgKyBzdGF0dXMuYnl0ZXMKICAgIGJ5dGVjXzAgLy8gMHg2ZQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTA3CiAgICAvLyByZXR1cm4gb3AuQXBwR2xvYmFsLmdldF91aW50NjQoX2NvdW50X2tleShzdGF0dXMpKQogICAgYXBwX2dsb2JhbF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMDUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5iYXRjaF9yZWdpc3RyeS5jb250cmFjdC5CYXRjaFJlZ2lzdHJ5Q29udHJhY3QubGlzdF9ieV9zdGF0dXNbcm91dGluZ10oKSAtPiB2b2lkOgpsaXN0X2J5X3N0YXR1czoKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18yIC8vICIiCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciAobGVuK3V0ZjhbXSkKICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzAgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgdWludDY0CiAgICBidG9pCiAgICBzd2FwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18wIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6NTIKICAgIC8vIHJldHVybiBiIm4iICsgc3RhdHVzLmJ5dGVzCiAgICBieXRlY18wIC8vIDB4NmUKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0CiAgICAvLyB0b3RhbCA9IG9wLkFwcEdsb2JhbC5nZXRfdWludDY0KF9jb3VudF9rZXkoc3RhdHVzKSkKICAgIGFwcF9nbG9iYWxfZ2V0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTE1CiAgICAvLyBpZiBsaW1pdCA+IExJU1RfTElNSVQ6CiAgICBwdXNoaW50IDEyNyAvLyAxMjcKICAgID4KICAgIGJ6IGxpc3RfYnlfc3RhdHVzX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNgogICAgLy8gbGltaXQgPSBVSW50NjQoTElTVF9MSU1JVCkKICAgIHB1c2hpbnQgMTI3IC8vIDEyNwogICAgYnVyeSAyCgpsaXN0X2J5X3N0YXR1c19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3CiAgICAvLyBpZiBjdXJzb3IgPiB0b3RhbDoKICAgIGRpZyAyCiAgICBkaWcgMQogICAgPgogICAgYnogbGlzdF9ieV9zdGF0dXNfYWZ0ZXJfaWZfZWxzZUA1CiAgICBkdXAKICAgIGJ1cnkgMwoKbGlzdF9ieV9zdGF0dXNfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOQogICAgLy8gZW5kID0gY3Vyc29yICsgbGltaXQKICAgIGRpZyAyCiAgICBkaWcgMgogICAgKwogICAgZHVwCiAgICBidXJ5IDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMjAKICAgIC8vIGlmIGVuZCA+IHRvdGFsOgogICAgZGlnIDEKICAgID4KICAgIGJ6IGxpc3RfYnlfc3RhdHVzX2FmdGVyX2lmX2Vsc2VANwogICAgZHVwCiAgICBidXJ5IDgKCmxpc3RfYnlfc3RhdHVzX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMjIKICAgIC8vIGlkcyA9IEJ5dGVzKCkKICAgIGJ5dGVjXzIgLy8gMHgKICAgIGJ1cnkgOQogICAgZGlnIDIKICAgIGJ1cnkgNwoKbGlzdF9ieV9zdGF0dXNfd2hpbGVfdG9wQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTI0CiAgICAvLyB3aGlsZSBpbmRleCA8IGVuZDoKICAgIGRpZyA2CiAgICBkaWcgOAogICAgPAogICAgYnogbGlzdF9ieV9zdGF0dXNfYWZ0ZXJfd2hpbGVAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMjUKICAgIC8vIHBhZ2VfZW5kID0gKGluZGV4IC8vIFBBR0VfU0laRSArIDEpICogUEFHRV9TSVpFCiAgICBkaWcgNgogICAgaW50Y18zIC8vIDEyOAogICAgLwogICAgZHVwCiAgICBidXJ5IDYKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBpbnRjXzMgLy8gMTI4CiAgICAqCiAgICBkdXAKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNgogICAgLy8gaWYgcGFnZV9lbmQgPiBlbmQ6CiAgICBkaWcgOAogICAgPgogICAgYnogbGlzdF9ieV9zdGF0dXNfYWZ0ZXJfaWZfZWxzZUAxMQogICAgZGlnIDcKICAgIGJ1cnkgNgoKbGlzdF9ieV9zdGF0dXNfYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weTo1NwogICAgLy8gcmV0dXJuIGIicCIgKyBvcC5pdG9iKGluZGV4IC8vIFBBR0VfU0laRSkgKyBzdGF0dXMuYnl0ZXMKICAgIGRpZyA0CiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDQKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyByZXR1cm4gKGluZGV4ICUgUEFHRV9TSVpFKSAqIDgKICAgIGRpZyA3CiAgICBkdXAKICAgIGludGNfMyAvLyAxMjgKICAgICUKICAgIGludGNfMCAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4CiAgICAvLyBpZHMgKz0gb3AuQm94LmV4dHJhY3QoX3BhZ2Vfa2V5KHN0YXR1cywgaW5kZXgpLCBfc2xvdChpbmRleCksIChwYWdlX2VuZCAtIGluZGV4KSAqIDgpCiAgICBkaWcgOAogICAgZHVwCiAgICBjb3ZlciA0CiAgICB1bmNvdmVyIDIKICAgIC0KICAgIGludGNfMCAvLyA4CiAgICAqCiAgICBib3hfZXh0cmFjdAogICAgZGlnIDEwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ1cnkgMTAKICAgIGJ1cnkgNwogICAgYiBsaXN0X2J5X3N0YXR1c193aGlsZV90b3BAOAoKbGlzdF9ieV9zdGF0dXNfYWZ0ZXJfd2hpbGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwCiAgICAvLyBsZW5ndGggPSBvcC5leHRyYWN0KG9wLml0b2IoZW5kIC0gY3Vyc29yKSwgNiwgMikKICAgIGRpZyA3CiAgICBkaWcgMwogICAgLQogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMzEKICAgIC8vIHJldHVybiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0uZnJvbV9ieXRlcyhsZW5ndGggKyBpZHMpCiAgICBkaWcgOQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYmF0Y2hfcmVnaXN0cnkuY29udHJhY3QuQmF0Y2hSZWdpc3RyeUNvbnRyYWN0Ll9tb3ZlKGFwcDogdWludDY0LCBzdGF0dXM6IGJ5dGVzKSAtPiB2b2lkOgpfbW92ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxMzMtMTM0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9tb3ZlKHNlbGYsIGFwcDogVUludDY0LCBzdGF0dXM6IFN0cmluZykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18xIC8vIDAKICAgIGR1cG4gNgogICAgYnl0ZWNfMiAvLyAiIgogICAgZHVwbiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTM1CiAgICAvLyBjcmVhdG9yLCBleGlzdHMgPSBvcC5BcHBQYXJhbXNHZXQuYXBwX2NyZWF0b3IoYXBwKQogICAgZnJhbWVfZGlnIC0yCiAgICBhcHBfcGFyYW1zX2dldCBBcHBDcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2CiAgICAvLyBhc3NlcnQgZXhpc3RzIGFuZCBjcmVhdG9yID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJBcHAgbm90IGNyZWF0ZWQgYnkgdGhlIHJlZ2lzdHJ5IGNyZWF0b3IiCiAgICBieiBfbW92ZV9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAxMQogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYnogX21vdmVfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzIgLy8gMQoKX21vdmVfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gYXNzZXJ0IGV4aXN0cyBhbmQgY3JlYXRvciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiQXBwIG5vdCBjcmVhdGVkIGJ5IHRoZSByZWdpc3RyeSBjcmVhdG9yIgogICAgYXNzZXJ0IC8vIEFwcCBub3QgY3JlYXRlZCBieSB0aGUgcmVnaXN0cnkgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNwogICAgLy8gaWYgYXBwIGluIHNlbGYucG9zaXRpb25zOgogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgcHVzaGJ5dGVzIDB4NjEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogX21vdmVfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4CiAgICAvLyBwb3NpdGlvbiA9IHNlbGYucG9zaXRpb25zW2FwcF0uY29weSgpCiAgICBmcmFtZV9kaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9zaXRpb25zIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOQogICAgLy8gaWYgcG9zaXRpb24uc3RhdHVzLm5hdGl2ZSA9PSBzdGF0dXM6CiAgICBkdXAKICAgIGludGNfMCAvLyA4CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIGxlbgogICAgc3Vic3RyaW5nMwogICAgZXh0cmFjdCAyIDAKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBfbW92ZV9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxNDAKICAgIC8vIHJldHVybgogICAgcmV0c3ViCgpfbW92ZV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxCiAgICAvLyBzZWxmLl9yZW1vdmUocG9zaXRpb24uc3RhdHVzLm5hdGl2ZSwgcG9zaXRpb24uaW5kZXguYXNfdWludDY0KCkpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDAKICAgIGludGNfMCAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6NTIKICAgIC8vIHJldHVybiBiIm4iICsgc3RhdHVzLmJ5dGVzCiAgICBieXRlY18wIC8vIDB4NmUKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxNTcKICAgIC8vIGxhc3QgPSBvcC5BcHBHbG9iYWwuZ2V0X3VpbnQ2NChfY291bnRfa2V5KHN0YXR1cykpIC0gMQogICAgYXBwX2dsb2JhbF9nZXQKICAgIGludGNfMiAvLyAxCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3CiAgICAvLyByZXR1cm4gYiJwIiArIG9wLml0b2IoaW5kZXggLy8gUEFHRV9TSVpFKSArIHN0YXR1cy5ieXRlcwogICAgZHVwCiAgICBpbnRjXzMgLy8gMTI4CiAgICAvCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OQogICAgLy8gaWYgaW5kZXggIT0gbGFzdDoKICAgICE9CiAgICBieiBfbW92ZV9hZnRlcl9pZl9lbHNlQDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiAoaW5kZXggJSBQQUdFX1NJWkUpICogOAogICAgZnJhbWVfZGlnIDkKICAgIGludGNfMyAvLyAxMjgKICAgICUKICAgIGludGNfMCAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwLTE2MQogICAgLy8gIyBUaGUgbGFzdCBhcHAgdGFrZXMgdGhlIHJlbW92ZWQgb25lJ3Mgc2xvdAogICAgLy8gbW92ZWQgPSBvcC5Cb3guZXh0cmFjdChsYXN0X2tleSwgX3Nsb3QobGFzdCksIDgpCiAgICBmcmFtZV9kaWcgNAogICAgc3dhcAogICAgaW50Y18wIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6NTcKICAgIC8vIHJldHVybiBiInAiICsgb3AuaXRvYihpbmRleCAvLyBQQUdFX1NJWkUpICsgc3RhdHVzLmJ5dGVzCiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBpbnRjXzMgLy8gMTI4CiAgICAvCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDUKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyByZXR1cm4gKGluZGV4ICUgUEFHRV9TSVpFKSAqIDgKICAgIHN3YXAKICAgIGludGNfMyAvLyAxMjgKICAgICUKICAgIGludGNfMCAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTYyCiAgICAvLyBvcC5Cb3gucmVwbGFjZShfcGFnZV9rZXkoc3RhdHVzLCBpbmRleCksIF9zbG90KGluZGV4KSwgbW92ZWQpCiAgICBkaWcgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxNjMKICAgIC8vIHBvc2l0aW9uID0gc2VsZi5wb3NpdGlvbnNbb3AuYnRvaShtb3ZlZCldLmNvcHkoKQogICAgYnRvaQogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4NjEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2My0xNjUKICAgIC8vIHBvc2l0aW9uID0gc2VsZi5wb3NpdGlvbnNbb3AuYnRvaShtb3ZlZCldLmNvcHkoKQogICAgLy8gcG9zaXRpb24uaW5kZXggPSBhcmM0LlVJbnQ2NChpbmRleCkKICAgIC8vIHNlbGYucG9zaXRpb25zW29wLmJ0b2kobW92ZWQpXSA9IHBvc2l0aW9uLmNvcHkoKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfcmVwbGFjZQoKX21vdmVfYWZ0ZXJfaWZfZWxzZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weTo2MgogICAgLy8gcmV0dXJuIChpbmRleCAlIFBBR0VfU0laRSkgKiA4CiAgICBmcmFtZV9kaWcgOQogICAgaW50Y18zIC8vIDEyOAogICAgJQogICAgaW50Y18wIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxNjYKICAgIC8vIGlmIF9zbG90KGxhc3QpID09IDA6CiAgICBibnogX21vdmVfYWZ0ZXJfaWZfZWxzZUAxNwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NwogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUobGFzdF9rZXkpCiAgICBmcmFtZV9kaWcgNAogICAgYm94X2RlbAogICAgYXNzZXJ0CgpfbW92ZV9hZnRlcl9pZl9lbHNlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OAogICAgLy8gb3AuQXBwR2xvYmFsLnB1dChfY291bnRfa2V5KHN0YXR1cyksIGxhc3QpCiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyCiAgICAvLyBkZWwgc2VsZi5wb3NpdGlvbnNbYXBwXQogICAgZnJhbWVfZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAoKX21vdmVfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyCiAgICAvLyByZXR1cm4gYiJuIiArIHN0YXR1cy5ieXRlcwogICAgYnl0ZWNfMCAvLyAweDZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYXRjaF9yZWdpc3RyeS9jb250cmFjdC5weToxNDcKICAgIC8vIGNvdW50ID0gb3AuQXBwR2xvYmFsLmdldF91aW50NjQoX2NvdW50X2tleShzdGF0dXMpKQogICAgYXBwX2dsb2JhbF9nZXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6NTcKICAgIC8vIHJldHVybiBiInAiICsgb3AuaXRvYihpbmRleCAvLyBQQUdFX1NJWkUpICsgc3RhdHVzLmJ5dGVzCiAgICBkdXAKICAgIGludGNfMyAvLyAxMjgKICAgIC8KICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHg3MAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIHJldHVybiAoaW5kZXggJSBQQUdFX1NJWkUpICogOAogICAgaW50Y18zIC8vIDEyOAogICAgJQogICAgaW50Y18wIC8vIDgKICAgICoKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OQogICAgLy8gaWYgX3Nsb3QoY291bnQpID09IDA6CiAgICBibnogX21vdmVfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MAogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUoa2V5LCBQQUdFX1NJWkUgKiA4KQogICAgZnJhbWVfZGlnIDMKICAgIHB1c2hpbnQgMTAyNCAvLyAxMDI0CiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQKCl9tb3ZlX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxCiAgICAvLyBvcC5Cb3gucmVwbGFjZShrZXksIF9zbG90KGNvdW50KSwgb3AuaXRvYihhcHApKQogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAxMAogICAgZnJhbWVfZGlnIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmF0Y2hfcmVnaXN0cnkvY29udHJhY3QucHk6MTUyCiAgICAvLyBzZWxmLnBvc2l0aW9uc1thcHBdID0gUG9zaXRpb24oYXJjNC5VSW50NjQoY291bnQpLCBhcmM0LlN0cmluZyhzdGF0dXMpKQogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgc3dhcAogICAgcHVzaGJ5dGVzIDB4MDAwYQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhdGNoX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MwogICAgLy8gb3AuQXBwR2xvYmFsLnB1dChfY291bnRfa2V5KHN0YXR1cyksIGNvdW50ICsgMSkKICAgIGludGNfMiAvLyAxCiAgICArCiAgICBmcmFtZV9kaWcgNgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKX21vdmVfYm9vbF9mYWxzZUAzOgogICAgaW50Y18xIC8vIDAKICAgIGIgX21vdmVfYm9vbF9tZXJnZUA0Cg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [604], "errorMessage": "App not created by the registry creator"}, {"pc": [28], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [82], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [153], "errorMessage": "One compliance score per app"}, {"pc": [270], "errorMessage": "One reason per app"}, {"pc": [102], "errorMessage": "Only a batch app can move itself"}, {"pc": [628], "errorMessage": "check self.positions entry exists"}, {"pc": [189, 305], "errorMessage": "index access is out of bounds"}, {"pc": [131, 151, 257], "errorMessage": "invalid number of bytes for (len+uint64[])"}, {"pc": [96, 381, 413], "errorMessage": "invalid number of bytes for (len+utf8[])"}, {"pc": [425, 435], "errorMessage": "invalid number of bytes for uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True)
+class Position:
+    """Struct for Position"""
+    index: int
+    status: str
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MoveArgs:
+    """Dataclass for move arguments"""
+    status: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "move(string)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ApproveManyArgs:
+    """Dataclass for approve_many arguments"""
+    app_ids: list[int]
+    compliance_scores: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "approve_many(uint64[],uint64[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RejectManyArgs:
+    """Dataclass for reject_many arguments"""
+    app_ids: list[int]
+    reasons: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "reject_many(uint64[],string[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CountByStatusArgs:
+    """Dataclass for count_by_status arguments"""
+    status: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "count_by_status(string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ListByStatusArgs:
+    """Dataclass for list_by_status arguments"""
+    status: str
+    cursor: int
+    limit: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "list_by_status(string,uint64,uint64)uint64[]"
+
+
+class BatchRegistryContractParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def move(
+        self,
+        args: tuple[str] | MoveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "move(string)void",
+            "args": method_args,
+        }))
+
+    def approve_many(
+        self,
+        args: tuple[list[int], list[int]] | ApproveManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_many(uint64[],uint64[])void",
+            "args": method_args,
+        }))
+
+    def reject_many(
+        self,
+        args: tuple[list[int], list[str]] | RejectManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reject_many(uint64[],string[])void",
+            "args": method_args,
+        }))
+
+    def count_by_status(
+        self,
+        args: tuple[str] | CountByStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "count_by_status(string)uint64",
+            "args": method_args,
+        }))
+
+    def list_by_status(
+        self,
+        args: tuple[str, int, int] | ListByStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_by_status(string,uint64,uint64)uint64[]",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class BatchRegistryContractCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def move(
+        self,
+        args: tuple[str] | MoveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "move(string)void",
+            "args": method_args,
+        }))
+
+    def approve_many(
+        self,
+        args: tuple[list[int], list[int]] | ApproveManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_many(uint64[],uint64[])void",
+            "args": method_args,
+        }))
+
+    def reject_many(
+        self,
+        args: tuple[list[int], list[str]] | RejectManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reject_many(uint64[],string[])void",
+            "args": method_args,
+        }))
+
+    def count_by_status(
+        self,
+        args: tuple[str] | CountByStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "count_by_status(string)uint64",
+            "args": method_args,
+        }))
+
+    def list_by_status(
+        self,
+        args: tuple[str, int, int] | ListByStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_by_status(string,uint64,uint64)uint64[]",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class BatchRegistryContractSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def move(
+        self,
+        args: tuple[str] | MoveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "move(string)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def approve_many(
+        self,
+        args: tuple[list[int], list[int]] | ApproveManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_many(uint64[],uint64[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def reject_many(
+        self,
+        args: tuple[list[int], list[str]] | RejectManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reject_many(uint64[],string[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def count_by_status(
+        self,
+        args: tuple[str] | CountByStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "count_by_status(string)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def list_by_status(
+        self,
+        args: tuple[str, int, int] | ListByStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_by_status(string,uint64,uint64)uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class BatchRegistryContractState:
+    """Methods to access state for the current BatchRegistryContract app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "Position": Position
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def positions(self) -> "_MapState[int, Position]":
+        """Get values from the positions map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "positions",
+            self._struct_classes.get("Position")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class BatchRegistryContractClient:
+    """Client for interacting with BatchRegistryContract smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = BatchRegistryContractParams(self.app_client)
+        self.create_transaction = BatchRegistryContractCreateTransactionParams(self.app_client)
+        self.send = BatchRegistryContractSend(self.app_client)
+        self.state = BatchRegistryContractState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "BatchRegistryContractClient":
+        return BatchRegistryContractClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "BatchRegistryContractClient":
+        return BatchRegistryContractClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "BatchRegistryContractClient":
+        return BatchRegistryContractClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "BatchRegistryContractComposer":
+        return BatchRegistryContractComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["move(string)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["approve_many(uint64[],uint64[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["reject_many(uint64[],string[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["count_by_status(string)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["list_by_status(string,uint64,uint64)uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | list[int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchRegistryContractBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating BatchRegistryContract contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class BatchRegistryContractFactory(algokit_utils.TypedAppFactoryProtocol[BatchRegistryContractBareCallCreateParams, None, None]):
+    """Factory for deploying and managing BatchRegistryContractClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = BatchRegistryContractFactoryParams(self.app_factory)
+        self.create_transaction = BatchRegistryContractFactoryCreateTransaction(self.app_factory)
+        self.send = BatchRegistryContractFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: BatchRegistryContractBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[BatchRegistryContractClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return BatchRegistryContractClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> BatchRegistryContractClient:
+        """Get an app client by creator address and name"""
+        return BatchRegistryContractClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> BatchRegistryContractClient:
+        """Get an app client by app ID"""
+        return BatchRegistryContractClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class BatchRegistryContractFactoryParams:
+    """Parameters for creating transactions for BatchRegistryContract contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = BatchRegistryContractFactoryCreateParams(app_factory)
+        self.update = BatchRegistryContractFactoryUpdateParams(app_factory)
+        self.delete = BatchRegistryContractFactoryDeleteParams(app_factory)
+
+class BatchRegistryContractFactoryCreateParams:
+    """Parameters for 'create' operations of BatchRegistryContract contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def move(
+        self,
+        args: tuple[str] | MoveArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the move(string)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "move(string)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def approve_many(
+        self,
+        args: tuple[list[int], list[int]] | ApproveManyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the approve_many(uint64[],uint64[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "approve_many(uint64[],uint64[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def reject_many(
+        self,
+        args: tuple[list[int], list[str]] | RejectManyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the reject_many(uint64[],string[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "reject_many(uint64[],string[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def count_by_status(
+        self,
+        args: tuple[str] | CountByStatusArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the count_by_status(string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "count_by_status(string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def list_by_status(
+        self,
+        args: tuple[str, int, int] | ListByStatusArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the list_by_status(string,uint64,uint64)uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "list_by_status(string,uint64,uint64)uint64[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class BatchRegistryContractFactoryUpdateParams:
+    """Parameters for 'update' operations of BatchRegistryContract contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class BatchRegistryContractFactoryDeleteParams:
+    """Parameters for 'delete' operations of BatchRegistryContract contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class BatchRegistryContractFactoryCreateTransaction:
+    """Create transactions for BatchRegistryContract contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = BatchRegistryContractFactoryCreateTransactionCreate(app_factory)
+
+
+class BatchRegistryContractFactoryCreateTransactionCreate:
+    """Create new instances of BatchRegistryContract contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class BatchRegistryContractFactorySend:
+    """Send calls to BatchRegistryContract contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = BatchRegistryContractFactorySendCreate(app_factory)
+
+
+class BatchRegistryContractFactorySendCreate:
+    """Send create calls to BatchRegistryContract contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[BatchRegistryContractClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return BatchRegistryContractClient(result[0]), result[1]
+
+
+class BatchRegistryContractComposer:
+    """Composer for creating transaction groups for BatchRegistryContract contract calls"""
+
+    def __init__(self, client: "BatchRegistryContractClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def move(
+        self,
+        args: tuple[str] | MoveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BatchRegistryContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.move(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "move(string)void", v
+            )
+        )
+        return self
+
+    def approve_many(
+        self,
+        args: tuple[list[int], list[int]] | ApproveManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BatchRegistryContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.approve_many(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "approve_many(uint64[],uint64[])void", v
+            )
+        )
+        return self
+
+    def reject_many(
+        self,
+        args: tuple[list[int], list[str]] | RejectManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BatchRegistryContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.reject_many(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "reject_many(uint64[],string[])void", v
+            )
+        )
+        return self
+
+    def count_by_status(
+        self,
+        args: tuple[str] | CountByStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BatchRegistryContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.count_by_status(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "count_by_status(string)uint64", v
+            )
+        )
+        return self
+
+    def list_by_status(
+        self,
+        args: tuple[str, int, int] | ListByStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BatchRegistryContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.list_by_status(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "list_by_status(string,uint64,uint64)uint64[]", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "BatchRegistryContractComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "BatchRegistryContractComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
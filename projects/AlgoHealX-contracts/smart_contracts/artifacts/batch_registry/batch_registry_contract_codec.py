@@ -0,0 +1,213 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts/_helpers/arc4_codec.py.
+# DO NOT MODIFY IT BY HAND.
+import functools
+import struct
+import typing
+
+from algosdk.encoding import decode_address as _checked_decode_address
+from algosdk.encoding import encode_address as _checked_encode_address
+
+_UINT8 = struct.Struct(">B")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_address(address: str) -> bytes:
+    return _checked_decode_address(address)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_address(public_key: bytes) -> str:
+    return _checked_encode_address(public_key)
+
+
+def _prefixed(value: bytes) -> bytes:
+    return _UINT16.pack(len(value)) + value
+
+
+def _unprefixed(encoded: bytes) -> bytes:
+    (length,) = _UINT16.unpack_from(encoded)
+    if len(encoded) != length + 2:
+        raise ValueError(f"Expected {length} bytes after the length prefix, got {len(encoded) - 2}")
+    return encoded[2:]
+
+
+def _dynamic(log: bytes, head: int) -> bytes:
+    # Offsets in an event's head are relative to the tuple, after the 4-byte selector
+    start = 4 + _UINT16.unpack_from(log, head)[0]
+    (length,) = _UINT16.unpack_from(log, start)
+    return log[start + 2 : start + 2 + length]
+
+
+def _pack_uint_array(values: list[int], code: str) -> bytes:
+    return _UINT16.pack(len(values)) + struct.pack(f">{len(values)}{code}", *values)
+
+
+def _pack_string_array(values: list[str]) -> bytes:
+    tails = [_prefixed(value.encode()) for value in values]
+    heads = []
+    offset = 2 * len(tails)
+    for tail in tails:
+        heads.append(_UINT16.pack(offset))
+        offset += len(tail)
+    return _UINT16.pack(len(tails)) + b"".join(heads) + b"".join(tails)
+
+
+def _string_array(encoded: bytes) -> list[str]:
+    (length,) = _UINT16.unpack_from(encoded)
+    values = []
+    for i in range(length):
+        start = 2 + _UINT16.unpack_from(encoded, 2 + 2 * i)[0]
+        (size,) = _UINT16.unpack_from(encoded, start)
+        values.append(encoded[start + 2 : start + 2 + size].decode())
+    return values
+
+
+def _uint_array(encoded: bytes, code: str, size: int) -> list[int]:
+    (length,) = _UINT16.unpack_from(encoded)
+    if len(encoded) != 2 + length * size:
+        raise ValueError(f"Expected {length} {size}-byte elements after the length prefix")
+    return list(struct.unpack_from(f">{length}{code}", encoded, 2))
+
+
+def _unreturned(log: bytes) -> bytes:
+    if not log.startswith(RETURN_PREFIX):
+        raise ValueError("Log is not an ARC-4 return value")
+    return log[4:]
+
+
+
+MOVE_SELECTOR = bytes.fromhex('2029aa19')
+
+
+def encode_move(status: str) -> list[bytes]:
+    """App args for move(string)void"""
+    return [
+        MOVE_SELECTOR,
+        _prefixed(status.encode()),
+    ]
+
+
+def decode_move(app_args: list[bytes]) -> tuple[str]:
+    """Arguments of a move(string)void call, from its app args"""
+    return (
+        _unprefixed(app_args[1]).decode(),
+    )
+
+
+APPROVE_MANY_SELECTOR = bytes.fromhex('7e1eb684')
+
+
+def encode_approve_many(app_ids: list[int], compliance_scores: list[int]) -> list[bytes]:
+    """App args for approve_many(uint64[],uint64[])void"""
+    return [
+        APPROVE_MANY_SELECTOR,
+        _pack_uint_array(app_ids, 'Q'),
+        _pack_uint_array(compliance_scores, 'Q'),
+    ]
+
+
+def decode_approve_many(app_args: list[bytes]) -> tuple[list[int], list[int]]:
+    """Arguments of a approve_many(uint64[],uint64[])void call, from its app args"""
+    return (
+        _uint_array(app_args[1], 'Q', 8),
+        _uint_array(app_args[2], 'Q', 8),
+    )
+
+
+REJECT_MANY_SELECTOR = bytes.fromhex('e66beb7e')
+
+
+def encode_reject_many(app_ids: list[int], reasons: list[str]) -> list[bytes]:
+    """App args for reject_many(uint64[],string[])void"""
+    return [
+        REJECT_MANY_SELECTOR,
+        _pack_uint_array(app_ids, 'Q'),
+        _pack_string_array(reasons),
+    ]
+
+
+def decode_reject_many(app_args: list[bytes]) -> tuple[list[int], list[str]]:
+    """Arguments of a reject_many(uint64[],string[])void call, from its app args"""
+    return (
+        _uint_array(app_args[1], 'Q', 8),
+        _string_array(app_args[2]),
+    )
+
+
+COUNT_BY_STATUS_SELECTOR = bytes.fromhex('d1dec39d')
+
+
+def encode_count_by_status(status: str) -> list[bytes]:
+    """App args for count_by_status(string)uint64"""
+    return [
+        COUNT_BY_STATUS_SELECTOR,
+        _prefixed(status.encode()),
+    ]
+
+
+def decode_count_by_status(app_args: list[bytes]) -> tuple[str]:
+    """Arguments of a count_by_status(string)uint64 call, from its app args"""
+    return (
+        _unprefixed(app_args[1]).decode(),
+    )
+
+
+def decode_count_by_status_return(log: bytes) -> int:
+    """Return value of count_by_status(string)uint64, from the last log of the call"""
+    return _UINT64.unpack(_unreturned(log))[0]
+
+
+LIST_BY_STATUS_SELECTOR = bytes.fromhex('4f53a11d')
+
+
+def encode_list_by_status(status: str, cursor: int, limit: int) -> list[bytes]:
+    """App args for list_by_status(string,uint64,uint64)uint64[]"""
+    return [
+        LIST_BY_STATUS_SELECTOR,
+        _prefixed(status.encode()),
+        _UINT64.pack(cursor),
+        _UINT64.pack(limit),
+    ]
+
+
+def decode_list_by_status(app_args: list[bytes]) -> tuple[str, int, int]:
+    """Arguments of a list_by_status(string,uint64,uint64)uint64[] call, from its app args"""
+    return (
+        _unprefixed(app_args[1]).decode(),
+        _UINT64.unpack(app_args[2])[0],
+        _UINT64.unpack(app_args[3])[0],
+    )
+
+
+def decode_list_by_status_return(log: bytes) -> list[int]:
+    """Return value of list_by_status(string,uint64,uint64)uint64[], from the last log of the call"""
+    return _uint_array(_unreturned(log), 'Q', 8)
+
+
+ENCODERS = {
+    'move(string)void': encode_move,
+    'approve_many(uint64[],uint64[])void': encode_approve_many,
+    'reject_many(uint64[],string[])void': encode_reject_many,
+    'count_by_status(string)uint64': encode_count_by_status,
+    'list_by_status(string,uint64,uint64)uint64[]': encode_list_by_status,
+}
+
+
+DECODERS_BY_SELECTOR = {
+    MOVE_SELECTOR: ('move(string)void', decode_move),
+    APPROVE_MANY_SELECTOR: ('approve_many(uint64[],uint64[])void', decode_approve_many),
+    REJECT_MANY_SELECTOR: ('reject_many(uint64[],string[])void', decode_reject_many),
+    COUNT_BY_STATUS_SELECTOR: ('count_by_status(string)uint64', decode_count_by_status),
+    LIST_BY_STATUS_SELECTOR: ('list_by_status(string,uint64,uint64)uint64[]', decode_list_by_status),
+}
+
+
+EVENTS_BY_SELECTOR = {
+}
@@ -0,0 +1,168 @@
+from algopy import (
+    ARC4Contract,
+    Application,
+    BoxMap,
+    Bytes,
+    Global,
+    StateTotals,
+    String,
+    Txn,
+    UInt64,
+    arc4,
+    op,
+    subroutine,
+    urange,
+)
+
+# Registry-level index of DrugBatchContract apps by `reg_status`, so a regulator
+# can enumerate the pending queue from chain instead of from Supabase.
+#
+# Each status holds a dense array of app IDs split over page boxes of PAGE_SIZE
+# uint64s, keyed "p" + itob(page) + status, with its length in the global uint
+# "n" + status. A box per app, "a" + itob(app), holds the app's status and
+# position, so moving an app is a swap-remove from one array and an append to
+# another: O(1), touching at most four boxes. Pages are 1 KiB, which one box
+# reference covers.
+#
+# Batch apps keep the index current themselves: `register`, `approve`, `reject`
+# and `set_regulator` call `move` with their new `reg_status`. Only apps created
+# by the registry's creator are accepted, which is the account that creates
+# DrugBatchContract apps (directly or through the app pool).
+#
+# `approve_many` and `reject_many` decide many batches in one call: each decision
+# is relayed to the batch's `approve_for` or `reject_for` with this call's sender
+# as the regulator, which the batch checks against its own, and the batch is moved
+# here directly. One inner call per batch, so a call pays one minimum fee per
+# decision on top of its own.
+
+PAGE_SIZE = 128
+# Most app IDs a list_by_status call returns, so its return value fits in a log
+LIST_LIMIT = 127
+# Global uints reserved for per-status counts
+MAX_STATUSES = 8
+
+
+class Position(arc4.Struct):
+    index: arc4.UInt64
+    status: arc4.String
+
+
+@subroutine
+def _count_key(status: String) -> Bytes:
+    return b"n" + status.bytes
+
+
+@subroutine
+def _page_key(status: String, index: UInt64) -> Bytes:
+    return b"p" + op.itob(index // PAGE_SIZE) + status.bytes
+
+
+@subroutine
+def _slot(index: UInt64) -> UInt64:
+    return (index % PAGE_SIZE) * 8
+
+
+class BatchRegistryContract(ARC4Contract, state_totals=StateTotals(global_uints=MAX_STATUSES)):
+    def __init__(self) -> None:
+        self.positions = BoxMap(UInt64, Position, key_prefix=b"a")
+
+    @arc4.abimethod
+    def move(self, status: String) -> None:
+        assert Global.caller_application_id, "Only a batch app can move itself"
+        self._move(Global.caller_application_id, status)
+
+    @arc4.abimethod
+    def approve_many(
+        self,
+        app_ids: arc4.DynamicArray[arc4.UInt64],
+        compliance_scores: arc4.DynamicArray[arc4.UInt64],
+    ) -> None:
+        assert app_ids.length == compliance_scores.length, "One compliance score per app"
+        for i in urange(app_ids.length):
+            app = app_ids[i].as_uint64()
+            arc4.abi_call(
+                "approve_for(address,uint64)void",
+                Txn.sender,
+                compliance_scores[i],
+                app_id=Application(app),
+            )
+            self._move(app, String("approved"))
+
+    @arc4.abimethod
+    def reject_many(
+        self,
+        app_ids: arc4.DynamicArray[arc4.UInt64],
+        reasons: arc4.DynamicArray[arc4.String],
+    ) -> None:
+        assert app_ids.length == reasons.length, "One reason per app"
+        for i in urange(app_ids.length):
+            app = app_ids[i].as_uint64()
+            arc4.abi_call(
+                "reject_for(address,string)void", Txn.sender, reasons[i], app_id=Application(app)
+            )
+            self._move(app, String("rejected"))
+
+    @arc4.abimethod(readonly=True)
+    def count_by_status(self, status: String) -> UInt64:
+        return op.AppGlobal.get_uint64(_count_key(status))
+
+    @arc4.abimethod(readonly=True)
+    def list_by_status(
+        self, status: String, cursor: UInt64, limit: UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Up to `limit` app IDs of a status from position `cursor` on."""
+        total = op.AppGlobal.get_uint64(_count_key(status))
+        if limit > LIST_LIMIT:
+            limit = UInt64(LIST_LIMIT)
+        if cursor > total:
+            cursor = total
+        end = cursor + limit
+        if end > total:
+            end = total
+        ids = Bytes()
+        index = cursor
+        while index < end:
+            page_end = (index // PAGE_SIZE + 1) * PAGE_SIZE
+            if page_end > end:
+                page_end = end
+            ids += op.Box.extract(_page_key(status, index), _slot(index), (page_end - index) * 8)
+            index = page_end
+        length = op.extract(op.itob(end - cursor), 6, 2)
+        return arc4.DynamicArray[arc4.UInt64].from_bytes(length + ids)
+
+    @subroutine
+    def _move(self, app: UInt64, status: String) -> None:
+        creator, exists = op.AppParamsGet.app_creator(app)
+        assert exists and creator == Global.creator_address, "App not created by the registry creator"
+        if app in self.positions:
+            position = self.positions[app].copy()
+            if position.status.native == status:
+                return
+            self._remove(position.status.native, position.index.as_uint64())
+            del self.positions[app]
+        self._append(status, app)
+
+    @subroutine
+    def _append(self, status: String, app: UInt64) -> None:
+        count = op.AppGlobal.get_uint64(_count_key(status))
+        key = _page_key(status, count)
+        if _slot(count) == 0:
+            assert op.Box.create(key, PAGE_SIZE * 8)
+        op.Box.replace(key, _slot(count), op.itob(app))
+        self.positions[app] = Position(arc4.UInt64(count), arc4.String(status))
+        op.AppGlobal.put(_count_key(status), count + 1)
+
+    @subroutine
+    def _remove(self, status: String, index: UInt64) -> None:
+        last = op.AppGlobal.get_uint64(_count_key(status)) - 1
+        last_key = _page_key(status, last)
+        if index != last:
+            # The last app takes the removed one's slot
+            moved = op.Box.extract(last_key, _slot(last), 8)
+            op.Box.replace(_page_key(status, index), _slot(index), moved)
+            position = self.positions[op.btoi(moved)].copy()
+            position.index = arc4.UInt64(index)
+            self.positions[op.btoi(moved)] = position.copy()
+        if _slot(last) == 0:
+            assert op.Box.delete(last_key)
+        op.AppGlobal.put(_count_key(status), last)
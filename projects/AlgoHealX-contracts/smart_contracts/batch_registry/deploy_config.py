@@ -0,0 +1,54 @@
+import logging
+import os
+
+import algokit_utils
+
+logger = logging.getLogger(__name__)
+
+
+# define deployment behaviour based on supplied app spec
+def deploy() -> None:
+    from smart_contracts.algo_healx.app_registry import AppRegistry
+    from smart_contracts.artifacts.batch_registry.batch_registry_contract_client import (
+        BatchRegistryContractFactory,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer_ = algorand.account.from_environment("DEPLOYER")
+
+    factory = algorand.client.get_typed_app_factory(
+        BatchRegistryContractFactory, default_sender=deployer_.address
+    )
+    app_name = os.environ.get("BATCH_REGISTRY_APP_NAME", factory.app_name)
+
+    with AppRegistry() as registry:
+        registry.track(algorand, deployer_.address)
+        registry.sync(algorand)
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+            app_name=app_name,
+            existing_deployments=registry.lookup(deployer_.address, app_name),
+        )
+        if result.operation_performed != algokit_utils.OperationPerformed.Nothing:
+            registry.record_deployment(deployer_.address, result.app)
+
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        # Box minimum balance: about 0.42 Algo per page of 128 apps and 0.014 Algo
+        # per indexed app. This only covers the first batches: an AppPool attached
+        # to the registry tops it up before every refill, anything else creating
+        # batch apps must fund it too, or `move` fails once the balance runs out
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(algo=int(os.environ.get("BATCH_REGISTRY_FUNDING", "5"))),
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
+        )
+
+    logger.info(
+        f"Deployed {app_client.app_name} ({app_client.app_id}): {result.operation_performed.name}"
+    )
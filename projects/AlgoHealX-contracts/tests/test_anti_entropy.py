@@ -0,0 +1,84 @@
+import hashlib
+import re
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.algo_healx.anti_entropy import bucket_of, leaf_hash, rollup
+
+# The migration adding medicines.sync_bucket and medicines.sync_leaf
+MIGRATION_PATH = next(
+    (
+        Path(__file__).parents[2] / "AlgoHealX-frontend" / "supabase" / "migrations"
+    ).glob("20251201090000_*.sql"),
+    None,
+)
+SYNC_BUCKET_SQL = "substr(md5(batch_id), 1, 4)"
+SYNC_LEAF_SQL = "('x' || substr(md5(batch_id || ':' || status), 1, 16))::bit(64)::bigint"
+
+
+def _postgres_sync_leaf(batch_id: str, status: str) -> int:
+    """SYNC_LEAF_SQL step by step: 16 hex digits read as a bit(64), cast to bigint."""
+    bits = int(hashlib.md5(f"{batch_id}:{status}".encode()).hexdigest()[:16], 16)
+    return bits - (1 << 64) if bits >> 63 else bits
+
+
+@pytest.mark.skipif(MIGRATION_PATH is None, reason="frontend migrations are not checked out")
+def test_generated_columns_are_the_ones_mirrored_here() -> None:
+    sql = re.sub(r"\s+", " ", MIGRATION_PATH.read_text())  # type: ignore[union-attr]
+    assert f"sync_bucket TEXT COLLATE \"C\" GENERATED ALWAYS AS ({SYNC_BUCKET_SQL}) STORED" in sql
+    assert f"sync_leaf BIGINT GENERATED ALWAYS AS ({SYNC_LEAF_SQL}) STORED" in sql
+
+
+@pytest.mark.parametrize(
+    ("batch_id", "status"),
+    [
+        ("BATCH-2025-0042", "approved"),
+        ("BATCH-2025-0042", "pending"),
+        ("", "rejected"),
+        ("ÉTUI-ß-42", "approved"),
+        *((f"B{i}", status) for i in range(200) for status in ("pending", "approved")),
+    ],
+)
+def test_leaf_hash_matches_sync_leaf(batch_id: str, status: str) -> None:
+    leaf = leaf_hash(batch_id, status)
+    assert leaf == _postgres_sync_leaf(batch_id, status)
+    assert -(1 << 63) <= leaf < 1 << 63
+
+
+def test_leaf_hash_covers_negative_leaves() -> None:
+    leaves = [leaf_hash(f"B{i}", "approved") for i in range(64)]
+    assert any(leaf < 0 for leaf in leaves) and any(leaf >= 0 for leaf in leaves)
+
+
+def test_bucket_of_matches_sync_bucket() -> None:
+    for i in range(100):
+        batch_id = f"B{i}"
+        assert bucket_of(batch_id) == hashlib.md5(batch_id.encode()).hexdigest()[:4]
+
+
+def test_rollup_xors_and_counts_by_prefix() -> None:
+    buckets = {"0a1b": (1, 0b0011), "0a2c": (2, 0b0101), "0b00": (1, 0b1000), "ff00": (4, -7)}
+    assert rollup(buckets, 1) == {"0": (4, 0b1110), "f": (4, -7)}
+    assert rollup(buckets, 2, ["0"]) == {"0a": (3, 0b0110), "0b": (1, 0b1000)}
+    assert rollup(buckets, 3, ["0a", "ff"]) == {
+        "0a1": (1, 0b0011),
+        "0a2": (2, 0b0101),
+        "ff0": (4, -7),
+    }
+    assert rollup(buckets, 2, ["1"]) == {}
+
+
+def test_rollup_top_level_is_the_xor_of_every_leaf() -> None:
+    rows = [(f"B{i}", ("pending", "approved", "rejected")[i % 3]) for i in range(500)]
+    buckets: dict[str, tuple[int, int]] = {}
+    for batch_id, status in rows:
+        count, digest = buckets.get(bucket_of(batch_id), (0, 0))
+        buckets[bucket_of(batch_id)] = (count + 1, digest ^ leaf_hash(batch_id, status))
+    root = 0
+    for batch_id, status in rows:
+        root ^= leaf_hash(batch_id, status)
+    count = digest = 0
+    for prefix_count, prefix_digest in rollup(buckets, 1).values():
+        count, digest = count + prefix_count, digest ^ prefix_digest
+    assert (count, digest) == (len(rows), root)
@@ -0,0 +1,88 @@
+import pytest
+
+from smart_contracts.algo_healx.qr_payload import (
+    QrPayload,
+    b45decode,
+    b45encode,
+    decode_payload,
+    encode_payload,
+    print_run,
+    verify_payload,
+)
+
+APP_ID = 1_234_567
+BATCH_ID = "BATCH-2025-0042"
+QR_HASH = bytes(range(32))
+
+# RFC 9285, section 4.3 and 4.4
+RFC_9285_VECTORS = [
+    (b"AB", "BB8"),
+    (b"Hello!!", "%69 VD92EX0"),
+    (b"base-45", "UJCLQE7W581"),
+    (b"ietf!", "QED8WEX0"),
+]
+
+
+@pytest.mark.parametrize(("data", "text"), RFC_9285_VECTORS)
+def test_base45_rfc_9285_vectors(data: bytes, text: str) -> None:
+    assert b45encode(data) == text
+    assert b45decode(text) == data
+
+
+@pytest.mark.parametrize("text", ["GGW", "A", "BB8A", "bb8", "BB8\n"])
+def test_base45_rejects_invalid_text(text: str) -> None:
+    with pytest.raises(ValueError):
+        b45decode(text)
+
+
+def test_base45_round_trips_every_byte() -> None:
+    for data in (b"", bytes(range(256)), bytes(range(255, -1, -1)), b"\xff" * 3):
+        assert b45decode(b45encode(data)) == data
+
+
+@pytest.mark.parametrize(
+    "qr_hash",
+    [QR_HASH, b"", b"k" * 64, b"k" * 65],
+    ids=["32 bytes", "empty", "block size", "hashed key"],
+)
+def test_print_run_matches_encode_payload(qr_hash: bytes) -> None:
+    serials = [*range(300), 2**14 - 1, 2**14, 2**32, 2**64 - 1]
+    assert list(print_run(APP_ID, BATCH_ID, qr_hash, serials)) == [
+        encode_payload(APP_ID, BATCH_ID, serial, qr_hash) for serial in serials
+    ]
+
+
+def test_payload_round_trips() -> None:
+    payload = decode_payload(encode_payload(APP_ID, BATCH_ID, 77, QR_HASH))
+    assert isinstance(payload, QrPayload)
+    assert (payload.app_id, payload.serial) == (APP_ID, 77)
+    assert verify_payload(payload, BATCH_ID, QR_HASH)
+
+
+def test_payload_of_another_batch_or_key_is_rejected() -> None:
+    payload = decode_payload(encode_payload(APP_ID, BATCH_ID, 77, QR_HASH))
+    assert not verify_payload(payload, "BATCH-2025-0043", QR_HASH)
+    # A print run is revoked by setting a new qr_hash
+    assert not verify_payload(payload, BATCH_ID, bytes(32))
+
+
+def _accepted(text: str) -> bool:
+    try:
+        payload = decode_payload(text)
+    except ValueError:
+        return False
+    return payload.app_id == APP_ID and verify_payload(payload, BATCH_ID, QR_HASH)
+
+
+def test_truncated_payloads_are_rejected() -> None:
+    text = encode_payload(APP_ID, BATCH_ID, 77, QR_HASH)
+    for length in range(len(text)):
+        assert not _accepted(text[:length])
+
+
+def test_tampered_payloads_are_rejected() -> None:
+    text = encode_payload(APP_ID, BATCH_ID, 77, QR_HASH)
+    for i, char in enumerate(text):
+        for replacement in "09AZ $%*+-./:":
+            if replacement != char:
+                assert not _accepted(text[:i] + replacement + text[i + 1 :])
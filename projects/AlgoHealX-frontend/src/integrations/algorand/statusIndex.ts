@@ -0,0 +1,77 @@
+import algosdk from 'algosdk';
+
+// Reads the BatchRegistryContract status index straight from chain, the same way
+// smart_contracts/algo_healx/status_index.py does: each status's count is a global
+// uint "n" + status, and every PAGE_SIZE app IDs of it are one box
+// "p" + uint64(page) + status. A page of the queue is one or two box reads,
+// however many batches there are.
+
+const PAGE_SIZE = 128;
+
+const rawRegistryAppId = import.meta.env.VITE_BATCH_REGISTRY_APP_ID;
+export const registryAppId: bigint | null = rawRegistryAppId ? BigInt(rawRegistryAppId) : null;
+
+const algodClient = new algosdk.Algodv2(
+  import.meta.env.VITE_ALGOD_TOKEN ?? '',
+  import.meta.env.VITE_ALGOD_SERVER ?? 'https://testnet-api.algonode.cloud',
+  import.meta.env.VITE_ALGOD_PORT ?? ''
+);
+
+const encoder = new TextEncoder();
+const decoder = new TextDecoder();
+
+const pageKey = (status: string, page: number) => {
+  const key = new Uint8Array(9 + encoder.encode(status).length);
+  key[0] = 'p'.charCodeAt(0);
+  new DataView(key.buffer).setBigUint64(1, BigInt(page));
+  key.set(encoder.encode(status), 9);
+  return key;
+};
+
+/** The number of indexed batches in every status */
+export const statusCounts = async (): Promise<Record<string, number>> => {
+  if (registryAppId === null) throw new Error('VITE_BATCH_REGISTRY_APP_ID is not set');
+  const app = await algodClient.getApplicationByID(registryAppId).do();
+  const counts: Record<string, number> = {};
+  for (const { key, value } of app.params.globalState ?? []) {
+    if (key[0] === 'n'.charCodeAt(0)) counts[decoder.decode(key.slice(1))] = Number(value.uint);
+  }
+  return counts;
+};
+
+/** Up to `limit` app IDs of a status from position `cursor` on, given the status's count */
+export const listByStatus = async (
+  status: string,
+  cursor: number,
+  limit: number,
+  total: number
+): Promise<bigint[]> => {
+  if (registryAppId === null) throw new Error('VITE_BATCH_REGISTRY_APP_ID is not set');
+  const end = Math.min(cursor + limit, total);
+  if (cursor >= end) return [];
+  const pages: number[] = [];
+  for (let page = Math.floor(cursor / PAGE_SIZE); page <= Math.floor((end - 1) / PAGE_SIZE); page++) {
+    pages.push(page);
+  }
+  const boxes = await Promise.all(
+    pages.map((page) =>
+      algodClient
+        .getApplicationBoxByName(registryAppId, pageKey(status, page))
+        .do()
+        .catch((error) => {
+          // A page that is gone emptied after the count was read
+          if (error?.response?.status === 404) return null;
+          throw error;
+        })
+    )
+  );
+  const appIds = new Set<bigint>();
+  boxes.forEach((box, i) => {
+    if (!box) return;
+    const view = new DataView(box.value.buffer, box.value.byteOffset, box.value.byteLength);
+    const start = Math.max(cursor - pages[i] * PAGE_SIZE, 0);
+    const stop = Math.min(end - pages[i] * PAGE_SIZE, PAGE_SIZE);
+    for (let slot = start; slot < stop; slot++) appIds.add(view.getBigUint64(slot * 8));
+  });
+  return [...appIds];
+};
@@ -30,6 +30,8 @@ export type Database = {
           qr_code_hash: string | null
           quantity: number
           status: string
+          sync_bucket: string | null
+          sync_leaf: number | null
           updated_at: string
         }
         Insert: {
@@ -47,6 +49,8 @@ export type Database = {
           qr_code_hash?: string | null
           quantity: number
           status?: string
+          sync_bucket?: never
+          sync_leaf?: never
           updated_at?: string
         }
         Update: {
@@ -64,6 +68,8 @@ export type Database = {
           qr_code_hash?: string | null
           quantity?: number
           status?: string
+          sync_bucket?: never
+          sync_leaf?: never
           updated_at?: string
         }
         Relationships: []
@@ -235,7 +241,14 @@ export type Database = {
       [_ in never]: never
     }
     Functions: {
-      [_ in never]: never
+      verify_medicine: {
+        Args: {
+          p_batch_id: string
+          p_verification_method?: string
+          p_verifier_address?: string
+        }
+        Returns: Json
+      }
     }
     Enums: {
       app_role: "producer" | "regulator" | "distributor"
@@ -8,6 +8,7 @@ import { Label } from '@/components/ui/label';
 import { useToast } from '@/hooks/use-toast';
 import { ShieldCheck, CheckCircle, XCircle, Clock, Loader2 } from 'lucide-react';
 import { supabase } from '@/integrations/supabase/client';
+import { listByStatus, registryAppId, statusCounts } from '@/integrations/algorand/statusIndex';
 import algosdk from 'algosdk';
 
 interface Medicine {
@@ -23,6 +24,10 @@ interface Medicine {
   created_at: string;
 }
 
+// Batches of each status loaded from the on-chain index at a time
+const QUEUE_PAGE_SIZE = 50;
+const QUEUE_STATUSES = ['pending', 'approved'];
+
 const Regulator = () => {
   const { accountAddress, isConnected, walletInstance } = useWallet();
   const { toast } = useToast();
@@ -30,9 +35,42 @@ const Regulator = () => {
   const [loading, setLoading] = useState<string | null>(null);
   const [complianceScores, setComplianceScores] = useState<{ [key: string]: number }>({});
   const [rejectionReasons, setRejectionReasons] = useState<{ [key: string]: string }>({});
+  const [chainCounts, setChainCounts] = useState<Record<string, number> | null>(null);
+  // Position of the loaded page in each status of the on-chain index
+  const [cursors, setCursors] = useState<Record<string, number>>({ pending: 0, approved: 0 });
 
   useEffect(() => {
+    // With a registry configured the queue comes from its on-chain status index,
+    // one page per status from its cursor, and only those batches' details from
+    // Supabase. Decisions made here are only recorded in Supabase, so a decided
+    // batch stays pending in the index: its status is Supabase's, not the index's.
+    const fetchQueueFromChain = async () => {
+      const counts = await statusCounts();
+      const pages = await Promise.all(
+        QUEUE_STATUSES.map((status) =>
+          listByStatus(status, cursors[status] ?? 0, QUEUE_PAGE_SIZE, counts[status] ?? 0)
+        )
+      );
+      const appIds = pages.flat().map((appId) => appId.toString());
+      const { data } = await supabase
+        .from('medicines')
+        .select('*')
+        .in('blockchain_app_id', appIds)
+        .order('created_at', { ascending: false });
+
+      setChainCounts(counts);
+      if (data) setMedicines(data);
+    };
+
     const fetchMedicines = async () => {
+      if (registryAppId !== null) {
+        try {
+          await fetchQueueFromChain();
+          return;
+        } catch (error) {
+          console.error('Loading the queue from chain failed, falling back to Supabase:', error);
+        }
+      }
       const { data } = await supabase
         .from('medicines')
         .select('*')
@@ -62,7 +100,7 @@ const Regulator = () => {
     return () => {
       supabase.removeChannel(channel);
     };
-  }, []);
+  }, [cursors]);
 
   const sendBlockchainTransaction = async () => {
     if (!walletInstance) throw new Error('Wallet not initialized');
@@ -218,6 +256,38 @@ const Regulator = () => {
   const pendingMedicines = medicines.filter(m => m.status === 'pending');
   const approvedMedicines = medicines.filter(m => m.status === 'approved');
 
+  // Previous/next through a status of the on-chain index, when it has more than a page
+  const renderPager = (status: string) => {
+    const total = chainCounts?.[status] ?? 0;
+    const cursor = cursors[status] ?? 0;
+    if (total <= QUEUE_PAGE_SIZE && cursor === 0) return null;
+    return (
+      <div className="flex items-center justify-between mt-4 text-sm text-muted-foreground">
+        <span>
+          {Math.min(cursor + 1, total)}-{Math.min(cursor + QUEUE_PAGE_SIZE, total)} of {total} on chain
+        </span>
+        <div className="flex gap-2">
+          <Button
+            variant="outline"
+            size="sm"
+            disabled={cursor === 0}
+            onClick={() => setCursors({ ...cursors, [status]: Math.max(cursor - QUEUE_PAGE_SIZE, 0) })}
+          >
+            Previous
+          </Button>
+          <Button
+            variant="outline"
+            size="sm"
+            disabled={cursor + QUEUE_PAGE_SIZE >= total}
+            onClick={() => setCursors({ ...cursors, [status]: cursor + QUEUE_PAGE_SIZE })}
+          >
+            Next
+          </Button>
+        </div>
+      </div>
+    );
+  };
+
   return (
     <div className="container py-10">
       <div className="max-w-6xl mx-auto">
@@ -238,7 +308,9 @@ const Regulator = () => {
               <div className="flex items-center justify-between">
                 <div>
                   <p className="text-sm text-muted-foreground">Pending Review</p>
-                  <p className="text-3xl font-bold text-warning">{pendingMedicines.length}</p>
+                  <p className="text-3xl font-bold text-warning">
+                    {chainCounts?.pending ?? pendingMedicines.length}
+                  </p>
                 </div>
                 <Clock className="h-10 w-10 text-warning" />
               </div>
@@ -250,7 +322,9 @@ const Regulator = () => {
               <div className="flex items-center justify-between">
                 <div>
                   <p className="text-sm text-muted-foreground">Approved</p>
-                  <p className="text-3xl font-bold text-success">{approvedMedicines.length}</p>
+                  <p className="text-3xl font-bold text-success">
+                    {chainCounts?.approved ?? approvedMedicines.length}
+                  </p>
                 </div>
                 <CheckCircle className="h-10 w-10 text-success" />
               </div>
@@ -262,7 +336,11 @@ const Regulator = () => {
               <div className="flex items-center justify-between">
                 <div>
                   <p className="text-sm text-muted-foreground">Total Batches</p>
-                  <p className="text-3xl font-bold text-primary">{medicines.length}</p>
+                  <p className="text-3xl font-bold text-primary">
+                    {chainCounts
+                      ? Object.values(chainCounts).reduce((total, count) => total + count, 0)
+                      : medicines.length}
+                  </p>
                 </div>
                 <ShieldCheck className="h-10 w-10 text-primary" />
               </div>
@@ -379,10 +457,11 @@ const Regulator = () => {
               ))
             )}
           </div>
+          {renderPager('pending')}
         </div>
 
         {/* Approved Batches */}
-        {approvedMedicines.length > 0 && (
+        {(approvedMedicines.length > 0 || (cursors.approved ?? 0) > 0) && (
           <div>
             <h2 className="text-2xl font-bold mb-4">Approved Batches</h2>
             <div className="space-y-4">
@@ -405,6 +484,7 @@ const Regulator = () => {
                 </Card>
               ))}
             </div>
+            {renderPager('approved')}
           </div>
         )}
       </div>
@@ -0,0 +1,103 @@
+"""
+AlgoHealX Supply Chain Schema Benchmark
+Measures the hot queries before and after the index and partitioning migrations
+"""
+
+import argparse
+import random
+import time
+
+from pg_common import (
+    DEFAULT_DSN,
+    apply_migration,
+    connect,
+    migrations,
+    print_report,
+    reset_schema,
+    seed,
+)
+
+
+# Migrations under test, applied one stage at a time on top of the seeded data
+INDEX_MIGRATION = "20251124102033"
+PARTITION_MIGRATION = "20251124103517"
+
+QUERIES = {
+    # verify-medicine: a batch's events in order
+    "batch events": (
+        "SELECT event_type, location, created_at, blockchain_tx_hash "
+        "FROM public.supply_chain_events WHERE batch_id = %s ORDER BY created_at",
+        True,
+    ),
+    # Regulator queue: newest pending medicines
+    "pending queue": (
+        "SELECT * FROM public.medicines WHERE status = 'pending' "
+        "ORDER BY created_at DESC LIMIT 50",
+        False,
+    ),
+    # Verification history of a batch
+    "batch verifications": (
+        "SELECT count(*) FROM public.verifications WHERE batch_id = %s",
+        True,
+    ),
+    # Dashboards: activity over the last week
+    "recent events": (
+        "SELECT count(*) FROM public.supply_chain_events "
+        "WHERE created_at >= now() - INTERVAL '7 days'",
+        False,
+    ),
+}
+
+
+def run_queries(conn, batches, iterations):
+    """Run every query `iterations` times with random batch IDs"""
+    rng = random.Random(42)
+    rows = []
+    for name, (sql, by_batch) in QUERIES.items():
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            params = (f"BATCH-{rng.randint(1, batches)}",) if by_batch else None
+            query_started = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            latencies.append((time.perf_counter() - query_started) * 1000)
+        rows.append((name, iterations, time.perf_counter() - started, latencies))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default=DEFAULT_DSN)
+    parser.add_argument("--batches", type=int, default=1_000_000)
+    parser.add_argument("--events-per-batch", type=int, default=10)
+    parser.add_argument("--verifications-per-batch", type=int, default=10)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    files = migrations()
+    baseline = [f.name[:14] for f in files if f.name < INDEX_MIGRATION][-1]
+
+    with connect(args.dsn) as conn:
+        reset_schema(conn, until=baseline)
+        seed(
+            conn,
+            args.batches,
+            args.events_per_batch,
+            months=args.months,
+            verifications_per_batch=args.verifications_per_batch,
+        )
+
+        print("\n== baseline ==")
+        print_report(run_queries(conn, args.batches, args.iterations), "query")
+
+        for stage, prefix in (("indexes", INDEX_MIGRATION), ("partitioned", PARTITION_MIGRATION)):
+            migration = next(f for f in files if f.name.startswith(prefix))
+            apply_migration(conn, migration)
+            conn.execute("ANALYZE")
+            print(f"\n== {stage} ==")
+            print_report(run_queries(conn, args.batches, args.iterations), "query")
+
+
+if __name__ == "__main__":
+    main()
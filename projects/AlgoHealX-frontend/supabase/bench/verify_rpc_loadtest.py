@@ -0,0 +1,123 @@
+"""
+AlgoHealX verify-medicine Load Test
+Compares the original four round-trip verify path with the verify_medicine RPC
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from pg_common import DEFAULT_DSN, connect, print_report, reset_schema, seed
+
+
+def verify_legacy(conn, batch_id, rtt):
+    """The original edge function path: three selects and an insert"""
+    medicine = conn.execute(
+        "SELECT * FROM public.medicines WHERE batch_id = %s", (batch_id,)
+    ).fetchone()
+    time.sleep(rtt)
+    if medicine is None:
+        return None
+    medicine_id, status = medicine[0], medicine[8]
+
+    conn.execute(
+        "SELECT * FROM public.regulatory_approvals WHERE medicine_id = %s",
+        (medicine_id,),
+    ).fetchone()
+    time.sleep(rtt)
+
+    conn.execute(
+        "SELECT * FROM public.supply_chain_events WHERE batch_id = %s "
+        "ORDER BY created_at ASC",
+        (batch_id,),
+    ).fetchall()
+    time.sleep(rtt)
+
+    conn.execute(
+        "INSERT INTO public.verifications "
+        "(batch_id, medicine_id, verification_method, is_authentic) "
+        "VALUES (%s, %s, 'qr_scan', %s)",
+        (batch_id, medicine_id, status == "approved"),
+    )
+    time.sleep(rtt)
+    return medicine
+
+
+def verify_rpc(conn, batch_id, rtt):
+    """The consolidated path: one call to public.verify_medicine"""
+    result = conn.execute(
+        "SELECT public.verify_medicine(%s)", (batch_id,)
+    ).fetchone()
+    time.sleep(rtt)
+    return result
+
+
+def run(dsn, verify, batches, requests, concurrency, rtt):
+    """Issue `requests` verifications from `concurrency` connections"""
+    latencies = []
+    lock = threading.Lock()
+    per_worker = requests // concurrency
+
+    def worker(seed_value):
+        rng = random.Random(seed_value)
+        local = []
+        with connect(dsn) as conn:
+            for _ in range(per_worker):
+                batch_id = f"BATCH-{rng.randint(1, batches)}"
+                started = time.perf_counter()
+                verify(conn, batch_id, rtt)
+                local.append((time.perf_counter() - started) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [
+        threading.Thread(target=worker, args=(i,)) for i in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), time.perf_counter() - started, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default=DEFAULT_DSN)
+    parser.add_argument(
+        "--setup",
+        action="store_true",
+        help="drop and recreate the public schema, then seed it (destructive)",
+    )
+    parser.add_argument("--batches", type=int, default=10_000)
+    parser.add_argument("--events-per-batch", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--rtt-ms",
+        type=float,
+        default=0.0,
+        help="simulated network round-trip time added to every query",
+    )
+    args = parser.parse_args()
+
+    if args.setup:
+        with connect(args.dsn) as conn:
+            reset_schema(conn)
+            seed(conn, args.batches, args.events_per_batch)
+
+    rtt = args.rtt_ms / 1000
+    rows = []
+    for name, verify in (("legacy (4 round-trips)", verify_legacy), ("rpc", verify_rpc)):
+        print(f"Running {name}...")
+        count, seconds, latencies = run(
+            args.dsn, verify, args.batches, args.requests, args.concurrency, rtt
+        )
+        rows.append((name, count, seconds, latencies))
+
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+AlgoHealX Verify Service Load Test
+Drives the Python verify-medicine service over HTTP and reports throughput and latency
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from urllib.parse import urlsplit
+
+from pg_common import DEFAULT_DSN, connect, print_report, reset_schema, seed
+
+
+class Connection:
+    """A keep-alive HTTP/1.1 connection; lighter than an HTTP client library, so the
+    load generator does not become the bottleneck on the machine running the service"""
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path or "/"
+
+    async def __aenter__(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.writer.close()
+
+    async def post(self, payload):
+        """Send a JSON body and return the response status"""
+        body = json.dumps(payload).encode()
+        self.writer.write(
+            f"POST {self.path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        headers = dict(line.lower().split(": ", 1) for line in lines[1:] if line)
+        await self.reader.readexactly(int(headers.get("content-length", 0)))
+        return int(lines[0].split()[1])
+
+
+async def run(url, batches, requests, concurrency, rng):
+    """Issue `requests` verifications from `concurrency` keep-alive connections"""
+    batch_ids = [f"BATCH-{rng.randint(1, batches)}" for _ in range(requests)]
+    latencies = []
+    failures = 0
+
+    async def worker(ids):
+        nonlocal failures
+        async with Connection(url) as conn:
+            for batch_id in ids:
+                started = time.perf_counter()
+                status = await conn.post({"batchId": batch_id})
+                latencies.append((time.perf_counter() - started) * 1000)
+                if status != 200:
+                    failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(batch_ids[i::concurrency]) for i in range(concurrency)))
+    seconds = time.perf_counter() - started
+    if failures:
+        print(f"{failures} requests failed")
+    return len(latencies), seconds, latencies
+
+
+def verification_count(dsn):
+    with connect(dsn) as conn:
+        return conn.execute("SELECT count(*) FROM public.verifications").fetchone()[0]
+
+
+async def main_async(args):
+    rng = random.Random(args.seed)
+    rows = []
+    # The first pass fills the service's snapshot cache, the second is served from it
+    for name in ("first pass", "second pass"):
+        print(f"Running {name}...")
+        count, seconds, latencies = await run(
+            args.url, args.hot_batches or args.batches, args.requests, args.concurrency, rng
+        )
+        rows.append((name, count, seconds, latencies))
+    print_report(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default=DEFAULT_DSN)
+    parser.add_argument("--url", default="http://localhost:8080/verify-medicine")
+    parser.add_argument(
+        "--setup",
+        action="store_true",
+        help="drop and recreate the public schema, then seed it (destructive)",
+    )
+    parser.add_argument("--batches", type=int, default=10_000)
+    parser.add_argument("--events-per-batch", type=int, default=5)
+    parser.add_argument(
+        "--hot-batches",
+        type=int,
+        help="only verify the first N batches, e.g. to fit the service's cache",
+    )
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.setup:
+        with connect(args.dsn) as conn:
+            reset_schema(conn)
+            seed(conn, args.batches, args.events_per_batch)
+
+    before = verification_count(args.dsn)
+    asyncio.run(main_async(args))
+    # The service writes verifications in the background; give it a moment to flush
+    time.sleep(1)
+    print(f"\n{verification_count(args.dsn) - before} verifications recorded")
+
+
+if __name__ == "__main__":
+    main()
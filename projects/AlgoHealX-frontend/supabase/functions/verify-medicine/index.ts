@@ -25,67 +25,20 @@ serve(async (req) => {
 
     console.log('Verifying medicine with batch ID:', batchId);
 
-    // Fetch medicine data from Supabase
-    const { data: medicine, error: medicineError } = await supabaseClient
-      .from('medicines')
-      .select('*')
-      .eq('batch_id', batchId)
-      .single();
-
-    if (medicineError || !medicine) {
-      console.error('Medicine not found:', medicineError);
-      throw new Error('Medicine not found');
-    }
-
-    // Fetch regulatory approval
-    const { data: approval } = await supabaseClient
-      .from('regulatory_approvals')
-      .select('*')
-      .eq('medicine_id', medicine.id)
-      .single();
-
-    // Fetch supply chain events with blockchain transactions
-    const { data: events, error: eventsError } = await supabaseClient
-      .from('supply_chain_events')
-      .select('*')
-      .eq('batch_id', batchId)
-      .order('created_at', { ascending: true });
-
-    if (eventsError) {
-      console.error('Error fetching supply chain events:', eventsError);
-    }
-
-    // Create verification record
-    const { error: verificationError } = await supabaseClient
-      .from('verifications')
-      .insert({
-        batch_id: batchId,
-        medicine_id: medicine.id,
-        verification_method: 'qr_scan',
-        is_authentic: medicine.status === 'approved',
-      });
+    // Fetch medicine, approval and supply chain events and record the
+    // verification in a single round-trip
+    const { data: verificationResult, error: verificationError } = await supabaseClient
+      .rpc('verify_medicine', { p_batch_id: batchId });
 
     if (verificationError) {
-      console.error('Error creating verification record:', verificationError);
+      console.error('Error verifying medicine:', verificationError);
+      throw new Error('Verification failed');
     }
 
-    const verificationResult = {
-      isAuthentic: medicine.status === 'approved',
-      status: medicine.status,
-      batchId: medicine.batch_id,
-      drugName: medicine.drug_name,
-      manufacturer: medicine.manufacturer,
-      expiryDate: medicine.expiry_date,
-      quantity: medicine.quantity,
-      registrationTxHash: medicine.blockchain_tx_hash,
-      approvalTxHash: approval?.blockchain_tx_hash,
-      supplyChainEvents: events?.map(event => ({
-        eventType: event.event_type,
-        location: event.location,
-        timestamp: event.created_at,
-        blockchainTxHash: event.blockchain_tx_hash,
-      })) || [],
-    };
+    if (!verificationResult) {
+      console.error('Medicine not found:', batchId);
+      throw new Error('Medicine not found');
+    }
 
     console.log('Verification result:', verificationResult);
 
@@ -0,0 +1,76 @@
+-- Single round-trip verification for the verify-medicine edge function.
+-- Returns the medicine, its approval and ordered supply chain events as one JSON
+-- document and records the verification in the same call.
+CREATE OR REPLACE FUNCTION public.verify_medicine(
+  p_batch_id TEXT,
+  p_verification_method TEXT DEFAULT 'qr_scan',
+  p_verifier_address TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+  v_medicine public.medicines%ROWTYPE;
+  v_approval_tx_hash TEXT;
+  v_events JSONB;
+BEGIN
+  SELECT * INTO v_medicine
+  FROM public.medicines
+  WHERE batch_id = p_batch_id;
+
+  IF NOT FOUND THEN
+    RETURN NULL;
+  END IF;
+
+  SELECT blockchain_tx_hash INTO v_approval_tx_hash
+  FROM public.regulatory_approvals
+  WHERE medicine_id = v_medicine.id
+  ORDER BY created_at DESC
+  LIMIT 1;
+
+  SELECT COALESCE(
+    jsonb_agg(
+      jsonb_build_object(
+        'eventType', event_type,
+        'location', location,
+        'timestamp', created_at,
+        'blockchainTxHash', blockchain_tx_hash
+      )
+      ORDER BY created_at
+    ),
+    '[]'::jsonb
+  ) INTO v_events
+  FROM public.supply_chain_events
+  WHERE batch_id = p_batch_id;
+
+  INSERT INTO public.verifications (
+    batch_id,
+    medicine_id,
+    verifier_address,
+    verification_method,
+    is_authentic
+  ) VALUES (
+    p_batch_id,
+    v_medicine.id,
+    p_verifier_address,
+    p_verification_method,
+    v_medicine.status = 'approved'
+  );
+
+  RETURN jsonb_build_object(
+    'isAuthentic', v_medicine.status = 'approved',
+    'status', v_medicine.status,
+    'batchId', v_medicine.batch_id,
+    'drugName', v_medicine.drug_name,
+    'manufacturer', v_medicine.manufacturer,
+    'expiryDate', v_medicine.expiry_date,
+    'quantity', v_medicine.quantity,
+    'registrationTxHash', v_medicine.blockchain_tx_hash,
+    'approvalTxHash', v_approval_tx_hash,
+    'supplyChainEvents', v_events
+  );
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.verify_medicine(TEXT, TEXT, TEXT) TO anon, authenticated;
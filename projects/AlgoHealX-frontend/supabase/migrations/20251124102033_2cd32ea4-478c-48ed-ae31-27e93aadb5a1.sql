@@ -0,0 +1,12 @@
+-- Covering index for verify-medicine, which reads a batch's events ordered by created_at.
+-- Replaces the single-column batch_id index, which it makes redundant.
+CREATE INDEX idx_supply_chain_events_batch_id_created_at
+  ON public.supply_chain_events(batch_id, created_at)
+  INCLUDE (event_type, location, blockchain_tx_hash);
+
+DROP INDEX IF EXISTS public.idx_supply_chain_events_batch_id;
+
+-- Partial index for the regulator queue, which only lists pending medicines
+CREATE INDEX idx_medicines_pending_created_at
+  ON public.medicines(created_at DESC)
+  WHERE status = 'pending';
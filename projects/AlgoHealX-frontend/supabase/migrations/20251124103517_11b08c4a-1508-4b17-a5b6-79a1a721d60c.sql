@@ -0,0 +1,171 @@
+-- Partition supply_chain_events and verifications by month on created_at.
+-- Both tables are append-only and grow without bound; monthly partitions keep
+-- indexes small and let old months be detached or dropped cheaply.
+
+-- Create one partition per month covering p_from through p_to
+CREATE OR REPLACE FUNCTION public.create_monthly_partitions(
+  p_table TEXT,
+  p_from TIMESTAMP WITH TIME ZONE,
+  p_to TIMESTAMP WITH TIME ZONE
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+  v_month DATE := date_trunc('month', p_from AT TIME ZONE 'UTC')::DATE;
+  v_partition TEXT;
+BEGIN
+  WHILE v_month <= (p_to AT TIME ZONE 'UTC')::DATE LOOP
+    v_partition := format('%s_%s', p_table, to_char(v_month, 'YYYY_MM'));
+    EXECUTE format(
+      'CREATE TABLE IF NOT EXISTS public.%I PARTITION OF public.%I
+         FOR VALUES FROM (%L) TO (%L)',
+      v_partition,
+      p_table,
+      v_month::TEXT || ' 00:00:00+00',
+      (v_month + INTERVAL '1 month')::DATE::TEXT || ' 00:00:00+00'
+    );
+    -- Partitions are only reached through the parent's RLS policies
+    EXECUTE format('ALTER TABLE public.%I ENABLE ROW LEVEL SECURITY', v_partition);
+    EXECUTE format('ALTER TABLE public.%I REPLICA IDENTITY FULL', v_partition);
+    v_month := (v_month + INTERVAL '1 month')::DATE;
+  END LOOP;
+END;
+$$;
+
+-- Keep a year of partitions ahead of the current month
+CREATE OR REPLACE FUNCTION public.create_upcoming_partitions()
+RETURNS VOID
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+  PERFORM public.create_monthly_partitions('supply_chain_events', now(), now() + INTERVAL '12 months');
+  PERFORM public.create_monthly_partitions('verifications', now(), now() + INTERVAL '12 months');
+END;
+$$;
+
+-- Realtime subscribers keep seeing changes under the parent table names
+ALTER PUBLICATION supabase_realtime SET (publish_via_partition_root = true);
+
+-- supply_chain_events
+ALTER PUBLICATION supabase_realtime DROP TABLE public.supply_chain_events;
+ALTER TABLE public.supply_chain_events RENAME TO supply_chain_events_unpartitioned;
+
+CREATE TABLE public.supply_chain_events (
+  id UUID NOT NULL DEFAULT gen_random_uuid(),
+  medicine_id UUID NOT NULL REFERENCES public.medicines(id) ON DELETE CASCADE,
+  batch_id TEXT NOT NULL,
+  event_type TEXT NOT NULL,
+  sender_wallet TEXT,
+  receiver_wallet TEXT,
+  location TEXT,
+  blockchain_tx_hash TEXT,
+  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+  PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE public.supply_chain_events_default
+  PARTITION OF public.supply_chain_events DEFAULT;
+ALTER TABLE public.supply_chain_events_default ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.supply_chain_events_default REPLICA IDENTITY FULL;
+
+SELECT public.create_monthly_partitions(
+  'supply_chain_events',
+  COALESCE((SELECT min(created_at) FROM public.supply_chain_events_unpartitioned), now()),
+  now() + INTERVAL '12 months'
+);
+
+INSERT INTO public.supply_chain_events
+SELECT * FROM public.supply_chain_events_unpartitioned;
+
+DROP TABLE public.supply_chain_events_unpartitioned;
+
+CREATE INDEX idx_supply_chain_events_medicine_id
+  ON public.supply_chain_events(medicine_id);
+CREATE INDEX idx_supply_chain_events_batch_id_created_at
+  ON public.supply_chain_events(batch_id, created_at)
+  INCLUDE (event_type, location, blockchain_tx_hash);
+
+ALTER TABLE public.supply_chain_events ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.supply_chain_events REPLICA IDENTITY FULL;
+
+CREATE POLICY "Anyone can view supply chain events"
+  ON public.supply_chain_events
+  FOR SELECT
+  USING (true);
+
+CREATE POLICY "Authenticated users can create supply chain events"
+  ON public.supply_chain_events
+  FOR INSERT
+  TO authenticated
+  WITH CHECK (true);
+
+ALTER PUBLICATION supabase_realtime ADD TABLE public.supply_chain_events;
+
+-- verifications
+ALTER PUBLICATION supabase_realtime DROP TABLE public.verifications;
+ALTER TABLE public.verifications RENAME TO verifications_unpartitioned;
+
+CREATE TABLE public.verifications (
+  id UUID NOT NULL DEFAULT gen_random_uuid(),
+  medicine_id UUID REFERENCES public.medicines(id) ON DELETE CASCADE,
+  batch_id TEXT NOT NULL,
+  verifier_address TEXT,
+  is_authentic BOOLEAN NOT NULL DEFAULT true,
+  verification_method TEXT,
+  blockchain_tx_hash TEXT,
+  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+  PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE public.verifications_default
+  PARTITION OF public.verifications DEFAULT;
+ALTER TABLE public.verifications_default ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.verifications_default REPLICA IDENTITY FULL;
+
+SELECT public.create_monthly_partitions(
+  'verifications',
+  COALESCE((SELECT min(created_at) FROM public.verifications_unpartitioned), now()),
+  now() + INTERVAL '12 months'
+);
+
+INSERT INTO public.verifications
+SELECT * FROM public.verifications_unpartitioned;
+
+DROP TABLE public.verifications_unpartitioned;
+
+CREATE INDEX idx_verifications_medicine_id
+  ON public.verifications(medicine_id);
+CREATE INDEX idx_verifications_batch_id
+  ON public.verifications(batch_id);
+
+ALTER TABLE public.verifications ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.verifications REPLICA IDENTITY FULL;
+
+CREATE POLICY "Anyone can view verifications"
+  ON public.verifications
+  FOR SELECT
+  USING (true);
+
+CREATE POLICY "Anyone can create verifications"
+  ON public.verifications
+  FOR INSERT
+  WITH CHECK (true);
+
+ALTER PUBLICATION supabase_realtime ADD TABLE public.verifications;
+
+-- Roll partitions forward monthly where pg_cron is available; otherwise call
+-- public.create_upcoming_partitions() from a scheduled job before each month starts.
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+    PERFORM cron.schedule(
+      'create-upcoming-partitions',
+      '0 0 1 * *',
+      'SELECT public.create_upcoming_partitions()'
+    );
+  END IF;
+END
+$$;
@@ -0,0 +1,18 @@
+-- Hash columns for reconciling medicines.status with DrugBatchContract state
+-- (smart_contracts/algo_healx/anti_entropy.py in the contracts project).
+--
+-- Batches are grouped into 65536 buckets by the first 4 hex digits of
+-- md5(batch_id). A bucket's digest is the XOR of its rows' sync_leaf, the first
+-- 64 bits of md5(batch_id || ':' || status), so the reconciler compares digests
+-- by hex prefix and only reads the rows of buckets that differ. Adding STORED
+-- columns rewrites the table once.
+ALTER TABLE public.medicines
+  ADD COLUMN sync_bucket TEXT COLLATE "C"
+    GENERATED ALWAYS AS (substr(md5(batch_id), 1, 4)) STORED,
+  ADD COLUMN sync_leaf BIGINT
+    GENERATED ALWAYS AS (('x' || substr(md5(batch_id || ':' || status), 1, 16))::bit(64)::bigint) STORED;
+
+-- Digests of a prefix range are read from this index alone
+CREATE INDEX idx_medicines_sync_bucket
+  ON public.medicines(sync_bucket)
+  INCLUDE (sync_leaf);
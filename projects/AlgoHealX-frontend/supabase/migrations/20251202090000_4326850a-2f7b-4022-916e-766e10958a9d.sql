@@ -0,0 +1,54 @@
+-- Change notifications for caches of verify-medicine results
+-- (smart_contracts/algo_healx/verify_service.py in the contracts project).
+--
+-- A result is built from a medicine, its latest regulatory approval and its
+-- supply chain events. New approvals and events touch the medicine's updated_at,
+-- so updated_at versions the whole result, and every change to a medicine is
+-- announced on the batch_changed channel with its batch ID when it commits.
+
+CREATE OR REPLACE FUNCTION public.touch_medicines()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  UPDATE public.medicines
+  SET updated_at = now()
+  WHERE id IN (SELECT DISTINCT medicine_id FROM inserted);
+  RETURN NULL;
+END;
+$$;
+
+-- Statement-level, so bulk inserts touch each medicine once
+CREATE TRIGGER touch_medicines_on_supply_chain_event
+  AFTER INSERT ON public.supply_chain_events
+  REFERENCING NEW TABLE AS inserted
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION public.touch_medicines();
+
+CREATE TRIGGER touch_medicines_on_regulatory_approval
+  AFTER INSERT ON public.regulatory_approvals
+  REFERENCING NEW TABLE AS inserted
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION public.touch_medicines();
+
+CREATE OR REPLACE FUNCTION public.notify_batch_changed()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+  -- Notifications with the same payload are delivered once per transaction
+  PERFORM pg_notify('batch_changed', OLD.batch_id);
+  IF TG_OP = 'UPDATE' AND NEW.batch_id <> OLD.batch_id THEN
+    PERFORM pg_notify('batch_changed', NEW.batch_id);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER notify_medicines_batch_changed
+  AFTER UPDATE OR DELETE ON public.medicines
+  FOR EACH ROW
+  EXECUTE FUNCTION public.notify_batch_changed();